@@ -0,0 +1,12 @@
+-- yoyo: CREATE TABLE product_import_jobs
+CREATE TYPE import_job_status AS ENUM ('RUNNING', 'COMPLETED');
+
+CREATE TABLE IF NOT EXISTS product_import_jobs (
+    id VARCHAR(26) PRIMARY KEY,
+    status import_job_status NOT NULL DEFAULT 'RUNNING',
+    rows_processed BIGINT NOT NULL DEFAULT 0,
+    imported BIGINT NOT NULL DEFAULT 0,
+    rejected BIGINT NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL
+);
@@ -0,0 +1,18 @@
+-- yoyo: Index products by updated_at and create product_tombstones
+UPDATE products
+SET updated_at = COALESCE(created_at, NOW())
+WHERE updated_at IS NULL;
+
+ALTER TABLE products
+    ALTER COLUMN updated_at SET DEFAULT NOW(),
+    ALTER COLUMN updated_at SET NOT NULL;
+
+CREATE INDEX IF NOT EXISTS ix_products_updated_at_id ON products (updated_at, id);
+
+CREATE TABLE IF NOT EXISTS product_tombstones (
+    product_id VARCHAR(26) PRIMARY KEY,
+    deleted_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS ix_product_tombstones_deleted_at_id
+    ON product_tombstones (deleted_at, product_id);
@@ -0,0 +1,18 @@
+-- yoyo: Index the columns products, product views and brands are looked up by
+-- transactional: false
+-- CONCURRENTLY can not run inside a transaction, and keeps the tables
+-- writable while the indexes are built. If a build fails it leaves an INVALID
+-- index behind: drop it (DROP INDEX CONCURRENTLY) before applying again.
+-- users.email needs no index of its own: its UNIQUE constraint is one.
+
+-- Filter of list_products, and joins from brands
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_brand_id
+    ON products (brand_id);
+
+-- Every view increment, the view report join and the cascade from products
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_product_views_product_id
+    ON product_views (product_id);
+
+-- Brand name checks on creation
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_brands_name
+    ON brands (name);
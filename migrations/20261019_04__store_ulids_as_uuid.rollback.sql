@@ -0,0 +1,27 @@
+-- yoyo: Store the ULID keys as VARCHAR(26) again
+ALTER TABLE products DROP CONSTRAINT fk_brand;
+ALTER TABLE product_views DROP CONSTRAINT product_views_product_id_fkey;
+
+ALTER TABLE brands
+    ALTER COLUMN id TYPE VARCHAR(26) USING uuid_to_ulid(id);
+ALTER TABLE products
+    ALTER COLUMN id TYPE VARCHAR(26) USING uuid_to_ulid(id),
+    ALTER COLUMN brand_id TYPE VARCHAR(26) USING uuid_to_ulid(brand_id);
+ALTER TABLE product_views
+    ALTER COLUMN id TYPE VARCHAR(26) USING uuid_to_ulid(id),
+    ALTER COLUMN product_id TYPE VARCHAR(26) USING uuid_to_ulid(product_id);
+ALTER TABLE users
+    ALTER COLUMN id TYPE VARCHAR(26) USING uuid_to_ulid(id);
+ALTER TABLE product_tombstones
+    ALTER COLUMN product_id TYPE VARCHAR(26) USING uuid_to_ulid(product_id);
+ALTER TABLE product_import_jobs
+    ALTER COLUMN id TYPE VARCHAR(26) USING uuid_to_ulid(id);
+
+ALTER TABLE products
+    ADD CONSTRAINT fk_brand FOREIGN KEY (brand_id) REFERENCES brands (id);
+ALTER TABLE product_views
+    ADD CONSTRAINT product_views_product_id_fkey
+    FOREIGN KEY (product_id) REFERENCES products (id) ON DELETE CASCADE;
+
+DROP FUNCTION uuid_to_ulid(UUID);
+DROP FUNCTION ulid_to_uuid(TEXT);
@@ -0,0 +1,71 @@
+-- yoyo: Store the ULID keys as 16-byte uuid instead of VARCHAR(26)
+-- The ULID bits are kept as they are, so IDs and their order do not change:
+-- the application still reads and writes them as Crockford base32 strings.
+-- Every ALTER ... TYPE rewrites its table (and rebuilds its indexes) under an
+-- ACCESS EXCLUSIVE lock: apply it in a maintenance window.
+
+CREATE OR REPLACE FUNCTION ulid_to_uuid(ulid TEXT) RETURNS UUID AS $$
+DECLARE
+    alphabet CONSTANT TEXT := '0123456789ABCDEFGHJKMNPQRSTVWXYZ';
+    bits BIT VARYING := B'';
+    digit INT;
+    hex TEXT := '';
+BEGIN
+    IF length(ulid) <> 26 THEN
+        RAISE EXCEPTION 'Invalid ULID: %', ulid;
+    END IF;
+    FOR i IN 1..26 LOOP
+        digit := strpos(alphabet, upper(substr(ulid, i, 1))) - 1;
+        IF digit < 0 THEN
+            RAISE EXCEPTION 'Invalid ULID: %', ulid;
+        END IF;
+        bits := bits || digit::BIT(5);
+    END LOOP;
+    -- 26 characters hold 130 bits, a ULID only uses the last 128
+    IF substring(bits FROM 1 FOR 2) <> B'00' THEN
+        RAISE EXCEPTION 'Invalid ULID: %', ulid;
+    END IF;
+    FOR i IN 0..31 LOOP
+        hex := hex || to_hex(substring(bits FROM 3 + i * 4 FOR 4)::BIT(4)::INT);
+    END LOOP;
+    RETURN hex::UUID;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE STRICT;
+
+-- To read the IDs in psql: SELECT uuid_to_ulid(id) FROM products
+CREATE OR REPLACE FUNCTION uuid_to_ulid(id UUID) RETURNS TEXT AS $$
+DECLARE
+    alphabet CONSTANT TEXT := '0123456789ABCDEFGHJKMNPQRSTVWXYZ';
+    bits BIT(130) := B'00' || ('x' || replace(id::TEXT, '-', ''))::BIT(128);
+    ulid TEXT := '';
+BEGIN
+    FOR i IN 0..25 LOOP
+        ulid := ulid || substr(alphabet, substring(bits FROM i * 5 + 1 FOR 5)::INT + 1, 1);
+    END LOOP;
+    RETURN ulid;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE STRICT;
+
+ALTER TABLE products DROP CONSTRAINT fk_brand;
+ALTER TABLE product_views DROP CONSTRAINT product_views_product_id_fkey;
+
+ALTER TABLE brands
+    ALTER COLUMN id TYPE UUID USING ulid_to_uuid(id);
+ALTER TABLE products
+    ALTER COLUMN id TYPE UUID USING ulid_to_uuid(id),
+    ALTER COLUMN brand_id TYPE UUID USING ulid_to_uuid(brand_id);
+ALTER TABLE product_views
+    ALTER COLUMN id TYPE UUID USING ulid_to_uuid(id),
+    ALTER COLUMN product_id TYPE UUID USING ulid_to_uuid(product_id);
+ALTER TABLE users
+    ALTER COLUMN id TYPE UUID USING ulid_to_uuid(id);
+ALTER TABLE product_tombstones
+    ALTER COLUMN product_id TYPE UUID USING ulid_to_uuid(product_id);
+ALTER TABLE product_import_jobs
+    ALTER COLUMN id TYPE UUID USING ulid_to_uuid(id);
+
+ALTER TABLE products
+    ADD CONSTRAINT fk_brand FOREIGN KEY (brand_id) REFERENCES brands (id);
+ALTER TABLE product_views
+    ADD CONSTRAINT product_views_product_id_fkey
+    FOREIGN KEY (product_id) REFERENCES products (id) ON DELETE CASCADE;
@@ -0,0 +1,9 @@
+-- yoyo: CREATE TABLE outbox
+-- Notifications written in the transaction of the change they describe and
+-- delivered by the outbox dispatcher once it commits
+CREATE TABLE IF NOT EXISTS outbox (
+    id UUID PRIMARY KEY,
+    event_type VARCHAR(64) NOT NULL,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL
+);
@@ -0,0 +1,16 @@
+-- yoyo: Retry failed outbox messages with backoff and keep the undeliverable ones
+ALTER TABLE outbox
+    ADD COLUMN IF NOT EXISTS attempts INT NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    ADD COLUMN IF NOT EXISTS last_error TEXT;
+
+-- Messages that failed permanently or ran out of attempts, until replayed
+CREATE TABLE IF NOT EXISTS outbox_dead_letters (
+    id UUID PRIMARY KEY,
+    event_type VARCHAR(64) NOT NULL,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL,
+    attempts INT NOT NULL,
+    last_error TEXT NOT NULL,
+    failed_at TIMESTAMPTZ NOT NULL
+);
@@ -0,0 +1,12 @@
+-- yoyo: CREATE TABLE rate_limit_buckets
+-- Token buckets of the login and sign-up rate limits, shared by every API
+-- worker when RATE_LIMIT_BACKEND=postgres
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+    key VARCHAR(255) PRIMARY KEY,
+    tokens DOUBLE PRECISION NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL
+);
+
+-- Pruning of the buckets idle long enough to be full again
+CREATE INDEX IF NOT EXISTS ix_rate_limit_buckets_updated_at
+    ON rate_limit_buckets (updated_at);
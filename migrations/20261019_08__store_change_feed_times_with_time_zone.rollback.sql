@@ -0,0 +1,6 @@
+-- yoyo: Store the change feed timestamps as UTC TIMESTAMP again
+ALTER TABLE products
+    ALTER COLUMN updated_at TYPE TIMESTAMP USING updated_at AT TIME ZONE 'UTC';
+
+ALTER TABLE product_tombstones
+    ALTER COLUMN deleted_at TYPE TIMESTAMP USING deleted_at AT TIME ZONE 'UTC';
@@ -0,0 +1,12 @@
+-- yoyo: Store the change feed timestamps as TIMESTAMPTZ
+-- The change feed unions products.updated_at with product_tombstones.deleted_at
+-- and compares both with the UTC cursor of its clients: as TIMESTAMP, Postgres
+-- read them in the session time zone to compare them, so every session not on
+-- UTC shifted the feed by its offset. The stored values are UTC wall-clock times.
+-- Both ALTER ... TYPE rewrite their table (and its indexes) under an ACCESS
+-- EXCLUSIVE lock: apply it in a maintenance window.
+ALTER TABLE products
+    ALTER COLUMN updated_at TYPE TIMESTAMPTZ USING updated_at AT TIME ZONE 'UTC';
+
+ALTER TABLE product_tombstones
+    ALTER COLUMN deleted_at TYPE TIMESTAMPTZ USING deleted_at AT TIME ZONE 'UTC';
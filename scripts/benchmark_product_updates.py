@@ -0,0 +1,260 @@
+# scripts/benchmark_product_updates.py
+"""
+Measures PUT /products/{id} throughput with notification delivery enabled:
+the API runs under uvicorn with the outbox dispatcher, and the dispatcher
+sends to the local SES stand-in (with the given latency and error rate).
+
+    poetry run python scripts/benchmark_product_updates.py --requests 2000 \
+        --concurrency 16 --ses-latency-ms 80 --ses-error-rate 0.05
+
+Reports request latency, how long the outbox took to drain after the last
+update and how many emails SES got. It uses DATABASE_URL: a scratch brand and
+its products are created through the API and deleted at the end.
+"""
+
+import argparse
+import logging
+import os
+import socket
+import statistics
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+
+import httpx
+import uvicorn
+from jose import jwt
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.application.containers import container
+from app.application.workers.outbox_dispatcher import OutboxDispatcher
+from app.core.configurations import settings
+from app.domain.helpers.datetime_generator import get_now_datetime
+from app.domain.helpers.ulid_generator import generate_ulid
+from app.infrastructure.db import session as db_session
+from app.infrastructure.entity.brand_entity import BrandEntity
+from app.infrastructure.entity.outbox_message_entity import OutboxMessageEntity
+from app.infrastructure.entity.product_entity import ProductEntity
+from app.infrastructure.service.ses_client import ses_client_holder
+from app.main import app
+from scripts.ses_stand_in import StandInConfig, running_stand_in
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+BENCHMARK_SETTINGS = (
+    "SES_ENDPOINT_URL",
+    "NOTIFICATION_COALESCE_WINDOW_SECONDS",
+    "OUTBOX_POLL_INTERVAL_SECONDS",
+    "OUTBOX_RETRY_BASE_SECONDS",
+)
+
+
+@dataclass
+class BenchmarkResult:
+    requests: int
+    concurrency: int
+    requests_per_second: float
+    p50_ms: float
+    p95_ms: float
+    drain_seconds: float
+    emails_sent: int
+
+
+@contextmanager
+def _running_api() -> Iterator[str]:
+    """Serves the app from a background thread; the lifespan is left out."""
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    host, port = sock.getsockname()
+    server = uvicorn.Server(
+        uvicorn.Config(app, lifespan="off", log_level="warning", access_log=False),
+    )
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]})
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    try:
+        yield f"http://{host}:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
+        sock.close()
+
+
+@contextmanager
+def _benchmark_settings(**values: object) -> Iterator[None]:
+    previous = {name: getattr(settings, name) for name in BENCHMARK_SETTINGS}
+    for name, value in values.items():
+        setattr(settings, name, value)
+    # The notification service and its SES client are rebuilt on the stand-in
+    container.close()
+    ses_client_holder.close()
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(settings, name, value)
+        container.close()
+        ses_client_holder.close()
+
+
+def _admin_token() -> str:
+    expires = get_now_datetime() + timedelta(hours=1)
+    return jwt.encode(
+        {"sub": "benchmark", "role": "ADMIN", "exp": expires},
+        settings.SECRET_KEY,
+        algorithm=settings.ALGORITHM,
+    )
+
+
+def _outbox_size() -> int:
+    with Session(db_session.engine) as session:
+        return session.scalar(select(func.count()).select_from(OutboxMessageEntity))
+
+
+def _wait_for_drain(timeout: float) -> float:
+    started = time.perf_counter()
+    while _outbox_size():
+        if time.perf_counter() - started > timeout:
+            msg = f"The outbox did not drain in {timeout} seconds"
+            raise TimeoutError(msg)
+        time.sleep(0.05)
+    return time.perf_counter() - started
+
+
+def _create_catalog(client: httpx.Client, products: int) -> tuple[str, list[str]]:
+    response = client.post("/brands", json={"name": f"Benchmark {generate_ulid()}"})
+    response.raise_for_status()
+    brand_id = response.json()["id"]
+    product_ids = []
+    for index in range(products):
+        response = client.post(
+            "/products",
+            json={
+                "brand_id": brand_id,
+                "sku": f"BENCH-{generate_ulid()}",
+                "name": f"Benchmark product {index}",
+                "price": "1.00",
+            },
+        )
+        response.raise_for_status()
+        product_ids.append(response.json()["id"])
+    return brand_id, product_ids
+
+
+def _delete_catalog(brand_id: str) -> None:
+    with Session(db_session.engine) as session, session.begin():
+        session.execute(delete(ProductEntity).where(ProductEntity.brand_id == brand_id))
+        session.execute(delete(BrandEntity).where(BrandEntity.id == brand_id))
+
+
+def run_benchmark(
+    requests: int,
+    concurrency: int,
+    products: int,
+    stand_in_config: StandInConfig | None = None,
+    coalesce_window: float = 1.0,
+    drain_timeout: float = 120.0,
+) -> BenchmarkResult:
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "stand-in")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "stand-in")
+    with (
+        running_stand_in(config=stand_in_config) as ses,
+        _benchmark_settings(
+            SES_ENDPOINT_URL=ses.endpoint_url,
+            NOTIFICATION_COALESCE_WINDOW_SECONDS=coalesce_window,
+            OUTBOX_POLL_INTERVAL_SECONDS=0.1,
+            # Injected errors are retried quickly, as a real outage would not be
+            OUTBOX_RETRY_BASE_SECONDS=0.1,
+        ),
+        _running_api() as base_url,
+        httpx.Client(
+            base_url=base_url,
+            headers={"Authorization": f"Bearer {_admin_token()}"},
+            limits=httpx.Limits(max_connections=concurrency),
+        ) as client,
+    ):
+        brand_id, product_ids = _create_catalog(client, products)
+        dispatcher = OutboxDispatcher(
+            container,
+            batch_size=settings.OUTBOX_BATCH_SIZE,
+            poll_interval=settings.OUTBOX_POLL_INTERVAL_SECONDS,
+        )
+        dispatcher.start()
+        try:
+
+            def update(number: int) -> float:
+                product_id = product_ids[number % products]
+                started = time.perf_counter()
+                response = client.put(
+                    f"/products/{product_id}",
+                    json={
+                        "brand_id": brand_id,
+                        "sku": f"BENCH-{product_id}",
+                        "name": f"Benchmark product {product_id}",
+                        "price": f"{number + 2}.00",
+                    },
+                )
+                response.raise_for_status()
+                return (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                timings = list(executor.map(update, range(requests)))
+            elapsed = time.perf_counter() - started
+            drain_seconds = _wait_for_drain(drain_timeout)
+        finally:
+            dispatcher.stop()
+            _delete_catalog(brand_id)
+
+    quantiles = statistics.quantiles(timings, n=20)
+    return BenchmarkResult(
+        requests=requests,
+        concurrency=concurrency,
+        requests_per_second=requests / elapsed,
+        p50_ms=statistics.median(timings),
+        p95_ms=quantiles[-1],
+        drain_seconds=drain_seconds,
+        emails_sent=ses.sent,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--products", type=int, default=50)
+    parser.add_argument("--coalesce-window", type=float, default=1.0)
+    parser.add_argument("--ses-latency-ms", type=float, default=50.0)
+    parser.add_argument("--ses-error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    result = run_benchmark(
+        args.requests,
+        args.concurrency,
+        args.products,
+        StandInConfig(
+            latency_ms=args.ses_latency_ms,
+            error_rate=args.ses_error_rate,
+        ),
+        args.coalesce_window,
+    )
+    logger.info(
+        "%d updates, %d at a time: %.0f req/s, p50 %.1f ms, p95 %.1f ms",
+        result.requests,
+        result.concurrency,
+        result.requests_per_second,
+        result.p50_ms,
+        result.p95_ms,
+    )
+    logger.info(
+        "Outbox drained %.2f s after the last update, %d emails sent",
+        result.drain_seconds,
+        result.emails_sent,
+    )
@@ -0,0 +1,118 @@
+# scripts/benchmark_ses_client.py
+"""
+Compares sending product update notifications with a boto3 SES client built
+for every notification (as the service used to do) and with the process-wide
+client, against the local SES stand-in.
+
+    poetry run python scripts/benchmark_ses_client.py --notifications 200
+
+No AWS credentials are needed, nothing leaves the machine.
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import boto3
+
+from app.core.configurations import settings
+from app.domain.services.product_update_event import ProductUpdateEvent
+from app.infrastructure.service.aws_ses_service import AwsSESNotificationService
+from app.infrastructure.service.ses_client import SESClientHolder, ses_client_config
+from scripts.ses_stand_in import running_stand_in
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+@dataclass
+class BenchmarkResult:
+    strategy: str
+    notifications: int
+    mean_ms: float
+    p95_ms: float
+
+
+def _per_notification_client(region_name: str) -> object:
+    return boto3.client(
+        "ses",
+        region_name=region_name,
+        endpoint_url=settings.SES_ENDPOINT_URL,
+        config=ses_client_config(),
+    )
+
+
+def _measure(
+    strategy: str,
+    build_service: Callable[[], AwsSESNotificationService],
+    notifications: int,
+) -> BenchmarkResult:
+    event = ProductUpdateEvent(product_id="benchmark", changes={"price": {}})
+    timings = []
+    for _ in range(notifications):
+        started = time.perf_counter()
+        build_service().notify(
+            settings.SES_SENDER_EMAIL,
+            settings.SES_RECIPIENT_EMAIL,
+            event,
+        )
+        timings.append((time.perf_counter() - started) * 1000)
+    return BenchmarkResult(
+        strategy=strategy,
+        notifications=notifications,
+        mean_ms=statistics.mean(timings),
+        p95_ms=statistics.quantiles(timings, n=20)[-1],
+    )
+
+
+def run_benchmark(notifications: int) -> list[BenchmarkResult]:
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "stand-in")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "stand-in")
+    endpoint_url = settings.SES_ENDPOINT_URL
+    holder = SESClientHolder()
+    with running_stand_in() as server:
+        settings.SES_ENDPOINT_URL = server.endpoint_url
+        region = settings.SES_REGION_NAME
+        try:
+            # Built on first use, then kept for the life of the process
+            holder.get(region)
+            results = [
+                _measure(
+                    "per-notification client",
+                    lambda: AwsSESNotificationService(
+                        client=_per_notification_client(region),
+                    ),
+                    notifications,
+                ),
+                _measure(
+                    "shared client",
+                    lambda: AwsSESNotificationService(client=holder.get(region)),
+                    notifications,
+                ),
+            ]
+        finally:
+            settings.SES_ENDPOINT_URL = endpoint_url
+            holder.close()
+        if server.sent != 2 * notifications:
+            msg = f"The stand-in got {server.sent} of {2 * notifications}"
+            raise RuntimeError(msg)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--notifications", type=int, default=200)
+    args = parser.parse_args()
+
+    for result in run_benchmark(args.notifications):
+        logger.info(
+            "%-24s %d notifications: mean %.2f ms, p95 %.2f ms",
+            result.strategy,
+            result.notifications,
+            result.mean_ms,
+            result.p95_ms,
+        )
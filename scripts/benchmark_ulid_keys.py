@@ -0,0 +1,195 @@
+# scripts/benchmark_ulid_keys.py
+"""
+Compares ULID keys stored as VARCHAR(26) with the same keys stored as uuid:
+size of the indexes of products and product_views, and execution time of the
+views report join (in full and for one brand).
+
+    poetry run python scripts/benchmark_ulid_keys.py --products 200000
+
+The tables are created in two scratch schemas of DATABASE_URL, dropped at the
+end.
+"""
+
+import argparse
+import csv
+import io
+import logging
+import statistics
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Connection, Engine, create_engine, text
+
+from app.core.configurations import settings
+from app.domain.helpers.ulid_generator import generate_ulid
+from app.infrastructure.db.ulid_type import ulid_to_uuid
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+KEY_TYPES = {"varchar": "VARCHAR(26)", "uuid": "UUID"}
+BRANDS = 100
+
+REPORT = (
+    "SELECT p.id, p.name, v.view_count FROM {schema}.products p "
+    "LEFT JOIN {schema}.product_views v ON v.product_id = p.id"
+)
+BRAND_REPORT = f"{REPORT} WHERE p.brand_id = :brand_id"
+
+
+@dataclass
+class BenchmarkResult:
+    key_type: str
+    index_bytes: int
+    report_ms: float
+    brand_report_ms: float
+
+
+def _copy(
+    connection: Connection,
+    table: str,
+    rows: Iterable[Sequence[Any]],
+) -> None:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    with connection.connection.dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table} FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def _create_tables(
+    connection: Connection,
+    schema: str,
+    key_type: str,
+    data: dict[str, list[tuple]],
+) -> None:
+    encode = (lambda key: key) if key_type == "varchar" else ulid_to_uuid
+    column = KEY_TYPES[key_type]
+
+    connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+    connection.execute(text(f"CREATE SCHEMA {schema}"))
+    connection.execute(
+        text(
+            f"CREATE TABLE {schema}.products ("
+            f"id {column} PRIMARY KEY, name VARCHAR(255) NOT NULL, "
+            f"brand_id {column} NOT NULL)",
+        ),
+    )
+    connection.execute(
+        text(
+            f"CREATE TABLE {schema}.product_views ("
+            f"id {column} PRIMARY KEY, product_id {column} NOT NULL, "
+            "view_count BIGINT NOT NULL)",
+        ),
+    )
+    _copy(
+        connection,
+        f"{schema}.products",
+        ((encode(id_), name, encode(brand)) for id_, name, brand in data["products"]),
+    )
+    _copy(
+        connection,
+        f"{schema}.product_views",
+        (
+            (encode(id_), encode(product), count)
+            for id_, product, count in data["views"]
+        ),
+    )
+    connection.execute(text(f"CREATE INDEX ON {schema}.products (brand_id)"))
+    connection.execute(text(f"CREATE INDEX ON {schema}.product_views (product_id)"))
+    connection.execute(text(f"ANALYZE {schema}.products"))
+    connection.execute(text(f"ANALYZE {schema}.product_views"))
+
+
+def _execution_ms(
+    connection: Connection,
+    query: str,
+    parameters: dict[str, Any],
+    repeats: int,
+) -> float:
+    """Median server-side execution time, so decoding the rows is not counted."""
+    timings = [
+        connection.execute(
+            text(f"EXPLAIN (ANALYZE, FORMAT JSON) {query}"),
+            parameters,
+        ).scalar_one()[0]["Execution Time"]
+        for _ in range(repeats)
+    ]
+    return statistics.median(timings)
+
+
+def run_benchmark(engine: Engine, products: int, repeats: int) -> list[BenchmarkResult]:
+    brands = [generate_ulid() for _ in range(BRANDS)]
+    product_ids = [generate_ulid() for _ in range(products)]
+    data = {
+        "products": [
+            (product_id, f"Product {index}", brands[index % BRANDS])
+            for index, product_id in enumerate(product_ids)
+        ],
+        "views": [
+            (generate_ulid(), product_id, index)
+            for index, product_id in enumerate(product_ids)
+        ],
+    }
+
+    results = []
+    for key_type in KEY_TYPES:
+        schema = f"benchmark_ulid_{key_type}"
+        try:
+            with engine.begin() as connection:
+                _create_tables(connection, schema, key_type, data)
+            with engine.begin() as connection:
+                index_bytes = connection.execute(
+                    text(
+                        f"SELECT pg_indexes_size('{schema}.products') "
+                        f"+ pg_indexes_size('{schema}.product_views')",
+                    ),
+                ).scalar_one()
+                brand_id = (
+                    brands[0] if key_type == "varchar" else ulid_to_uuid(brands[0])
+                )
+                results.append(
+                    BenchmarkResult(
+                        key_type=key_type,
+                        index_bytes=index_bytes,
+                        report_ms=_execution_ms(
+                            connection,
+                            REPORT.format(schema=schema),
+                            {},
+                            repeats,
+                        ),
+                        brand_report_ms=_execution_ms(
+                            connection,
+                            BRAND_REPORT.format(schema=schema),
+                            {"brand_id": brand_id},
+                            repeats,
+                        ),
+                    ),
+                )
+        finally:
+            with engine.begin() as connection:
+                connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=200_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine(settings.DATABASE_URL)
+    logger.info("Loading %d products with their views twice...", args.products)
+    results = run_benchmark(engine, args.products, args.repeats)
+    engine.dispose()
+
+    for result in results:
+        logger.info(
+            "%-7s keys: indexes %.1f MB, views report %.1f ms, brand report %.2f ms",
+            result.key_type,
+            result.index_bytes / 1024 / 1024,
+            result.report_ms,
+            result.brand_report_ms,
+        )
@@ -23,5 +23,10 @@ if [ "${AUTO_MIGRATE:-false}" = "true" ]; then
 fi
 
 echo "[entrypoint] Starting uvicorn (production)"
-# Exec uvicorn using poetry (ensures correct venv) and without --reload
-exec poetry run uvicorn app.main:app --host 0.0.0.0 --port "${DEV_PORT:-8080}" 
\ No newline at end of file
+# Exec uvicorn using poetry (ensures correct venv) and without --reload.
+# The client IP (rate limits) is taken from X-Forwarded-For only when the
+# connection comes from FORWARDED_ALLOW_IPS (comma-separated IPs). Behind a
+# load balancer use its IPs, or "*" only if the security group lets nothing
+# else reach the port: otherwise any client could pick its own IP
+exec poetry run uvicorn app.main:app --host 0.0.0.0 --port "${DEV_PORT:-8080}" \
+  --proxy-headers --forwarded-allow-ips "${FORWARDED_ALLOW_IPS:-127.0.0.1}"
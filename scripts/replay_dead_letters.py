@@ -0,0 +1,38 @@
+# scripts/replay_dead_letters.py
+"""
+Puts the notifications in outbox_dead_letters back in the outbox, to be sent
+again by the outbox dispatcher of a running API.
+
+    poetry run python scripts/replay_dead_letters.py
+    poetry run python scripts/replay_dead_letters.py --id 01K... --id 01K...
+"""
+
+import argparse
+import logging
+
+from app.application.containers import container
+from app.domain.use_cases.notifications.replay.dead_letter_replay_use_case import (
+    DeadLetterReplayUseCase,
+)
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+def replay_dead_letters(message_ids: list[str] | None = None) -> int:
+    with container.scope():
+        return container.resolve(DeadLetterReplayUseCase).replay(message_ids)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--id",
+        dest="message_ids",
+        action="append",
+        help="Dead letter to replay (repeatable); all of them by default",
+    )
+    args = parser.parse_args()
+
+    replayed = replay_dead_letters(args.message_ids)
+    logger.info("%d notifications moved back to the outbox", replayed)
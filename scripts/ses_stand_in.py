@@ -0,0 +1,305 @@
+# scripts/ses_stand_in.py
+"""
+Local stand-in for the SES API: accepts SendEmail, SendRawEmail and
+SendBulkTemplatedEmail (query protocol, as sent by boto3) and answers with
+message IDs, without delivering anything.
+
+    poetry run python scripts/ses_stand_in.py --port 4579 --latency-ms 50
+    SES_ENDPOINT_URL=http://localhost:4579 poetry run uvicorn app.main:app
+
+Latency, injected errors and the sending quota are set with the options below
+(or SES_STAND_IN_* environment variables, as docker-compose does) and can be
+changed while it runs with `POST /_stand_in/config`. `GET /_stand_in/messages`
+returns how many emails were accepted and the last ones, `DELETE` resets them.
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs
+
+logger = logging.getLogger(__name__)
+
+SES_NAMESPACE = "http://ses.amazonaws.com/doc/2010-12-01/"
+ADMIN_PATH = "/_stand_in"
+ENVIRONMENT_PREFIX = "SES_STAND_IN_"
+# Accepted requests kept for inspection; `sent` counts all of them
+KEPT_MESSAGES = 1000
+BULK_DESTINATION_SUFFIX = ".Destination.ToAddresses.member.1"
+
+# Error code -> (HTTP status, SES error type), as SES answers them
+ERRORS = {
+    "Throttling": (400, "Sender"),
+    "MessageRejected": (400, "Sender"),
+    "MailFromDomainNotVerified": (400, "Sender"),
+    "InternalFailure": (500, "Receiver"),
+    "ServiceUnavailable": (503, "Receiver"),
+}
+
+
+@dataclass
+class StandInConfig:
+    # Added to every send, plus up to `jitter_ms` at random
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    # Fraction (0 to 1) of the sends answered with `error_code`
+    error_rate: float = 0.0
+    error_code: str = "Throttling"
+    # Emails accepted per second (0: no limit); over it, Throttling
+    max_send_rate: float = 0.0
+
+    @classmethod
+    def from_environment(cls) -> "StandInConfig":
+        values = {}
+        for field in fields(cls):
+            value = os.environ.get(f"{ENVIRONMENT_PREFIX}{field.name.upper()}")
+            if value is not None:
+                values[field.name] = field.type(value)
+        return cls(**values)
+
+
+class SESStandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        config: StandInConfig | None = None,
+    ) -> None:
+        super().__init__(address, SESStandInHandler)
+        self.config = config or StandInConfig()
+        self.lock = threading.Lock()
+        self.sent = 0
+        self.messages: deque[dict[str, str]] = deque(maxlen=KEPT_MESSAGES)
+        self._sent_at: deque[float] = deque()
+
+    @property
+    def endpoint_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def accept(self, form: dict[str, str], emails: int) -> bool:
+        """Records the emails, or returns False when they go over the quota."""
+        with self.lock:
+            if self.config.max_send_rate:
+                now = time.monotonic()
+                while self._sent_at and now - self._sent_at[0] >= 1:
+                    self._sent_at.popleft()
+                if len(self._sent_at) + emails > self.config.max_send_rate:
+                    return False
+                self._sent_at.extend([now] * emails)
+            self.sent += emails
+            self.messages.append(form)
+        return True
+
+    def reset(self) -> None:
+        with self.lock:
+            self.sent = 0
+            self.messages.clear()
+            self._sent_at.clear()
+
+
+class SESStandInHandler(BaseHTTPRequestHandler):
+    # Keep-alive, as the SES endpoint does
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, a reused
+    # connection waits for the client's delayed ACK (~40 ms) between them
+    disable_nagle_algorithm = True
+    server: SESStandInServer
+
+    def do_GET(self) -> None:
+        if self.path != f"{ADMIN_PATH}/messages":
+            self._respond_json(404, {"detail": "Not found"})
+            return
+        with self.server.lock:
+            body = {"sent": self.server.sent, "messages": list(self.server.messages)}
+        self._respond_json(200, body)
+
+    def do_DELETE(self) -> None:
+        if self.path != f"{ADMIN_PATH}/messages":
+            self._respond_json(404, {"detail": "Not found"})
+            return
+        self.server.reset()
+        self._respond_json(200, {"sent": 0, "messages": []})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length).decode()
+
+        if self.path == f"{ADMIN_PATH}/config":
+            self._configure(json.loads(body or "{}"))
+            return
+
+        form = {key: values[0] for key, values in parse_qs(body).items()}
+        action = form.get("Action")
+        if action in ("SendEmail", "SendRawEmail"):
+            self._send(action, form, emails=1)
+        elif action == "SendBulkTemplatedEmail":
+            destinations = sum(
+                1 for key in form if key.endswith(BULK_DESTINATION_SUFFIX)
+            )
+            self._send(action, form, emails=destinations)
+        else:
+            self._respond_error(
+                400,
+                "Sender",
+                "InvalidAction",
+                f"Unsupported action {action}",
+            )
+
+    def _configure(self, changes: dict[str, Any]) -> None:
+        known = {field.name: field.type for field in fields(StandInConfig)}
+        unknown = set(changes) - set(known)
+        if unknown:
+            self._respond_json(400, {"detail": f"Unknown settings {sorted(unknown)}"})
+            return
+        with self.server.lock:
+            for name, value in changes.items():
+                setattr(self.server.config, name, known[name](value))
+            config = asdict(self.server.config)
+        logger.info("SES stand-in settings changed to %s", config)
+        self._respond_json(200, config)
+
+    def _send(self, action: str, form: dict[str, str], emails: int) -> None:
+        config = self.server.config
+        delay_ms = config.latency_ms + random.uniform(0, config.jitter_ms)  # noqa: S311
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        if config.error_rate and random.random() < config.error_rate:  # noqa: S311
+            status, error_type = ERRORS.get(config.error_code, (400, "Sender"))
+            self._respond_error(
+                status,
+                error_type,
+                config.error_code,
+                "Injected by the SES stand-in",
+            )
+            return
+        if not self.server.accept(form, emails):
+            self._respond_error(
+                400,
+                "Sender",
+                "Throttling",
+                "Maximum sending rate exceeded.",
+            )
+            return
+
+        if action == "SendBulkTemplatedEmail":
+            statuses = "".join(
+                f"<member><Status>Success</Status>"
+                f"<MessageId>{uuid.uuid4()}</MessageId></member>"
+                for _ in range(emails)
+            )
+            result = f"<Status>{statuses}</Status>"
+        else:
+            result = f"<MessageId>{uuid.uuid4()}</MessageId>"
+        self._respond(
+            200,
+            f'<{action}Response xmlns="{SES_NAMESPACE}">'
+            f"<{action}Result>{result}</{action}Result>"
+            f"<ResponseMetadata><RequestId>{uuid.uuid4()}</RequestId>"
+            f"</ResponseMetadata></{action}Response>",
+        )
+
+    def _respond_error(
+        self,
+        status: int,
+        error_type: str,
+        code: str,
+        message: str,
+    ) -> None:
+        self._respond(
+            status,
+            f'<ErrorResponse xmlns="{SES_NAMESPACE}"><Error>'
+            f"<Type>{error_type}</Type><Code>{code}</Code>"
+            f"<Message>{message}</Message></Error>"
+            f"<RequestId>{uuid.uuid4()}</RequestId></ErrorResponse>",
+        )
+
+    def _respond_json(self, status: int, body: dict[str, Any]) -> None:
+        self._respond(status, json.dumps(body), "application/json")
+
+    def _respond(
+        self,
+        status: int,
+        body: str,
+        content_type: str = "text/xml",
+    ) -> None:
+        payload = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: object) -> None:
+        logger.debug(format, *args)
+
+
+@contextmanager
+def running_stand_in(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    config: StandInConfig | None = None,
+) -> Iterator[SESStandInServer]:
+    """Serves the stand-in from a background thread (port 0: any free one)."""
+    server = SESStandInServer((host, port), config)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    defaults = StandInConfig.from_environment()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--host",
+        default=os.environ.get(f"{ENVIRONMENT_PREFIX}HOST", "127.0.0.1"),
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=int(os.environ.get(f"{ENVIRONMENT_PREFIX}PORT", "4579")),
+    )
+    for field in fields(StandInConfig):
+        parser.add_argument(
+            f"--{field.name.replace('_', '-')}",
+            type=field.type,
+            default=getattr(defaults, field.name),
+        )
+    args = parser.parse_args()
+
+    server = SESStandInServer(
+        (args.host, args.port),
+        StandInConfig(
+            **{
+                field.name: getattr(args, field.name) for field in fields(StandInConfig)
+            },
+        ),
+    )
+    logger.info(
+        "SES stand-in listening on %s with %s",
+        server.endpoint_url,
+        asdict(server.config),
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,23 @@
+from app.application.api.internal.db_pool.schemas import (
+    DatabasePoolResponse,
+    DatabasePoolsResponse,
+)
+from app.domain.models.database_pool import DatabasePoolsStatus, DatabasePoolStatus
+
+
+class DatabasePoolResponseMapper:
+
+    @staticmethod
+    def map(status: DatabasePoolsStatus) -> DatabasePoolsResponse:
+        return DatabasePoolsResponse(
+            process_id=status.process_id,
+            pools=[DatabasePoolResponseMapper._map_pool(pool) for pool in status.pools],
+        )
+
+    @staticmethod
+    def _map_pool(pool: DatabasePoolStatus) -> DatabasePoolResponse:
+        attempts = pool.checkouts + pool.timeouts
+        return DatabasePoolResponse(
+            **pool.model_dump(),
+            wait_seconds_avg=pool.wait_seconds_total / attempts if attempts else 0.0,
+        )
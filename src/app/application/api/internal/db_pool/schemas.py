@@ -0,0 +1,77 @@
+from pydantic import BaseModel, Field
+
+
+class DatabasePoolResponse(BaseModel):
+    engine: str = Field(
+        ...,
+        description="Engine of the pool: primary, replica-N (DATABASE_READ_URL), "
+        "async or async-replica-N (asyncpg, once used)",
+        example="primary",
+    )
+    pool_class: str = Field(
+        ...,
+        description="SQLAlchemy pool implementation",
+        example="InstrumentedQueuePool",
+    )
+    size: int | None = Field(
+        ...,
+        description="Connections kept open by the pool",
+        example=5,
+    )
+    max_overflow: int | None = Field(
+        ...,
+        description="Connections that can be opened above `size`",
+        example=10,
+    )
+    checked_in: int | None = Field(
+        ...,
+        description="Idle connections in the pool",
+        example=3,
+    )
+    checked_out: int | None = Field(
+        ...,
+        description="Connections currently in use",
+        example=2,
+    )
+    overflow: int | None = Field(
+        ...,
+        description="Connections currently open above `size`",
+        example=0,
+    )
+    checkouts: int = Field(
+        ...,
+        description="Connections handed out since the worker started",
+        example=1024,
+    )
+    timeouts: int = Field(
+        ...,
+        description="Checkouts that gave up after waiting `pool_timeout`",
+        example=0,
+    )
+    wait_seconds_total: float = Field(
+        ...,
+        description="Time spent waiting for a connection, in seconds",
+        example=0.42,
+    )
+    wait_seconds_avg: float = Field(
+        ...,
+        description="Average wait per checkout, in seconds",
+        example=0.0004,
+    )
+    wait_seconds_max: float = Field(
+        ...,
+        description="Longest wait for a connection, in seconds",
+        example=0.05,
+    )
+
+
+class DatabasePoolsResponse(BaseModel):
+    process_id: int = Field(
+        ...,
+        description="Worker process that answered. Every worker has its own pools",
+        example=4242,
+    )
+    pools: list[DatabasePoolResponse] = Field(
+        ...,
+        description="One pool per database engine of the worker",
+    )
@@ -0,0 +1,76 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+
+from app.application.api.internal.db_pool.mappers import DatabasePoolResponseMapper
+from app.application.api.internal.db_pool.schemas import DatabasePoolsResponse
+from app.application.api.internal.slow_queries.mappers import (
+    SlowQueriesResponseMapper,
+)
+from app.application.api.internal.slow_queries.schemas import SlowQueriesResponse
+from app.application.containers import container
+from app.core.role_checker import RoleChecker
+from app.domain.services.database_pool_monitor import DatabasePoolMonitor
+from app.domain.services.slow_query_log import SlowQueryLog
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["Internal"],
+)
+
+
+@router.get(
+    "/db-pool",
+    dependencies=[Depends(RoleChecker(["SUPERADMIN"]))],
+    summary="Database connection pool metrics",
+    description=(
+        "Returns the state of the connection pools of the worker process that "
+        "handles the request (primary, read replicas and asyncpg engines), and "
+        "how long checkouts waited for a connection. Accessible by only "
+        "superadmins."
+    ),
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unauthorized"},
+                },
+            },
+        },
+    },
+)
+def database_pool(
+    monitor: Annotated[
+        DatabasePoolMonitor,
+        Depends(lambda: container.resolve(DatabasePoolMonitor)),
+    ],
+) -> DatabasePoolsResponse:
+    return DatabasePoolResponseMapper.map(monitor.status())
+
+
+@router.get(
+    "/slow-queries",
+    dependencies=[Depends(RoleChecker(["SUPERADMIN"]))],
+    summary="Slow queries with their plans",
+    description=(
+        "Returns the last statements that exceeded `SLOW_QUERY_THRESHOLD_MS` in "
+        "the worker process that handles the request, with their EXPLAIN plan. "
+        "Empty while the slow query log is off. Accessible by only superadmins."
+    ),
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unauthorized"},
+                },
+            },
+        },
+    },
+)
+def slow_queries(
+    slow_query_log: Annotated[
+        SlowQueryLog,
+        Depends(lambda: container.resolve(SlowQueryLog)),
+    ],
+) -> SlowQueriesResponse:
+    return SlowQueriesResponseMapper.map(slow_query_log.recent())
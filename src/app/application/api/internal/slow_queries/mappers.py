@@ -0,0 +1,17 @@
+from app.application.api.internal.slow_queries.schemas import (
+    SlowQueriesResponse,
+    SlowQueryResponse,
+)
+from app.domain.models.slow_query import SlowQuery
+
+
+class SlowQueriesResponseMapper:
+
+    @staticmethod
+    def map(slow_queries: list[SlowQuery]) -> SlowQueriesResponse:
+        return SlowQueriesResponse(
+            slow_queries=[
+                SlowQueryResponse(**slow_query.model_dump())
+                for slow_query in slow_queries
+            ],
+        )
@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class SlowQueryResponse(BaseModel):
+    statement: str = Field(
+        ...,
+        description="Statement with its parameters as placeholders",
+        example="SELECT products.id, products.name FROM products "
+        "WHERE products.brand_id = %(brand_id_1)s",
+    )
+    parameters_fingerprint: str = Field(
+        ...,
+        description="Hash of the parameter values, equal for equal values",
+        example="9f86d081884c7d65",
+    )
+    duration_ms: float = Field(
+        ...,
+        description="Time the statement took, in milliseconds",
+        example=812.4,
+    )
+    captured_at: datetime = Field(
+        ...,
+        description="When the plan was captured",
+        example="2026-10-19T12:00:00Z",
+    )
+    plan: list[dict[str, Any]] = Field(
+        ...,
+        description="Output of EXPLAIN (ANALYZE off, FORMAT JSON)",
+        example=[{"Plan": {"Node Type": "Seq Scan", "Relation Name": "products"}}],
+    )
+
+
+class SlowQueriesResponse(BaseModel):
+    slow_queries: list[SlowQueryResponse] = Field(
+        ...,
+        description="Slow queries of the worker process that answered, newest first",
+    )
@@ -0,0 +1,27 @@
+from app.application.api.products.bulk_import.schemas import (
+    ProductImportErrorResponse,
+    ProductImportResponse,
+)
+from app.domain.models.product_import import ProductImportReport
+
+
+class ProductImportResponseMapper:
+
+    @staticmethod
+    def map(report: ProductImportReport) -> ProductImportResponse:
+        return ProductImportResponse(
+            job_id=report.job.id,
+            status=report.job.status.value,
+            rows_processed=report.job.rows_processed,
+            imported=report.job.imported,
+            rejected=report.job.rejected,
+            errors=[
+                ProductImportErrorResponse(
+                    row=error.row,
+                    type=error.code,
+                    loc=error.location,
+                    msg=error.message,
+                )
+                for error in report.errors
+            ],
+        )
@@ -0,0 +1,140 @@
+import codecs
+import csv
+from collections.abc import Iterable, Iterator
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+
+from app.application.api.products.create.mappers import ProductCreateInputMapper
+from app.application.api.products.create.schemas import ProductCreateRequest
+from app.domain.models.product_import import ProductImportError
+from app.domain.use_cases.products.bulk_import.product_import_input import (
+    ProductImportRecord,
+    ProductImportRow,
+)
+
+CSV_MEDIA_TYPE = "text/csv"
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson")
+
+
+class ProductImportParser:
+    """
+    Turns the lines of an uploaded CSV (with header) or NDJSON file into
+    import records, applying the same field validations as POST /products.
+    Everything is lazy, so memory stays bounded by the longest record.
+    """
+
+    @staticmethod
+    def media_type(content_type: str | None) -> str | None:
+        media_type = (content_type or "").split(";")[0].strip().lower()
+        if media_type == CSV_MEDIA_TYPE or media_type in NDJSON_MEDIA_TYPES:
+            return media_type
+        return None
+
+    @staticmethod
+    def lines(chunks: Iterable[bytes], max_line_length: int) -> Iterator[str]:
+        """Splits a stream of UTF-8 byte chunks into lines, keeping line endings."""
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        # Pieces of the line not ended yet: only the new text of each chunk is
+        # split, so long lines spread over many chunks are not re-scanned
+        pending: list[str] = []
+        pending_length = 0
+        try:
+            for chunk in chunks:
+                *ends, tail = decoder.decode(chunk).split("\n")
+                for end in ends:
+                    ProductImportParser._check_length(
+                        pending_length + len(end),
+                        max_line_length,
+                    )
+                    pending.append(end)
+                    yield f"{''.join(pending)}\n"
+                    pending.clear()
+                    pending_length = 0
+                pending.append(tail)
+                pending_length += len(tail)
+                ProductImportParser._check_length(pending_length, max_line_length)
+            pending.append(decoder.decode(b"", final=True))
+        except UnicodeDecodeError as err:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="The file must be UTF-8 encoded",
+            ) from err
+
+        last = "".join(pending)
+        ProductImportParser._check_length(len(last), max_line_length)
+        if last:
+            yield last
+
+    @staticmethod
+    def parse(
+        media_type: str,
+        lines: Iterable[str],
+        skip_records: int = 0,
+    ) -> Iterator[ProductImportRecord]:
+        """
+        Yields one record per product of the file. The first `skip_records`
+        records (already imported by a previous attempt) are not validated.
+        """
+        records = (
+            ProductImportParser._csv_records(lines)
+            if media_type == CSV_MEDIA_TYPE
+            else ProductImportParser._ndjson_records(lines)
+        )
+        for index, (line_number, record) in enumerate(records):
+            if index < skip_records:
+                continue
+
+            try:
+                request = (
+                    ProductCreateRequest.model_validate_json(record)
+                    if isinstance(record, str)
+                    else ProductCreateRequest.model_validate(record)
+                )
+            except ValidationError as exc:
+                yield [
+                    ProductImportError(
+                        row=line_number,
+                        code=error["type"],
+                        location=list(error["loc"]),
+                        message=error["msg"],
+                    )
+                    for error in exc.errors()
+                ]
+                continue
+
+            yield ProductImportRow(
+                row=line_number,
+                product=ProductCreateInputMapper.map(request),
+            )
+
+    @staticmethod
+    def _csv_records(lines: Iterable[str]) -> Iterator[tuple[int, dict]]:
+        reader = csv.DictReader(lines)
+        try:
+            for record in reader:
+                # Missing trailing columns are reported as missing fields
+                yield reader.line_num, {
+                    field: value
+                    for field, value in record.items()
+                    if field is not None and value is not None
+                }
+        except csv.Error as err:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Malformed CSV at line {reader.line_num}: {err}",
+            ) from err
+
+    @staticmethod
+    def _ndjson_records(lines: Iterable[str]) -> Iterator[tuple[int, str]]:
+        for line_number, line in enumerate(lines, start=1):
+            if line.strip():
+                yield line_number, line
+
+    @staticmethod
+    def _check_length(length: int, max_line_length: int) -> None:
+        if length > max_line_length:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Lines can not be longer than {max_line_length} characters",
+            )
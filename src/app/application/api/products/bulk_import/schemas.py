@@ -0,0 +1,59 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class ProductImportErrorResponse(BaseModel):
+    row: int = Field(
+        ...,
+        description="Line of the uploaded file where the product was found",
+        example=3,
+    )
+    type: str = Field(
+        ...,
+        description="Error type",
+        example="ALREADY_EXIST_PRODUCT_SKU",
+    )
+    loc: list[Any] = Field(
+        ...,
+        description="Error locations",
+        example=["sku"],
+    )
+    msg: str = Field(
+        ...,
+        description="Error message",
+        example="Product with SKU 'SKU-12345' already exists",
+    )
+
+
+class ProductImportResponse(BaseModel):
+    job_id: str = Field(
+        ...,
+        description="Import job identifier, used to resume an interrupted import",
+        example="01K4EH5T4YQERHJ99RM1SWYV99",
+    )
+    status: str = Field(
+        ...,
+        description="Import job status",
+        example="COMPLETED",
+    )
+    rows_processed: int = Field(
+        ...,
+        description="Number of rows of the file processed by the job",
+        example=1000,
+    )
+    imported: int = Field(
+        ...,
+        description="Number of products created by the job",
+        example=998,
+    )
+    rejected: int = Field(
+        ...,
+        description="Number of rows rejected by the job",
+        example=2,
+    )
+    errors: list[ProductImportErrorResponse] = Field(
+        ...,
+        description="Rows rejected by this request, with the reason. "
+        "The list is truncated to the first errors",
+    )
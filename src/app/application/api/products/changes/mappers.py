@@ -0,0 +1,68 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from app.application.api.products.changes.schemas import (
+    ProductChangeResponse,
+    ProductChangesResponse,
+)
+from app.application.api.products.detail.mappers import ProductDetailResponseMapper
+from app.domain.enums.code_enum import ErrorCodeEnum
+from app.domain.exceptions.data_validation_exception import DataValidationError
+from app.domain.models.product_change import ProductChangeCursor, ProductChangePage
+
+
+class ProductChangeCursorMapper:
+    """Cursors are opaque to clients: base64 of the last change seen."""
+
+    @staticmethod
+    def encode(cursor: ProductChangeCursor) -> str:
+        payload = json.dumps(
+            {"at": cursor.changed_at.isoformat(), "id": cursor.product_id},
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode(value: str) -> ProductChangeCursor:
+        try:
+            payload = json.loads(
+                base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)),
+            )
+            return ProductChangeCursor(
+                changed_at=datetime.fromisoformat(payload["at"]),
+                product_id=payload["id"],
+            )
+        except (binascii.Error, ValueError, TypeError, KeyError) as err:
+            raise DataValidationError(
+                code=ErrorCodeEnum.INVALID_CURSOR,
+                location=["since"],
+                message="The cursor is not valid",
+            ) from err
+
+
+class ProductChangesResponseMapper:
+
+    @staticmethod
+    def map(page: ProductChangePage) -> ProductChangesResponse:
+        return ProductChangesResponse(
+            changes=[
+                ProductChangeResponse(
+                    change_type=change.change_type.value,
+                    product_id=change.product_id,
+                    changed_at=change.changed_at,
+                    product=(
+                        ProductDetailResponseMapper.map(change.product)
+                        if change.product
+                        else None
+                    ),
+                )
+                for change in page.changes
+            ],
+            next_cursor=(
+                ProductChangeCursorMapper.encode(page.next_cursor)
+                if page.next_cursor
+                else None
+            ),
+            has_more=page.has_more,
+        )
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from app.application.api.products.detail.schemas import ProductDetailResponse
+
+
+class ProductChangeResponse(BaseModel):
+    change_type: str = Field(
+        ...,
+        description="UPSERT when the product was created or updated, "
+        "DELETE when it was deleted",
+        example="UPSERT",
+    )
+    product_id: str = Field(
+        ...,
+        description="Product identifier in ULID format",
+        example="01K4EH5T4YQERHJ99RM1SWYV99",
+    )
+    changed_at: datetime = Field(
+        ...,
+        description="Date of the change",
+    )
+    product: ProductDetailResponse | None = Field(
+        ...,
+        description="Current product, null for deleted products",
+    )
+
+
+class ProductChangesResponse(BaseModel):
+    changes: list[ProductChangeResponse] = Field(
+        ...,
+        description="Changes in the order they happened",
+    )
+    next_cursor: str | None = Field(
+        ...,
+        description="Value of `since` for the next request, null if the catalog "
+        "has no changes yet",
+        example="eyJjIjogIjIwMjYtMTAtMTlUMTA6MDA6MDArMDA6MDAiLCAiaWQiOiAiMDEifQ",
+    )
+    has_more: bool = Field(
+        ...,
+        description="Whether more changes can be fetched right away with "
+        "`next_cursor`",
+        example=False,
+    )
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ProductExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+    # One JSON object per batch with a list of values per column
+    COLUMNAR = "columnar"
@@ -0,0 +1,59 @@
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+
+from app.application.api.products.export.schemas import ProductExportFormat
+from app.domain.models.product_export import ProductExportRow
+
+EXPORT_MEDIA_TYPES = {
+    ProductExportFormat.CSV: "text/csv",
+    ProductExportFormat.NDJSON: "application/x-ndjson",
+    ProductExportFormat.COLUMNAR: "application/x-ndjson",
+}
+
+
+class ProductExportWriter:
+    """
+    Serializes batches of exported rows, producing one chunk of the response
+    per batch so the whole catalog is never held in memory.
+    """
+
+    @staticmethod
+    def write(
+        export_format: ProductExportFormat,
+        batches: Iterable[list[ProductExportRow]],
+    ) -> Iterator[str]:
+        if export_format == ProductExportFormat.CSV:
+            return ProductExportWriter._csv(batches)
+        if export_format == ProductExportFormat.NDJSON:
+            return ProductExportWriter._ndjson(batches)
+        return ProductExportWriter._columnar(batches)
+
+    @staticmethod
+    def _csv(batches: Iterable[list[ProductExportRow]]) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(ProductExportRow._fields)
+        for batch in batches:
+            writer.writerows(batch)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+        if buffer.tell():
+            # Header of an empty catalog
+            yield buffer.getvalue()
+
+    @staticmethod
+    def _ndjson(batches: Iterable[list[ProductExportRow]]) -> Iterator[str]:
+        for batch in batches:
+            yield "".join(
+                json.dumps(row._asdict(), default=str) + "\n" for row in batch
+            )
+
+    @staticmethod
+    def _columnar(batches: Iterable[list[ProductExportRow]]) -> Iterator[str]:
+        for batch in batches:
+            columns = dict(zip(ProductExportRow._fields, zip(*batch), strict=True))
+            yield json.dumps(columns, default=str) + "\n"
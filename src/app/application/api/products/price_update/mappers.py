@@ -0,0 +1,29 @@
+from app.application.api.products.price_update.schemas import (
+    ProductPriceUpdateRequest,
+    ProductPriceUpdateResponse,
+)
+from app.domain.models.product_price_update import ProductPriceUpdateResult
+from app.domain.use_cases.products.price_update.product_price_update_input import (
+    ProductPriceUpdateInput,
+)
+
+
+class ProductPriceUpdateInputMapper:
+
+    @staticmethod
+    def map(request: ProductPriceUpdateRequest) -> list[ProductPriceUpdateInput]:
+        return [
+            ProductPriceUpdateInput(sku=item.sku, price=item.price)
+            for item in request.prices
+        ]
+
+
+class ProductPriceUpdateResponseMapper:
+
+    @staticmethod
+    def map(result: ProductPriceUpdateResult) -> ProductPriceUpdateResponse:
+        return ProductPriceUpdateResponse(
+            updated=len(result.changes),
+            unchanged=result.unchanged,
+            not_found_skus=result.not_found_skus,
+        )
@@ -0,0 +1,48 @@
+from decimal import Decimal
+
+from pydantic import BaseModel, Field
+
+from app.core.configurations import settings
+
+
+class ProductPriceItemRequest(BaseModel):
+    sku: str = Field(
+        ...,
+        description="Unique product code (SKU)",
+        min_length=1,
+        max_length=64,
+        example="SKU-12345",
+    )
+    price: Decimal = Field(
+        ...,
+        description="Product's new price",
+        ge=0,
+        example=49.99,
+    )
+
+
+class ProductPriceUpdateRequest(BaseModel):
+    prices: list[ProductPriceItemRequest] = Field(
+        ...,
+        description="New prices by SKU. Each SKU can appear only once",
+        min_length=1,
+        max_length=settings.PRICE_UPDATE_MAX_ITEMS,
+    )
+
+
+class ProductPriceUpdateResponse(BaseModel):
+    updated: int = Field(
+        ...,
+        description="Number of products whose price changed",
+        example=998,
+    )
+    unchanged: int = Field(
+        ...,
+        description="Number of products that already had the requested price",
+        example=1,
+    )
+    not_found_skus: list[str] = Field(
+        ...,
+        description="Requested SKUs that do not belong to any product",
+        example=["SKU-UNKNOWN"],
+    )
@@ -1,32 +1,93 @@
-from typing import Annotated
+import inspect
+from collections.abc import Callable, Iterator
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, Path, Query, status
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
+from app.application.api.products.bulk_import.mappers import (
+    ProductImportResponseMapper,
+)
+from app.application.api.products.bulk_import.parsers import (
+    CSV_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPES,
+    ProductImportParser,
+)
+from app.application.api.products.bulk_import.schemas import ProductImportResponse
+from app.application.api.products.changes.mappers import (
+    ProductChangeCursorMapper,
+    ProductChangesResponseMapper,
+)
+from app.application.api.products.changes.schemas import ProductChangesResponse
 from app.application.api.products.create.mappers import ProductCreateInputMapper
 from app.application.api.products.create.schemas import ProductCreateRequest
 from app.application.api.products.detail.mappers import ProductDetailResponseMapper
 from app.application.api.products.detail.schemas import ProductDetailResponse
 from app.application.api.products.edit.mappers import ProductUpdateInputMapper
 from app.application.api.products.edit.schemas import ProductUpdateRequest
+from app.application.api.products.export.schemas import ProductExportFormat
+from app.application.api.products.export.writers import (
+    EXPORT_MEDIA_TYPES,
+    ProductExportWriter,
+)
 from app.application.api.products.list.schemas import (
     ProductListItemResponse,
     ProductListResponse,
 )
+from app.application.api.products.price_update.mappers import (
+    ProductPriceUpdateInputMapper,
+    ProductPriceUpdateResponseMapper,
+)
+from app.application.api.products.price_update.schemas import (
+    ProductPriceUpdateRequest,
+    ProductPriceUpdateResponse,
+)
 from app.application.containers import container
+from app.core.configurations import settings
 from app.core.role_checker import RoleChecker
 from app.domain.enums.role_enum import UserRole
+from app.domain.models.product_import import ProductImportReport
+from app.domain.use_cases.products.bulk_import.product_import_use_case import (
+    ProductImportUseCase,
+)
+from app.domain.use_cases.products.changes.product_changes_use_case import (
+    ProductChangesUseCase,
+)
+from app.domain.use_cases.products.create.async_product_create_use_case import (
+    AsyncProductCreateUseCase,
+)
 from app.domain.use_cases.products.create.product_create_use_case import (
     ProductCreateUseCase,
 )
+from app.domain.use_cases.products.detail.async_product_detail_use_case import (
+    AsyncProductDetailUseCase,
+)
 from app.domain.use_cases.products.detail.product_detail_use_case import (
     ProductDetailUseCase,
 )
+from app.domain.use_cases.products.edit.async_product_update_use_case import (
+    AsyncProductUpdateUseCase,
+)
 from app.domain.use_cases.products.edit.product_update_use_case import (
     ProductUpdateUseCase,
 )
+from app.domain.use_cases.products.export.product_export_use_case import (
+    ProductExportUseCase,
+)
+from app.domain.use_cases.products.price_update.product_price_update_use_case import (
+    ProductPriceUpdateUseCase,
+)
+from app.domain.use_cases.products.remove.async_product_remove_use_case import (
+    AsyncProductRemoveUseCase,
+)
 from app.domain.use_cases.products.remove.product_remove_use_case import (
     ProductRemoveUseCase,
 )
+from app.domain.use_cases.products.view_report.async_product_view_report_use_case import (  # noqa: E501
+    AsyncProductViewReportUseCase,
+)
 from app.domain.use_cases.products.view_report.product_view_report_use_case import (
     ProductViewReportUseCase,
 )
@@ -37,6 +98,24 @@ router = APIRouter(
 )
 
 
+def _use_case(sync_use_case: type, async_use_case: type) -> Callable[[], Any]:
+    """Dependency resolving the async use case when DATABASE_ASYNC is enabled."""
+
+    def resolve() -> Any:
+        return container.resolve(
+            async_use_case if settings.DATABASE_ASYNC else sync_use_case,
+        )
+
+    return resolve
+
+
+async def _run(method: Callable[..., Any], /, **kwargs: Any) -> Any:
+    """Awaits async use cases; sync ones are sent to the threadpool."""
+    if inspect.iscoroutinefunction(method):
+        return await method(**kwargs)
+    return await run_in_threadpool(method, **kwargs)
+
+
 @router.post(
     "",
     dependencies=[Depends(RoleChecker(["ADMIN"]))],
@@ -72,20 +151,187 @@ router = APIRouter(
         },
     },
 )
-def create_product(
+async def create_product(
     request: ProductCreateRequest,
     use_case: Annotated[
-        ProductCreateUseCase,
-        Depends(lambda: container.resolve(ProductCreateUseCase)),
+        ProductCreateUseCase | AsyncProductCreateUseCase,
+        Depends(_use_case(ProductCreateUseCase, AsyncProductCreateUseCase)),
     ],
 ) -> ProductDetailResponse:
-    product = use_case.create_product(
+    product = await _run(
+        use_case.create_product,
         create_input=ProductCreateInputMapper.map(request),
     )
 
     return ProductDetailResponseMapper.map(product)
 
 
+@router.post(
+    ":import",
+    dependencies=[Depends(RoleChecker(["ADMIN"]))],
+    summary="Import products in bulk",
+    description=(
+        "Creates the products of a CSV file (header `brand_id,sku,name,price`) or "
+        "an NDJSON file (one product per line). Every row is validated like "
+        "`POST /products`; invalid rows are skipped and reported with their line. "
+        "The body is processed as a stream and committed in chunks, so an "
+        "interrupted import can be resumed by sending the same file again with "
+        "the returned `job_id`. Accessible by only admins."
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                media_type: {"schema": {"type": "string", "format": "binary"}}
+                for media_type in (CSV_MEDIA_TYPE, *NDJSON_MEDIA_TYPES)
+            },
+        },
+    },
+    responses={
+        status.HTTP_403_FORBIDDEN: {
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "You do not have permission to perform this action",
+                    },
+                },
+            },
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "No import job found with ID: "
+                        "01K4EH5T4YQERHJ99RM1SWYV99.",
+                    },
+                },
+            },
+        },
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Unsupported media type 'application/json'",
+                    },
+                },
+            },
+        },
+    },
+)
+async def import_products(
+    request: Request,
+    use_case: Annotated[
+        ProductImportUseCase,
+        Depends(lambda: container.resolve(ProductImportUseCase)),
+    ],
+    job_id: Annotated[
+        str | None,
+        Query(
+            title="Import job ID",
+            description="Job of a previous interrupted import to resume",
+            examples=["01K4EH5T4YQERHJ99RM1SWYV99"],
+        ),
+    ] = None,
+) -> ProductImportResponse:
+    content_type = request.headers.get("content-type")
+    media_type = ProductImportParser.media_type(content_type)
+    if media_type is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Unsupported media type '{content_type}'",
+        )
+
+    report = await run_in_threadpool(
+        _import_products,
+        use_case,
+        media_type,
+        request,
+        job_id,
+    )
+    return ProductImportResponseMapper.map(report)
+
+
+def _import_products(
+    use_case: ProductImportUseCase,
+    media_type: str,
+    request: Request,
+    job_id: str | None,
+) -> ProductImportReport:
+    job = use_case.start_job(job_id)
+    lines = ProductImportParser.lines(
+        _iter_request_body(request),
+        max_line_length=settings.IMPORT_MAX_LINE_LENGTH,
+    )
+    return use_case.import_records(
+        job,
+        ProductImportParser.parse(media_type, lines, skip_records=job.rows_processed),
+        chunk_size=settings.IMPORT_CHUNK_SIZE,
+        max_reported_errors=settings.IMPORT_MAX_REPORTED_ERRORS,
+    )
+
+
+def _iter_request_body(request: Request) -> Iterator[bytes]:
+    """Reads the request body chunk by chunk from a worker thread."""
+    stream = request.stream()
+
+    async def next_chunk() -> bytes | None:
+        try:
+            return await stream.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    while (chunk := anyio.from_thread.run(next_chunk)) is not None:
+        yield chunk
+
+
+@router.patch(
+    "/prices",
+    dependencies=[Depends(RoleChecker(["ADMIN"]))],
+    summary="Update product prices in bulk",
+    description=(
+        "Updates the price of many products, identified by SKU, at once. "
+        "A single notification summarizing the changes is sent for the whole "
+        "batch. Unknown SKUs are returned in `not_found_skus`. "
+        "Accessible by only admins."
+    ),
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": [
+                            {
+                                "loc": ["prices", 1, "sku"],
+                                "msg": "Product with SKU '123' is repeated",
+                                "type": "REPEATED_PRODUCT_SKU",
+                            },
+                        ],
+                    },
+                },
+            },
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "You do not have permission to perform this action",
+                    },
+                },
+            },
+        },
+    },
+)
+def update_prices(
+    request: ProductPriceUpdateRequest,
+    use_case: Annotated[
+        ProductPriceUpdateUseCase,
+        Depends(lambda: container.resolve(ProductPriceUpdateUseCase)),
+    ],
+) -> ProductPriceUpdateResponse:
+    result = use_case.update_prices(ProductPriceUpdateInputMapper.map(request))
+    return ProductPriceUpdateResponseMapper.map(result)
+
+
 @router.get(
     "/views",
     dependencies=[Depends(RoleChecker(["ADMIN", "ANONYMOUS"]))],
@@ -104,10 +350,10 @@ def create_product(
         },
     },
 )
-def views_report(
+async def views_report(
     use_case: Annotated[
-        ProductViewReportUseCase,
-        Depends(lambda: container.resolve(ProductViewReportUseCase)),
+        ProductViewReportUseCase | AsyncProductViewReportUseCase,
+        Depends(_use_case(ProductViewReportUseCase, AsyncProductViewReportUseCase)),
     ],
     brand_id: Annotated[
         str | None,
@@ -118,7 +364,7 @@ def views_report(
         ),
     ] = None,
 ) -> ProductListResponse:
-    product_views = use_case.view_report(brand_id=brand_id)
+    product_views = await _run(use_case.view_report, brand_id=brand_id)
     return ProductListResponse(
         products=[
             ProductListItemResponse(
@@ -131,13 +377,131 @@ def views_report(
     )
 
 
+@router.get(
+    "/export",
+    dependencies=[Depends(RoleChecker(["ADMIN"]))],
+    summary="Export the catalog",
+    description=(
+        "Streams every product with its brand as CSV, NDJSON (one product per "
+        "line) or columnar JSON (one object per batch of products, with the "
+        "list of values of each column). Accessible by only admins."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {
+                "text/csv": {"schema": {"type": "string"}},
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "You do not have permission to perform this action",
+                    },
+                },
+            },
+        },
+    },
+)
+def export_products(
+    use_case: Annotated[
+        ProductExportUseCase,
+        Depends(lambda: container.resolve(ProductExportUseCase)),
+    ],
+    export_format: Annotated[
+        ProductExportFormat,
+        Query(
+            alias="format",
+            title="Export format",
+            description="Format of the exported file",
+        ),
+    ] = ProductExportFormat.CSV,
+) -> StreamingResponse:
+    batches = use_case.export_products(batch_size=settings.EXPORT_BATCH_SIZE)
+    return StreamingResponse(
+        ProductExportWriter.write(export_format, batches),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": "attachment; "
+            f'filename="products.{export_format.value}"',
+        },
+    )
+
+
+@router.get(
+    "/changes",
+    dependencies=[Depends(RoleChecker(["ADMIN"]))],
+    summary="Changes of products",
+    description=(
+        "Returns the products created, updated or deleted after the `since` "
+        "cursor, oldest first. Start without cursor and keep sending the "
+        "returned `next_cursor` to stay in sync. Changes of the last seconds "
+        "are only returned once they settle. Accessible by only admins."
+    ),
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": [
+                            {
+                                "loc": ["since"],
+                                "msg": "The cursor is not valid",
+                                "type": "INVALID_CURSOR",
+                            },
+                        ],
+                    },
+                },
+            },
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "You do not have permission to perform this action",
+                    },
+                },
+            },
+        },
+    },
+)
+def list_changes(
+    use_case: Annotated[
+        ProductChangesUseCase,
+        Depends(lambda: container.resolve(ProductChangesUseCase)),
+    ],
+    since: Annotated[
+        str | None,
+        Query(
+            title="Cursor",
+            description="`next_cursor` of the previous response",
+        ),
+    ] = None,
+    limit: Annotated[
+        int,
+        Query(
+            title="Limit",
+            description="Maximum number of changes to return",
+            ge=1,
+            le=settings.PRODUCT_CHANGES_MAX_LIMIT,
+        ),
+    ] = 100,
+) -> ProductChangesResponse:
+    page = use_case.list_changes(
+        since=ProductChangeCursorMapper.decode(since) if since else None,
+        limit=limit,
+    )
+    return ProductChangesResponseMapper.map(page)
+
+
 @router.get(
     "/{product_id}",
-    dependencies=[Depends(RoleChecker(["ADMIN", "ANONYMOUS"]))],
     summary="Get product details",
     description=(
         "Retrieves the details of a product by its ID. "
-        "Accessible by anonymous users or admins."
+        "Accessible by anonymous users (guest tokens included) or admins."
     ),
     responses={
         status.HTTP_403_FORBIDDEN: {
@@ -160,10 +524,10 @@ def views_report(
         },
     },
 )
-def get_product(
+async def get_product(
     use_case: Annotated[
-        ProductDetailUseCase,
-        Depends(lambda: container.resolve(ProductDetailUseCase)),
+        ProductDetailUseCase | AsyncProductDetailUseCase,
+        Depends(_use_case(ProductDetailUseCase, AsyncProductDetailUseCase)),
     ],
     product_id: Annotated[
         str,
@@ -173,10 +537,17 @@ def get_product(
             examples=["01K4EH5T4YQERHJ99RM1SWYV99"],
         ),
     ],
-    user: Annotated[dict, Depends(RoleChecker(["ADMIN", "ANONYMOUS"]))],
+    user: Annotated[
+        dict,
+        Depends(RoleChecker(["ADMIN", "ANONYMOUS"], allow_guests=True)),
+    ],
 ) -> ProductDetailResponse:
     increment_view = user.get("role") == UserRole.ANONYMOUS.value
-    product = use_case.get_product(product_id=product_id, increment_view=increment_view)
+    product = await _run(
+        use_case.get_product,
+        product_id=product_id,
+        increment_view=increment_view,
+    )
     return ProductDetailResponseMapper.map(product)
 
 
@@ -205,10 +576,10 @@ def get_product(
         },
     },
 )
-def update_product(
+async def update_product(
     use_case: Annotated[
-        ProductUpdateUseCase,
-        Depends(lambda: container.resolve(ProductUpdateUseCase)),
+        ProductUpdateUseCase | AsyncProductUpdateUseCase,
+        Depends(_use_case(ProductUpdateUseCase, AsyncProductUpdateUseCase)),
     ],
     request: ProductUpdateRequest,
     product_id: Annotated[
@@ -220,7 +591,8 @@ def update_product(
         ),
     ],
 ) -> ProductDetailResponse:
-    updated_product = use_case.update_product(
+    updated_product = await _run(
+        use_case.update_product,
         product_id=product_id,
         update_input=ProductUpdateInputMapper.map(request),
     )
@@ -245,10 +617,10 @@ def update_product(
         },
     },
 )
-def delete_product(
+async def delete_product(
     use_case: Annotated[
-        ProductRemoveUseCase,
-        Depends(lambda: container.resolve(ProductRemoveUseCase)),
+        ProductRemoveUseCase | AsyncProductRemoveUseCase,
+        Depends(_use_case(ProductRemoveUseCase, AsyncProductRemoveUseCase)),
     ],
     product_id: Annotated[
         str,
@@ -259,4 +631,4 @@ def delete_product(
         ),
     ],
 ) -> None:
-    use_case.remove_product(product_id)
+    await _run(use_case.remove_product, product_id=product_id)
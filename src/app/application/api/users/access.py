@@ -7,6 +7,9 @@ from app.application.api.users.login.schemas import TokenResponse, UserLoginRequ
 from app.application.api.users.sig_up.mappers import SigUpInputMapper
 from app.application.api.users.sig_up.schemas import SigUpRequest
 from app.application.containers import container
+from app.domain.use_cases.users.guest_token.guest_token_use_case import (
+    GuestTokenUseCase,
+)
 from app.domain.use_cases.users.login.login_use_case import LoginUseCase
 from app.domain.use_cases.users.sig_up.sig_up_use_case import SigUpUseCase
 
@@ -31,22 +34,57 @@ router = APIRouter(
                 },
             },
         },
+        status.HTTP_429_TOO_MANY_REQUESTS: {
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Too many attempts, try again later"},
+                },
+            },
+        },
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many password checks in progress, "
+                        "try again later",
+                    },
+                },
+            },
+        },
     },
 )
-def login(
+async def login(
     request: UserLoginRequest,
     use_case: Annotated[
         LoginUseCase,
         Depends(lambda: container.resolve(LoginUseCase)),
     ],
 ) -> TokenResponse:
-    token = use_case.login(
+    token = await use_case.login(
         username=request.username,
         password=request.password,
     )
     return TokenResponse(access_token=token)
 
 
+@router.post(
+    "/guest-token",
+    summary="Issue a guest token",
+    description=(
+        "Returns a short-lived ANONYMOUS JWT for browsing the catalog without "
+        "registering. No user is created; the token is accepted to read "
+        "product details (counting the view) and nowhere else."
+    ),
+)
+def guest_token(
+    use_case: Annotated[
+        GuestTokenUseCase,
+        Depends(lambda: container.resolve(GuestTokenUseCase)),
+    ],
+) -> TokenResponse:
+    return TokenResponse(access_token=use_case.issue())
+
+
 @router.post(
     "/sigup",
     summary="Register a new user",
@@ -72,16 +110,33 @@ def login(
                 },
             },
         },
+        status.HTTP_429_TOO_MANY_REQUESTS: {
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Too many attempts, try again later"},
+                },
+            },
+        },
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many password checks in progress, "
+                        "try again later",
+                    },
+                },
+            },
+        },
     },
 )
-def sig_up(
+async def sig_up(
     request: SigUpRequest,
     use_case: Annotated[
         SigUpUseCase,
         Depends(lambda: container.resolve(SigUpUseCase)),
     ],
 ) -> UserDetailResponse:
-    user = use_case.sig_up(
+    user = await use_case.sig_up(
         sig_up_input=SigUpInputMapper.map(request),
     )
     return UserDetailResponse(**user.model_dump())
@@ -60,16 +60,26 @@ router = APIRouter(
                 },
             },
         },
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many password checks in progress, "
+                        "try again later",
+                    },
+                },
+            },
+        },
     },
 )
-def create_user(
+async def create_user(
     request: UserCreateRequest,
     use_case: Annotated[
         UserCreateUseCase,
         Depends(lambda: container.resolve(UserCreateUseCase)),
     ],
 ) -> UserDetailResponse:
-    user = use_case.create_user(
+    user = await use_case.create_user(
         user_create_input=UserCreateInputMapper.map(request),
     )
     return UserDetailResponse(**user.model_dump())
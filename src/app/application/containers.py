@@ -1,103 +1,388 @@
 from app.core.configurations import settings
 from app.core.container import Container
+from app.domain.repositories.async_brand_repository import AsyncBrandRepository
+from app.domain.repositories.async_outbox_repository import AsyncOutboxRepository
+from app.domain.repositories.async_product_repository import AsyncProductRepository
+from app.domain.repositories.async_product_view_repository import (
+    AsyncProductViewRepository,
+)
+from app.domain.repositories.async_unit_of_work import AsyncUnitOfWork
 from app.domain.repositories.brand_repository import BrandRepository
+from app.domain.repositories.outbox_repository import OutboxRepository
+from app.domain.repositories.product_import_job_repository import (
+    ProductImportJobRepository,
+)
 from app.domain.repositories.product_repository import ProductRepository
 from app.domain.repositories.product_view_repository import ProductViewRepository
+from app.domain.repositories.unit_of_work import UnitOfWork
 from app.domain.repositories.user_repository import UserRepository
+from app.domain.services.database_pool_monitor import DatabasePoolMonitor
 from app.domain.services.notification_service import NotificationService
+from app.domain.services.rate_limiter import RateLimiter
+from app.domain.services.slow_query_log import SlowQueryLog
 from app.domain.use_cases.brands.create.brand_create_use_case import BrandCreateUseCase
+from app.domain.use_cases.notifications.dispatch.outbox_dispatch_use_case import (
+    OutboxDispatchUseCase,
+)
+from app.domain.use_cases.notifications.replay.dead_letter_replay_use_case import (
+    DeadLetterReplayUseCase,
+)
+from app.domain.use_cases.products.bulk_import.product_import_use_case import (
+    ProductImportUseCase,
+)
+from app.domain.use_cases.products.changes.product_changes_use_case import (
+    ProductChangesUseCase,
+)
+from app.domain.use_cases.products.create.async_product_create_use_case import (
+    AsyncProductCreateUseCase,
+)
 from app.domain.use_cases.products.create.product_create_use_case import (
     ProductCreateUseCase,
 )
+from app.domain.use_cases.products.detail.async_product_detail_use_case import (
+    AsyncProductDetailUseCase,
+)
 from app.domain.use_cases.products.detail.product_detail_use_case import (
     ProductDetailUseCase,
 )
+from app.domain.use_cases.products.edit.async_product_update_use_case import (
+    AsyncProductUpdateUseCase,
+)
 from app.domain.use_cases.products.edit.product_update_use_case import (
     ProductUpdateUseCase,
 )
+from app.domain.use_cases.products.export.product_export_use_case import (
+    ProductExportUseCase,
+)
+from app.domain.use_cases.products.price_update.product_price_update_use_case import (
+    ProductPriceUpdateUseCase,
+)
+from app.domain.use_cases.products.remove.async_product_remove_use_case import (
+    AsyncProductRemoveUseCase,
+)
 from app.domain.use_cases.products.remove.product_remove_use_case import (
     ProductRemoveUseCase,
 )
+from app.domain.use_cases.products.view_report.async_product_view_report_use_case import (  # noqa: E501
+    AsyncProductViewReportUseCase,
+)
 from app.domain.use_cases.products.view_report.product_view_report_use_case import (
     ProductViewReportUseCase,
 )
 from app.domain.use_cases.users.create.user_create_use_case import UserCreateUseCase
 from app.domain.use_cases.users.edit.user_update_use_case import UserUpdateUseCase
+from app.domain.use_cases.users.guest_token.guest_token_use_case import (
+    GuestTokenUseCase,
+)
 from app.domain.use_cases.users.login.login_use_case import LoginUseCase
 from app.domain.use_cases.users.remove.user_remove_use_case import UserRemoveUseCase
 from app.domain.use_cases.users.sig_up.sig_up_use_case import SigUpUseCase
+from app.infrastructure.db.async_database_repository import AsyncDatabaseRepository
 from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.persistence.async_postgres_brand_repository import (
+    AsyncPostgresBrandRepository,
+)
+from app.infrastructure.persistence.async_postgres_outbox_repository import (
+    AsyncPostgresOutboxRepository,
+)
+from app.infrastructure.persistence.async_postgres_product_repository import (
+    AsyncPostgresProductRepository,
+)
+from app.infrastructure.persistence.async_postgres_product_view_repository import (
+    AsyncPostgresProductViewRepository,
+)
+from app.infrastructure.persistence.async_postgres_unit_of_work import (
+    AsyncPostgresUnitOfWork,
+)
 from app.infrastructure.persistence.postgres_brand_repository import (
     PostgresBrandRepository,
 )
+from app.infrastructure.persistence.postgres_outbox_repository import (
+    PostgresOutboxRepository,
+)
+from app.infrastructure.persistence.postgres_product_import_job_repository import (
+    PostgresProductImportJobRepository,
+)
 from app.infrastructure.persistence.postgres_product_repository import (
     PostgresProductRepository,
 )
 from app.infrastructure.persistence.postgres_product_view_repository import (
     PostgresProductViewRepository,
 )
+from app.infrastructure.persistence.postgres_unit_of_work import PostgresUnitOfWork
 from app.infrastructure.persistence.postgres_user_repository import (
     PostgresUserRepository,
 )
 from app.infrastructure.service.aws_ses_service import AwsSESNotificationService
+from app.infrastructure.service.in_memory_rate_limiter import InMemoryRateLimiter
+from app.infrastructure.service.postgres_rate_limiter import PostgresRateLimiter
+from app.infrastructure.service.sqlalchemy_pool_monitor import (
+    SqlAlchemyDatabasePoolMonitor,
+)
+from app.infrastructure.service.sqlalchemy_slow_query_log import (
+    SqlAlchemySlowQueryLog,
+)
 
 container = Container()
 
+# Repositories and use cases are request-scoped: built once per request and
+# shared by everything resolved for it. Stateless services are singletons.
+container.scoped(
+    DatabaseRepository,
+    lambda _: DatabaseRepository(),
+    dispose=DatabaseRepository.close,
+)
+container.scoped(AsyncDatabaseRepository, lambda _: AsyncDatabaseRepository())
+
 # Repositories
-container[UserRepository] = lambda _: PostgresUserRepository(
-    database_repository=DatabaseRepository(),
+container.scoped(
+    UserRepository,
+    lambda c: PostgresUserRepository(
+        database_repository=c[DatabaseRepository],
+    ),
 )
-container[ProductRepository] = lambda _: PostgresProductRepository(
-    database_repository=DatabaseRepository(),
+container.scoped(
+    ProductRepository,
+    lambda c: PostgresProductRepository(
+        database_repository=c[DatabaseRepository],
+    ),
 )
-container[ProductViewRepository] = lambda _: PostgresProductViewRepository(
-    database_repository=DatabaseRepository(),
+container.scoped(
+    ProductViewRepository,
+    lambda c: PostgresProductViewRepository(
+        database_repository=c[DatabaseRepository],
+    ),
 )
-container[BrandRepository] = lambda _: PostgresBrandRepository(
-    database_repository=DatabaseRepository(),
+container.scoped(
+    BrandRepository,
+    lambda c: PostgresBrandRepository(
+        database_repository=c[DatabaseRepository],
+    ),
+)
+container.scoped(
+    ProductImportJobRepository,
+    lambda c: PostgresProductImportJobRepository(
+        database_repository=c[DatabaseRepository],
+    ),
+)
+container.scoped(
+    OutboxRepository,
+    lambda c: PostgresOutboxRepository(
+        database_repository=c[DatabaseRepository],
+    ),
+)
+container.scoped(
+    UnitOfWork,
+    lambda c: PostgresUnitOfWork(
+        database_repository=c[DatabaseRepository],
+    ),
+)
+container.scoped(
+    AsyncProductRepository,
+    lambda c: AsyncPostgresProductRepository(
+        database_repository=c[AsyncDatabaseRepository],
+    ),
+)
+container.scoped(
+    AsyncProductViewRepository,
+    lambda c: AsyncPostgresProductViewRepository(
+        database_repository=c[AsyncDatabaseRepository],
+    ),
+)
+container.scoped(
+    AsyncBrandRepository,
+    lambda c: AsyncPostgresBrandRepository(
+        database_repository=c[AsyncDatabaseRepository],
+    ),
+)
+container.scoped(
+    AsyncOutboxRepository,
+    lambda c: AsyncPostgresOutboxRepository(
+        database_repository=c[AsyncDatabaseRepository],
+    ),
+)
+container.scoped(
+    AsyncUnitOfWork,
+    lambda c: AsyncPostgresUnitOfWork(
+        database_repository=c[AsyncDatabaseRepository],
+    ),
 )
 
 # Use cases
-container[SigUpUseCase] = lambda c: SigUpUseCase(
-    user_repository=c[UserRepository],
+container.scoped(
+    SigUpUseCase,
+    lambda c: SigUpUseCase(
+        user_repository=c[UserRepository],
+    ),
 )
-container[UserCreateUseCase] = lambda c: UserCreateUseCase(
-    user_repository=c[UserRepository],
+container.scoped(
+    UserCreateUseCase,
+    lambda c: UserCreateUseCase(
+        user_repository=c[UserRepository],
+    ),
 )
-container[LoginUseCase] = lambda c: LoginUseCase(
-    user_repository=c[UserRepository],
+container.scoped(
+    LoginUseCase,
+    lambda c: LoginUseCase(
+        user_repository=c[UserRepository],
+    ),
 )
-container[UserUpdateUseCase] = lambda c: UserUpdateUseCase(
-    user_repository=c[UserRepository],
+container.scoped(GuestTokenUseCase, lambda _: GuestTokenUseCase())
+container.scoped(
+    UserUpdateUseCase,
+    lambda c: UserUpdateUseCase(
+        user_repository=c[UserRepository],
+    ),
 )
-container[UserRemoveUseCase] = lambda c: UserRemoveUseCase(
-    user_repository=c[UserRepository],
+container.scoped(
+    UserRemoveUseCase,
+    lambda c: UserRemoveUseCase(
+        user_repository=c[UserRepository],
+    ),
 )
-container[ProductCreateUseCase] = lambda c: ProductCreateUseCase(
-    product_repository=c[ProductRepository],
-    brand_repository=c[BrandRepository],
+container.scoped(
+    ProductCreateUseCase,
+    lambda c: ProductCreateUseCase(
+        product_repository=c[ProductRepository],
+        brand_repository=c[BrandRepository],
+        unit_of_work=c[UnitOfWork],
+    ),
 )
-container[ProductUpdateUseCase] = lambda c: ProductUpdateUseCase(
-    product_repository=c[ProductRepository],
-    brand_repository=c[BrandRepository],
-    notification_service=c[NotificationService],
+container.scoped(
+    ProductImportUseCase,
+    lambda c: ProductImportUseCase(
+        product_repository=c[ProductRepository],
+        brand_repository=c[BrandRepository],
+        import_job_repository=c[ProductImportJobRepository],
+        unit_of_work=c[UnitOfWork],
+    ),
 )
-container[ProductRemoveUseCase] = lambda c: ProductRemoveUseCase(
-    product_repository=c[ProductRepository],
-    view_repository=c[ProductViewRepository],
+container.scoped(
+    ProductUpdateUseCase,
+    lambda c: ProductUpdateUseCase(
+        product_repository=c[ProductRepository],
+        brand_repository=c[BrandRepository],
+        outbox_repository=c[OutboxRepository],
+        unit_of_work=c[UnitOfWork],
+    ),
 )
-container[ProductDetailUseCase] = lambda c: ProductDetailUseCase(
-    product_repository=c[ProductRepository],
-    view_repository=c[ProductViewRepository],
+container.scoped(
+    ProductPriceUpdateUseCase,
+    lambda c: ProductPriceUpdateUseCase(
+        product_repository=c[ProductRepository],
+        outbox_repository=c[OutboxRepository],
+        unit_of_work=c[UnitOfWork],
+    ),
 )
-container[ProductViewReportUseCase] = lambda c: ProductViewReportUseCase(
-    product_repository=c[ProductRepository],
+container.scoped(
+    ProductRemoveUseCase,
+    lambda c: ProductRemoveUseCase(
+        product_repository=c[ProductRepository],
+        view_repository=c[ProductViewRepository],
+        unit_of_work=c[UnitOfWork],
+    ),
 )
-container[BrandCreateUseCase] = lambda c: BrandCreateUseCase(
-    brand_repository=c[BrandRepository],
+container.scoped(
+    ProductDetailUseCase,
+    lambda c: ProductDetailUseCase(
+        product_repository=c[ProductRepository],
+        view_repository=c[ProductViewRepository],
+        unit_of_work=c[UnitOfWork],
+    ),
+)
+container.scoped(
+    ProductViewReportUseCase,
+    lambda c: ProductViewReportUseCase(
+        product_repository=c[ProductRepository],
+    ),
+)
+container.scoped(
+    ProductExportUseCase,
+    lambda c: ProductExportUseCase(
+        product_repository=c[ProductRepository],
+    ),
+)
+container.scoped(
+    ProductChangesUseCase,
+    lambda c: ProductChangesUseCase(
+        product_repository=c[ProductRepository],
+    ),
+)
+container.scoped(
+    AsyncProductCreateUseCase,
+    lambda c: AsyncProductCreateUseCase(
+        product_repository=c[AsyncProductRepository],
+        brand_repository=c[AsyncBrandRepository],
+        unit_of_work=c[AsyncUnitOfWork],
+    ),
+)
+container.scoped(
+    AsyncProductUpdateUseCase,
+    lambda c: AsyncProductUpdateUseCase(
+        product_repository=c[AsyncProductRepository],
+        brand_repository=c[AsyncBrandRepository],
+        outbox_repository=c[AsyncOutboxRepository],
+        unit_of_work=c[AsyncUnitOfWork],
+    ),
+)
+container.scoped(
+    AsyncProductRemoveUseCase,
+    lambda c: AsyncProductRemoveUseCase(
+        product_repository=c[AsyncProductRepository],
+        view_repository=c[AsyncProductViewRepository],
+        unit_of_work=c[AsyncUnitOfWork],
+    ),
+)
+container.scoped(
+    AsyncProductDetailUseCase,
+    lambda c: AsyncProductDetailUseCase(
+        product_repository=c[AsyncProductRepository],
+        view_repository=c[AsyncProductViewRepository],
+        unit_of_work=c[AsyncUnitOfWork],
+    ),
+)
+container.scoped(
+    AsyncProductViewReportUseCase,
+    lambda c: AsyncProductViewReportUseCase(
+        product_repository=c[AsyncProductRepository],
+    ),
+)
+container.scoped(
+    BrandCreateUseCase,
+    lambda c: BrandCreateUseCase(
+        brand_repository=c[BrandRepository],
+    ),
+)
+container.scoped(
+    OutboxDispatchUseCase,
+    lambda c: OutboxDispatchUseCase(
+        outbox_repository=c[OutboxRepository],
+        notification_service=c[NotificationService],
+        unit_of_work=c[UnitOfWork],
+    ),
+)
+container.scoped(
+    DeadLetterReplayUseCase,
+    lambda c: DeadLetterReplayUseCase(
+        outbox_repository=c[OutboxRepository],
+        unit_of_work=c[UnitOfWork],
+    ),
 )
 
 # Services
-container[NotificationService] = lambda _: AwsSESNotificationService(
-    region_name=settings.SES_REGION_NAME,
+container.singleton(
+    NotificationService,
+    lambda _: AwsSESNotificationService(
+        region_name=settings.SES_REGION_NAME,
+    ),
+)
+container.singleton(DatabasePoolMonitor, lambda _: SqlAlchemyDatabasePoolMonitor())
+container.singleton(
+    RateLimiter,
+    lambda _: (
+        PostgresRateLimiter(idle_seconds=settings.AUTH_RATE_LIMIT_WINDOW_SECONDS)
+        if settings.RATE_LIMIT_BACKEND == "postgres"
+        else InMemoryRateLimiter(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+    ),
 )
+container.singleton(SlowQueryLog, lambda _: SqlAlchemySlowQueryLog())
@@ -4,6 +4,7 @@ from starlette.responses import JSONResponse
 
 from app.application.handlers.detail_error_response import DetailErrorResponse
 from app.application.handlers.error_response import ErrorResponse
+from app.core.security_utils import PasswordHashingBusyError
 from app.domain.exceptions.credential_exception import CredentialError
 from app.domain.exceptions.data_validation_exception import DataValidationError
 from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundError
@@ -53,6 +54,18 @@ def _add_project_exception_handlers(app: FastAPI) -> None:
             content={"detail": exc.message},
         )
 
+    @app.exception_handler(PasswordHashingBusyError)
+    async def password_hashing_busy_error(
+        request: Request,
+        exc: PasswordHashingBusyError,
+    ) -> JSONResponse:
+        _ = request
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": exc.message},
+            headers={"Retry-After": "1"},
+        )
+
 
 def add_exception_handlers(app: FastAPI) -> None:
     return _add_project_exception_handlers(app)
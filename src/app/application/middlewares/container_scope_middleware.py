@@ -0,0 +1,29 @@
+import anyio
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.container import Container, ContainerScope
+
+
+class ContainerScopeMiddleware:
+    """
+    Gives each HTTP request its own scope of the dependency container, so the
+    scoped dependencies (repositories, use cases) are built once per request,
+    and disposes them once the response (streamed bodies included) has been
+    sent.
+    """
+
+    def __init__(self, app: ASGIApp, container: Container) -> None:
+        self.app = app
+        self.container = container
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        container_scope = ContainerScope()
+        try:
+            with self.container.activate_scope(container_scope):
+                await self.app(scope, receive, send)
+        finally:
+            await anyio.to_thread.run_sync(container_scope.close)
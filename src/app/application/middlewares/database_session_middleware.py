@@ -0,0 +1,35 @@
+import anyio
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infrastructure.db.session_scope import (
+    DatabaseSessionScope,
+    activate_session_scope,
+)
+
+
+class DatabaseSessionMiddleware:
+    """
+    Gives each HTTP request its own database session scope, so all the
+    repositories resolved for the request share one session, and closes it
+    once the response (streamed bodies included) has been sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        session_scope = DatabaseSessionScope()
+        try:
+            with activate_session_scope(session_scope):
+                await self.app(scope, receive, send)
+        finally:
+            try:
+                await session_scope.close_async_session()
+            finally:
+                # Closing rolls back and talks to the database, keep it off
+                # the loop
+                await anyio.to_thread.run_sync(session_scope.close)
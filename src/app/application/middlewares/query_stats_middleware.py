@@ -0,0 +1,48 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.configurations import settings
+from app.core.logging_config import logger
+from app.infrastructure.db.query_stats import QueryStats, record_queries
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time-Ms"
+
+
+class QueryStatsMiddleware:
+    """
+    In debug mode, counts the SQL statements each HTTP request runs and the
+    time spent on them, reports both in response headers and logs statements
+    repeated often enough to look like N+1 queries.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.DEBUG:
+            await self.app(scope, receive, send)
+            return
+
+        with record_queries() as stats:
+
+            async def send_with_stats(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    # Statements run while streaming the body are not included
+                    headers = MutableHeaders(scope=message)
+                    headers[QUERY_COUNT_HEADER] = str(stats.count)
+                    headers[QUERY_TIME_HEADER] = f"{stats.seconds * 1000:.2f}"
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                self._warn_repeated_statements(scope, stats)
+
+    @staticmethod
+    def _warn_repeated_statements(scope: Scope, stats: QueryStats) -> None:
+        for statement, count in stats.repeated(settings.DB_QUERY_REPEAT_THRESHOLD):
+            logger.warning(
+                f"Possible N+1 in {scope['method']} {scope['path']}: "
+                f"statement run {count} times: {statement}",
+            )
@@ -0,0 +1,121 @@
+import hashlib
+import json
+import math
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.configurations import settings
+from app.core.container import Container
+from app.domain.services.rate_limiter import RateLimiter
+
+# Open endpoints that hash or verify a password (bcrypt, ~0.3 s of CPU each)
+RATE_LIMITED_ROUTES = {("POST", "/login"), ("POST", "/sigup")}
+# Credentials take a few dozen bytes; anything past this is not read
+MAX_BODY_BYTES = 4096
+
+
+class RateLimitMiddleware:
+    """
+    Limits the login and sign-up attempts per client IP and per username, so
+    a few clients can not keep every core busy with bcrypt or guess a
+    password. Over the limit the request is answered 429 with Retry-After
+    before the body is validated or any hashing happens, and a body over
+    MAX_BODY_BYTES is answered 413 without reading the rest of it.
+    """
+
+    def __init__(self, app: ASGIApp, container: Container) -> None:
+        self.app = app
+        self.container = container
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not settings.RATE_LIMIT_ENABLED
+            or (scope["method"], scope["path"]) not in RATE_LIMITED_ROUTES
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        rate_limiter: RateLimiter = self.container.resolve(RateLimiter)
+        window = settings.AUTH_RATE_LIMIT_WINDOW_SECONDS
+        client_ip = scope["client"][0] if scope.get("client") else "unknown"
+        retry_after = await rate_limiter.hit(
+            f"ip:{client_ip}",
+            settings.AUTH_RATE_LIMIT_PER_IP / window,
+            settings.AUTH_RATE_LIMIT_PER_IP,
+        )
+
+        if not retry_after:
+            body = await _read_body(receive, MAX_BODY_BYTES)
+            if body is None:
+                response = JSONResponse(
+                    status_code=413,
+                    content={"detail": "Request body too large"},
+                )
+                await response(scope, receive, send)
+                return
+
+            username = _username(body)
+            if username:
+                # Same length for any username: keys are at most 255 characters
+                digest = hashlib.sha256(username.encode()).hexdigest()
+                retry_after = await rate_limiter.hit(
+                    f"username:{digest}",
+                    settings.AUTH_RATE_LIMIT_PER_USERNAME / window,
+                    settings.AUTH_RATE_LIMIT_PER_USERNAME,
+                )
+            receive = _replay(body, receive)
+
+        if retry_after:
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": "Too many attempts, try again later"},
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+
+async def _read_body(receive: Receive, max_bytes: int) -> bytes | None:
+    """The whole body, or None as soon as it is longer than `max_bytes`."""
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > max_bytes:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _replay(body: bytes, receive: Receive) -> Receive:
+    """The body already read, for the app, then the rest of the messages."""
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if sent:
+            return await receive()
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return replay
+
+
+def _username(body: bytes) -> str | None:
+    # Malformed bodies are left for the endpoint to reject
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return None
+    username = payload.get("username") if isinstance(payload, dict) else None
+    return username.strip().lower() if isinstance(username, str) else None
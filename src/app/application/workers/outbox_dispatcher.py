@@ -0,0 +1,58 @@
+import threading
+
+from app.core.container import Container
+from app.core.logging_config import logger
+from app.domain.use_cases.notifications.dispatch.outbox_dispatch_use_case import (
+    OutboxDispatchUseCase,
+)
+
+
+class OutboxDispatcher:
+    """
+    Background thread draining the outbox: batch after batch while they come
+    full, then polling every `poll_interval` seconds. Several processes can
+    run one each, SKIP LOCKED keeps them off each other's messages.
+    """
+
+    def __init__(
+        self,
+        container: Container,
+        batch_size: int,
+        poll_interval: float,
+    ) -> None:
+        self.container = container
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="outbox-dispatcher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Lets the batch being delivered finish and stops."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def dispatch_batch(self) -> int:
+        with self.container.scope():
+            use_case = self.container.resolve(OutboxDispatchUseCase)
+            return use_case.dispatch_batch(self.batch_size)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                delivered = self.dispatch_batch()
+            except Exception:
+                logger.exception("Error dispatching the outbox")
+                delivered = 0
+            if delivered < self.batch_size:
+                self._stopped.wait(self.poll_interval)
@@ -1,3 +1,8 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
 from typing import Any, Callable
 
 
@@ -6,19 +11,168 @@ class DependencyNotRegisteredError(Exception):
     that hasn't been registered in the container."""
 
 
+class DependencyLifetimeError(Exception):
+    """Raised when a singleton depends on a request-scoped dependency, which
+    it would keep alive (and share) after the request is over."""
+
+
+class Lifetime(Enum):
+    # Built on every resolve
+    TRANSIENT = "transient"
+    # Built once per scope (an HTTP request) and disposed when it ends
+    SCOPED = "scoped"
+    # Built once per process
+    SINGLETON = "singleton"
+
+
+class _Provider:
+    def __init__(
+        self,
+        builder: Callable[["Container"], Any],
+        lifetime: Lifetime,
+        dispose: Callable[[Any], None] | None,
+    ) -> None:
+        self.builder = builder
+        self.lifetime = lifetime
+        self.dispose = dispose
+
+
+class ContainerScope:
+    """
+    Instances owned by a scope: one HTTP request for scoped dependencies, the
+    whole process for singletons.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._instances: dict[Any, Any] = {}
+        self._disposers: list[Callable[[], None]] = []
+        self.closed = False
+
+    def get_or_build(
+        self,
+        key: Any,
+        provider: _Provider,
+        build: Callable[[], Any],
+    ) -> Any:
+        with self._lock:
+            if self.closed:
+                msg = "The dependency scope is already closed"
+                raise RuntimeError(msg)
+            if key not in self._instances:
+                instance = build()
+                self._instances[key] = instance
+                if provider.dispose is not None:
+                    self._disposers.append(lambda: provider.dispose(instance))
+            return self._instances[key]
+
+    def close(self) -> None:
+        """Disposes the instances, the most recently built first."""
+        with self._lock:
+            self.closed = True
+            disposers, self._disposers = self._disposers, []
+            self._instances.clear()
+        for dispose in reversed(disposers):
+            dispose()
+
+
 class Container:
     def __init__(self):
-        self._registry: dict[Any, Callable[[Container], Any]] = {}
+        self._registry: dict[Any, _Provider] = {}
+        self._singletons = ContainerScope()
+        self._current_scope: ContextVar[ContainerScope | None] = ContextVar(
+            f"container_scope_{id(self)}",
+            default=None,
+        )
+        self._building_singleton: ContextVar[Any] = ContextVar(
+            f"container_building_singleton_{id(self)}",
+            default=None,
+        )
+
+    def register(
+        self,
+        key: Any,
+        builder: Callable[["Container"], Any],
+        lifetime: Lifetime = Lifetime.TRANSIENT,
+        dispose: Callable[[Any], None] | None = None,
+    ) -> None:
+        self._registry[key] = _Provider(builder, lifetime, dispose)
+
+    def singleton(
+        self,
+        key: Any,
+        builder: Callable[["Container"], Any],
+        dispose: Callable[[Any], None] | None = None,
+    ) -> None:
+        self.register(key, builder, Lifetime.SINGLETON, dispose)
 
-    def register(self, key: Any, builder: Callable[["Container"], Any]) -> None:
-        self._registry[key] = builder
+    def scoped(
+        self,
+        key: Any,
+        builder: Callable[["Container"], Any],
+        dispose: Callable[[Any], None] | None = None,
+    ) -> None:
+        self.register(key, builder, Lifetime.SCOPED, dispose)
 
     def resolve(self, key: Any) -> Any:
-        builder = self._registry.get(key)
-        if not builder:
+        provider = self._registry.get(key)
+        if not provider:
             msg = f"No dependency registered for key {key}"
             raise DependencyNotRegisteredError(msg)
-        return builder(self)
+
+        if provider.lifetime is Lifetime.SINGLETON:
+            return self._singletons.get_or_build(
+                key,
+                provider,
+                lambda: self._build_singleton(key, provider),
+            )
+
+        if provider.lifetime is Lifetime.SCOPED:
+            building = self._building_singleton.get()
+            if building is not None:
+                msg = f"Singleton {building} can not depend on scoped {key}"
+                raise DependencyLifetimeError(msg)
+            scope = self._current_scope.get()
+            # Outside a scope (scripts, workers) it behaves as transient
+            if scope is not None:
+                return scope.get_or_build(key, provider, lambda: provider.builder(self))
+
+        return provider.builder(self)
+
+    def _build_singleton(self, key: Any, provider: _Provider) -> Any:
+        token = self._building_singleton.set(key)
+        try:
+            return provider.builder(self)
+        finally:
+            self._building_singleton.reset(token)
+
+    @contextmanager
+    def activate_scope(self, scope: ContainerScope) -> Iterator[ContainerScope]:
+        """
+        Makes `scope` the one scoped dependencies are resolved from, for the
+        code running in this context (threadpool included). Closing it is up
+        to the caller.
+        """
+        token = self._current_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            self._current_scope.reset(token)
+
+    @contextmanager
+    def scope(self) -> Iterator[ContainerScope]:
+        """Scope for code running outside a request, closed at the end."""
+        scope = ContainerScope()
+        try:
+            with self.activate_scope(scope):
+                yield scope
+        finally:
+            scope.close()
+
+    def close(self) -> None:
+        """Disposes the singletons (at shutdown)."""
+        self._singletons.close()
+        self._singletons = ContainerScope()
 
     def __getitem__(self, key: Any):
         return self.resolve(key)
@@ -1,15 +1,19 @@
 from fastapi import Depends, HTTPException
 
-from app.core.security import JWTBearer
+from app.core.security import jwt_bearer
 
 
 class RoleChecker:
     """Reusable class for checking roles"""
 
-    def __init__(self, allowed_roles: list[str]):
+    def __init__(self, allowed_roles: list[str], allow_guests: bool = False):
         self.allowed_roles = allowed_roles
+        # Guest tokens (POST /guest-token) belong to no user
+        self.allow_guests = allow_guests
 
-    def __call__(self, user: dict = Depends(JWTBearer())):
+    async def __call__(self, user: dict = Depends(jwt_bearer)):
         if not user or user.get("role") not in self.allowed_roles:
             raise HTTPException(status_code=401, detail="Unauthorized")
+        if user.get("guest") and not self.allow_guests:
+            raise HTTPException(status_code=401, detail="Unauthorized")
         return user
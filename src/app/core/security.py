@@ -1,3 +1,9 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
 from fastapi import HTTPException, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import jwt
@@ -7,13 +13,66 @@ from app.core.configurations import settings
 bearer_scheme = HTTPBearer(bearerFormat="JWT", auto_error=True)
 
 
+class VerifiedTokenCache:
+    """
+    Claims of the tokens already verified, so a client sending the same token
+    on every request pays for the signature check once. Entries are keyed by
+    the SHA-256 of the token, dropped at the token's `exp` and evicted least
+    recently used first past `max_size`. Only valid tokens are cached.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._claims: OrderedDict[bytes, tuple[dict[str, Any], float]] = OrderedDict()
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        key = self.key(token)
+        with self._lock:
+            entry = self._claims.get(key)
+            if entry is None:
+                return None
+            claims, expires_at = entry
+            if expires_at <= time.time():
+                del self._claims[key]
+                return None
+            self._claims.move_to_end(key)
+        return dict(claims)
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        # Without `exp` the token never expires: it is verified every time
+        if self.max_size <= 0 or not isinstance(claims.get("exp"), int | float):
+            return
+        with self._lock:
+            self._claims[self.key(token)] = (dict(claims), float(claims["exp"]))
+            self._claims.move_to_end(self.key(token))
+            while len(self._claims) > self.max_size:
+                self._claims.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._claims.clear()
+
+
+verified_token_cache = VerifiedTokenCache(settings.JWT_CACHE_MAX_SIZE)
+
+
 class JWTBearer:
     """Reusable class for extracting and validating the JWT"""
 
-    def __init__(self, auto_error: bool = True):
+    def __init__(
+        self,
+        auto_error: bool = True,
+        cache: VerifiedTokenCache = verified_token_cache,
+    ):
         self.auto_error = auto_error
+        self.cache = cache
 
-    def __call__(
+    async def __call__(
         self,
         credentials: HTTPAuthorizationCredentials = Security(bearer_scheme),
     ):
@@ -22,8 +81,11 @@ class JWTBearer:
                 raise HTTPException(status_code=401, detail="Missing token")
             return None
         token = credentials.credentials
+        claims = self.cache.get(token)
+        if claims is not None:
+            return claims
         try:
-            return jwt.decode(
+            claims = jwt.decode(
                 token,
                 settings.SECRET_KEY,
                 algorithms=[settings.ALGORITHM],
@@ -32,3 +94,10 @@ class JWTBearer:
             if self.auto_error:
                 raise HTTPException(status_code=401, detail="Invalid token") from err
             return None
+        self.cache.put(token, claims)
+        return claims
+
+
+# One instance for every route: FastAPI runs a dependency once per request
+# when it is the same callable, however many RoleCheckers depend on it
+jwt_bearer = JWTBearer()
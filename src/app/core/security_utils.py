@@ -1,8 +1,106 @@
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from typing import Any, TypeVar
+
+from jose import jwt
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.configurations import settings
+
+T = TypeVar("T")
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__ident="2b",
+)
+
+
+class PasswordHashingBusyError(Exception):
+    """Every password hashing worker is busy and the waiting list is full."""
+
+    message: str
+
+    def __init__(self: "PasswordHashingBusyError", message: str) -> None:
+        self.message = message
+        super().__init__(self.message)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt (~0.3 s of CPU per call) on a pool of its own, so a burst of
+    logins uses at most `max_workers` cores. Callers await the result without
+    holding a thread of the request threadpool; at most `max_workers +
+    queue_limit` calls are taken at once, later ones fail fast with
+    PasswordHashingBusyError instead of queueing. bcrypt releases the GIL, so
+    the workers are threads.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        queue_limit: int,
+        context: CryptContext = pwd_context,
+    ) -> None:
+        self.context = context
+        self._slots = threading.BoundedSemaphore(max_workers + queue_limit)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="password-hashing",
+        )
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(self.context.verify, password, hashed_password)
+
+    def close(self) -> None:
+        """Waits for the hashes in progress (at shutdown)."""
+        self._executor.shutdown()
+
+    async def _run(self, function: Callable[..., T], *args: str) -> T:
+        if not self._slots.acquire(blocking=False):
+            msg = "Too many password checks in progress, try again later"
+            raise PasswordHashingBusyError(msg)
+        try:
+            future = self._executor.submit(function, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # Given back when bcrypt finishes, even if the caller stopped waiting
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASHING_WORKERS,
+    queue_limit=settings.PASSWORD_HASHING_QUEUE_LIMIT,
+)
 
 
 # Password hashing
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+async def hash_password(password: str) -> str:
+    return await password_hasher.hash(password)
+
+
+async def verify_password(password: str, hashed_password: str) -> bool:
+    return await password_hasher.verify(password, hashed_password)
+
+
+def create_access_token(
+    claims: dict[str, Any],
+    expires_delta: timedelta | None = None,
+) -> str:
+    to_encode = claims.copy()
+    expire = datetime.now(UTC) + (
+        expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+    to_encode.update({"exp": expire})
+    if not settings.SECRET_KEY:
+        msg = "SECRET_KEY is not set"
+        raise RuntimeError(msg)
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
@@ -11,3 +11,6 @@ class ErrorCodeEnum(str, Enum):
     ALREADY_EXIST_PRODUCT_SKU = "ALREADY_EXIST_PRODUCT_SKU"
     BRAND_NOT_FOUND = "BRAND_NOT_FOUND"
     PRODUCT_NOT_FOUND = "PRODUCT_NOT_FOUND"
+    REPEATED_PRODUCT_SKU = "REPEATED_PRODUCT_SKU"
+    IMPORT_JOB_NOT_FOUND = "IMPORT_JOB_NOT_FOUND"
+    INVALID_CURSOR = "INVALID_CURSOR"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ImportJobStatus(str, Enum):
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class OutboxEventType(str, Enum):
+    PRODUCT_UPDATED = "PRODUCT_UPDATED"
+    # The changes of a whole price update, as one ProductBatchUpdateEvent
+    PRODUCTS_UPDATED = "PRODUCTS_UPDATED"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ProductChangeType(str, Enum):
+    UPSERT = "UPSERT"
+    DELETE = "DELETE"
@@ -0,0 +1,18 @@
+class NotificationDeliveryError(Exception):
+    """
+    A notification could not be sent. `retryable` tells transient failures
+    (throttling, timeouts, 5xx) from the ones that would fail again the same
+    way (rejected message, unverified sender).
+    """
+
+    message: str
+    retryable: bool
+
+    def __init__(
+        self: "NotificationDeliveryError",
+        message: str,
+        retryable: bool,
+    ) -> None:
+        self.message = message
+        self.retryable = retryable
+        super().__init__(self.message)
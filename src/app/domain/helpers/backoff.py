@@ -0,0 +1,17 @@
+import random
+from collections.abc import Callable
+
+
+def backoff_delay(
+    attempt: int,
+    base_seconds: float,
+    max_seconds: float,
+    rand: Callable[[], float] = random.random,
+) -> float:
+    """
+    Seconds to wait before retry number `attempt` (1 for the first retry):
+    exponential backoff with full jitter, so that failures at the same moment
+    do not come back at the same moment.
+    """
+    ceiling = min(max_seconds, base_seconds * 2 ** (attempt - 1))
+    return ceiling * rand()
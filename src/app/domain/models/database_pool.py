@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+
+
+class DatabasePoolStatus(BaseModel):
+    """
+    Connection pool of one database engine. Sizes are None for pools that do
+    not keep connections (e.g. NullPool).
+    """
+
+    engine: str
+    pool_class: str
+    size: int | None
+    max_overflow: int | None
+    checked_in: int | None
+    checked_out: int | None
+    overflow: int | None
+    checkouts: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class DatabasePoolsStatus(BaseModel):
+    """Connection pools of one worker process, one per database engine."""
+
+    process_id: int
+    pools: list[DatabasePoolStatus]
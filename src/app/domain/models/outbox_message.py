@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
+
+
+class OutboxMessage(BaseModel):
+    id: str
+    # A type this version does not know is kept as written (and dead-lettered)
+    event_type: OutboxEventType | str = Field(union_mode="left_to_right")
+    payload: dict[str, Any]
+    created_at: datetime
+    # Failed deliveries so far
+    attempts: int = 0
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from app.domain.enums.product_change_type_enum import ProductChangeType
+from app.domain.models.product import Product
+
+
+class ProductChangeCursor(BaseModel):
+    """Position in the change feed: the last change already seen."""
+
+    changed_at: datetime
+    product_id: str
+
+
+class ProductChange(BaseModel):
+    change_type: ProductChangeType
+    product_id: str
+    changed_at: datetime
+    product: Product | None
+
+
+class ProductChangePage(BaseModel):
+    changes: list[ProductChange]
+    next_cursor: ProductChangeCursor | None
+    has_more: bool
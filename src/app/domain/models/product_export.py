@@ -0,0 +1,16 @@
+from decimal import Decimal
+from typing import NamedTuple
+
+
+class ProductExportRow(NamedTuple):
+    """
+    Plain tuple instead of a pydantic model: exports go through the whole
+    catalog, so rows are passed along without validation.
+    """
+
+    id: str
+    sku: str
+    name: str
+    price: Decimal
+    brand_id: str
+    brand_name: str
@@ -0,0 +1,30 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.domain.enums.import_job_status_enum import ImportJobStatus
+
+
+class ProductImportError(BaseModel):
+    row: int
+    code: str
+    location: list[Any]
+    message: str
+
+
+class ProductImportResult(BaseModel):
+    imported: int
+    errors: list[ProductImportError]
+
+
+class ProductImportJob(BaseModel):
+    id: str
+    status: ImportJobStatus
+    rows_processed: int
+    imported: int
+    rejected: int
+
+
+class ProductImportReport(BaseModel):
+    job: ProductImportJob
+    errors: list[ProductImportError]
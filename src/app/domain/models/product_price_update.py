@@ -0,0 +1,16 @@
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+
+class ProductPriceChange(BaseModel):
+    product_id: str
+    sku: str
+    old_price: Decimal
+    new_price: Decimal
+
+
+class ProductPriceUpdateResult(BaseModel):
+    changes: list[ProductPriceChange]
+    unchanged: int
+    not_found_skus: list[str]
@@ -0,0 +1,15 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class SlowQuery(BaseModel):
+    """A statement that ran longer than the slow query threshold."""
+
+    statement: str
+    parameters_fingerprint: str
+    duration_ms: float
+    captured_at: datetime
+    # EXPLAIN (FORMAT JSON) output for the statement
+    plan: list[dict[str, Any]]
@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+
+class AsyncBrandRepository(ABC):
+
+    @abstractmethod
+    async def exists_by_id(self, brand_id: str) -> bool:
+        raise NotImplementedError
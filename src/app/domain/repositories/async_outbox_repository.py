@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
+
+
+class AsyncOutboxRepository(ABC):
+
+    @abstractmethod
+    async def add(self, event_type: OutboxEventType, payload: dict[str, Any]) -> None:
+        raise NotImplementedError
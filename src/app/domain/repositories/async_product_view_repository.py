@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class AsyncProductViewRepository(ABC):
+
+    @abstractmethod
+    async def increment_view(self, product_id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_views_by_product_id(self, product_id: str) -> None:
+        raise NotImplementedError
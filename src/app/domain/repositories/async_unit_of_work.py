@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Self
+
+
+class AsyncUnitOfWork(ABC):
+    """UnitOfWork for the async repositories, used with `async with`."""
+
+    @abstractmethod
+    async def __aenter__(self) -> Self:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        raise NotImplementedError
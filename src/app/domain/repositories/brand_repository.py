@@ -17,6 +17,10 @@ class BrandRepository(ABC):
     def exists_by_id(self, brand_id: str) -> bool:
         raise NotImplementedError
 
+    @abstractmethod
+    def find_existing_ids(self, brand_ids: set[str]) -> set[str]:
+        raise NotImplementedError
+
     @abstractmethod
     def exists_by_name(self, name: str) -> bool:
         raise NotImplementedError
@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
+
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
+from app.domain.models.outbox_message import OutboxMessage
+
+
+class OutboxRepository(ABC):
+    """
+    Events written in the same transaction as the change they describe, and
+    delivered after it commits by the outbox dispatcher.
+    """
+
+    @abstractmethod
+    def add(self, event_type: OutboxEventType, payload: dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_many(
+        self,
+        event_type: OutboxEventType,
+        payloads: list[dict[str, Any]],
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def claim_batch(self, limit: int) -> list[OutboxMessage]:
+        """
+        Oldest messages due for delivery, locked until the unit of work ends.
+        Messages locked by another dispatcher are skipped, not waited for.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, message_ids: list[str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def schedule_retry(
+        self,
+        message_ids: list[str],
+        retry_at: datetime,
+        error: str,
+    ) -> None:
+        """Counts a failed attempt and leaves the messages until `retry_at`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def move_to_dead_letters(self, message_ids: list[str], error: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def replay_dead_letters(self, message_ids: list[str] | None = None) -> int:
+        """
+        Puts dead letters (all of them by default) back in the outbox with
+        their attempts reset, and returns how many.
+        """
+        raise NotImplementedError
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+from app.domain.models.product_import import ProductImportJob
+
+
+class ProductImportJobRepository(ABC):
+
+    @abstractmethod
+    def create(self) -> ProductImportJob:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_by_id(self, job_id: str) -> ProductImportJob | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, job: ProductImportJob) -> ProductImportJob:
+        raise NotImplementedError
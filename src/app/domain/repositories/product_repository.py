@@ -1,8 +1,15 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 from app.domain.models.product import Product, ProductView
+from app.domain.models.product_change import ProductChange, ProductChangeCursor
+from app.domain.models.product_export import ProductExportRow
+from app.domain.models.product_price_update import ProductPriceChange
 from app.domain.use_cases.products.create.product_create_input import ProductCreateInput
 from app.domain.use_cases.products.edit.product_update_input import ProductUpdateInput
+from app.domain.use_cases.products.price_update.product_price_update_input import (
+    ProductPriceUpdateInput,
+)
 
 
 class ProductRepository(ABC):
@@ -14,10 +21,19 @@ class ProductRepository(ABC):
     ) -> Product:
         raise NotImplementedError
 
+    @abstractmethod
+    def bulk_create(self, products: list[ProductCreateInput]) -> set[str]:
+        """Inserts the products and returns the SKUs that were actually created."""
+        raise NotImplementedError
+
     @abstractmethod
     def exists_by_sku(self, sku: str) -> bool:
         raise NotImplementedError
 
+    @abstractmethod
+    def find_existing_skus(self, skus: set[str]) -> set[str]:
+        raise NotImplementedError
+
     @abstractmethod
     def find_by_id(self, product_id: str) -> Product | None:
         raise NotImplementedError
@@ -30,6 +46,14 @@ class ProductRepository(ABC):
     def update(self, product_id: str, product_update: ProductUpdateInput) -> Product:
         raise NotImplementedError
 
+    @abstractmethod
+    def update_prices(
+        self,
+        prices: list[ProductPriceUpdateInput],
+    ) -> list[ProductPriceChange]:
+        """Updates the prices by SKU and returns the products whose price changed."""
+        raise NotImplementedError
+
     @abstractmethod
     def delete_by_id(self, user_id: str) -> None:
         raise NotImplementedError
@@ -37,3 +61,22 @@ class ProductRepository(ABC):
     @abstractmethod
     def list_products(self, brand_id: str) -> list[ProductView]:
         raise NotImplementedError
+
+    @abstractmethod
+    def export_products(self, batch_size: int) -> Iterator[list[ProductExportRow]]:
+        """Yields every product with its brand, `batch_size` rows at a time."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_changes(
+        self,
+        since: ProductChangeCursor | None,
+        limit: int,
+        settle_seconds: float,
+    ) -> list[ProductChange]:
+        """
+        Returns the products created, updated or deleted after `since`, in change
+        order. Changes newer than `settle_seconds` are left for a later call, so
+        transactions still in flight can not be skipped by the cursor.
+        """
+        raise NotImplementedError
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Self
+
+
+class UnitOfWork(ABC):
+    """
+    Runs everything the repositories do inside the `with` block on a single
+    connection and transaction: committed when the block ends, rolled back if
+    it raises. Nested blocks join the outermost one.
+    """
+
+    @abstractmethod
+    def __enter__(self) -> Self:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        raise NotImplementedError
@@ -12,6 +12,7 @@ class UserRepository(ABC):
     def create(
         self,
         user: UserCreateInput,
+        hashed_password: str,
         role: UserRole,
     ) -> User:
         raise NotImplementedError
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from app.domain.models.database_pool import DatabasePoolsStatus
+
+
+class DatabasePoolMonitor(ABC):
+
+    @abstractmethod
+    def status(self) -> DatabasePoolsStatus:
+        raise NotImplementedError
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from app.domain.services.product_batch_update_event import ProductBatchUpdateEvent
 from app.domain.services.product_update_event import ProductUpdateEvent
 
 
@@ -13,3 +14,13 @@ class NotificationService(ABC):
         event: ProductUpdateEvent,
     ) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    def notify_batch(
+        self,
+        sender_email: str,
+        recipient_email: str,
+        event: ProductBatchUpdateEvent,
+    ) -> None:
+        """Sends a single notification summarizing all the updates of a batch."""
+        raise NotImplementedError
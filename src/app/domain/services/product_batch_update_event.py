@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+from app.domain.services.product_update_event import ProductUpdateEvent
+
+
+class ProductBatchUpdateEvent(BaseModel):
+    events: list[ProductUpdateEvent]
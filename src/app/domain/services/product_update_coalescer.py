@@ -0,0 +1,45 @@
+from collections.abc import Iterable
+from decimal import Decimal
+
+from app.domain.services.product_update_event import ProductUpdateEvent
+
+# Amounts arrive as the JSON strings of their Decimal, with the scale they were
+# written with ("100" and "100.00"), so they are compared as numbers
+NUMERIC_FIELDS = {"price"}
+
+
+def coalesce_product_updates(
+    events: Iterable[ProductUpdateEvent],
+) -> list[ProductUpdateEvent]:
+    """
+    One event per product, in order of first appearance, with the first old
+    value and the last new value of every field. Fields that end up where they
+    started are dropped, and so are products left without changes.
+    """
+    merged: dict[str, dict[str, dict]] = {}
+    for event in events:
+        changes = merged.setdefault(event.product_id, {})
+        for field, change in event.changes.items():
+            if field in changes:
+                changes[field] = {"old": changes[field]["old"], "new": change["new"]}
+            else:
+                changes[field] = dict(change)
+
+    coalesced = []
+    for product_id, changes in merged.items():
+        net_changes = {
+            field: change
+            for field, change in changes.items()
+            if _changed(field, change)
+        }
+        if net_changes:
+            coalesced.append(
+                ProductUpdateEvent(product_id=product_id, changes=net_changes),
+            )
+    return coalesced
+
+
+def _changed(field: str, change: dict) -> bool:
+    if field in NUMERIC_FIELDS:
+        return Decimal(change["old"]) != Decimal(change["new"])
+    return change["old"] != change["new"]
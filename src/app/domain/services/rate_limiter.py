@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+
+class RateLimiter(ABC):
+    """
+    Token buckets by key (a client IP, a username): `rate` tokens per second,
+    up to `capacity` saved for bursts.
+    """
+
+    @abstractmethod
+    async def hit(self, key: str, rate: float, capacity: float) -> float:
+        """
+        Takes a token from the bucket of `key`. Returns 0 if there was one,
+        otherwise the seconds until there will be.
+        """
+        raise NotImplementedError
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from app.domain.models.slow_query import SlowQuery
+
+
+class SlowQueryLog(ABC):
+
+    @abstractmethod
+    def recent(self) -> list[SlowQuery]:
+        """Slow queries captured with their plan, newest first."""
+        raise NotImplementedError
@@ -0,0 +1,181 @@
+from collections.abc import Callable
+from datetime import timedelta
+
+from app.core.configurations import settings
+from app.core.logging_config import logger
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
+from app.domain.exceptions.notification_delivery_exception import (
+    NotificationDeliveryError,
+)
+from app.domain.helpers.backoff import backoff_delay
+from app.domain.helpers.datetime_generator import get_now_datetime
+from app.domain.models.outbox_message import OutboxMessage
+from app.domain.repositories.outbox_repository import OutboxRepository
+from app.domain.repositories.unit_of_work import UnitOfWork
+from app.domain.services.notification_service import NotificationService
+from app.domain.services.product_batch_update_event import ProductBatchUpdateEvent
+from app.domain.services.product_update_coalescer import coalesce_product_updates
+from app.domain.services.product_update_event import ProductUpdateEvent
+
+# The product updates carried by each type of message
+EVENT_READERS: dict[OutboxEventType, Callable[[dict], list[ProductUpdateEvent]]] = {
+    OutboxEventType.PRODUCT_UPDATED: lambda payload: [
+        ProductUpdateEvent.model_validate(payload),
+    ],
+    OutboxEventType.PRODUCTS_UPDATED: lambda payload: (
+        ProductBatchUpdateEvent.model_validate(payload).events
+    ),
+}
+
+
+class OutboxDispatchUseCase:
+    """
+    Delivers the pending outbox messages, oldest first. Messages are held
+    until the oldest one is NOTIFICATION_COALESCE_WINDOW_SECONDS old, then the
+    updates of the whole batch are merged per product and sent as a single
+    digest. Delivery is at least once: the messages are deleted in the
+    transaction that claimed them, after the digest was sent.
+
+    When sending fails the messages are left for a later attempt, with
+    exponential backoff, or moved to the dead letters once the failure is
+    permanent or they have run out of attempts. Unexpected errors are retried
+    the same way. A message that can never be sent (unknown event type,
+    invalid payload) goes to the dead letters on its own, without holding
+    back the rest of the batch.
+
+    SES_MAX_SEND_RATE is enforced by a TokenBucket in each process: every
+    process running a dispatcher sends up to that rate, so with N of them it
+    must be set to the account's quota divided by N.
+    """
+
+    def __init__(
+        self,
+        outbox_repository: OutboxRepository,
+        notification_service: NotificationService,
+        unit_of_work: UnitOfWork,
+    ) -> None:
+        self.outbox_repository = outbox_repository
+        self.notification_service = notification_service
+        self.unit_of_work = unit_of_work
+
+    def dispatch_batch(self, limit: int) -> int:
+        """
+        Delivers up to `limit` messages and returns how many were sent, 0
+        while the coalescing window of the oldest one is still open or when
+        sending failed.
+        """
+        with self.unit_of_work:
+            messages = self.outbox_repository.claim_batch(limit)
+            if not messages or not self._window_elapsed(messages[0]):
+                return 0
+
+            deliverable, events = self._read_events(messages)
+            if not deliverable:
+                return 0
+
+            try:
+                self._deliver(events)
+            except NotificationDeliveryError as error:
+                self._handle_failure(deliverable, error)
+                return 0
+            except Exception as error:
+                logger.exception("Unexpected error delivering the outbox")
+                self._handle_failure(
+                    deliverable,
+                    NotificationDeliveryError(
+                        f"{type(error).__name__}: {error}",
+                        retryable=True,
+                    ),
+                )
+                return 0
+
+            self.outbox_repository.delete([message.id for message in deliverable])
+        return len(deliverable)
+
+    @staticmethod
+    def _window_elapsed(oldest: OutboxMessage) -> bool:
+        window = timedelta(seconds=settings.NOTIFICATION_COALESCE_WINDOW_SECONDS)
+        return get_now_datetime() - oldest.created_at >= window
+
+    def _read_events(
+        self,
+        messages: list[OutboxMessage],
+    ) -> tuple[list[OutboxMessage], list[ProductUpdateEvent]]:
+        """
+        Returns the messages that can be delivered and their events; the rest
+        would fail the same way on every attempt, so they are dead-lettered.
+        """
+        deliverable, events = [], []
+        for message in messages:
+            read_events = EVENT_READERS.get(message.event_type)
+            if read_events is None:
+                self._reject(message, f"Unknown event type {message.event_type}")
+                continue
+            try:
+                events.extend(read_events(message.payload))
+            except Exception as error:
+                self._reject(message, f"Invalid payload: {error}")
+                continue
+            deliverable.append(message)
+        return deliverable, events
+
+    def _reject(self, message: OutboxMessage, error: str) -> None:
+        logger.error(
+            f"Moving outbox message {message.id} to the dead letters: {error}",
+        )
+        self.outbox_repository.move_to_dead_letters([message.id], error)
+
+    def _deliver(self, product_events: list[ProductUpdateEvent]) -> None:
+        events = coalesce_product_updates(product_events)
+        if len(events) == 1:
+            self.notification_service.notify(
+                sender_email=settings.SES_SENDER_EMAIL,
+                recipient_email=settings.SES_RECIPIENT_EMAIL,
+                event=events[0],
+            )
+        elif events:
+            self.notification_service.notify_batch(
+                sender_email=settings.SES_SENDER_EMAIL,
+                recipient_email=settings.SES_RECIPIENT_EMAIL,
+                event=ProductBatchUpdateEvent(events=events),
+            )
+
+    def _handle_failure(
+        self,
+        messages: list[OutboxMessage],
+        error: NotificationDeliveryError,
+    ) -> None:
+        exhausted, retried = [], []
+        for message in messages:
+            out_of_attempts = message.attempts + 1 >= settings.OUTBOX_MAX_ATTEMPTS
+            if not error.retryable or out_of_attempts:
+                exhausted.append(message)
+            else:
+                retried.append(message)
+
+        if exhausted:
+            logger.error(
+                f"Moving {len(exhausted)} outbox messages to the dead letters: "
+                f"{error.message}",
+            )
+            self.outbox_repository.move_to_dead_letters(
+                [message.id for message in exhausted],
+                error.message,
+            )
+
+        if retried:
+            attempt = max(message.attempts for message in retried) + 1
+            delay = backoff_delay(
+                attempt,
+                base_seconds=settings.OUTBOX_RETRY_BASE_SECONDS,
+                max_seconds=settings.OUTBOX_RETRY_MAX_SECONDS,
+            )
+            logger.warning(
+                f"Retrying {len(retried)} outbox messages in {delay:.1f}s "
+                f"(attempt {attempt}): {error.message}",
+            )
+            self.outbox_repository.schedule_retry(
+                [message.id for message in retried],
+                get_now_datetime() + timedelta(seconds=delay),
+                error.message,
+            )
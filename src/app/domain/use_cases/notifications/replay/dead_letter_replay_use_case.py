@@ -0,0 +1,22 @@
+from app.domain.repositories.outbox_repository import OutboxRepository
+from app.domain.repositories.unit_of_work import UnitOfWork
+
+
+class DeadLetterReplayUseCase:
+    """
+    Sends undeliverable notifications again, once the cause (unverified
+    sender, paused account...) has been fixed.
+    """
+
+    def __init__(
+        self,
+        outbox_repository: OutboxRepository,
+        unit_of_work: UnitOfWork,
+    ) -> None:
+        self.outbox_repository = outbox_repository
+        self.unit_of_work = unit_of_work
+
+    def replay(self, message_ids: list[str] | None = None) -> int:
+        """Moves the dead letters (all by default) back to the outbox."""
+        with self.unit_of_work:
+            return self.outbox_repository.replay_dead_letters(message_ids)
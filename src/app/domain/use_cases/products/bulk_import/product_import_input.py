@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+from app.domain.models.product_import import ProductImportError
+from app.domain.use_cases.products.create.product_create_input import ProductCreateInput
+
+
+class ProductImportRow(BaseModel):
+    row: int
+    product: ProductCreateInput
+
+
+# A parsed record of the uploaded file: a valid row or the errors that rejected it
+ProductImportRecord = ProductImportRow | list[ProductImportError]
@@ -0,0 +1,199 @@
+from collections.abc import Iterable
+
+from app.domain.enums.code_enum import ErrorCodeEnum
+from app.domain.enums.import_job_status_enum import ImportJobStatus
+from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundError
+from app.domain.models.product_import import (
+    ProductImportError,
+    ProductImportJob,
+    ProductImportReport,
+    ProductImportResult,
+)
+from app.domain.repositories.brand_repository import BrandRepository
+from app.domain.repositories.product_import_job_repository import (
+    ProductImportJobRepository,
+)
+from app.domain.repositories.product_repository import ProductRepository
+from app.domain.repositories.unit_of_work import UnitOfWork
+from app.domain.use_cases.products.bulk_import.product_import_input import (
+    ProductImportRecord,
+    ProductImportRow,
+)
+
+
+class ProductImportUseCase:
+    """
+    Bulk version of ProductCreateUseCase: same rules (brand must exist, SKU must
+    be unique), checked once per chunk instead of once per product.
+    """
+
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        brand_repository: BrandRepository,
+        import_job_repository: ProductImportJobRepository,
+        unit_of_work: UnitOfWork,
+    ) -> None:
+        self.product_repository = product_repository
+        self.brand_repository = brand_repository
+        self.import_job_repository = import_job_repository
+        self.unit_of_work = unit_of_work
+
+    def start_job(self, job_id: str | None) -> ProductImportJob:
+        if job_id is None:
+            return self.import_job_repository.create()
+
+        job = self.import_job_repository.find_by_id(job_id)
+        if job is None:
+            raise ResourceNotFoundError(
+                code=ErrorCodeEnum.IMPORT_JOB_NOT_FOUND,
+                location=["job_id"],
+                message=f"No import job found with ID: {job_id}.",
+            )
+        return job
+
+    def import_records(
+        self,
+        job: ProductImportJob,
+        records: Iterable[ProductImportRecord],
+        chunk_size: int,
+        max_reported_errors: int,
+    ) -> ProductImportReport:
+        """
+        Imports the records that follow the job's checkpoint, `chunk_size` records
+        at a time. Every chunk is committed together with the checkpoint, so an
+        interrupted import can be resumed with the same job.
+        """
+        reported_errors: list[ProductImportError] = []
+        chunk: list[ProductImportRecord] = []
+
+        for record in records:
+            chunk.append(record)
+            if len(chunk) == chunk_size:
+                job = self._import_chunk(
+                    job,
+                    chunk,
+                    reported_errors,
+                    max_reported_errors,
+                )
+                chunk = []
+        job = self._import_chunk(job, chunk, reported_errors, max_reported_errors)
+
+        job = self.import_job_repository.save(
+            job.model_copy(update={"status": ImportJobStatus.COMPLETED}),
+        )
+        return ProductImportReport(job=job, errors=reported_errors)
+
+    def import_products(self, rows: list[ProductImportRow]) -> ProductImportResult:
+        errors = self._apply_business_validation(rows)
+        rejected_rows = {error.row for error in errors}
+        valid_rows = [row for row in rows if row.row not in rejected_rows]
+
+        inserted_skus = (
+            self.product_repository.bulk_create(
+                [row.product for row in valid_rows],
+            )
+            if valid_rows
+            else set()
+        )
+
+        # SKUs created concurrently between the validation and the insert
+        errors.extend(
+            self._sku_already_exists(row)
+            for row in valid_rows
+            if row.product.sku not in inserted_skus
+        )
+
+        return ProductImportResult(
+            imported=len(inserted_skus),
+            errors=sorted(errors, key=lambda error: error.row),
+        )
+
+    def _import_chunk(
+        self,
+        job: ProductImportJob,
+        chunk: list[ProductImportRecord],
+        reported_errors: list[ProductImportError],
+        max_reported_errors: int,
+    ) -> ProductImportJob:
+        if not chunk:
+            return job
+
+        rows = [record for record in chunk if isinstance(record, ProductImportRow)]
+        parse_errors = [
+            error
+            for record in chunk
+            if not isinstance(record, ProductImportRow)
+            for error in record
+        ]
+        with self.unit_of_work:
+            result = self.import_products(rows)
+            errors = sorted(
+                [*parse_errors, *result.errors],
+                key=lambda error: error.row,
+            )
+            job = self.import_job_repository.save(
+                job.model_copy(
+                    update={
+                        "rows_processed": job.rows_processed + len(chunk),
+                        "imported": job.imported + result.imported,
+                        "rejected": job.rejected + len({error.row for error in errors}),
+                    },
+                ),
+            )
+
+        reported_errors.extend(errors[: max_reported_errors - len(reported_errors)])
+        return job
+
+    def _apply_business_validation(
+        self,
+        rows: list[ProductImportRow],
+    ) -> list[ProductImportError]:
+        if not rows:
+            return []
+
+        existing_brand_ids = self.brand_repository.find_existing_ids(
+            {row.product.brand_id for row in rows},
+        )
+        existing_skus = self.product_repository.find_existing_skus(
+            {row.product.sku for row in rows},
+        )
+
+        errors = []
+        first_row_by_sku: dict[str, int] = {}
+        for row in rows:
+            product = row.product
+            if product.brand_id not in existing_brand_ids:
+                errors.append(
+                    ProductImportError(
+                        row=row.row,
+                        code=ErrorCodeEnum.BRAND_NOT_FOUND.value,
+                        location=["brand_id"],
+                        message=f"Brand with ID '{product.brand_id}' not found",
+                    ),
+                )
+            elif product.sku in existing_skus:
+                errors.append(self._sku_already_exists(row))
+            elif product.sku in first_row_by_sku:
+                errors.append(
+                    ProductImportError(
+                        row=row.row,
+                        code=ErrorCodeEnum.ALREADY_EXIST_PRODUCT_SKU.value,
+                        location=["sku"],
+                        message=f"Product with SKU '{product.sku}' is repeated, "
+                        f"first seen at row {first_row_by_sku[product.sku]}",
+                    ),
+                )
+            else:
+                first_row_by_sku[product.sku] = row.row
+
+        return errors
+
+    @staticmethod
+    def _sku_already_exists(row: ProductImportRow) -> ProductImportError:
+        return ProductImportError(
+            row=row.row,
+            code=ErrorCodeEnum.ALREADY_EXIST_PRODUCT_SKU.value,
+            location=["sku"],
+            message=f"Product with SKU '{row.product.sku}' already exists",
+        )
@@ -0,0 +1,42 @@
+from app.core.configurations import settings
+from app.domain.models.product_change import ProductChangeCursor, ProductChangePage
+from app.domain.repositories.product_repository import ProductRepository
+
+
+class ProductChangesUseCase:
+    """
+    Change feed of the catalog: lets downstream copies sync only what changed
+    since the last change they saw.
+    """
+
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+    ) -> None:
+        self.product_repository = product_repository
+
+    def list_changes(
+        self,
+        since: ProductChangeCursor | None,
+        limit: int,
+    ) -> ProductChangePage:
+        changes = self.product_repository.find_changes(
+            since=since,
+            limit=limit + 1,
+            settle_seconds=settings.PRODUCT_CHANGES_SETTLE_SECONDS,
+        )
+        page = changes[:limit]
+
+        next_cursor = (
+            ProductChangeCursor(
+                changed_at=page[-1].changed_at,
+                product_id=page[-1].product_id,
+            )
+            if page
+            else since
+        )
+        return ProductChangePage(
+            changes=page,
+            next_cursor=next_cursor,
+            has_more=len(changes) > limit,
+        )
@@ -0,0 +1,38 @@
+from app.domain.models.product import Product
+from app.domain.repositories.async_brand_repository import AsyncBrandRepository
+from app.domain.repositories.async_product_repository import AsyncProductRepository
+from app.domain.repositories.async_unit_of_work import AsyncUnitOfWork
+from app.domain.use_cases.products.create.product_create_input import ProductCreateInput
+from app.domain.use_cases.products.product_validation import (
+    brand_not_found,
+    sku_already_exists,
+)
+
+
+class AsyncProductCreateUseCase:
+
+    def __init__(
+        self,
+        product_repository: AsyncProductRepository,
+        brand_repository: AsyncBrandRepository,
+        unit_of_work: AsyncUnitOfWork,
+    ) -> None:
+        self.product_repository = product_repository
+        self.brand_repository = brand_repository
+        self.unit_of_work = unit_of_work
+
+    async def create_product(self, create_input: ProductCreateInput) -> Product:
+        async with self.unit_of_work:
+            await self._apply_business_validation(create_input)
+            return await self.product_repository.create(product_create=create_input)
+
+    async def _apply_business_validation(
+        self,
+        product_create_input: ProductCreateInput,
+    ) -> None:
+        if not await self.brand_repository.exists_by_id(
+            product_create_input.brand_id,
+        ):
+            raise brand_not_found(product_create_input.brand_id)
+        if await self.product_repository.exists_by_sku(product_create_input.sku):
+            raise sku_already_exists(product_create_input.sku)
@@ -0,0 +1,31 @@
+from app.domain.models.product import Product
+from app.domain.repositories.async_product_repository import AsyncProductRepository
+from app.domain.repositories.async_product_view_repository import (
+    AsyncProductViewRepository,
+)
+from app.domain.repositories.async_unit_of_work import AsyncUnitOfWork
+from app.domain.use_cases.products.product_validation import product_not_found
+
+
+class AsyncProductDetailUseCase:
+
+    def __init__(
+        self,
+        product_repository: AsyncProductRepository,
+        view_repository: AsyncProductViewRepository,
+        unit_of_work: AsyncUnitOfWork,
+    ) -> None:
+        self.product_repository = product_repository
+        self.view_repository = view_repository
+        self.unit_of_work = unit_of_work
+
+    async def get_product(self, product_id: str, increment_view: bool) -> Product:
+        async with self.unit_of_work:
+            product = await self.product_repository.find_by_id(product_id)
+            if product is None:
+                raise product_not_found(product_id)
+
+            if increment_view:
+                await self.view_repository.increment_view(product_id)
+
+            return product
@@ -0,0 +1,75 @@
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
+from app.domain.models.product import Product
+from app.domain.repositories.async_brand_repository import AsyncBrandRepository
+from app.domain.repositories.async_outbox_repository import AsyncOutboxRepository
+from app.domain.repositories.async_product_repository import AsyncProductRepository
+from app.domain.repositories.async_unit_of_work import AsyncUnitOfWork
+from app.domain.services.product_update_event import ProductUpdateEvent
+from app.domain.use_cases.products.edit.product_update_input import ProductUpdateInput
+from app.domain.use_cases.products.product_validation import (
+    brand_not_found,
+    product_changes,
+    sku_already_exists,
+    sku_taken_by_another_product,
+)
+
+
+class AsyncProductUpdateUseCase:
+
+    def __init__(
+        self,
+        product_repository: AsyncProductRepository,
+        brand_repository: AsyncBrandRepository,
+        outbox_repository: AsyncOutboxRepository,
+        unit_of_work: AsyncUnitOfWork,
+    ) -> None:
+        self.product_repository = product_repository
+        self.brand_repository = brand_repository
+        self.outbox_repository = outbox_repository
+        self.unit_of_work = unit_of_work
+
+    async def update_product(
+        self,
+        product_id: str,
+        update_input: ProductUpdateInput,
+    ) -> Product:
+        async with self.unit_of_work:
+            await self._apply_business_validation(product_id, update_input)
+            # Sent by the outbox dispatcher once the update is committed
+            await self._record_changes(product_id, update_input)
+            return await self.product_repository.update(
+                product_id=product_id,
+                product_update=update_input,
+            )
+
+    async def _apply_business_validation(
+        self,
+        product_id: str,
+        update_input: ProductUpdateInput,
+    ) -> None:
+        if not await self.brand_repository.exists_by_id(update_input.brand_id):
+            raise brand_not_found(update_input.brand_id)
+
+        product_by_sku = await self.product_repository.find_by_sku(update_input.sku)
+        if sku_taken_by_another_product(product_by_sku, product_id):
+            raise sku_already_exists(update_input.sku)
+
+    async def _record_changes(
+        self,
+        product_id: str,
+        update_input: ProductUpdateInput,
+    ) -> None:
+        existing_product = await self.product_repository.find_by_id(product_id)
+        if not existing_product:
+            return
+
+        changes = product_changes(existing_product, update_input)
+        if changes:
+            event = ProductUpdateEvent(
+                product_id=product_id,
+                changes=changes,
+            )
+            await self.outbox_repository.add(
+                OutboxEventType.PRODUCT_UPDATED,
+                event.model_dump(mode="json"),
+            )
@@ -1,12 +1,17 @@
-from app.core.configurations import settings
-from app.domain.enums.code_enum import ErrorCodeEnum
-from app.domain.exceptions.data_validation_exception import DataValidationError
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
 from app.domain.models.product import Product
 from app.domain.repositories.brand_repository import BrandRepository
+from app.domain.repositories.outbox_repository import OutboxRepository
 from app.domain.repositories.product_repository import ProductRepository
-from app.domain.services.notification_service import NotificationService
+from app.domain.repositories.unit_of_work import UnitOfWork
 from app.domain.services.product_update_event import ProductUpdateEvent
 from app.domain.use_cases.products.edit.product_update_input import ProductUpdateInput
+from app.domain.use_cases.products.product_validation import (
+    brand_not_found,
+    product_changes,
+    sku_already_exists,
+    sku_taken_by_another_product,
+)
 
 
 class ProductUpdateUseCase:
@@ -15,23 +20,27 @@ class ProductUpdateUseCase:
         self,
         product_repository: ProductRepository,
         brand_repository: BrandRepository,
-        notification_service: NotificationService,
+        outbox_repository: OutboxRepository,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.product_repository = product_repository
         self.brand_repository = brand_repository
-        self.notification_service = notification_service
+        self.outbox_repository = outbox_repository
+        self.unit_of_work = unit_of_work
 
     def update_product(
         self,
         product_id: str,
         update_input: ProductUpdateInput,
     ) -> Product:
-        self._apply_business_validation(product_id, update_input)
-        self._notify_changes(product_id, update_input)
-        return self.product_repository.update(
-            product_id=product_id,
-            product_update=update_input,
-        )
+        with self.unit_of_work:
+            self._apply_business_validation(product_id, update_input)
+            # Sent by the outbox dispatcher once the update is committed
+            self._record_changes(product_id, update_input)
+            return self.product_repository.update(
+                product_id=product_id,
+                product_update=update_input,
+            )
 
     def _apply_business_validation(
         self,
@@ -39,21 +48,13 @@ class ProductUpdateUseCase:
         update_input: ProductUpdateInput,
     ) -> None:
         if not self.brand_repository.exists_by_id(update_input.brand_id):
-            raise DataValidationError(
-                code=ErrorCodeEnum.BRAND_NOT_FOUND,
-                location=["brand_id"],
-                message=f"Brand with ID '{update_input.brand_id}' not found",
-            )
+            raise brand_not_found(update_input.brand_id)
 
         product_by_sku = self.product_repository.find_by_sku(update_input.sku)
-        if product_by_sku and product_by_sku.id != product_id:
-            raise DataValidationError(
-                code=ErrorCodeEnum.ALREADY_EXIST_PRODUCT_SKU,
-                location=["sku"],
-                message=f"Product with SKU '{update_input.sku}' already exists",
-            )
+        if sku_taken_by_another_product(product_by_sku, product_id):
+            raise sku_already_exists(update_input.sku)
 
-    def _notify_changes(
+    def _record_changes(
         self,
         product_id: str,
         update_input: ProductUpdateInput,
@@ -62,35 +63,13 @@ class ProductUpdateUseCase:
         if not existing_product:
             return
 
-        changes = {}
-        if existing_product.name != update_input.name:
-            changes["name"] = {
-                "old": existing_product.name,
-                "new": update_input.name,
-            }
-        if existing_product.sku != update_input.sku:
-            changes["sku"] = {
-                "old": existing_product.sku,
-                "new": update_input.sku,
-            }
-        if existing_product.price != update_input.price:
-            changes["price"] = {
-                "old": existing_product.price,
-                "new": update_input.price,
-            }
-        if existing_product.brand_id != update_input.brand_id:
-            changes["brand_id"] = {
-                "old": existing_product.brand_id,
-                "new": update_input.brand_id,
-            }
-
+        changes = product_changes(existing_product, update_input)
         if changes:
             event = ProductUpdateEvent(
                 product_id=product_id,
                 changes=changes,
             )
-            self.notification_service.notify(
-                sender_email=settings.SES_SENDER_EMAIL,
-                recipient_email=settings.SES_RECIPIENT_EMAIL,
-                event=event,
+            self.outbox_repository.add(
+                OutboxEventType.PRODUCT_UPDATED,
+                event.model_dump(mode="json"),
             )
@@ -0,0 +1,16 @@
+from collections.abc import Iterator
+
+from app.domain.models.product_export import ProductExportRow
+from app.domain.repositories.product_repository import ProductRepository
+
+
+class ProductExportUseCase:
+
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+    ) -> None:
+        self.product_repository = product_repository
+
+    def export_products(self, batch_size: int) -> Iterator[list[ProductExportRow]]:
+        return self.product_repository.export_products(batch_size=batch_size)
@@ -0,0 +1,8 @@
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+
+class ProductPriceUpdateInput(BaseModel):
+    sku: str
+    price: Decimal
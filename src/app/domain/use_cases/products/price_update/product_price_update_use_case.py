@@ -0,0 +1,91 @@
+from app.domain.enums.code_enum import ErrorCodeEnum
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
+from app.domain.exceptions.data_validation_exception import DataValidationError
+from app.domain.models.product_price_update import (
+    ProductPriceChange,
+    ProductPriceUpdateResult,
+)
+from app.domain.repositories.outbox_repository import OutboxRepository
+from app.domain.repositories.product_repository import ProductRepository
+from app.domain.repositories.unit_of_work import UnitOfWork
+from app.domain.services.product_batch_update_event import ProductBatchUpdateEvent
+from app.domain.services.product_update_event import ProductUpdateEvent
+from app.domain.use_cases.products.price_update.product_price_update_input import (
+    ProductPriceUpdateInput,
+)
+
+
+class ProductPriceUpdateUseCase:
+    """
+    Updates the price of many products, identified by SKU, in a single statement.
+    The changes are left in the outbox in the same transaction, as a single
+    message, and sent as one digest by the outbox dispatcher.
+    """
+
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        outbox_repository: OutboxRepository,
+        unit_of_work: UnitOfWork,
+    ) -> None:
+        self.product_repository = product_repository
+        self.outbox_repository = outbox_repository
+        self.unit_of_work = unit_of_work
+
+    def update_prices(
+        self,
+        prices: list[ProductPriceUpdateInput],
+    ) -> ProductPriceUpdateResult:
+        self._apply_business_validation(prices)
+
+        with self.unit_of_work:
+            changes = self.product_repository.update_prices(prices)
+            self._record_changes(changes)
+
+        changed_skus = {change.sku for change in changes}
+        pending_skus = {price.sku for price in prices} - changed_skus
+        not_found_skus = (
+            pending_skus - self.product_repository.find_existing_skus(pending_skus)
+            if pending_skus
+            else set()
+        )
+
+        return ProductPriceUpdateResult(
+            changes=changes,
+            unchanged=len(pending_skus) - len(not_found_skus),
+            not_found_skus=sorted(not_found_skus),
+        )
+
+    @staticmethod
+    def _apply_business_validation(prices: list[ProductPriceUpdateInput]) -> None:
+        seen_skus = set()
+        for index, price in enumerate(prices):
+            if price.sku in seen_skus:
+                raise DataValidationError(
+                    code=ErrorCodeEnum.REPEATED_PRODUCT_SKU,
+                    location=["prices", index, "sku"],
+                    message=f"Product with SKU '{price.sku}' is repeated",
+                )
+            seen_skus.add(price.sku)
+
+    def _record_changes(self, changes: list[ProductPriceChange]) -> None:
+        # One message for the whole batch, however many products it changed
+        if not changes:
+            return
+        self.outbox_repository.add(
+            OutboxEventType.PRODUCTS_UPDATED,
+            ProductBatchUpdateEvent(
+                events=[
+                    ProductUpdateEvent(
+                        product_id=change.product_id,
+                        changes={
+                            "price": {
+                                "old": change.old_price,
+                                "new": change.new_price,
+                            },
+                        },
+                    )
+                    for change in changes
+                ],
+            ).model_dump(mode="json"),
+        )
@@ -0,0 +1,57 @@
+"""Business rules shared by the sync and async product use cases."""
+
+from typing import Any
+
+from app.domain.enums.code_enum import ErrorCodeEnum
+from app.domain.exceptions.data_validation_exception import DataValidationError
+from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundError
+from app.domain.models.product import Product
+from app.domain.use_cases.products.edit.product_update_input import ProductUpdateInput
+
+# Fields whose changes are published when a product is updated
+TRACKED_FIELDS = ("name", "sku", "price", "brand_id")
+
+
+def brand_not_found(brand_id: str) -> DataValidationError:
+    return DataValidationError(
+        code=ErrorCodeEnum.BRAND_NOT_FOUND,
+        location=["brand_id"],
+        message=f"Brand with ID '{brand_id}' not found",
+    )
+
+
+def sku_already_exists(sku: str) -> DataValidationError:
+    return DataValidationError(
+        code=ErrorCodeEnum.ALREADY_EXIST_PRODUCT_SKU,
+        location=["sku"],
+        message=f"Product with SKU '{sku}' already exists",
+    )
+
+
+def product_not_found(product_id: str) -> ResourceNotFoundError:
+    return ResourceNotFoundError(
+        code=ErrorCodeEnum.BRAND_NOT_FOUND,
+        location=["product_id"],
+        message=f"No product found with ID: {product_id}.",
+    )
+
+
+def sku_taken_by_another_product(
+    product_by_sku: Product | None,
+    product_id: str,
+) -> bool:
+    return product_by_sku is not None and product_by_sku.id != product_id
+
+
+def product_changes(
+    product: Product,
+    update_input: ProductUpdateInput,
+) -> dict[str, dict[str, Any]]:
+    """Old and new value of every tracked field the update changes."""
+    changes = {}
+    for field in TRACKED_FIELDS:
+        old_value = getattr(product, field)
+        new_value = getattr(update_input, field)
+        if old_value != new_value:
+            changes[field] = {"old": old_value, "new": new_value}
+    return changes
@@ -0,0 +1,23 @@
+from app.domain.repositories.async_product_repository import AsyncProductRepository
+from app.domain.repositories.async_product_view_repository import (
+    AsyncProductViewRepository,
+)
+from app.domain.repositories.async_unit_of_work import AsyncUnitOfWork
+
+
+class AsyncProductRemoveUseCase:
+
+    def __init__(
+        self,
+        product_repository: AsyncProductRepository,
+        view_repository: AsyncProductViewRepository,
+        unit_of_work: AsyncUnitOfWork,
+    ) -> None:
+        self.product_repository = product_repository
+        self.view_repository = view_repository
+        self.unit_of_work = unit_of_work
+
+    async def remove_product(self, product_id: str) -> None:
+        async with self.unit_of_work:
+            await self.view_repository.delete_views_by_product_id(product_id)
+            await self.product_repository.delete_by_id(product_id)
@@ -1,5 +1,6 @@
 from app.domain.repositories.product_repository import ProductRepository
 from app.domain.repositories.product_view_repository import ProductViewRepository
+from app.domain.repositories.unit_of_work import UnitOfWork
 
 
 class ProductRemoveUseCase:
@@ -8,10 +9,13 @@ class ProductRemoveUseCase:
         self,
         product_repository: ProductRepository,
         view_repository: ProductViewRepository,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.product_repository = product_repository
         self.view_repository = view_repository
+        self.unit_of_work = unit_of_work
 
     def remove_product(self, product_id: str) -> None:
-        self.view_repository.delete_views_by_product_id(product_id)
-        self.product_repository.delete_by_id(product_id)
+        with self.unit_of_work:
+            self.view_repository.delete_views_by_product_id(product_id)
+            self.product_repository.delete_by_id(product_id)
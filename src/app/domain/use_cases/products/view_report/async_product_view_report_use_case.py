@@ -0,0 +1,14 @@
+from app.domain.models.product import ProductView
+from app.domain.repositories.async_product_repository import AsyncProductRepository
+
+
+class AsyncProductViewReportUseCase:
+
+    def __init__(
+        self,
+        product_repository: AsyncProductRepository,
+    ) -> None:
+        self.product_repository = product_repository
+
+    async def view_report(self, brand_id: str | None) -> list[ProductView]:
+        return await self.product_repository.list_products(brand_id=brand_id)
@@ -1,3 +1,6 @@
+from anyio import to_thread
+
+from app.core.security_utils import hash_password
 from app.domain.enums.code_enum import ErrorCodeEnum
 from app.domain.enums.role_enum import UserRole
 from app.domain.exceptions.data_validation_exception import DataValidationError
@@ -14,9 +17,17 @@ class UserCreateUseCase:
     ) -> None:
         self.user_repository = user_repository
 
-    def create_user(self, user_create_input: UserCreateInput) -> User:
-        self._apply_business_validation(user_create_input)
-        return self.user_repository.create(user=user_create_input, role=UserRole.ADMIN)
+    async def create_user(self, user_create_input: UserCreateInput) -> User:
+        # The password is hashed on its own pool (see PasswordHasher) and
+        # only the queries run on the threadpool
+        await to_thread.run_sync(self._apply_business_validation, user_create_input)
+        hashed_password = await hash_password(user_create_input.password)
+        return await to_thread.run_sync(
+            self.user_repository.create,
+            user_create_input,
+            hashed_password,
+            UserRole.ADMIN,
+        )
 
     def _apply_business_validation(self, create_input: UserCreateInput) -> None:
         if self.user_repository.exists_by(
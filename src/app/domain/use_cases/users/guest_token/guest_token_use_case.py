@@ -0,0 +1,26 @@
+from datetime import timedelta
+
+from app.core.configurations import settings
+from app.core.security_utils import create_access_token
+from app.domain.enums.role_enum import UserRole
+from app.domain.helpers.ulid_generator import generate_ulid
+
+GUEST_SUBJECT_PREFIX = "guest-"
+
+
+class GuestTokenUseCase:
+    """
+    Short-lived ANONYMOUS tokens for browsing the catalog: no user row and no
+    password hashing, just a signature. The `guest` claim keeps them to the
+    routes that accept guests.
+    """
+
+    def issue(self) -> str:
+        return create_access_token(
+            {
+                "sub": f"{GUEST_SUBJECT_PREFIX}{generate_ulid()}",
+                "role": UserRole.ANONYMOUS.value,
+                "guest": True,
+            },
+            expires_delta=timedelta(minutes=settings.GUEST_TOKEN_EXPIRE_MINUTES),
+        )
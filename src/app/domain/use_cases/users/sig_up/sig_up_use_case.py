@@ -1,3 +1,6 @@
+from anyio import to_thread
+
+from app.core.security_utils import hash_password
 from app.domain.enums.code_enum import ErrorCodeEnum
 from app.domain.enums.role_enum import UserRole
 from app.domain.exceptions.data_validation_exception import DataValidationError
@@ -14,9 +17,15 @@ class SigUpUseCase:
     ) -> None:
         self.user_repository = user_repository
 
-    def sig_up(self, sig_up_input: SigUpInput) -> User:
-        self._apply_business_validation_create(sig_up_input)
-        return self.user_repository.create(user=sig_up_input, role=UserRole.ANONYMOUS)
+    async def sig_up(self, sig_up_input: SigUpInput) -> User:
+        await to_thread.run_sync(self._apply_business_validation_create, sig_up_input)
+        hashed_password = await hash_password(sig_up_input.password)
+        return await to_thread.run_sync(
+            self.user_repository.create,
+            sig_up_input,
+            hashed_password,
+            UserRole.ANONYMOUS,
+        )
 
     def _apply_business_validation_create(self, sig_up_input: SigUpInput) -> None:
         if self.user_repository.exists_by(
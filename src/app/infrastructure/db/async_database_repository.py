@@ -0,0 +1,82 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.db.async_session import AsyncSessionLocal
+from app.infrastructure.db.database_repository import UNIT_OF_WORK_DEPTH
+from app.infrastructure.db.routing_session import reads_on_replica
+from app.infrastructure.db.session_scope import current_session_scope
+
+
+class AsyncDatabaseRepository:
+    """
+    Async counterpart of DatabaseRepository: manages the AsyncSession used by
+    the async repositories.
+    """
+
+    def __init__(self) -> None:
+        self._session: AsyncSession | None = None
+
+    def get_db_session(self) -> AsyncSession:
+        if self._session is None:
+            # Inside a request the session belongs to the request scope
+            scope = current_session_scope()
+            if scope is not None:
+                return scope.get_async_session(AsyncSessionLocal)
+
+            self._session = AsyncSessionLocal()
+        return self._session
+
+    @contextmanager
+    def read_only(self) -> Iterator[None]:
+        """
+        Lets the statements run inside the block go to a read replica, under the
+        same rules as DatabaseRepository.read_only.
+        """
+        with reads_on_replica(
+            self.get_db_session().info,
+            in_unit_of_work=self.in_unit_of_work(),
+        ):
+            yield
+
+    async def commit(self) -> None:
+        """
+        Commits the session, or only flushes it inside a unit of work, which
+        commits once at its end.
+        """
+        if self.in_unit_of_work():
+            await self.get_db_session().flush()
+            return
+
+        try:
+            await self.get_db_session().commit()
+        except Exception:
+            await self.get_db_session().rollback()
+            raise
+
+    async def rollback(self) -> None:
+        await self.get_db_session().rollback()
+
+    async def close(self) -> None:
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+    def in_unit_of_work(self) -> bool:
+        return self.get_db_session().info.get(UNIT_OF_WORK_DEPTH, 0) > 0
+
+    def begin_unit_of_work(self) -> None:
+        info = self.get_db_session().info
+        info[UNIT_OF_WORK_DEPTH] = info.get(UNIT_OF_WORK_DEPTH, 0) + 1
+
+    async def end_unit_of_work(self, commit: bool) -> None:
+        info = self.get_db_session().info
+        info[UNIT_OF_WORK_DEPTH] -= 1
+        if info[UNIT_OF_WORK_DEPTH] > 0:
+            return
+
+        if commit:
+            await self.commit()
+        else:
+            await self.rollback()
@@ -0,0 +1,99 @@
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from app.core.configurations import settings
+from app.infrastructure.db.pool import InstrumentedAsyncAdaptedQueuePool
+from app.infrastructure.db.routing_session import RoutingSession
+from app.infrastructure.db.session import pool_options, read_database_urls
+
+_async_engine: AsyncEngine | None = None
+_async_read_engines: list[AsyncEngine] | None = None
+
+
+def async_database_url(database_url: str) -> str:
+    """Same database as DATABASE_URL, through the asyncpg driver."""
+    return (
+        make_url(database_url)
+        .set(drivername="postgresql+asyncpg")
+        .render_as_string(hide_password=False)
+    )
+
+
+def asyncpg_connect_args() -> dict[str, Any]:
+    if not settings.DATABASE_PGBOUNCER:
+        return {}
+    # asyncpg prepares every statement and caches it on the connection. Behind
+    # transaction pooling the next transaction may land on another server
+    # connection (where the statement does not exist) or on one where another
+    # client already used the same generated name. No caching, unique names.
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+
+
+def create_async_database_engine(database_url: str) -> AsyncEngine:
+    options = pool_options()
+    options.setdefault("poolclass", InstrumentedAsyncAdaptedQueuePool)
+    return create_async_engine(
+        async_database_url(database_url),
+        connect_args=asyncpg_connect_args(),
+        **options,
+    )
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Created on first use, so workers running the sync data path never load
+    asyncpg or open its pool.
+    """
+    global _async_engine  # noqa: PLW0603
+    if _async_engine is None:
+        _async_engine = create_async_database_engine(settings.DATABASE_URL)
+    return _async_engine
+
+
+def created_async_engine() -> AsyncEngine | None:
+    """The async engine if something already used it, without creating it."""
+    return _async_engine
+
+
+def set_async_engine(engine: AsyncEngine | None) -> None:
+    global _async_engine  # noqa: PLW0603
+    _async_engine = engine
+
+
+def get_async_read_engines() -> list[AsyncEngine]:
+    """Async engines of the DATABASE_READ_URL replicas, also created on first use."""
+    global _async_read_engines  # noqa: PLW0603
+    if _async_read_engines is None:
+        _async_read_engines = [
+            create_async_database_engine(url) for url in read_database_urls()
+        ]
+    return _async_read_engines
+
+
+def created_async_read_engines() -> list[AsyncEngine]:
+    return _async_read_engines or []
+
+
+def set_async_read_engines(engines: list[AsyncEngine] | None) -> None:
+    global _async_read_engines  # noqa: PLW0603
+    _async_read_engines = engines
+
+
+def AsyncSessionLocal() -> AsyncSession:  # noqa: N802
+    # Objects are not expired on commit: reloading them would need IO that
+    # can not happen implicitly with asyncio. The wrapped sync session routes
+    # the read-only statements to the replicas, like SessionLocal does
+    return AsyncSession(
+        bind=get_async_engine(),
+        sync_session_class=RoutingSession,
+        read_engines=[engine.sync_engine for engine in get_async_read_engines()],
+        autoflush=False,
+        expire_on_commit=False,
+    )
@@ -1,6 +1,18 @@
+import csv
+import io
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.infrastructure.db.routing_session import reads_on_replica
 from app.infrastructure.db.session import SessionLocal
+from app.infrastructure.db.session_scope import current_session_scope
+
+# Session.info key counting the units of work open on a session
+UNIT_OF_WORK_DEPTH = "unit_of_work_depth"
 
 
 class DatabaseRepository:
@@ -13,16 +25,60 @@ class DatabaseRepository:
 
     def get_db_session(self) -> Session:
         if self._session is None:
+            # Inside a request the session belongs to the request scope
+            scope = current_session_scope()
+            if scope is not None:
+                return scope.get_session(SessionLocal)
+
             self._session = SessionLocal()
         return self._session
 
     def commit(self) -> None:
+        """
+        Commits the session, or only flushes it inside a unit of work, which
+        commits once at its end.
+        """
+        if self.in_unit_of_work():
+            self.get_db_session().flush()
+            return
+
         try:
             self.get_db_session().commit()
         except Exception:
             self.get_db_session().rollback()
             raise
 
+    @contextmanager
+    def read_only(self) -> Iterator[None]:
+        """
+        Lets the statements run inside the block go to a read replica. Inside a
+        unit of work, or once the session went to the primary, it does nothing:
+        those reads belong to the write transaction (see RoutingSession).
+        """
+        with reads_on_replica(
+            self.get_db_session().info,
+            in_unit_of_work=self.in_unit_of_work(),
+        ):
+            yield
+
+    def in_unit_of_work(self) -> bool:
+        return self.get_db_session().info.get(UNIT_OF_WORK_DEPTH, 0) > 0
+
+    def begin_unit_of_work(self) -> None:
+        info = self.get_db_session().info
+        info[UNIT_OF_WORK_DEPTH] = info.get(UNIT_OF_WORK_DEPTH, 0) + 1
+
+    def end_unit_of_work(self, commit: bool) -> None:
+        info = self.get_db_session().info
+        info[UNIT_OF_WORK_DEPTH] -= 1
+        if info[UNIT_OF_WORK_DEPTH] > 0:
+            return
+
+        if commit:
+            self.commit()
+        else:
+            self.rollback()
+
     def add_and_commit(self, entity) -> None:  # noqa: ANN001
         self.get_db_session().add(entity)
         self.commit()
@@ -34,3 +90,38 @@ class DatabaseRepository:
         if self._session:
             self._session.close()
             self._session = None
+
+    def create_temp_table(self, name: str, columns: str) -> None:
+        """
+        (Re)creates a temporary table that is dropped at the end of the current
+        transaction. `name` and `columns` must never come from user input.
+        """
+        session = self.get_db_session()
+        session.execute(text(f"DROP TABLE IF EXISTS pg_temp.{name}"))
+        session.execute(
+            text(f"CREATE TEMP TABLE {name} ({columns}) ON COMMIT DROP"),
+        )
+
+    def copy_rows(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+    ) -> None:
+        """
+        Loads rows into `table` with a single COPY ... FROM STDIN on the session's
+        connection, then analyzes it. `None` values are loaded as NULL.
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+
+        dbapi_connection = self.get_db_session().connection().connection
+        with dbapi_connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+            # Autovacuum never analyzes temporary tables: without statistics the
+            # planner joins them to the big tables with sequential scans
+            cursor.execute(f"ANALYZE {table}")
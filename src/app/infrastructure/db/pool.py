@@ -0,0 +1,63 @@
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+
+class PoolWaitMetrics:
+    """Counters about the time requests wait for a pooled connection."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, wait_seconds: float, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += wait_seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+
+class _WaitMeasuredPool:
+    """Measures how long each checkout of a QueuePool waits for a connection."""
+
+    _max_overflow: int
+
+    def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        super().__init__(*args, **kwargs)
+        self.wait_metrics = PoolWaitMetrics()
+
+    @property
+    def max_overflow(self) -> int:
+        """Connections that can be opened above the pool size."""
+        return self._max_overflow
+
+    def recreate(self) -> QueuePool:
+        pool = super().recreate()
+        pool.wait_metrics = self.wait_metrics
+        return pool
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.wait_metrics.record(time.perf_counter() - started, timed_out=False)
+        return connection
+
+
+class InstrumentedQueuePool(_WaitMeasuredPool, QueuePool):
+    """QueuePool that measures how long each checkout waits for a connection."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_WaitMeasuredPool, AsyncAdaptedQueuePool):
+    """Same measures for the pool of the asyncpg engine."""
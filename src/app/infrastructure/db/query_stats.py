@@ -0,0 +1,63 @@
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.engine import Connection
+
+from app.infrastructure.db.statement_timing import on_statement_timed
+
+
+@dataclass
+class QueryStats:
+    """Statements run (and time spent running them) while recording."""
+
+    count: int = 0
+    seconds: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements run at least `threshold` times, a sign of N+1 queries."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar(
+    "query_stats",
+    default=None,
+)
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryStats]:
+    """
+    Counts the statements run by the code in this context, threads started with
+    a copy of the context (e.g. run_in_threadpool) included.
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@on_statement_timed
+def _count_statement(
+    _conn: Connection,
+    statement: str,
+    _parameters: Any,
+    _executemany: bool,
+    seconds: float,
+) -> None:
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.count += 1
+    stats.seconds += seconds
+    stats.statements[statement] += 1
@@ -0,0 +1,72 @@
+import itertools
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+# Session.info keys
+READ_ONLY = "read_only"
+HAS_WRITTEN = "has_written"
+READ_ENGINE = "read_engine"
+
+# Shared by every session, so consecutive sessions (requests) take turns
+_next_read_engine = itertools.count()
+
+
+class RoutingSession(Session):
+    """
+    Session that sends the statements run in read-only mode (see
+    DatabaseRepository.read_only) to one of the read replicas, chosen
+    round-robin once per session. Everything else goes to the primary, and
+    a session that already went to the primary for anything else stays
+    there, so a request always reads its own writes. Read-only mode is never
+    turned on inside a unit of work, whose reads must see the primary too.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        read_engines: Sequence[Engine] = (),
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.read_engines = read_engines
+
+    def get_bind(
+        self,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Engine | Connection:
+        if not self.read_engines:
+            return super().get_bind(*args, **kwargs)
+
+        if self.info.get(READ_ONLY) and not self.info.get(HAS_WRITTEN):
+            if READ_ENGINE not in self.info:
+                self.info[READ_ENGINE] = self.read_engines[
+                    next(_next_read_engine) % len(self.read_engines)
+                ]
+            return self.info[READ_ENGINE]
+
+        self.info[HAS_WRITTEN] = True
+        return super().get_bind(*args, **kwargs)
+
+
+@contextmanager
+def reads_on_replica(info: dict[str, Any], in_unit_of_work: bool) -> Iterator[None]:
+    """
+    Turns on read-only mode for the session whose `info` is given during the
+    block. Inside a unit of work, or once the session went to the primary, it
+    does nothing: those reads belong to the write transaction.
+    """
+    if in_unit_of_work or info.get(HAS_WRITTEN):
+        yield
+        return
+
+    previous = info.get(READ_ONLY, False)
+    info[READ_ONLY] = True
+    try:
+        yield
+    finally:
+        info[READ_ONLY] = previous
@@ -1,8 +1,59 @@
-from sqlalchemy import create_engine
+from typing import Any
+
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.core.configurations import settings
+from app.infrastructure.db.pool import InstrumentedQueuePool
+from app.infrastructure.db.routing_session import RoutingSession
+
+
+def pool_options() -> dict[str, Any]:
+    """Pool arguments shared by the sync and async engines."""
+    if settings.DATABASE_NULL_POOL:
+        return {
+            "poolclass": NullPool,
+            "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        }
+    return {
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "pool_use_lifo": settings.DATABASE_POOL_USE_LIFO,
+    }
+
+
+def create_database_engine(url: str) -> Engine:
+    """
+    psycopg2 sends the parameters inline and never prepares statements on the
+    server; the only session state it relies on (named cursors for the export,
+    ON COMMIT DROP temp tables) lives inside a transaction. So PgBouncer's
+    transaction pooling only changes the pool here.
+    """
+    options = pool_options()
+    options.setdefault("poolclass", InstrumentedQueuePool)
+    return create_engine(url, echo=False, future=True, **options)
+
+
+def read_database_urls() -> list[str]:
+    """Read replicas listed in DATABASE_READ_URL, comma-separated."""
+    return [
+        url.strip()
+        for url in (settings.DATABASE_READ_URL or "").split(",")
+        if url.strip()
+    ]
+
 
-engine = create_engine(settings.DATABASE_URL, echo=False, future=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_database_engine(settings.DATABASE_URL)
+read_engines = [create_database_engine(url) for url in read_database_urls()]
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    read_engines=read_engines,
+)
 Base = declarative_base()
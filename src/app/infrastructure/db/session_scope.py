@@ -0,0 +1,146 @@
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import (
+    ConnectionPoolEntry,
+    Pool,
+    PoolProxiedConnection,
+)
+
+from app.core.configurations import settings
+from app.core.logging_config import logger
+
+
+class SessionLeakError(RuntimeError):
+    """Raised when a connection outlives the scope that checked it out."""
+
+
+class DatabaseSessionScope:
+    """
+    Owns the session shared by every repository used while the scope is
+    active (typically one HTTP request). The session is opened on first use
+    and closed, returning its connection to the pool, when the scope ends.
+    """
+
+    def __init__(self) -> None:
+        self._session: Session | None = None
+        self._async_session: AsyncSession | None = None
+        self._checked_out: set[int] = set()
+        self.closed = False
+
+    def get_session(self, session_factory: Callable[[], Session]) -> Session:
+        if self.closed:
+            msg = "The database session scope is already closed"
+            raise RuntimeError(msg)
+        if self._session is None:
+            self._session = session_factory()
+        return self._session
+
+    def get_async_session(
+        self,
+        session_factory: Callable[[], AsyncSession],
+    ) -> AsyncSession:
+        if self.closed:
+            msg = "The database session scope is already closed"
+            raise RuntimeError(msg)
+        if self._async_session is None:
+            self._async_session = session_factory()
+        return self._async_session
+
+    async def close_async_session(self) -> None:
+        """Must be awaited before close() when the scope used the async path."""
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        self.closed = True
+
+        if self._checked_out:
+            message = (
+                f"{len(self._checked_out)} database connection(s) checked out "
+                "during the scope were not returned to the pool"
+            )
+            logger.error(message)
+            if settings.RAISE_ON_DB_SESSION_LEAK:
+                raise SessionLeakError(message)
+
+
+_current_scope: ContextVar[DatabaseSessionScope | None] = ContextVar(
+    "database_session_scope",
+    default=None,
+)
+
+
+def current_session_scope() -> DatabaseSessionScope | None:
+    return _current_scope.get()
+
+
+@contextmanager
+def activate_session_scope(scope: DatabaseSessionScope) -> Iterator[None]:
+    """
+    Makes `scope` the current one for the code running in this context, threads
+    started with a copy of the context (e.g. run_in_threadpool) included.
+    """
+    token = _current_scope.set(scope)
+    try:
+        yield
+    finally:
+        _current_scope.reset(token)
+
+
+@contextmanager
+def database_session_scope() -> Iterator[DatabaseSessionScope]:
+    """Session scope for code running outside a request (scripts, workers)."""
+    scope = DatabaseSessionScope()
+    try:
+        with activate_session_scope(scope):
+            yield scope
+    finally:
+        scope.close()
+
+
+@asynccontextmanager
+async def async_database_session_scope() -> AsyncIterator[DatabaseSessionScope]:
+    """Session scope for async code running outside a request."""
+    scope = DatabaseSessionScope()
+    try:
+        with activate_session_scope(scope):
+            yield scope
+    finally:
+        try:
+            await scope.close_async_session()
+        finally:
+            scope.close()
+
+
+# Leak detection: every connection checked out while a scope is active is
+# tracked by that scope until it is checked in again.
+@event.listens_for(Pool, "checkout")
+def _track_checkout(
+    _dbapi_connection: DBAPIConnection,
+    connection_record: ConnectionPoolEntry,
+    _connection_proxy: PoolProxiedConnection,
+) -> None:
+    scope = _current_scope.get()
+    if scope is not None:
+        scope._checked_out.add(id(connection_record))  # noqa: SLF001
+        connection_record.info["session_scope"] = scope
+
+
+@event.listens_for(Pool, "checkin")
+def _track_checkin(
+    _dbapi_connection: DBAPIConnection | None,
+    connection_record: ConnectionPoolEntry,
+) -> None:
+    scope = connection_record.info.pop("session_scope", None)
+    if scope is not None:
+        scope._checked_out.discard(id(connection_record))  # noqa: SLF001
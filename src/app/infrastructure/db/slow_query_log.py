@@ -0,0 +1,159 @@
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any
+
+from sqlalchemy.engine import Connection
+
+from app.core.configurations import settings
+from app.core.logging_config import logger
+from app.domain.helpers.datetime_generator import get_now_datetime
+from app.domain.models.slow_query import SlowQuery
+from app.infrastructure.db.statement_timing import on_statement_timed
+
+_EXPLAINABLE = re.compile(r"^\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+_PLACEHOLDER = r"(?:%\(\w+\)s|\$\d+)"
+# IN lists expanded to one placeholder per value (psycopg2 and asyncpg styles)
+_EXPANDED_IN = re.compile(rf"\bIN \({_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\)")
+
+
+def normalize_statement(statement: str) -> str:
+    """One line, with IN lists of any length written the same way."""
+    return _EXPANDED_IN.sub("IN (...)", re.sub(r"\s+", " ", statement).strip())
+
+
+def fingerprint_parameters(parameters: Any) -> str:
+    """Tells executions apart without logging the (possibly personal) values."""
+    return hashlib.sha256(repr(parameters).encode()).hexdigest()[:16]
+
+
+class SlowQueryRecorder:
+    """
+    Keeps the last slow queries with their EXPLAIN plan. Plans are captured at
+    most once per statement every SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS, the
+    statement is logged every time.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._lock = threading.Lock()
+        self._captured: deque[SlowQuery] = deque(maxlen=size)
+        # When each statement was last explained, oldest first. Only as many
+        # statements as plans kept are remembered, and none past the interval
+        self._last_explained: OrderedDict[str, float] = OrderedDict()
+        self._remembered = size
+
+    def recent(self) -> list[SlowQuery]:
+        with self._lock:
+            return list(reversed(self._captured))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._captured.clear()
+            self._last_explained.clear()
+
+    def record(
+        self,
+        conn: Connection,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        duration_ms: float,
+    ) -> None:
+        normalized = normalize_statement(statement)
+        fingerprint = fingerprint_parameters(parameters)
+        logger.warning(
+            f"Slow query ({duration_ms:.1f} ms, parameters {fingerprint}): "
+            f"{normalized}",
+        )
+
+        if executemany or not _EXPLAINABLE.match(statement):
+            return
+        if not self._explain_due(normalized):
+            return
+
+        plan = self._explain(conn, statement, parameters)
+        if plan is None:
+            return
+        with self._lock:
+            self._captured.append(
+                SlowQuery(
+                    statement=normalized,
+                    parameters_fingerprint=fingerprint,
+                    duration_ms=duration_ms,
+                    captured_at=get_now_datetime(),
+                    plan=plan,
+                ),
+            )
+
+    def _explain_due(self, normalized: str) -> bool:
+        now = time.monotonic()
+        interval = settings.SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS
+        with self._lock:
+            while self._last_explained:
+                oldest = next(iter(self._last_explained.values()))
+                if now - oldest < interval:
+                    break
+                self._last_explained.popitem(last=False)
+            if normalized in self._last_explained:
+                return False
+            self._last_explained[normalized] = now
+            if len(self._last_explained) > self._remembered:
+                self._last_explained.popitem(last=False)
+            return True
+
+    @staticmethod
+    def _explain(
+        conn: Connection,
+        statement: str,
+        parameters: Any,
+    ) -> list[dict[str, Any]] | None:
+        # Straight on the DBAPI connection: no engine events (so no recursion)
+        # and the cursor of the statement keeps its rows. The savepoint keeps
+        # a failing EXPLAIN from aborting the application's transaction.
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                cursor.execute(
+                    f"EXPLAIN (ANALYZE off, FORMAT JSON) {statement}",
+                    parameters,
+                )
+                plan = cursor.fetchone()[0]
+            except Exception:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                raise
+            finally:
+                cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        except Exception:
+            logger.exception("Could not capture the plan of a slow query")
+            return None
+        finally:
+            cursor.close()
+
+        return json.loads(plan) if isinstance(plan, str) else plan
+
+
+slow_query_recorder = SlowQueryRecorder(size=settings.SLOW_QUERY_RING_SIZE)
+
+
+@on_statement_timed
+def _record_if_slow(
+    conn: Connection,
+    statement: str,
+    parameters: Any,
+    executemany: bool,
+    seconds: float,
+) -> None:
+    threshold_ms = settings.SLOW_QUERY_THRESHOLD_MS
+    duration_ms = seconds * 1000
+    if threshold_ms is not None and duration_ms >= threshold_ms:
+        slow_query_recorder.record(
+            conn,
+            statement,
+            parameters,
+            executemany,
+            duration_ms,
+        )
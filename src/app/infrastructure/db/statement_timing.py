@@ -0,0 +1,61 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext, ExecutionContext
+
+# Called with (connection, statement, parameters, executemany, seconds)
+StatementTimer = Callable[[Connection, str, Any, bool, float], None]
+
+# Connection.info key with the statements in flight and when they started
+_STARTED_AT = "statement_started_at"
+
+_timers: list[StatementTimer] = []
+
+
+def on_statement_timed(timer: StatementTimer) -> StatementTimer:
+    """Registers `timer` to be called after every statement that succeeds."""
+    _timers.append(timer)
+    return timer
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(
+    conn: Connection,
+    _cursor: Any,
+    _statement: str,
+    _parameters: Any,
+    context: ExecutionContext,
+    _executemany: bool,
+) -> None:
+    conn.info.setdefault(_STARTED_AT, []).append((context, time.perf_counter()))
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(
+    conn: Connection,
+    _cursor: Any,
+    statement: str,
+    parameters: Any,
+    _context: ExecutionContext,
+    executemany: bool,
+) -> None:
+    started_at = conn.info.get(_STARTED_AT)
+    if not started_at:
+        return
+    seconds = time.perf_counter() - started_at.pop()[1]
+    for timer in _timers:
+        timer(conn, statement, parameters, executemany, seconds)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context: ExceptionContext) -> None:
+    # A failed statement never reaches after_cursor_execute: drop its start
+    # time, or the connection would carry it back to the pool
+    conn = exception_context.connection
+    if conn is None:
+        return
+    started_at = conn.info.get(_STARTED_AT)
+    if started_at and started_at[-1][0] is exception_context.execution_context:
+        started_at.pop()
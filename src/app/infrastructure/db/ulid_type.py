@@ -0,0 +1,43 @@
+import uuid
+from typing import Any
+
+import ulid
+from sqlalchemy import Dialect, Uuid
+from sqlalchemy.types import TypeDecorator
+
+# Malformed identifiers (e.g. from a URL) can not name any row. They are looked
+# up as the nil ULID, which generate_ulid never returns (it would be dated 1970)
+NIL_ULID = uuid.UUID(int=0)
+
+
+def ulid_to_uuid(value: str) -> uuid.UUID:
+    """The 128 bits of a Crockford base32 ULID, as stored in the database."""
+    try:
+        return ulid.from_str(value).uuid
+    except ValueError:
+        return NIL_ULID
+
+
+def uuid_to_ulid(value: uuid.UUID) -> str:
+    return str(ulid.from_uuid(value))
+
+
+class ULIDType(TypeDecorator):
+    """
+    ULID identifier stored as a 16-byte `uuid` column, and handled everywhere
+    else (models, API, logs) as its 26-character Crockford base32 string.
+    Both encodings sort the same way, so ORDER BY id keeps ULID order.
+    """
+
+    impl = Uuid(as_uuid=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, _dialect: Dialect) -> uuid.UUID | None:
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        return ulid_to_uuid(value)
+
+    def process_result_value(self, value: Any, _dialect: Dialect) -> str | None:
+        if value is None:
+            return None
+        return uuid_to_ulid(value)
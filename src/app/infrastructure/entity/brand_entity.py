@@ -4,13 +4,14 @@ from sqlalchemy import Column, String
 from sqlalchemy.orm import relationship
 
 from app.infrastructure.db.session import Base
+from app.infrastructure.db.ulid_type import ULIDType
 from app.infrastructure.entity.audit_entity import AuditMixinEntity
 
 
 class BrandEntity(AuditMixinEntity, Base):
     __tablename__ = "brands"
 
-    id = Column(String(26), primary_key=True, index=True)
+    id = Column(ULIDType(), primary_key=True, index=True)
     name = Column(String(128), unique=True, index=True, nullable=False)
     description = Column(String(255), nullable=True)
     logo_url = Column(String(255), nullable=True)
@@ -0,0 +1,55 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.infrastructure.db.session import Base
+from app.infrastructure.db.ulid_type import ULIDType
+
+
+class OutboxMessageEntity(Base):
+    """Pending notifications, deleted once delivered."""
+
+    __tablename__ = "outbox"
+
+    # Claimed by created_at, then id (ULIDs of the same millisecond are unordered)
+    id = Column(ULIDType(), primary_key=True)
+    event_type = Column(String(64), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    def __init__(
+        self,
+        id: str,
+        event_type: str,
+        payload: dict[str, Any],
+        created_at: datetime,
+        next_attempt_at: datetime,
+        attempts: int = 0,
+        last_error: str | None = None,
+    ) -> None:
+        self.id = id
+        self.event_type = event_type
+        self.payload = payload
+        self.created_at = created_at
+        self.next_attempt_at = next_attempt_at
+        self.attempts = attempts
+        self.last_error = last_error
+
+
+class OutboxDeadLetterEntity(Base):
+    """Outbox messages that could not be delivered, kept until replayed."""
+
+    __tablename__ = "outbox_dead_letters"
+
+    id = Column(ULIDType(), primary_key=True)
+    event_type = Column(String(64), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    attempts = Column(Integer, nullable=False)
+    last_error = Column(Text, nullable=False)
+    failed_at = Column(DateTime(timezone=True), nullable=False)
@@ -1,23 +1,25 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Index, String
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql.schema import ForeignKey
 from sqlalchemy.sql.sqltypes import Numeric
 
 from app.infrastructure.db.session import Base
+from app.infrastructure.db.ulid_type import ULIDType
 from app.infrastructure.entity.audit_entity import AuditMixinEntity
 
 
 class ProductEntity(AuditMixinEntity, Base):
     __tablename__ = "products"
+    __table_args__ = (Index("ix_products_updated_at_id", "updated_at", "id"),)
 
-    id = Column(String(26), primary_key=True, index=True)
+    id = Column(ULIDType(), primary_key=True, index=True)
     sku = Column(String(64), unique=True, index=True, nullable=False)
     name = Column(String(255), nullable=False)
     price = Column(Numeric(10, 2), nullable=False)
-    brand_id = Column(String(26), ForeignKey("brands.id"), nullable=False)
+    brand_id = Column(ULIDType(), ForeignKey("brands.id"), index=True, nullable=False)
 
     brand = relationship("BrandEntity", back_populates="products")
 
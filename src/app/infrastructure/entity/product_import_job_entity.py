@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from sqlalchemy import Column
+from sqlalchemy.sql.sqltypes import BigInteger, Enum
+
+from app.domain.enums.import_job_status_enum import ImportJobStatus
+from app.infrastructure.db.session import Base
+from app.infrastructure.db.ulid_type import ULIDType
+from app.infrastructure.entity.audit_entity import AuditMixinEntity
+
+
+class ProductImportJobEntity(AuditMixinEntity, Base):
+    __tablename__ = "product_import_jobs"
+
+    id = Column(ULIDType(), primary_key=True, index=True)
+    status = Column(
+        Enum(ImportJobStatus, name="import_job_status"),
+        nullable=False,
+        default=ImportJobStatus.RUNNING,
+    )
+    rows_processed = Column(BigInteger, nullable=False, default=0)
+    imported = Column(BigInteger, nullable=False, default=0)
+    rejected = Column(BigInteger, nullable=False, default=0)
+
+    def __init__(
+        self,
+        id: str,
+        status: ImportJobStatus,
+        rows_processed: int,
+        imported: int,
+        rejected: int,
+        created_at: datetime,
+        updated_at: datetime,
+    ) -> None:
+        self.id = id
+        self.status = status
+        self.rows_processed = rows_processed
+        self.imported = imported
+        self.rejected = rejected
+        self.created_at = created_at
+        self.updated_at = updated_at
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index
+
+from app.infrastructure.db.session import Base
+from app.infrastructure.db.ulid_type import ULIDType
+
+
+class ProductTombstoneEntity(Base):
+    """Deleted products, kept so the change feed can report deletions."""
+
+    __tablename__ = "product_tombstones"
+    __table_args__ = (
+        Index("ix_product_tombstones_deleted_at_id", "deleted_at", "product_id"),
+    )
+
+    product_id = Column(ULIDType(), primary_key=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __init__(self, product_id: str, deleted_at: datetime) -> None:
+        self.product_id = product_id
+        self.deleted_at = deleted_at
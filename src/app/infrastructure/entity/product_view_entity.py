@@ -1,19 +1,25 @@
 from datetime import datetime
 
-from sqlalchemy import Column, String
+from sqlalchemy import Column
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql.schema import ForeignKey
 from sqlalchemy.sql.sqltypes import BigInteger
 
 from app.infrastructure.db.session import Base
+from app.infrastructure.db.ulid_type import ULIDType
 from app.infrastructure.entity.audit_entity import AuditMixinEntity
 
 
 class ProductViewCountEntity(AuditMixinEntity, Base):
     __tablename__ = "product_views"
 
-    id = Column(String(26), primary_key=True, index=True)
-    product_id = Column(String(26), ForeignKey("products.id"), nullable=False)
+    id = Column(ULIDType(), primary_key=True, index=True)
+    product_id = Column(
+        ULIDType(),
+        ForeignKey("products.id"),
+        index=True,
+        nullable=False,
+    )
     view_count = Column(BigInteger, default=0)
 
     product = relationship("ProductEntity")
@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Float, String
+
+from app.infrastructure.db.session import Base
+
+
+class RateLimitBucketEntity(Base):
+    """Token buckets shared by the API workers (RATE_LIMIT_BACKEND=postgres)."""
+
+    __tablename__ = "rate_limit_buckets"
+
+    key = Column(String(255), primary_key=True)
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+    def __init__(self, key: str, tokens: float, updated_at: datetime) -> None:
+        self.key = key
+        self.tokens = tokens
+        self.updated_at = updated_at
@@ -5,13 +5,14 @@ from sqlalchemy.sql.sqltypes import Enum
 
 from app.domain.enums.role_enum import UserRole
 from app.infrastructure.db.session import Base
+from app.infrastructure.db.ulid_type import ULIDType
 from app.infrastructure.entity.audit_entity import AuditMixinEntity
 
 
 class UserEntity(AuditMixinEntity, Base):
     __tablename__ = "users"
 
-    id = Column(String(26), primary_key=True, index=True)
+    id = Column(ULIDType(), primary_key=True, index=True)
     username = Column(String(50), unique=True, nullable=False)
     email = Column(String(100), unique=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
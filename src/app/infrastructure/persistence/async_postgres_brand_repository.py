@@ -0,0 +1,23 @@
+from sqlalchemy import exists, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.logging_config import logger
+from app.domain.repositories.async_brand_repository import AsyncBrandRepository
+from app.infrastructure.db.async_database_repository import AsyncDatabaseRepository
+from app.infrastructure.entity.brand_entity import BrandEntity
+
+
+class AsyncPostgresBrandRepository(AsyncBrandRepository):
+
+    def __init__(self, database_repository: AsyncDatabaseRepository) -> None:
+        self.database_repository = database_repository
+
+    async def exists_by_id(self, brand_id: str) -> bool:
+        session = self.database_repository.get_db_session()
+        try:
+            stmt = select(exists().where(BrandEntity.id == brand_id))
+            with self.database_repository.read_only():
+                return await session.scalar(stmt)
+        except SQLAlchemyError:
+            logger.exception(f"Error checking existence of brand with ID: {brand_id}")
+            raise
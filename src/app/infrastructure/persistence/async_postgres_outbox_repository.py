@@ -0,0 +1,27 @@
+from typing import Any
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.logging_config import logger
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
+from app.domain.repositories.async_outbox_repository import AsyncOutboxRepository
+from app.infrastructure.db.async_database_repository import AsyncDatabaseRepository
+from app.infrastructure.persistence.mappers.outbox_message_mapper import (
+    OutboxMessageMapper,
+)
+
+
+class AsyncPostgresOutboxRepository(AsyncOutboxRepository):
+
+    def __init__(self, database_repository: AsyncDatabaseRepository) -> None:
+        self.database_repository = database_repository
+
+    async def add(self, event_type: OutboxEventType, payload: dict[str, Any]) -> None:
+        session = self.database_repository.get_db_session()
+        try:
+            session.add(OutboxMessageMapper.map_to_new_entity(event_type, payload))
+            await self.database_repository.commit()
+        except SQLAlchemyError:
+            logger.exception(f"Error adding {event_type.value} to the outbox")
+            await session.rollback()
+            raise
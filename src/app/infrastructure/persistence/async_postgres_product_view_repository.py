@@ -0,0 +1,60 @@
+from sqlalchemy import delete, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql.sqltypes import BigInteger
+
+from app.core.logging_config import logger
+from app.domain.helpers.datetime_generator import get_now_datetime
+from app.domain.helpers.ulid_generator import generate_ulid
+from app.domain.repositories.async_product_view_repository import (
+    AsyncProductViewRepository,
+)
+from app.infrastructure.db.async_database_repository import AsyncDatabaseRepository
+from app.infrastructure.entity.product_view_entity import ProductViewCountEntity
+
+
+class AsyncPostgresProductViewRepository(AsyncProductViewRepository):
+
+    def __init__(self, database_repository: AsyncDatabaseRepository) -> None:
+        self.database_repository = database_repository
+
+    async def increment_view(self, product_id: str) -> None:
+        session = self.database_repository.get_db_session()
+        try:
+            stmt = select(ProductViewCountEntity).where(
+                ProductViewCountEntity.product_id == product_id,
+            )
+            view = (await session.execute(stmt)).scalar_one_or_none()
+            date_now = get_now_datetime()
+
+            if view:
+                view.view_count += 1
+                view.updated_at = date_now
+            else:
+                view = ProductViewCountEntity(
+                    id=generate_ulid(),
+                    product_id=product_id,
+                    view_count=BigInteger().python_type(1),
+                    created_at=date_now,
+                    updated_at=date_now,
+                )
+                session.add(view)
+
+            await self.database_repository.commit()
+        except SQLAlchemyError:
+            logger.exception(f"Error incrementing view for product {product_id}")
+            await session.rollback()
+            raise
+
+    async def delete_views_by_product_id(self, product_id: str) -> None:
+        session = self.database_repository.get_db_session()
+        try:
+            await session.execute(
+                delete(ProductViewCountEntity).where(
+                    ProductViewCountEntity.product_id == product_id,
+                ),
+            )
+            await self.database_repository.commit()
+        except SQLAlchemyError:
+            logger.exception(f"Error deleting views for product {product_id}")
+            await session.rollback()
+            raise
@@ -0,0 +1,38 @@
+from contextlib import AsyncExitStack
+from types import TracebackType
+from typing import Self
+
+from app.domain.repositories.async_unit_of_work import AsyncUnitOfWork
+from app.infrastructure.db.async_database_repository import AsyncDatabaseRepository
+from app.infrastructure.db.session_scope import (
+    async_database_session_scope,
+    current_session_scope,
+)
+
+
+class AsyncPostgresUnitOfWork(AsyncUnitOfWork):
+
+    def __init__(self, database_repository: AsyncDatabaseRepository) -> None:
+        self.database_repository = database_repository
+        self._scopes: list[AsyncExitStack] = []
+
+    async def __aenter__(self) -> Self:
+        scope = AsyncExitStack()
+        if current_session_scope() is None:
+            # Outside a request: open a scope so every repository shares
+            # the session of this unit of work
+            await scope.enter_async_context(async_database_session_scope())
+        self._scopes.append(scope)
+        self.database_repository.begin_unit_of_work()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        async with self._scopes.pop():
+            await self.database_repository.end_unit_of_work(
+                commit=exc_type is None,
+            )
@@ -0,0 +1,35 @@
+from typing import Any
+
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
+from app.domain.helpers.datetime_generator import get_now_datetime
+from app.domain.helpers.ulid_generator import generate_ulid
+from app.domain.models.outbox_message import OutboxMessage
+from app.infrastructure.entity.outbox_message_entity import OutboxMessageEntity
+
+
+class OutboxMessageMapper:
+
+    @staticmethod
+    def map_to_new_entity(
+        event_type: OutboxEventType,
+        payload: dict[str, Any],
+    ) -> OutboxMessageEntity:
+        date_now = get_now_datetime()
+
+        return OutboxMessageEntity(
+            id=generate_ulid(),
+            event_type=event_type.value,
+            payload=payload,
+            created_at=date_now,
+            next_attempt_at=date_now,
+        )
+
+    @staticmethod
+    def map_to_model(entity: OutboxMessageEntity) -> OutboxMessage:
+        return OutboxMessage(
+            id=entity.id,
+            event_type=entity.event_type,
+            payload=entity.payload,
+            created_at=entity.created_at,
+            attempts=entity.attempts,
+        )
@@ -0,0 +1,34 @@
+from app.domain.enums.import_job_status_enum import ImportJobStatus
+from app.domain.helpers.datetime_generator import get_now_datetime
+from app.domain.helpers.ulid_generator import generate_ulid
+from app.domain.models.product_import import ProductImportJob
+from app.infrastructure.entity.product_import_job_entity import (
+    ProductImportJobEntity,
+)
+
+
+class ProductImportJobMapper:
+
+    @staticmethod
+    def map_to_new_entity() -> ProductImportJobEntity:
+        date_now = get_now_datetime()
+
+        return ProductImportJobEntity(
+            id=generate_ulid(),
+            status=ImportJobStatus.RUNNING,
+            rows_processed=0,
+            imported=0,
+            rejected=0,
+            created_at=date_now,
+            updated_at=date_now,
+        )
+
+    @staticmethod
+    def map_to_model(entity: ProductImportJobEntity) -> ProductImportJob:
+        return ProductImportJob(
+            id=entity.id,
+            status=entity.status,
+            rows_processed=entity.rows_processed,
+            imported=entity.imported,
+            rejected=entity.rejected,
+        )
@@ -9,14 +9,18 @@ from app.infrastructure.entity.user_entity import UserEntity
 class UserMapper:
 
     @staticmethod
-    def map_to_entity(user: UserCreateInput, role: UserRole) -> UserEntity:
+    def map_to_entity(
+        user: UserCreateInput,
+        hashed_password: str,
+        role: UserRole,
+    ) -> UserEntity:
         date_now = get_now_datetime()
 
         return UserEntity(
             id=generate_ulid(),
             username=user.username,
             email=str(user.email),
-            hashed_password=user.hashed_password,
+            hashed_password=hashed_password,
             role=role,
             created_at=date_now,
             updated_at=date_now,
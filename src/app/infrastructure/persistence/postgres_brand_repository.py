@@ -1,4 +1,4 @@
-from sqlalchemy import exists, select
+from sqlalchemy import exists, select, text
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.logging_config import logger
@@ -6,6 +6,7 @@ from app.domain.models.brand import Brand
 from app.domain.repositories.brand_repository import BrandRepository
 from app.domain.use_cases.brands.create.brand_create_input import BrandCreateInput
 from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.db.ulid_type import ulid_to_uuid
 from app.infrastructure.entity.brand_entity import BrandEntity
 from app.infrastructure.persistence.mappers.brand_mapper import BrandMapper
 
@@ -20,7 +21,7 @@ class PostgresBrandRepository(BrandRepository):
         try:
             brand_entity = BrandMapper.map_to_entity(brand)
             session.add(brand_entity)
-            session.commit()
+            self.database_repository.commit()
         except SQLAlchemyError:
             logger.exception("Error creating brand")
             session.rollback()
@@ -32,16 +33,42 @@ class PostgresBrandRepository(BrandRepository):
         session = self.database_repository.get_db_session()
         try:
             stmt = select(exists().where(BrandEntity.id == brand_id))
-            return session.scalar(stmt)
+            with self.database_repository.read_only():
+                return session.scalar(stmt)
         except SQLAlchemyError:
             logger.exception(f"Error checking existence of brand with ID: {brand_id}")
             raise
 
+    def find_existing_ids(self, brand_ids: set[str]) -> set[str]:
+        session = self.database_repository.get_db_session()
+        try:
+            self.database_repository.create_temp_table(
+                "brand_import_ids",
+                "id UUID",
+            )
+            self.database_repository.copy_rows(
+                "brand_import_ids",
+                ["id"],
+                ((ulid_to_uuid(brand_id),) for brand_id in brand_ids),
+            )
+            return set(
+                session.scalars(
+                    text(
+                        "SELECT b.id FROM brands b "
+                        "JOIN brand_import_ids i ON i.id = b.id",
+                    ).columns(BrandEntity.id),
+                ).all(),
+            )
+        except SQLAlchemyError:
+            logger.exception(f"Error checking existence of {len(brand_ids)} brands")
+            raise
+
     def exists_by_name(self, name: str) -> bool:
         session = self.database_repository.get_db_session()
         try:
             stmt = select(exists().where(BrandEntity.name == name))
-            return session.scalar(stmt)
+            with self.database_repository.read_only():
+                return session.scalar(stmt)
         except SQLAlchemyError:
             logger.exception(f"Error checking existence of brand with name: {name}")
             raise
@@ -0,0 +1,206 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, insert, literal, select, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.logging_config import logger
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
+from app.domain.helpers.datetime_generator import get_now_datetime
+from app.domain.models.outbox_message import OutboxMessage
+from app.domain.repositories.outbox_repository import OutboxRepository
+from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.entity.outbox_message_entity import (
+    OutboxDeadLetterEntity,
+    OutboxMessageEntity,
+)
+from app.infrastructure.persistence.mappers.outbox_message_mapper import (
+    OutboxMessageMapper,
+)
+
+
+class PostgresOutboxRepository(OutboxRepository):
+
+    def __init__(self, database_repository: DatabaseRepository) -> None:
+        self.database_repository = database_repository
+
+    def add(self, event_type: OutboxEventType, payload: dict[str, Any]) -> None:
+        session = self.database_repository.get_db_session()
+        try:
+            session.add(OutboxMessageMapper.map_to_new_entity(event_type, payload))
+            self.database_repository.commit()
+        except SQLAlchemyError:
+            logger.exception(f"Error adding {event_type.value} to the outbox")
+            session.rollback()
+            raise
+
+    def add_many(
+        self,
+        event_type: OutboxEventType,
+        payloads: list[dict[str, Any]],
+    ) -> None:
+        if not payloads:
+            return
+
+        session = self.database_repository.get_db_session()
+        try:
+            session.execute(
+                insert(OutboxMessageEntity),
+                [
+                    {
+                        "id": entity.id,
+                        "event_type": entity.event_type,
+                        "payload": entity.payload,
+                        "created_at": entity.created_at,
+                        "next_attempt_at": entity.next_attempt_at,
+                        "attempts": entity.attempts,
+                    }
+                    for entity in (
+                        OutboxMessageMapper.map_to_new_entity(event_type, payload)
+                        for payload in payloads
+                    )
+                ],
+            )
+            self.database_repository.commit()
+        except SQLAlchemyError:
+            logger.exception(
+                f"Error adding {len(payloads)} {event_type.value} to the outbox",
+            )
+            session.rollback()
+            raise
+
+    def claim_batch(self, limit: int) -> list[OutboxMessage]:
+        session = self.database_repository.get_db_session()
+        try:
+            stmt = (
+                select(OutboxMessageEntity)
+                .where(OutboxMessageEntity.next_attempt_at <= get_now_datetime())
+                # ULIDs from the same millisecond do not keep the write order
+                .order_by(OutboxMessageEntity.created_at, OutboxMessageEntity.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            return [
+                OutboxMessageMapper.map_to_model(entity)
+                for entity in session.execute(stmt).scalars()
+            ]
+        except SQLAlchemyError:
+            logger.exception("Error claiming outbox messages")
+            raise
+
+    def delete(self, message_ids: list[str]) -> None:
+        if not message_ids:
+            return
+
+        session = self.database_repository.get_db_session()
+        try:
+            session.execute(
+                delete(OutboxMessageEntity).where(
+                    OutboxMessageEntity.id.in_(message_ids),
+                ),
+            )
+            self.database_repository.commit()
+        except SQLAlchemyError:
+            logger.exception("Error deleting outbox messages")
+            session.rollback()
+            raise
+
+    def schedule_retry(
+        self,
+        message_ids: list[str],
+        retry_at: datetime,
+        error: str,
+    ) -> None:
+        if not message_ids:
+            return
+
+        session = self.database_repository.get_db_session()
+        try:
+            session.execute(
+                update(OutboxMessageEntity)
+                .where(OutboxMessageEntity.id.in_(message_ids))
+                .values(
+                    attempts=OutboxMessageEntity.attempts + 1,
+                    next_attempt_at=retry_at,
+                    last_error=error,
+                ),
+            )
+            self.database_repository.commit()
+        except SQLAlchemyError:
+            logger.exception("Error scheduling the retry of outbox messages")
+            session.rollback()
+            raise
+
+    def move_to_dead_letters(self, message_ids: list[str], error: str) -> None:
+        if not message_ids:
+            return
+
+        session = self.database_repository.get_db_session()
+        try:
+            session.execute(
+                insert(OutboxDeadLetterEntity).from_select(
+                    [
+                        "id",
+                        "event_type",
+                        "payload",
+                        "created_at",
+                        "attempts",
+                        "last_error",
+                        "failed_at",
+                    ],
+                    select(
+                        OutboxMessageEntity.id,
+                        OutboxMessageEntity.event_type,
+                        OutboxMessageEntity.payload,
+                        OutboxMessageEntity.created_at,
+                        OutboxMessageEntity.attempts + 1,
+                        literal(error),
+                        literal(get_now_datetime()),
+                    ).where(OutboxMessageEntity.id.in_(message_ids)),
+                ),
+            )
+            session.execute(
+                delete(OutboxMessageEntity).where(
+                    OutboxMessageEntity.id.in_(message_ids),
+                ),
+            )
+            self.database_repository.commit()
+        except SQLAlchemyError:
+            logger.exception("Error moving outbox messages to the dead letters")
+            session.rollback()
+            raise
+
+    def replay_dead_letters(self, message_ids: list[str] | None = None) -> int:
+        session = self.database_repository.get_db_session()
+        try:
+            stmt = delete(OutboxDeadLetterEntity)
+            if message_ids is not None:
+                stmt = stmt.where(OutboxDeadLetterEntity.id.in_(message_ids))
+            replayed = (
+                session.execute(
+                    stmt.returning(
+                        OutboxDeadLetterEntity.id,
+                        OutboxDeadLetterEntity.event_type,
+                        OutboxDeadLetterEntity.payload,
+                        OutboxDeadLetterEntity.created_at,
+                    ),
+                )
+                .mappings()
+                .all()
+            )
+            if replayed:
+                date_now = get_now_datetime()
+                session.execute(
+                    insert(OutboxMessageEntity),
+                    [
+                        {**row, "attempts": 0, "next_attempt_at": date_now}
+                        for row in replayed
+                    ],
+                )
+            self.database_repository.commit()
+        except SQLAlchemyError:
+            logger.exception("Error replaying the outbox dead letters")
+            session.rollback()
+            raise
+
+        return len(replayed)
@@ -0,0 +1,70 @@
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.logging_config import logger
+from app.domain.enums.code_enum import ErrorCodeEnum
+from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundError
+from app.domain.helpers.datetime_generator import get_now_datetime
+from app.domain.models.product_import import ProductImportJob
+from app.domain.repositories.product_import_job_repository import (
+    ProductImportJobRepository,
+)
+from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.entity.product_import_job_entity import (
+    ProductImportJobEntity,
+)
+from app.infrastructure.persistence.mappers.product_import_job_mapper import (
+    ProductImportJobMapper,
+)
+
+
+class PostgresProductImportJobRepository(ProductImportJobRepository):
+
+    def __init__(self, database_repository: DatabaseRepository) -> None:
+        self.database_repository = database_repository
+
+    def create(self) -> ProductImportJob:
+        session = self.database_repository.get_db_session()
+        try:
+            job_entity = ProductImportJobMapper.map_to_new_entity()
+            session.add(job_entity)
+            self.database_repository.commit()
+        except SQLAlchemyError:
+            logger.exception("Error creating product import job")
+            session.rollback()
+            raise
+
+        return ProductImportJobMapper.map_to_model(job_entity)
+
+    def find_by_id(self, job_id: str) -> ProductImportJob | None:
+        session = self.database_repository.get_db_session()
+        try:
+            entity = session.get(ProductImportJobEntity, job_id)
+            return ProductImportJobMapper.map_to_model(entity) if entity else None
+        except SQLAlchemyError:
+            logger.exception(f"Error getting product import job with ID: {job_id}")
+            raise
+
+    def save(self, job: ProductImportJob) -> ProductImportJob:
+        session = self.database_repository.get_db_session()
+        try:
+            entity = session.get(ProductImportJobEntity, job.id)
+            if entity is None:
+                raise ResourceNotFoundError(
+                    code=ErrorCodeEnum.IMPORT_JOB_NOT_FOUND,
+                    location=["job_id"],
+                    message=f"No import job found with ID: {job.id}.",
+                )
+
+            entity.status = job.status
+            entity.rows_processed = job.rows_processed
+            entity.imported = job.imported
+            entity.rejected = job.rejected
+            entity.updated_at = get_now_datetime()
+            self.database_repository.commit()
+
+            return ProductImportJobMapper.map_to_model(entity)
+
+        except SQLAlchemyError:
+            logger.exception(f"Error saving product import job with ID: {job.id}")
+            session.rollback()
+            raise
@@ -1,17 +1,44 @@
 from __future__ import annotations
 
-from sqlalchemy import exists, select
+from collections.abc import Iterator
+from datetime import timedelta
+
+from sqlalchemy import (
+    Numeric,
+    column,
+    exists,
+    literal,
+    null,
+    select,
+    text,
+    tuple_,
+    union_all,
+)
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.logging_config import logger
 from app.domain.enums.code_enum import ErrorCodeEnum
+from app.domain.enums.product_change_type_enum import ProductChangeType
 from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundError
+from app.domain.helpers.datetime_generator import get_now_datetime
+from app.domain.helpers.ulid_generator import generate_ulid
 from app.domain.models.product import Product, ProductView
+from app.domain.models.product_change import ProductChange, ProductChangeCursor
+from app.domain.models.product_export import ProductExportRow
+from app.domain.models.product_price_update import ProductPriceChange
 from app.domain.repositories.product_repository import ProductRepository
 from app.domain.use_cases.products.create.product_create_input import ProductCreateInput
 from app.domain.use_cases.products.edit.product_update_input import ProductUpdateInput
+from app.domain.use_cases.products.price_update.product_price_update_input import (
+    ProductPriceUpdateInput,
+)
 from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.db.ulid_type import ulid_to_uuid
+from app.infrastructure.entity.brand_entity import BrandEntity
 from app.infrastructure.entity.product_entity import ProductEntity
+from app.infrastructure.entity.product_tombstone_entity import (
+    ProductTombstoneEntity,
+)
 from app.infrastructure.entity.product_view_entity import ProductViewCountEntity
 from app.infrastructure.persistence.mappers.product_mapper import ProductMapper
 
@@ -26,7 +53,7 @@ class PostgresProductRepository(ProductRepository):
         try:
             product_entity = ProductMapper.map_to_entity(product_create)
             session.add(product_entity)
-            session.commit()
+            self.database_repository.commit()
         except SQLAlchemyError:
             logger.exception("Error creating product")
             session.rollback()
@@ -34,20 +61,87 @@ class PostgresProductRepository(ProductRepository):
 
         return ProductMapper.map_to_model(product_entity)
 
+    def bulk_create(self, products: list[ProductCreateInput]) -> set[str]:
+        session = self.database_repository.get_db_session()
+        try:
+            self.database_repository.create_temp_table(
+                "product_import_staging",
+                "id UUID, sku VARCHAR(64), name VARCHAR(255), "
+                "price NUMERIC(10,2), brand_id UUID",
+            )
+            self.database_repository.copy_rows(
+                "product_import_staging",
+                ["id", "sku", "name", "price", "brand_id"],
+                (
+                    (
+                        ulid_to_uuid(generate_ulid()),
+                        product.sku,
+                        product.name,
+                        product.price,
+                        ulid_to_uuid(product.brand_id),
+                    )
+                    for product in products
+                ),
+            )
+            inserted_skus = session.scalars(
+                text(
+                    "INSERT INTO products "
+                    "(id, sku, name, price, brand_id, created_at, updated_at) "
+                    "SELECT id, sku, name, price, brand_id, :now, :now "
+                    "FROM product_import_staging "
+                    "ON CONFLICT (sku) DO NOTHING "
+                    "RETURNING sku",
+                ),
+                {"now": get_now_datetime()},
+            ).all()
+            self.database_repository.commit()
+        except SQLAlchemyError:
+            logger.exception(f"Error importing {len(products)} products")
+            session.rollback()
+            raise
+
+        return set(inserted_skus)
+
     def exists_by_sku(self, sku: str) -> bool:
         session = self.database_repository.get_db_session()
         try:
             stmt = select(exists().where(ProductEntity.sku == sku))
-            return session.scalar(stmt)
+            with self.database_repository.read_only():
+                return session.scalar(stmt)
         except SQLAlchemyError:
             logger.exception(f"Error checking existence of product with SKU: {sku}")
             raise
 
+    def find_existing_skus(self, skus: set[str]) -> set[str]:
+        session = self.database_repository.get_db_session()
+        try:
+            self.database_repository.create_temp_table(
+                "product_import_skus",
+                "sku TEXT",
+            )
+            self.database_repository.copy_rows(
+                "product_import_skus",
+                ["sku"],
+                ((sku,) for sku in skus),
+            )
+            return set(
+                session.scalars(
+                    text(
+                        "SELECT p.sku FROM products p "
+                        "JOIN product_import_skus i ON i.sku = p.sku",
+                    ),
+                ).all(),
+            )
+        except SQLAlchemyError:
+            logger.exception(f"Error checking existence of {len(skus)} SKUs")
+            raise
+
     def find_by_id(self, product_id: str) -> Product | None:
         session = self.database_repository.get_db_session()
         try:
             stmt = select(ProductEntity).where(ProductEntity.id == product_id)
-            result = session.execute(stmt).scalar_one_or_none()
+            with self.database_repository.read_only():
+                result = session.execute(stmt).scalar_one_or_none()
             return ProductMapper.map_to_model(result) if result is not None else None
         except SQLAlchemyError:
             logger.exception(f"Error getting product with ID: {product_id}")
@@ -57,7 +151,8 @@ class PostgresProductRepository(ProductRepository):
         session = self.database_repository.get_db_session()
         try:
             stmt = select(ProductEntity).where(ProductEntity.sku == sku)
-            result = session.execute(stmt).scalar_one_or_none()
+            with self.database_repository.read_only():
+                result = session.execute(stmt).scalar_one_or_none()
             return ProductMapper.map_to_model(result) if result is not None else None
         except SQLAlchemyError:
             logger.exception(f"Error getting product with SKU: {sku}")
@@ -80,7 +175,7 @@ class PostgresProductRepository(ProductRepository):
             for field, value in update_data.items():
                 setattr(product_entity, field, value)
 
-            session.commit()
+            self.database_repository.commit()
             session.refresh(product_entity)
 
             return ProductMapper.map_to_model(product_entity)
@@ -90,6 +185,54 @@ class PostgresProductRepository(ProductRepository):
             session.rollback()
             raise
 
+    def update_prices(
+        self,
+        prices: list[ProductPriceUpdateInput],
+    ) -> list[ProductPriceChange]:
+        session = self.database_repository.get_db_session()
+        try:
+            # The self-join reads the rows as they were before the update,
+            # which gives the old prices without a previous SELECT. Prices
+            # are rounded as the column stores them before being compared,
+            # or 49.999 would differ from the stored 50.00 on every run.
+            rows = session.execute(
+                text(
+                    "UPDATE products AS p "
+                    "SET price = v.price, updated_at = :now "
+                    "FROM unnest("
+                    "CAST(:skus AS VARCHAR[]), CAST(:prices AS NUMERIC(10,2)[])"
+                    ") AS v(sku, price) "
+                    "JOIN products AS old ON old.sku = v.sku "
+                    "WHERE p.id = old.id AND p.price IS DISTINCT FROM v.price "
+                    "RETURNING p.id, p.sku, old.price, p.price",
+                ).columns(
+                    ProductEntity.id,
+                    ProductEntity.sku,
+                    column("old_price", Numeric),
+                    column("new_price", Numeric),
+                ),
+                {
+                    "skus": [price.sku for price in prices],
+                    "prices": [price.price for price in prices],
+                    "now": get_now_datetime(),
+                },
+            ).all()
+            self.database_repository.commit()
+        except SQLAlchemyError:
+            logger.exception(f"Error updating the price of {len(prices)} products")
+            session.rollback()
+            raise
+
+        return [
+            ProductPriceChange(
+                product_id=product_id,
+                sku=sku,
+                old_price=old_price,
+                new_price=new_price,
+            )
+            for product_id, sku, old_price, new_price in rows
+        ]
+
     def delete_by_id(self, user_id: str) -> None:
         session = self.database_repository.get_db_session()
         try:
@@ -97,7 +240,13 @@ class PostgresProductRepository(ProductRepository):
             if not entity:
                 return
             session.delete(entity)
-            session.commit()
+            session.add(
+                ProductTombstoneEntity(
+                    product_id=entity.id,
+                    deleted_at=get_now_datetime(),
+                ),
+            )
+            self.database_repository.commit()
         except SQLAlchemyError:
             logger.exception(f"Error deleting product with ID: {user_id}")
             session.rollback()
@@ -119,7 +268,8 @@ class PostgresProductRepository(ProductRepository):
             if brand_id:
                 stmt = stmt.where(ProductEntity.brand_id == brand_id)
 
-            results = session.execute(stmt).all()
+            with self.database_repository.read_only():
+                results = session.execute(stmt).all()
 
             return [
                 ProductView(
@@ -133,3 +283,124 @@ class PostgresProductRepository(ProductRepository):
         except SQLAlchemyError:
             logger.exception(f"Error listing products for brand_id={brand_id}")
             raise
+
+    def export_products(self, batch_size: int) -> Iterator[list[ProductExportRow]]:
+        session = self.database_repository.get_db_session()
+        stmt = (
+            select(
+                ProductEntity.id,
+                ProductEntity.sku,
+                ProductEntity.name,
+                ProductEntity.price,
+                ProductEntity.brand_id,
+                BrandEntity.name,
+            )
+            .join(BrandEntity, BrandEntity.id == ProductEntity.brand_id)
+            .order_by(ProductEntity.id)
+            # Named server-side cursor, fetching batch_size rows per round trip
+            .execution_options(yield_per=batch_size)
+        )
+        try:
+            # The cursor stays on the connection it was opened on
+            with self.database_repository.read_only():
+                result = session.execute(stmt)
+            for partition in result.partitions():
+                yield [ProductExportRow._make(row) for row in partition]
+        except SQLAlchemyError:
+            logger.exception("Error exporting products")
+            raise
+        finally:
+            # Ends the transaction that kept the cursor open, also when the
+            # client goes away before the end of the export
+            session.rollback()
+
+    def find_changes(
+        self,
+        since: ProductChangeCursor | None,
+        limit: int,
+        settle_seconds: float,
+    ) -> list[ProductChange]:
+        session = self.database_repository.get_db_session()
+        until = get_now_datetime() - timedelta(seconds=settle_seconds)
+
+        # Both branches are keyset scans on their (timestamp, id) index
+        upserts = (
+            select(
+                literal(ProductChangeType.UPSERT.value).label("change_type"),
+                ProductEntity.id.label("product_id"),
+                ProductEntity.updated_at.label("changed_at"),
+                ProductEntity.sku,
+                ProductEntity.name,
+                ProductEntity.price,
+                ProductEntity.brand_id,
+            )
+            .where(ProductEntity.updated_at <= until)
+            .order_by(ProductEntity.updated_at, ProductEntity.id)
+            .limit(limit)
+        )
+        deletes = (
+            select(
+                literal(ProductChangeType.DELETE.value),
+                ProductTombstoneEntity.product_id,
+                ProductTombstoneEntity.deleted_at,
+                null(),
+                null(),
+                null(),
+                null(),
+            )
+            .where(ProductTombstoneEntity.deleted_at <= until)
+            .order_by(
+                ProductTombstoneEntity.deleted_at,
+                ProductTombstoneEntity.product_id,
+            )
+            .limit(limit)
+        )
+        if since:
+            # Typed, so the cursor's product ID is bound as a ULID
+            position = tuple_(
+                since.changed_at,
+                since.product_id,
+                types=[ProductEntity.updated_at.type, ProductEntity.id.type],
+            )
+            upserts = upserts.where(
+                tuple_(ProductEntity.updated_at, ProductEntity.id) > position,
+            )
+            deletes = deletes.where(
+                tuple_(
+                    ProductTombstoneEntity.deleted_at,
+                    ProductTombstoneEntity.product_id,
+                )
+                > position,
+            )
+
+        changes = union_all(upserts, deletes).subquery()
+        stmt = (
+            select(changes)
+            .order_by(changes.c.changed_at, changes.c.product_id)
+            .limit(limit)
+        )
+        try:
+            rows = session.execute(stmt).all()
+        except SQLAlchemyError:
+            logger.exception(f"Error listing product changes since {since}")
+            raise
+
+        return [
+            ProductChange(
+                change_type=ProductChangeType(change_type),
+                product_id=product_id,
+                changed_at=changed_at,
+                product=(
+                    Product(
+                        id=product_id,
+                        sku=sku,
+                        name=name,
+                        price=price,
+                        brand_id=brand_id,
+                    )
+                    if change_type == ProductChangeType.UPSERT.value
+                    else None
+                ),
+            )
+            for change_type, product_id, changed_at, sku, name, price, brand_id in rows
+        ]
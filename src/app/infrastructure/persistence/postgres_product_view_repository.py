@@ -37,7 +37,7 @@ class PostgresProductViewRepository(ProductViewRepository):
                 )
                 session.add(view)
 
-            session.commit()
+            self.database_repository.commit()
         except SQLAlchemyError:
             logger.exception(f"Error incrementing view for product {product_id}")
             session.rollback()
@@ -49,7 +49,7 @@ class PostgresProductViewRepository(ProductViewRepository):
             session.query(ProductViewCountEntity).filter(
                 ProductViewCountEntity.product_id == product_id,
             ).delete(synchronize_session=False)
-            session.commit()
+            self.database_repository.commit()
         except SQLAlchemyError:
             logger.exception(f"Error deleting views for product {product_id}")
             session.rollback()
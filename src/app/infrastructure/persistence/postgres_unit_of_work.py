@@ -0,0 +1,36 @@
+from contextlib import ExitStack
+from types import TracebackType
+from typing import Self
+
+from app.domain.repositories.unit_of_work import UnitOfWork
+from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.db.session_scope import (
+    current_session_scope,
+    database_session_scope,
+)
+
+
+class PostgresUnitOfWork(UnitOfWork):
+
+    def __init__(self, database_repository: DatabaseRepository) -> None:
+        self.database_repository = database_repository
+        self._scopes: list[ExitStack] = []
+
+    def __enter__(self) -> Self:
+        scope = ExitStack()
+        if current_session_scope() is None:
+            # Outside a request: open a scope so every repository shares
+            # the session of this unit of work
+            scope.enter_context(database_session_scope())
+        self._scopes.append(scope)
+        self.database_repository.begin_unit_of_work()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        with self._scopes.pop():
+            self.database_repository.end_unit_of_work(commit=exc_type is None)
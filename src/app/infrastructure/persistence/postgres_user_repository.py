@@ -19,12 +19,17 @@ class PostgresUserRepository(UserRepository):
     def __init__(self, database_repository: DatabaseRepository) -> None:
         self.database_repository = database_repository
 
-    def create(self, user: UserCreateInput, role: UserRole) -> User:
+    def create(
+        self,
+        user: UserCreateInput,
+        hashed_password: str,
+        role: UserRole,
+    ) -> User:
         session = self.database_repository.get_db_session()
         try:
-            user_entity = UserMapper.map_to_entity(user, role)
+            user_entity = UserMapper.map_to_entity(user, hashed_password, role)
             session.add(user_entity)
-            session.commit()
+            self.database_repository.commit()
         except SQLAlchemyError:
             logger.exception("Error creating user")
             session.rollback()
@@ -35,9 +40,10 @@ class PostgresUserRepository(UserRepository):
     def find_by_username(self, username: str) -> User | None:
         session = self.database_repository.get_db_session()
         try:
-            entity = session.scalar(
-                select(UserEntity).where(UserEntity.username == username),
-            )
+            with self.database_repository.read_only():
+                entity = session.scalar(
+                    select(UserEntity).where(UserEntity.username == username),
+                )
             return UserMapper.map_to_model(entity) if entity else None
         except SQLAlchemyError:
             logger.exception(f"Error getting user with USERNAME: {username}")
@@ -51,7 +57,8 @@ class PostgresUserRepository(UserRepository):
                     or_(UserEntity.username == username, UserEntity.email == email),
                 ),
             )
-            return session.scalar(stmt)
+            with self.database_repository.read_only():
+                return session.scalar(stmt)
         except SQLAlchemyError:
             logger.exception(
                 f"Error checking existence of user with"
@@ -63,7 +70,8 @@ class PostgresUserRepository(UserRepository):
         session = self.database_repository.get_db_session()
         try:
             stmt = select(exists().where(UserEntity.email == email))
-            return session.scalar(stmt)
+            with self.database_repository.read_only():
+                return session.scalar(stmt)
         except SQLAlchemyError:
             logger.exception(
                 f"Error checking existence of user with EMAIL: {email}",
@@ -87,7 +95,7 @@ class PostgresUserRepository(UserRepository):
             for field, value in update_data.items():
                 setattr(user_entity, field, value)
 
-            session.commit()
+            self.database_repository.commit()
             session.refresh(user_entity)
 
             return UserMapper.map_to_model(user_entity)
@@ -104,7 +112,7 @@ class PostgresUserRepository(UserRepository):
             if not entity:
                 return
             session.delete(entity)
-            session.commit()
+            self.database_repository.commit()
         except SQLAlchemyError:
             logger.exception(f"Error deleting user with ID: {user_id}")
             session.rollback()
@@ -1,25 +1,50 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 
 from app.core.configurations import settings
+from app.domain.exceptions.notification_delivery_exception import (
+    NotificationDeliveryError,
+)
 from app.domain.services.notification_service import NotificationService
+from app.infrastructure.service.ses_client import ses_client_holder
+from app.infrastructure.service.token_bucket import TokenBucket
 from scripts.run_yoyo_migrations import logger
 
 if TYPE_CHECKING:
+    from app.domain.services.product_batch_update_event import (
+        ProductBatchUpdateEvent,
+    )
     from app.domain.services.product_update_event import ProductUpdateEvent
 
+# Products listed in the body of a batch notification, the rest are summarized
+MAX_LISTED_PRODUCTS = 100
+
+# Errors that would happen again on retry: the message goes to the dead letters
+PERMANENT_ERROR_CODES = {
+    "AccessDenied",
+    "AccountSendingPausedException",
+    "ConfigurationSetDoesNotExist",
+    "InvalidParameterValue",
+    "MailFromDomainNotVerified",
+    "MessageRejected",
+}
+
 
 class AwsSESNotificationService(NotificationService):
 
-    def __init__(self, region_name: str | None = None) -> None:
-        self.client = boto3.client(
-            "ses",
-            region_name=region_name or settings.SES_REGION_NAME,
-        )
+    def __init__(
+        self,
+        region_name: str | None = None,
+        client: Any | None = None,
+        rate_limiter: TokenBucket | None = None,
+    ) -> None:
+        # The process-wide client unless one is given (tests, benchmarks)
+        self.client = client or ses_client_holder.get(region_name)
+        # SES rejects anything over the account's sending rate with Throttling
+        self.rate_limiter = rate_limiter or TokenBucket(settings.SES_MAX_SEND_RATE)
 
     def notify(
         self,
@@ -32,7 +57,40 @@ class AwsSESNotificationService(NotificationService):
             f"The product with ID: {event.product_id} was updated.\n"
             f"Updated fields: {', '.join(event.changes)}"
         )
+        self._send_email(sender_email, recipient_email, subject, body_text)
 
+    def notify_batch(
+        self,
+        sender_email: str,
+        recipient_email: str,
+        event: ProductBatchUpdateEvent,
+    ) -> None:
+        listed_events = event.events[:MAX_LISTED_PRODUCTS]
+        subject = f"Products updated: {len(event.events)}"
+        lines = [
+            f"{len(event.events)} products were updated.",
+            *(
+                f"{product_event.product_id}: "
+                + ", ".join(
+                    f"{field} {change['old']} -> {change['new']}"
+                    for field, change in product_event.changes.items()
+                )
+                for product_event in listed_events
+            ),
+        ]
+        if len(event.events) > len(listed_events):
+            lines.append(f"... and {len(event.events) - len(listed_events)} more.")
+
+        self._send_email(sender_email, recipient_email, subject, "\n".join(lines))
+
+    def _send_email(
+        self,
+        sender_email: str,
+        recipient_email: str,
+        subject: str,
+        body_text: str,
+    ) -> None:
+        self.rate_limiter.acquire()
         try:
             self.client.send_email(
                 Source=sender_email,
@@ -47,6 +105,14 @@ class AwsSESNotificationService(NotificationService):
             error_code = e.response.get("Error", {}).get("Code")
             error_message = e.response.get("Error", {}).get("Message")
             logger.info(f"SES ClientError [{error_code}]: {error_message}")
+            raise NotificationDeliveryError(
+                message=f"SES {error_code}: {error_message}",
+                retryable=error_code not in PERMANENT_ERROR_CODES,
+            ) from e
 
         except BotoCoreError as e:
             logger.info(f"SES BotoCoreError: {e}")
+            raise NotificationDeliveryError(
+                message=f"SES unreachable: {e}",
+                retryable=True,
+            ) from e
@@ -0,0 +1,27 @@
+from collections import OrderedDict
+
+from app.domain.services.rate_limiter import RateLimiter
+from app.infrastructure.service.token_bucket import TokenBucket
+
+
+class InMemoryRateLimiter(RateLimiter):
+    """
+    Buckets of this process, for single-worker deployments. At most `max_keys`
+    are kept: past that the least recently used ones are dropped, which at
+    worst gives an idle client a full bucket again.
+    """
+
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+
+    async def hit(self, key: str, rate: float, capacity: float) -> float:
+        # Only ever called from the event loop: no lock around the dict
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(rate, capacity)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket.try_acquire()
@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.domain.helpers.datetime_generator import get_now_datetime
+from app.domain.services.rate_limiter import RateLimiter
+from app.infrastructure.db.async_session import get_async_engine
+from app.infrastructure.entity.rate_limit_bucket_entity import (
+    RateLimitBucketEntity,
+)
+
+# Every this many hits, buckets idle for `idle_seconds` are deleted
+PRUNE_EVERY = 1000
+
+
+class PostgresRateLimiter(RateLimiter):
+    """
+    Buckets shared by every worker (and host) of the API. Taking a token is
+    one upsert that refills the bucket and only writes it when a token was
+    left, so concurrent hits on the same key are serialized by its row lock.
+    Buckets idle for `idle_seconds` (full again) are pruned now and then.
+    """
+
+    def __init__(self, idle_seconds: float) -> None:
+        self.idle_seconds = idle_seconds
+        self._hits = 0
+
+    async def hit(self, key: str, rate: float, capacity: float) -> float:
+        bucket = RateLimitBucketEntity.__table__
+        # The time of the statement, not of the transaction (NOW()): a hit
+        # waiting on the row lock started before the hit that holds it and
+        # would otherwise see a negative refill and lose tokens
+        now = func.clock_timestamp()
+        elapsed = func.greatest(func.extract("epoch", now - bucket.c.updated_at), 0)
+        refilled = func.least(capacity, bucket.c.tokens + elapsed * rate)
+        take = (
+            insert(bucket)
+            .values(key=key, tokens=capacity - 1, updated_at=now)
+            .on_conflict_do_update(
+                index_elements=[bucket.c.key],
+                set_={"tokens": refilled - 1, "updated_at": now},
+                where=refilled >= 1,
+            )
+            .returning(bucket.c.tokens)
+        )
+
+        self._hits += 1
+        async with get_async_engine().begin() as connection:
+            if self._hits % PRUNE_EVERY == 0:
+                idle_since = get_now_datetime() - timedelta(seconds=self.idle_seconds)
+                await connection.execute(
+                    delete(bucket).where(bucket.c.updated_at < idle_since),
+                )
+            if (await connection.execute(take)).first() is not None:
+                return 0.0
+            tokens = (
+                await connection.execute(select(refilled).where(bucket.c.key == key))
+            ).scalar_one()
+        return (1 - tokens) / rate
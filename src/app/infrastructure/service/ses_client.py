@@ -0,0 +1,66 @@
+import threading
+from typing import Any
+
+import boto3
+from botocore.config import Config
+
+from app.core.configurations import settings
+
+
+def ses_client_config() -> Config:
+    """Pool sized for the threads sending at once, connections kept alive."""
+    return Config(
+        max_pool_connections=settings.SES_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        connect_timeout=settings.SES_CONNECT_TIMEOUT_SECONDS,
+        read_timeout=settings.SES_READ_TIMEOUT_SECONDS,
+        retries={"max_attempts": settings.SES_MAX_ATTEMPTS, "mode": "standard"},
+    )
+
+
+class SESClientHolder:
+    """
+    One SES client per region for the whole process. Building a client
+    (credential chain, endpoint resolution, service model loading) costs tens
+    of milliseconds; boto3 clients are thread-safe once built, sessions are
+    not, so building is serialized.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: dict[str, Any] = {}
+
+    def get(self, region_name: str | None = None) -> Any:
+        region_name = region_name or settings.SES_REGION_NAME
+        client = self._clients.get(region_name)
+        if client is not None:
+            return client
+        with self._lock:
+            if region_name not in self._clients:
+                self._clients[region_name] = self._build(region_name)
+            return self._clients[region_name]
+
+    def close(self) -> None:
+        """Closes the pooled connections (at shutdown)."""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for client in clients.values():
+            client.close()
+
+    @staticmethod
+    def _build(region_name: str) -> Any:
+        # Own session: boto3.client() goes through the shared default one.
+        # Without explicit keys the usual credential chain applies
+        session = boto3.session.Session(
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        )
+        return session.client(
+            "ses",
+            region_name=region_name,
+            endpoint_url=settings.SES_ENDPOINT_URL,
+            config=ses_client_config(),
+        )
+
+
+ses_client_holder = SESClientHolder()
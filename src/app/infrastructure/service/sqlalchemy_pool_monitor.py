@@ -0,0 +1,64 @@
+import os
+
+from sqlalchemy.pool import Pool, QueuePool
+
+import app.infrastructure.db.session as db_session
+from app.domain.models.database_pool import DatabasePoolsStatus, DatabasePoolStatus
+from app.domain.services.database_pool_monitor import DatabasePoolMonitor
+from app.infrastructure.db.async_session import (
+    created_async_engine,
+    created_async_read_engines,
+)
+from app.infrastructure.db.pool import PoolWaitMetrics
+
+
+class SqlAlchemyDatabasePoolMonitor(DatabasePoolMonitor):
+
+    def status(self) -> DatabasePoolsStatus:
+        # Looked up on every call: the engines can be replaced (e.g. in tests)
+        pools = [("primary", db_session.engine.pool)]
+        pools += [
+            (f"replica-{number}", engine.pool)
+            for number, engine in enumerate(db_session.read_engines, start=1)
+        ]
+        # Only once something used them: reporting must not open their pools
+        async_engine = created_async_engine()
+        if async_engine is not None:
+            pools.append(("async", async_engine.pool))
+        pools += [
+            (f"async-replica-{number}", engine.pool)
+            for number, engine in enumerate(created_async_read_engines(), start=1)
+        ]
+
+        return DatabasePoolsStatus(
+            process_id=os.getpid(),
+            pools=[self._pool_status(name, pool) for name, pool in pools],
+        )
+
+    @staticmethod
+    def _pool_status(engine: str, pool: Pool) -> DatabasePoolStatus:
+        wait_metrics = getattr(pool, "wait_metrics", PoolWaitMetrics())
+
+        sizes = dict.fromkeys(
+            ("size", "max_overflow", "checked_in", "checked_out", "overflow"),
+        )
+        if isinstance(pool, QueuePool):
+            sizes = {
+                "size": pool.size(),
+                # Only the instrumented pools expose it
+                "max_overflow": getattr(pool, "max_overflow", None),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                # Negative while the pool has not opened `size` connections yet
+                "overflow": max(pool.overflow(), 0),
+            }
+
+        return DatabasePoolStatus(
+            engine=engine,
+            pool_class=type(pool).__name__,
+            **sizes,
+            checkouts=wait_metrics.checkouts,
+            timeouts=wait_metrics.timeouts,
+            wait_seconds_total=wait_metrics.wait_seconds_total,
+            wait_seconds_max=wait_metrics.wait_seconds_max,
+        )
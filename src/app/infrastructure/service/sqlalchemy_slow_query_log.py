@@ -0,0 +1,9 @@
+from app.domain.models.slow_query import SlowQuery
+from app.domain.services.slow_query_log import SlowQueryLog
+from app.infrastructure.db.slow_query_log import slow_query_recorder
+
+
+class SqlAlchemySlowQueryLog(SlowQueryLog):
+
+    def recent(self) -> list[SlowQuery]:
+        return slow_query_recorder.recent()
@@ -0,0 +1,45 @@
+import threading
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """
+    Rate limiter shared by the threads of a process: `rate` tokens per second,
+    up to `capacity` saved for bursts. `acquire` blocks until a token is free,
+    `try_acquire` does not.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated_at = clock()
+
+    def acquire(self) -> None:
+        while (wait := self.try_acquire()) > 0:
+            self._sleep(wait)
+
+    def try_acquire(self) -> float:
+        """Takes a token if there is one (returns 0), otherwise returns the
+        seconds until there will be."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated_at) * self.rate,
+            )
+            self._updated_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
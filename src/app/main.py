@@ -7,19 +7,30 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 
-from app.application import containers  # noqa: F401
 from app.application.api.brands import brands
+from app.application.api.internal import internal
 from app.application.api.products import products
 from app.application.api.users import access, users
+from app.application.containers import container
 from app.application.handlers.exception_handlers import add_exception_handlers
+from app.application.middlewares.container_scope_middleware import (
+    ContainerScopeMiddleware,
+)
+from app.application.middlewares.database_session_middleware import (
+    DatabaseSessionMiddleware,
+)
+from app.application.middlewares.query_stats_middleware import QueryStatsMiddleware
+from app.application.middlewares.rate_limit_middleware import RateLimitMiddleware
+from app.application.workers.outbox_dispatcher import OutboxDispatcher
 from app.core.configurations import settings
 from app.core.logging_config import logger
-from app.core.security_utils import hash_password
+from app.core.security_utils import hash_password, password_hasher
 from app.domain.enums.role_enum import UserRole
 from app.domain.helpers.datetime_generator import get_now_datetime
 from app.domain.helpers.ulid_generator import generate_ulid
 from app.infrastructure.db.session import Base, engine  # noqa: F401
 from app.infrastructure.entity.user_entity import UserEntity
+from app.infrastructure.service.ses_client import ses_client_holder
 from app.openapi import openapi
 from scripts.run_yoyo_migrations import normalize_for_yoyo, run_yoyo_migrations_sync
 
@@ -56,7 +67,7 @@ async def lifespan(app: FastAPI) -> None:  # noqa: ARG001
                 id=generate_ulid(),
                 username=default_admin,
                 email=default_email,
-                hashed_password=hash_password(default_password),
+                hashed_password=await hash_password(default_password),
                 role=UserRole.SUPERADMIN,
                 created_at=date_now,
                 updated_at=date_now,
@@ -65,8 +76,21 @@ async def lifespan(app: FastAPI) -> None:  # noqa: ARG001
             session.commit()
             logger.info("Default superadmin user created")
 
+    outbox_dispatcher = OutboxDispatcher(
+        container,
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        poll_interval=settings.OUTBOX_POLL_INTERVAL_SECONDS,
+    )
+    if settings.OUTBOX_DISPATCHER_ENABLED:
+        outbox_dispatcher.start()
+
     yield
 
+    outbox_dispatcher.stop()
+    container.close()
+    ses_client_holder.close()
+    password_hasher.close()
+
 
 # ----------------------------
 # FastAPI
@@ -76,6 +100,12 @@ app = FastAPI(redoc_url="/", lifespan=lifespan)
 # ----------------------------
 # Middleware y Exception Handlers
 # ----------------------------
+app.add_middleware(ContainerScopeMiddleware, container=container)
+app.add_middleware(DatabaseSessionMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+# Before the rest: rejected attempts cost no scope, session or body validation
+app.add_middleware(RateLimitMiddleware, container=container)
+# Outermost, so every response (429s included) carries the CORS headers
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -89,6 +119,7 @@ add_exception_handlers(app)
 # ----------------------------
 app.include_router(access.router)
 app.include_router(brands.router)
+app.include_router(internal.router)
 app.include_router(products.router)
 app.include_router(users.router)
 
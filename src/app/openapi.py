@@ -51,6 +51,7 @@ def openapi(app: FastAPI) -> dict:
         {"name": "Users", "description": "Operations with users"},
         {"name": "Brands", "description": "Operations with brands"},
         {"name": "Products", "description": "Operations with products"},
+        {"name": "Internal", "description": "Operational endpoints"},
     ]
 
     for path in openapi_schema["paths"].values():
@@ -0,0 +1,116 @@
+from collections.abc import Iterator
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+
+from app.application.api.products.bulk_import.parsers import ProductImportParser
+from app.domain.models.product_import import ProductImportError
+from app.domain.use_cases.products.bulk_import.product_import_input import (
+    ProductImportRow,
+)
+
+
+class TestProductImportParser:
+
+    def test_media_type_accepts_csv_and_ndjson(self) -> None:
+        assert ProductImportParser.media_type("text/csv; charset=utf-8") == "text/csv"
+        assert (
+            ProductImportParser.media_type("application/x-ndjson")
+            == "application/x-ndjson"
+        )
+        assert ProductImportParser.media_type("application/json") is None
+        assert ProductImportParser.media_type(None) is None
+
+    def test_parse_csv_uses_line_numbers_and_header(self) -> None:
+        lines = [
+            "sku,name,price,brand_id\n",
+            "SKU-1,T-Shirt,9.99,01K4KNPTYEBNMX5DP8W0BMTS6C\n",
+            'SKU-2,"Multi\n',
+            'line",1,01K4KNPTYEBNMX5DP8W0BMTS6C\n',
+            "SKU-3,Missing brand,1\n",
+        ]
+
+        items = list(ProductImportParser.parse("text/csv", lines))
+
+        first, second, errors = items
+        assert isinstance(first, ProductImportRow)
+        assert first.row == 2  # noqa: PLR2004
+        assert first.product.price == Decimal("9.99")
+        assert isinstance(second, ProductImportRow)
+        assert second.product.name == "Multi\nline"
+        assert len(errors) == 1
+        assert isinstance(errors[0], ProductImportError)
+        assert errors[0].code == "missing"
+        assert errors[0].location == ["brand_id"]
+
+    def test_parse_ndjson_reports_invalid_lines(self) -> None:
+        lines = [
+            '{"sku": "SKU-1", "name": "A", "price": 1, "brand_id": "B"}\n',
+            "\n",
+            '{"sku": "", "name": "A", "price": 1, "brand_id": "B"}\n',
+        ]
+
+        row, errors = ProductImportParser.parse("application/x-ndjson", lines)
+
+        assert isinstance(row, ProductImportRow)
+        assert row.row == 1
+        assert errors[0].row == 3  # noqa: PLR2004
+        assert errors[0].location == ["sku"]
+
+    def test_parse_skips_records_already_imported(self) -> None:
+        lines = [
+            "sku,name,price,brand_id\n",
+            "SKU-1,Imported,1,B\n",
+            "SKU-2,,1,B\n",
+            "SKU-3,Pending,1,B\n",
+        ]
+
+        (row,) = ProductImportParser.parse("text/csv", lines, skip_records=2)
+
+        assert row.row == 4  # noqa: PLR2004
+        assert row.product.sku == "SKU-3"
+
+    def test_lines_are_rebuilt_across_chunks(self) -> None:
+        chunks = [b"\xef\xbb\xbfsku,na", b"me\r\nSKU-1,Caf\xc3", b"\xa9\n", b"SKU-2,X"]
+
+        lines = list(ProductImportParser.lines(chunks, max_line_length=100))
+
+        assert lines == ["sku,name\r\n", "SKU-1,Caf\u00e9\n", "SKU-2,X"]
+
+    def test_lines_longer_than_the_limit_are_rejected(self) -> None:
+        with pytest.raises(HTTPException) as exc_info:
+            list(ProductImportParser.lines([b"x" * 11], max_line_length=10))
+
+        assert exc_info.value.status_code == 413  # noqa: PLR2004
+
+    @pytest.mark.parametrize(
+        "chunks",
+        [
+            # Ended in the same chunk it starts in, then followed by more lines
+            [b"ok\n" + b"x" * 11 + b"\nok\n"],
+            # Spread over chunks, ended by the last one
+            [b"x" * 6, b"x" * 5 + b"\n"],
+        ],
+    )
+    def test_every_line_is_checked_against_the_limit(
+        self,
+        chunks: list[bytes],
+    ) -> None:
+        with pytest.raises(HTTPException) as exc_info:
+            list(ProductImportParser.lines(chunks, max_line_length=10))
+
+        assert exc_info.value.status_code == 413  # noqa: PLR2004
+
+    def test_long_lines_are_rejected_before_reading_the_rest(self) -> None:
+        read: list[bytes] = []
+
+        def chunks() -> Iterator[bytes]:
+            for _ in range(100):
+                read.append(b"x")
+                yield b"x"
+
+        with pytest.raises(HTTPException):
+            list(ProductImportParser.lines(chunks(), max_line_length=10))
+
+        assert len(read) == 11  # noqa: PLR2004
@@ -0,0 +1,30 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from app.application.api.products.changes.mappers import ProductChangeCursorMapper
+from app.domain.enums.code_enum import ErrorCodeEnum
+from app.domain.exceptions.data_validation_exception import DataValidationError
+from app.domain.models.product_change import ProductChangeCursor
+
+
+class TestProductChangeCursorMapper:
+
+    def test_cursor_round_trip(self) -> None:
+        cursor = ProductChangeCursor(
+            changed_at=datetime(2026, 10, 19, 10, 0, 0, 123456, tzinfo=UTC),
+            product_id="01K4EH5T4YQERHJ99RM1SWYV99",
+        )
+
+        encoded = ProductChangeCursorMapper.encode(cursor)
+
+        assert "=" not in encoded
+        assert ProductChangeCursorMapper.decode(encoded) == cursor
+
+    @pytest.mark.parametrize("value", ["not-a-cursor", "e30", "bnVsbA"])
+    def test_invalid_cursor_raises_error(self, value: str) -> None:
+        with pytest.raises(DataValidationError) as exc_info:
+            ProductChangeCursorMapper.decode(value)
+
+        assert exc_info.value.code == ErrorCodeEnum.INVALID_CURSOR
+        assert exc_info.value.location == ["since"]
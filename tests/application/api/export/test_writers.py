@@ -0,0 +1,55 @@
+import json
+from decimal import Decimal
+
+from app.application.api.products.export.schemas import ProductExportFormat
+from app.application.api.products.export.writers import ProductExportWriter
+from app.domain.models.product_export import ProductExportRow
+
+BATCHES = [
+    [
+        ProductExportRow("p1", "SKU-1", "Shirt, blue", Decimal("9.99"), "b1", "Nike"),
+        ProductExportRow("p2", "SKU-2", "Shoes", Decimal("20.00"), "b1", "Nike"),
+    ],
+    [ProductExportRow("p3", "SKU-3", "Cap", Decimal("5.50"), "b2", "Adidas")],
+]
+
+
+class TestProductExportWriter:
+
+    def test_csv_writes_one_chunk_per_batch(self) -> None:
+        chunks = list(ProductExportWriter.write(ProductExportFormat.CSV, BATCHES))
+
+        assert chunks == [
+            "id,sku,name,price,brand_id,brand_name\r\n"
+            'p1,SKU-1,"Shirt, blue",9.99,b1,Nike\r\n'
+            "p2,SKU-2,Shoes,20.00,b1,Nike\r\n",
+            "p3,SKU-3,Cap,5.50,b2,Adidas\r\n",
+        ]
+
+    def test_csv_of_empty_catalog_has_header(self) -> None:
+        chunks = list(ProductExportWriter.write(ProductExportFormat.CSV, []))
+
+        assert chunks == ["id,sku,name,price,brand_id,brand_name\r\n"]
+
+    def test_ndjson_writes_one_line_per_product(self) -> None:
+        chunks = list(ProductExportWriter.write(ProductExportFormat.NDJSON, BATCHES))
+
+        lines = "".join(chunks).splitlines()
+        assert len(lines) == 3  # noqa: PLR2004
+        assert json.loads(lines[0]) == {
+            "id": "p1",
+            "sku": "SKU-1",
+            "name": "Shirt, blue",
+            "price": "9.99",
+            "brand_id": "b1",
+            "brand_name": "Nike",
+        }
+
+    def test_columnar_writes_one_object_per_batch(self) -> None:
+        chunks = list(ProductExportWriter.write(ProductExportFormat.COLUMNAR, BATCHES))
+
+        assert len(chunks) == 2  # noqa: PLR2004
+        first = json.loads(chunks[0])
+        assert first["sku"] == ["SKU-1", "SKU-2"]
+        assert first["price"] == ["9.99", "20.00"]
+        assert json.loads(chunks[1])["brand_name"] == ["Adidas"]
@@ -4,6 +4,11 @@ from datetime import UTC, datetime, timedelta
 import pytest
 from fastapi.testclient import TestClient
 from jose import jwt
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.security_utils import PasswordHashingBusyError
+from app.infrastructure.entity.user_entity import UserEntity
 
 USERNAME_TEST = "newaccessuser"
 PASSWORD_TEST = "SuperSecure123!"
@@ -131,6 +136,103 @@ class TestAccessApiIntegration:
         body = response.json()
         assert body["detail"] in ["Invalid credentials", "Unauthorized"]
 
+    @pytest.mark.parametrize(
+        ("path", "target", "payload"),
+        [
+            (
+                "/login",
+                "app.domain.use_cases.users.login.login_use_case.verify_password",
+                {"username": USERNAME_TEST, "password": PASSWORD_TEST},
+            ),
+            (
+                "/sigup",
+                "app.domain.use_cases.users.sig_up.sig_up_use_case.hash_password",
+                {
+                    "username": "busyhasher",
+                    "email": "busyhasher@example.com",
+                    "password": PASSWORD_TEST,
+                },
+            ),
+        ],
+    )
+    def test_busy_password_hashing_returns_service_unavailable(
+        self,
+        client: TestClient,
+        monkeypatch: pytest.MonkeyPatch,
+        path: str,
+        target: str,
+        payload: dict[str, str],
+    ) -> None:
+        service_unavailable_code = 503
+
+        def busy(*_: str) -> None:
+            msg = "Too many password checks in progress, try again later"
+            raise PasswordHashingBusyError(msg)
+
+        monkeypatch.setattr(target, busy)
+
+        response = client.post(path, json=payload)
+
+        assert response.status_code == service_unavailable_code
+        assert response.headers["Retry-After"] == "1"
+        assert response.json()["detail"].startswith("Too many password checks")
+
+    def test_guest_token_reads_products_without_creating_users(
+        self,
+        client: TestClient,
+        db_session: Session,
+        test_token: str,
+    ) -> None:
+        expected_ok_code = 200
+        admin_headers = {"Authorization": f"Bearer {test_token}"}
+        product_id = client.post(
+            "/products",
+            headers=admin_headers,
+            json={
+                "brand_id": "01K4KNPTYEBNMX5DP8W0BMTS6C",
+                "sku": "SKU-GUEST-001",
+                "name": "Guest read",
+                "price": "10.00",
+            },
+        ).json()["id"]
+        users_before = db_session.scalar(select(func.count(UserEntity.id)))
+
+        response = client.post("/guest-token")
+
+        assert response.status_code == expected_ok_code
+        token = response.json()["access_token"]
+        assert jwt.get_unverified_claims(token)["role"] == "ANONYMOUS"
+        assert db_session.scalar(select(func.count(UserEntity.id))) == users_before
+
+        response = client.get(
+            f"/products/{product_id}",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == expected_ok_code
+
+        # The guest's read counts as a view
+        views = client.get("/products/views", headers=admin_headers).json()
+        assert [
+            product["views"]
+            for product in views["products"]
+            if product["id"] == product_id
+        ] == [1]
+        client.delete(f"/products/{product_id}", headers=admin_headers)
+
+    def test_guest_token_is_rejected_outside_the_guest_routes(
+        self,
+        client: TestClient,
+    ) -> None:
+        unauthorized_code = 401
+        token = client.post("/guest-token").json()["access_token"]
+
+        response = client.get(
+            "/products/views",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == unauthorized_code
+
     def test_login_expired_token_is_rejected(self, client: TestClient):
         error_status_code = 405
 
@@ -0,0 +1,80 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.configurations import settings
+from app.infrastructure.db.slow_query_log import slow_query_recorder
+
+
+class TestInternalApiIntegration:
+
+    def test_when_db_pool_is_requested_then_metrics_are_retrieved(
+        self,
+        test_superadmin_token: str,
+        client: TestClient,
+    ) -> None:
+        expected_success_code = 200
+        headers = {"Authorization": f"Bearer {test_superadmin_token}"}
+
+        response = client.get("/internal/db-pool", headers=headers)
+
+        assert response.status_code == expected_success_code
+        data = response.json()
+        assert data["process_id"] > 0
+        # The test suite runs on NullPool engines
+        primary = data["pools"][0]
+        assert primary["engine"] == "primary"
+        assert primary["pool_class"] == "NullPool"
+        assert primary["size"] is None
+        assert primary["wait_seconds_avg"] >= 0
+
+    def test_when_db_pool_is_requested_by_admin_then_unauthorized(
+        self,
+        test_token: str,
+        client: TestClient,
+    ) -> None:
+        expected_unauthorized = 401
+        headers = {"Authorization": f"Bearer {test_token}"}
+
+        response = client.get("/internal/db-pool", headers=headers)
+
+        assert response.status_code == expected_unauthorized
+
+    def test_when_slow_queries_are_requested_then_plans_are_retrieved(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        test_token: str,
+        test_superadmin_token: str,
+        client: TestClient,
+    ) -> None:
+        expected_success_code = 200
+        slow_query_recorder.clear()
+        monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+
+        client.get("/products/views", headers={"Authorization": f"Bearer {test_token}"})
+        response = client.get(
+            "/internal/slow-queries",
+            headers={"Authorization": f"Bearer {test_superadmin_token}"},
+        )
+        slow_query_recorder.clear()
+
+        assert response.status_code == expected_success_code
+        views_queries = [
+            slow_query
+            for slow_query in response.json()["slow_queries"]
+            if "product_views" in slow_query["statement"]
+        ]
+        assert views_queries
+        assert views_queries[0]["duration_ms"] >= 0
+        assert "Plan" in views_queries[0]["plan"][0]
+
+    def test_when_slow_queries_are_requested_by_admin_then_unauthorized(
+        self,
+        test_token: str,
+        client: TestClient,
+    ) -> None:
+        expected_unauthorized = 401
+        headers = {"Authorization": f"Bearer {test_token}"}
+
+        response = client.get("/internal/slow-queries", headers=headers)
+
+        assert response.status_code == expected_unauthorized
@@ -1,12 +1,20 @@
+import json
 from decimal import Decimal
 
 import pytest
 import ulid
 from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core import security
+from app.core.configurations import settings
+from app.infrastructure.entity.outbox_message_entity import OutboxMessageEntity
 
 
 class TestProductsApiIntegration:
 
+    @pytest.mark.query_budget(3)
     def test_create_product_then_patched_role_is_checked(
         self,
         test_token: str,
@@ -112,6 +120,7 @@ class TestProductsApiIntegration:
             error_msgs = [err["msg"] for err in body["detail"]]
             assert any(expected_msg in msg for msg in error_msgs)
 
+    @pytest.mark.query_budget(1)
     def test_when_get_product_detail_successfully(
         self,
         test_token: str,
@@ -129,6 +138,34 @@ class TestProductsApiIntegration:
         assert data["name"] == "Nike Air Max"
         assert data["price"] == expected_price
 
+    def test_get_product_detail_verifies_the_token_once(
+        self,
+        test_token: str,
+        client: TestClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        success_status_code = 200
+        decoded_tokens = []
+        decode = security.jwt.decode
+
+        def counting_decode(token: str, *args: object, **kwargs: object) -> dict:
+            decoded_tokens.append(token)
+            return decode(token, *args, **kwargs)
+
+        monkeypatch.setattr(security.jwt, "decode", counting_decode)
+        security.verified_token_cache.clear()
+        headers = {"Authorization": f"Bearer {test_token}"}
+
+        for _ in range(2):
+            response = client.get(
+                "/products/01K4KNQGXMW5KK788YBHJ2D28V",
+                headers=headers,
+            )
+            assert response.status_code == success_status_code
+
+        # Once on the first request, the second one hits the cache
+        assert decoded_tokens == [test_token]
+
     def test_when_get_product_detail_but_it_is_not_found(
         self,
         test_token: str,
@@ -144,6 +181,7 @@ class TestProductsApiIntegration:
         body = response.json()
         assert body["detail"] == "No product found with ID: 01ZZZZZZZZZZZZZZZZZZZZZZZZ."
 
+    @pytest.mark.query_budget(7)
     def test_when_update_successfully_product(
         self,
         test_token: str,
@@ -254,6 +292,7 @@ class TestProductsApiIntegration:
         assert first_err.get("type") == "ALREADY_EXIST_PRODUCT_SKU"
         assert first_err.get("msg") == "Product with SKU 'SKU-NIKE-001' already exists"
 
+    @pytest.mark.query_budget(1)
     def test_views_report(
         self,
         test_token: str,
@@ -287,6 +326,7 @@ class TestProductsApiIntegration:
             else:
                 assert product["views"] == expected_product_3_view
 
+    @pytest.mark.query_budget(4)
     def test_delete_product(
         self,
         test_token: str,
@@ -301,3 +341,408 @@ class TestProductsApiIntegration:
         )
 
         assert response.status_code == expected_not_content
+
+    def test_when_import_products_from_csv_then_valid_rows_are_created(
+        self,
+        test_token: str,
+        client: TestClient,
+    ) -> None:
+        expected_success_code = 200
+        expected_imported = 2
+
+        headers = {
+            "Authorization": f"Bearer {test_token}",
+            "Content-Type": "text/csv",
+        }
+        ulid_str = ulid.new().str
+        content = (
+            "brand_id,sku,name,price\n"
+            f"01K4KNPTYEBNMX5DP8W0BMTS6C,SKU-CSV-1-{ulid_str},Import 1,10.50\n"
+            f"01K4KNQ7FG9YCRZ3HPF7HRSPWG,SKU-CSV-2-{ulid_str},Import 2,20\n"
+            "01K4KNPTYEBNMX5DP8W0BMTS6C,SKU-NIKE-001,Duplicated,1\n"
+            f"01ZZZZZZZZZZZZZZZZZZZZZZZZ,SKU-CSV-3-{ulid_str},No brand,1\n"
+            f"01K4KNPTYEBNMX5DP8W0BMTS6C,SKU-CSV-4-{ulid_str},Negative,-1\n"
+        )
+
+        response = client.post("/products:import", headers=headers, content=content)
+
+        assert response.status_code == expected_success_code
+        data = response.json()
+        assert data["imported"] == expected_imported
+        assert [(err["row"], err["type"]) for err in data["errors"]] == [
+            (4, "ALREADY_EXIST_PRODUCT_SKU"),
+            (5, "BRAND_NOT_FOUND"),
+            (6, "greater_than_equal"),
+        ]
+
+        product = client.get(
+            "/products/views?brand_id=01K4KNQ7FG9YCRZ3HPF7HRSPWG",
+            headers=headers,
+        ).json()["products"]
+        assert any(item["name"] == "Import 2" for item in product)
+
+    def test_when_import_products_from_ndjson_then_valid_rows_are_created(
+        self,
+        test_token: str,
+        client: TestClient,
+    ) -> None:
+        expected_success_code = 200
+
+        headers = {
+            "Authorization": f"Bearer {test_token}",
+            "Content-Type": "application/x-ndjson",
+        }
+        ulid_str = ulid.new().str
+        content = (
+            '{"brand_id": "01K4KNPTYEBNMX5DP8W0BMTS6C", '
+            f'"sku": "SKU-ND-{ulid_str}", "name": "Import", "price": 5}}\n'
+            "\n"
+            "not json\n"
+        )
+
+        response = client.post("/products:import", headers=headers, content=content)
+
+        assert response.status_code == expected_success_code
+        data = response.json()
+        assert data["imported"] == 1
+        assert [(err["row"], err["type"]) for err in data["errors"]] == [
+            (3, "json_invalid"),
+        ]
+
+    def test_when_import_products_with_unsupported_media_type_then_error(
+        self,
+        test_token: str,
+        client: TestClient,
+    ) -> None:
+        expected_unsupported_media_type = 415
+
+        headers = {"Authorization": f"Bearer {test_token}"}
+        response = client.post("/products:import", headers=headers, json=[])
+
+        assert response.status_code == expected_unsupported_media_type
+
+    def test_when_import_is_resumed_then_processed_rows_are_skipped(
+        self,
+        test_token: str,
+        client: TestClient,
+    ) -> None:
+        expected_success_code = 200
+        expected_rows_processed = 3
+
+        headers = {
+            "Authorization": f"Bearer {test_token}",
+            "Content-Type": "text/csv",
+        }
+        ulid_str = ulid.new().str
+        rows = [
+            f"01K4KNPTYEBNMX5DP8W0BMTS6C,SKU-RESUME-{index}-{ulid_str},Resume,1\n"
+            for index in range(3)
+        ]
+        header = "brand_id,sku,name,price\n"
+
+        first = client.post(
+            "/products:import",
+            headers=headers,
+            content=header + "".join(rows[:2]),
+        )
+        job_id = first.json()["job_id"]
+        response = client.post(
+            f"/products:import?job_id={job_id}",
+            headers=headers,
+            content=header + "".join(rows),
+        )
+
+        assert response.status_code == expected_success_code
+        data = response.json()
+        assert data["job_id"] == job_id
+        assert data["status"] == "COMPLETED"
+        assert data["rows_processed"] == expected_rows_processed
+        assert data["imported"] == expected_rows_processed
+        assert data["errors"] == []
+
+    def test_when_import_job_is_not_found_then_error_is_thrown(
+        self,
+        test_token: str,
+        client: TestClient,
+    ) -> None:
+        expected_not_found = 404
+
+        headers = {
+            "Authorization": f"Bearer {test_token}",
+            "Content-Type": "text/csv",
+        }
+        response = client.post(
+            "/products:import?job_id=01ZZZZZZZZZZZZZZZZZZZZZZZZ",
+            headers=headers,
+            content="brand_id,sku,name,price\n",
+        )
+
+        assert response.status_code == expected_not_found
+
+    def test_when_prices_are_updated_in_bulk_then_changes_are_reported(
+        self,
+        test_token: str,
+        client: TestClient,
+    ) -> None:
+        expected_success_code = 200
+        headers = {"Authorization": f"Bearer {test_token}"}
+        sku = f"SKU-PRICES-{ulid.new().str}"
+        client.post(
+            "/products",
+            headers=headers,
+            json={
+                "sku": sku,
+                "name": "Bulk priced product",
+                "price": "10.00",
+                "brand_id": "01K4KNPTYEBNMX5DP8W0BMTS6C",
+            },
+        )
+
+        response = client.patch(
+            "/products/prices",
+            headers=headers,
+            json={
+                "prices": [
+                    {"sku": sku, "price": "15.50"},
+                    {"sku": "SKU-PRICES-UNKNOWN", "price": "1"},
+                ],
+            },
+        )
+
+        assert response.status_code == expected_success_code
+        assert response.json() == {
+            "updated": 1,
+            "unchanged": 0,
+            "not_found_skus": ["SKU-PRICES-UNKNOWN"],
+        }
+
+    def test_when_prices_have_repeated_sku_then_bad_request_is_retrieved(
+        self,
+        test_token: str,
+        client: TestClient,
+    ) -> None:
+        expected_bad_request = 400
+        headers = {"Authorization": f"Bearer {test_token}"}
+
+        response = client.patch(
+            "/products/prices",
+            headers=headers,
+            json={
+                "prices": [
+                    {"sku": "SKU-REPEATED", "price": "1"},
+                    {"sku": "SKU-REPEATED", "price": "2"},
+                ],
+            },
+        )
+
+        assert response.status_code == expected_bad_request
+        assert response.json()["detail"][0]["type"] == "REPEATED_PRODUCT_SKU"
+
+    def test_when_catalog_is_exported_then_all_products_are_streamed(
+        self,
+        test_token: str,
+        client: TestClient,
+    ) -> None:
+        expected_success_code = 200
+        headers = {"Authorization": f"Bearer {test_token}"}
+
+        csv_response = client.get("/products/export", headers=headers)
+        ndjson_response = client.get(
+            "/products/export?format=ndjson",
+            headers=headers,
+        )
+
+        assert csv_response.status_code == expected_success_code
+        assert csv_response.headers["content-type"].startswith("text/csv")
+        csv_lines = csv_response.text.splitlines()
+        assert csv_lines[0] == "id,sku,name,price,brand_id,brand_name"
+        assert ndjson_response.status_code == expected_success_code
+        products = [json.loads(line) for line in ndjson_response.text.splitlines()]
+        assert len(products) == len(csv_lines) - 1
+        assert {"sku": "SKU-NIKE-001", "brand_name": "Nike"}.items() <= next(
+            product for product in products if product["sku"] == "SKU-NIKE-001"
+        ).items()
+
+    def test_when_changes_are_listed_then_feed_resumes_from_cursor(
+        self,
+        test_token: str,
+        client: TestClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        expected_success_code = 200
+        monkeypatch.setattr(settings, "PRODUCT_CHANGES_SETTLE_SECONDS", 0)
+        headers = {"Authorization": f"Bearer {test_token}"}
+
+        since = None
+        has_more = True
+        while has_more:
+            params = {"limit": 1000} | ({"since": since} if since else {})
+            response = client.get("/products/changes", headers=headers, params=params)
+            assert response.status_code == expected_success_code
+            since = response.json()["next_cursor"]
+            has_more = response.json()["has_more"]
+
+        created = client.post(
+            "/products",
+            headers=headers,
+            json={
+                "sku": f"SKU-CHANGES-{ulid.new().str}",
+                "name": "Change feed product",
+                "price": "5.00",
+                "brand_id": "01K4KNPTYEBNMX5DP8W0BMTS6C",
+            },
+        ).json()
+        client.delete(f"/products/{created['id']}", headers=headers)
+
+        response = client.get(
+            "/products/changes",
+            headers=headers,
+            params={"since": since},
+        )
+
+        assert response.status_code == expected_success_code
+        data = response.json()
+        assert [
+            (change["change_type"], change["product_id"]) for change in data["changes"]
+        ] == [("DELETE", created["id"])]
+        assert data["changes"][0]["product"] is None
+        assert data["has_more"] is False
+        assert data["next_cursor"] != since
+
+    def test_when_changes_cursor_is_invalid_then_bad_request_is_retrieved(
+        self,
+        test_token: str,
+        client: TestClient,
+    ) -> None:
+        expected_bad_request = 400
+        headers = {"Authorization": f"Bearer {test_token}"}
+
+        response = client.get(
+            "/products/changes",
+            headers=headers,
+            params={"since": "not-a-cursor"},
+        )
+
+        assert response.status_code == expected_bad_request
+        assert response.json()["detail"][0]["type"] == "INVALID_CURSOR"
+
+    def test_when_product_is_updated_then_notification_is_left_in_outbox(
+        self,
+        test_token: str,
+        client: TestClient,
+        db_session: Session,
+    ) -> None:
+        expected_success_code = 200
+        expected_bad_request = 400
+        headers = {"Authorization": f"Bearer {test_token}"}
+        ulid_str = ulid.new().str
+        payload = {
+            "brand_id": "01K4KNPTYEBNMX5DP8W0BMTS6C",
+            "sku": f"SKU-OUTBOX-{ulid_str}",
+            "name": f"Outbox {ulid_str}",
+            "price": "15.00",
+        }
+        product_id = client.post("/products", headers=headers, json=payload).json()[
+            "id"
+        ]
+
+        updated = client.put(
+            f"/products/{product_id}",
+            headers=headers,
+            json={**payload, "price": "16.50"},
+        )
+        rejected = client.put(
+            f"/products/{product_id}",
+            headers=headers,
+            json={**payload, "sku": "SKU-NIKE-001", "price": "17.00"},
+        )
+
+        assert updated.status_code == expected_success_code
+        assert rejected.status_code == expected_bad_request
+        messages = (
+            db_session.execute(
+                select(OutboxMessageEntity).where(
+                    OutboxMessageEntity.payload["product_id"].astext == product_id,
+                ),
+            )
+            .scalars()
+            .all()
+        )
+        assert [(message.event_type, message.payload) for message in messages] == [
+            (
+                "PRODUCT_UPDATED",
+                {
+                    "product_id": product_id,
+                    "changes": {"price": {"old": "15.00", "new": "16.50"}},
+                },
+            ),
+        ]
+
+
+class TestProductsApiAsyncIntegration:
+
+    @pytest.fixture(autouse=True)
+    def async_data_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "DATABASE_ASYNC", True)
+
+    def test_product_lifecycle_on_async_data_path(
+        self,
+        test_token: str,
+        client: TestClient,
+    ) -> None:
+        expected_success_code = 200
+        expected_not_found = 404
+        expected_not_content = 204
+        headers = {"Authorization": f"Bearer {test_token}"}
+        ulid_str = ulid.new().str
+        payload = {
+            "brand_id": "01K4KNPTYEBNMX5DP8W0BMTS6C",
+            "sku": f"SKU-ASYNC-{ulid_str}",
+            "name": f"Async {ulid_str}",
+            "price": "15.00",
+        }
+
+        created = client.post("/products", headers=headers, json=payload)
+        assert created.status_code == expected_success_code
+        product_id = created.json()["id"]
+
+        detail = client.get(f"/products/{product_id}", headers=headers)
+        assert detail.status_code == expected_success_code
+        assert detail.json()["sku"] == f"SKU-ASYNC-{ulid_str}"
+
+        updated = client.put(
+            f"/products/{product_id}",
+            headers=headers,
+            json={**payload, "name": f"Async updated {ulid_str}"},
+        )
+        assert updated.status_code == expected_success_code
+        assert updated.json()["name"] == f"Async updated {ulid_str}"
+
+        report = client.get("/products/views", headers=headers)
+        assert report.status_code == expected_success_code
+        assert product_id in {product["id"] for product in report.json()["products"]}
+
+        deleted = client.delete(f"/products/{product_id}", headers=headers)
+        assert deleted.status_code == expected_not_content
+
+        missing = client.get(f"/products/{product_id}", headers=headers)
+        assert missing.status_code == expected_not_found
+
+    def test_when_sku_already_exists_on_async_data_path_then_bad_request(
+        self,
+        test_token: str,
+        client: TestClient,
+    ) -> None:
+        expected_bad_request = 400
+        headers = {"Authorization": f"Bearer {test_token}"}
+        payload = {
+            "brand_id": "01K4KNPTYEBNMX5DP8W0BMTS6C",
+            "sku": "SKU-NIKE-001",
+            "name": "Test Product",
+            "price": "10.0",
+        }
+
+        response = client.post("/products", headers=headers, json=payload)
+
+        assert response.status_code == expected_bad_request
+        assert response.json()["detail"][0]["type"] == "ALREADY_EXIST_PRODUCT_SKU"
@@ -0,0 +1,53 @@
+from typing import Annotated
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.application.middlewares.container_scope_middleware import (
+    ContainerScopeMiddleware,
+)
+from app.core.container import Container
+
+
+class Repository:
+    closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_each_request_gets_its_scope_disposed_after_the_response() -> None:
+    container = Container()
+    container.scoped(Repository, lambda _: Repository(), dispose=Repository.close)
+    container.singleton("client", lambda _: object())
+    resolved: list[tuple[Repository, object]] = []
+
+    app = FastAPI()
+    app.add_middleware(ContainerScopeMiddleware, container=container)
+
+    @app.get("/")
+    def endpoint(
+        repository: Annotated[
+            Repository,
+            Depends(lambda: container.resolve(Repository)),
+        ],
+    ) -> dict:
+        # Sync endpoint: resolved in a worker thread
+        resolved.append((repository, container.resolve("client")))
+        return {
+            "shared": container.resolve(Repository) is repository,
+            "closed": repository.closed,
+        }
+
+    client = TestClient(app)
+    responses = [client.get("/"), client.get("/")]
+
+    assert [response.json() for response in responses] == [
+        {"shared": True, "closed": False},
+        {"shared": True, "closed": False},
+    ]
+    (first, first_client), (second, second_client) = resolved
+    assert first is not second
+    assert first.closed
+    assert second.closed
+    assert first_client is second_client
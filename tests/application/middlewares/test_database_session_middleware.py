@@ -0,0 +1,37 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.application.middlewares.database_session_middleware import (
+    DatabaseSessionMiddleware,
+)
+from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.db.session_scope import (
+    DatabaseSessionScope,
+    current_session_scope,
+)
+
+
+def test_each_request_gets_one_session_closed_after_the_response() -> None:
+    scopes: list[DatabaseSessionScope] = []
+    app = FastAPI()
+    app.add_middleware(DatabaseSessionMiddleware)
+
+    @app.get("/")
+    def endpoint() -> dict:
+        scopes.append(current_session_scope())
+        first = DatabaseRepository().get_db_session()
+        second = DatabaseRepository().get_db_session()
+        first.execute(text("SELECT 1"))
+        return {"shared": first is second}
+
+    client = TestClient(app)
+    responses = [client.get("/"), client.get("/")]
+
+    assert [response.json() for response in responses] == [
+        {"shared": True},
+        {"shared": True},
+    ]
+    assert len(scopes) == 2  # noqa: PLR2004
+    assert scopes[0] is not scopes[1]
+    assert all(scope.closed for scope in scopes)
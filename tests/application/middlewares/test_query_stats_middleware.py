@@ -0,0 +1,62 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.application.middlewares.database_session_middleware import (
+    DatabaseSessionMiddleware,
+)
+from app.application.middlewares.query_stats_middleware import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    QueryStatsMiddleware,
+)
+from app.core.configurations import settings
+from app.infrastructure.db.database_repository import DatabaseRepository
+
+
+def make_app(statements: int) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(DatabaseSessionMiddleware)
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/")
+    def endpoint() -> dict:
+        session = DatabaseRepository().get_db_session()
+        for _ in range(statements):
+            session.execute(text("SELECT 1"))
+        return {}
+
+    return app
+
+
+def test_statements_are_reported_in_debug_mode(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "DEBUG", True)
+
+    response = TestClient(make_app(statements=2)).get("/")
+
+    assert response.headers[QUERY_COUNT_HEADER] == "2"
+    assert float(response.headers[QUERY_TIME_HEADER]) > 0
+
+
+def test_statements_are_not_reported_outside_debug_mode() -> None:
+    response = TestClient(make_app(statements=2)).get("/")
+
+    assert QUERY_COUNT_HEADER not in response.headers
+
+
+def test_repeated_statements_are_logged_as_possible_n_plus_one(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    monkeypatch.setattr(settings, "DEBUG", True)
+    monkeypatch.setattr(settings, "DB_QUERY_REPEAT_THRESHOLD", 3)
+
+    with caplog.at_level(logging.WARNING):
+        TestClient(make_app(statements=3)).get("/")
+
+    assert "Possible N+1 in GET /: statement run 3 times: SELECT 1" in caplog.text
@@ -0,0 +1,129 @@
+from collections.abc import Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.application.middlewares.rate_limit_middleware import (
+    MAX_BODY_BYTES,
+    RateLimitMiddleware,
+)
+from app.core.configurations import settings
+from app.core.container import Container
+from app.domain.services.rate_limiter import RateLimiter
+from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.entity.rate_limit_bucket_entity import (
+    RateLimitBucketEntity,
+)
+from app.infrastructure.service.in_memory_rate_limiter import InMemoryRateLimiter
+from app.infrastructure.service.postgres_rate_limiter import PostgresRateLimiter
+
+TOO_MANY_REQUESTS = 429
+CONTENT_TOO_LARGE = 413
+PER_IP = 4
+PER_USERNAME = 2
+
+
+class Credentials(BaseModel):
+    username: str
+    password: str
+
+
+@pytest.fixture
+def rate_limiter(
+    request: pytest.FixtureRequest,
+) -> Generator[RateLimiter, None, None]:
+    # In memory unless the test asks for a backend
+    if getattr(request, "param", "memory") == "memory":
+        yield InMemoryRateLimiter(max_keys=100)
+        return
+
+    yield PostgresRateLimiter(idle_seconds=60)
+    database_repository = DatabaseRepository()
+    database_repository.get_db_session().query(RateLimitBucketEntity).delete()
+    database_repository.commit()
+    database_repository.close()
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch, rate_limiter: RateLimiter) -> TestClient:
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(settings, "AUTH_RATE_LIMIT_PER_IP", PER_IP)
+    monkeypatch.setattr(settings, "AUTH_RATE_LIMIT_PER_USERNAME", PER_USERNAME)
+    monkeypatch.setattr(settings, "AUTH_RATE_LIMIT_WINDOW_SECONDS", 60.0)
+    container = Container()
+    container.singleton(RateLimiter, lambda _: rate_limiter)
+
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware, container=container)
+
+    @app.post("/login")
+    def login(credentials: Credentials) -> dict:
+        # The body read by the middleware still reaches the endpoint
+        return {"username": credentials.username}
+
+    @app.get("/products")
+    def products() -> list:
+        return []
+
+    return TestClient(app)
+
+
+def _login(client: TestClient, username: str) -> int:
+    response = client.post(
+        "/login",
+        json={"username": username, "password": "secret"},
+    )
+    if response.status_code == TOO_MANY_REQUESTS:
+        assert int(response.headers["Retry-After"]) > 0
+    else:
+        assert response.json() == {"username": username}
+    return response.status_code
+
+
+def test_attempts_per_username_are_limited(client: TestClient) -> None:
+    statuses = [_login(client, "Admin") for _ in range(PER_USERNAME)]
+    # Usernames are compared case insensitively
+    statuses.append(_login(client, "admin"))
+
+    assert statuses == [200] * PER_USERNAME + [TOO_MANY_REQUESTS]
+    assert _login(client, "someone-else") == 200  # noqa: PLR2004
+
+
+def test_attempts_per_ip_are_limited(client: TestClient) -> None:
+    statuses = [_login(client, f"user-{number}") for number in range(PER_IP + 1)]
+
+    assert statuses == [200] * PER_IP + [TOO_MANY_REQUESTS]
+
+
+def test_other_routes_are_not_limited(client: TestClient) -> None:
+    for _ in range(PER_IP + 1):
+        assert client.get("/products").status_code == 200  # noqa: PLR2004
+
+
+def test_disabled_rate_limit_lets_everything_through(
+    client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", False)
+
+    assert {_login(client, "admin") for _ in range(PER_IP + 1)} == {200}
+
+
+@pytest.mark.parametrize("rate_limiter", ["memory", "postgres"], indirect=True)
+def test_oversized_usernames_are_limited_too(client: TestClient) -> None:
+    username = "a" * 300
+
+    statuses = [_login(client, username) for _ in range(PER_USERNAME + 1)]
+
+    assert statuses == [200] * PER_USERNAME + [TOO_MANY_REQUESTS]
+
+
+def test_oversized_bodies_are_rejected_unread(client: TestClient) -> None:
+    response = client.post(
+        "/login",
+        json={"username": "admin", "password": "x" * MAX_BODY_BYTES},
+    )
+
+    assert response.status_code == CONTENT_TOO_LARGE
@@ -1,8 +1,11 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.configurations import settings
 from app.main import app
 
+TOO_MANY_REQUESTS = 429
+
 
 @pytest.fixture
 def client():
@@ -15,3 +18,19 @@ def test_app_has_openapi(client: TestClient):
     response = client.get("/openapi.json")
     assert response.status_code == expected_success_code
     assert "paths" in response.json()
+
+
+def test_rate_limited_responses_carry_cors_headers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(settings, "AUTH_RATE_LIMIT_PER_IP", 1)
+    client = TestClient(app, client=("203.0.113.7", 50000))
+    credentials = {"username": "nobody", "password": "wrong-password"}
+    headers = {"Origin": "https://shop.example.com"}
+
+    client.post("/login", json=credentials, headers=headers)
+    response = client.post("/login", json=credentials, headers=headers)
+
+    assert response.status_code == TOO_MANY_REQUESTS
+    assert response.headers["access-control-allow-origin"] == "*"
@@ -0,0 +1,80 @@
+import threading
+from unittest.mock import MagicMock
+
+from app.application.workers.outbox_dispatcher import OutboxDispatcher
+from app.core.container import Container
+from app.domain.use_cases.notifications.dispatch.outbox_dispatch_use_case import (
+    OutboxDispatchUseCase,
+)
+
+BATCH_SIZE = 10
+
+
+def make_dispatcher(use_case: MagicMock, poll_interval: float) -> OutboxDispatcher:
+    container = Container()
+    container.scoped(OutboxDispatchUseCase, lambda _: use_case)
+    return OutboxDispatcher(
+        container,
+        batch_size=BATCH_SIZE,
+        poll_interval=poll_interval,
+    )
+
+
+def test_full_batches_are_drained_without_waiting() -> None:
+    idle = threading.Event()
+    use_case = MagicMock()
+
+    def dispatch_batch(_limit: int) -> int:
+        if use_case.dispatch_batch.call_count > 3:  # noqa: PLR2004
+            idle.set()
+            return 0
+        return BATCH_SIZE
+
+    use_case.dispatch_batch.side_effect = dispatch_batch
+    # Would time out if it slept between the full batches
+    dispatcher = make_dispatcher(use_case, poll_interval=60)
+
+    dispatcher.start()
+    assert idle.wait(timeout=5)
+    dispatcher.stop(timeout=5)
+
+    assert use_case.dispatch_batch.call_count == 4  # noqa: PLR2004
+    use_case.dispatch_batch.assert_called_with(BATCH_SIZE)
+
+
+def test_errors_do_not_stop_the_dispatcher() -> None:
+    retried = threading.Event()
+    use_case = MagicMock()
+
+    def dispatch_batch(_limit: int) -> int:
+        if use_case.dispatch_batch.call_count == 1:
+            msg = "database is down"
+            raise RuntimeError(msg)
+        retried.set()
+        return 0
+
+    use_case.dispatch_batch.side_effect = dispatch_batch
+    dispatcher = make_dispatcher(use_case, poll_interval=0.01)
+
+    dispatcher.start()
+    assert retried.wait(timeout=5)
+    dispatcher.stop(timeout=5)
+
+
+def test_stop_interrupts_the_poll_wait() -> None:
+    polled = threading.Event()
+    use_case = MagicMock()
+
+    def dispatch_batch(_limit: int) -> int:
+        polled.set()
+        return 0
+
+    use_case.dispatch_batch.side_effect = dispatch_batch
+    dispatcher = make_dispatcher(use_case, poll_interval=60)
+
+    dispatcher.start()
+    assert polled.wait(timeout=5)
+    dispatcher.stop(timeout=5)
+
+    assert dispatcher._thread is None
+    use_case.dispatch_batch.assert_called_once_with(BATCH_SIZE)
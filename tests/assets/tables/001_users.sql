@@ -1,4 +1,4 @@
 INSERT INTO users (id, username, email, hashed_password, role, created_at, updated_at) VALUES
-('01K4KNRC1B66FPMG6YSCBMJDK4', 'admin', 'admin@example.com', 'hashed_pwd_admin', 'ADMIN', NOW(), NOW()),
-('01K4KNRF2EBK6DF0171YXPPQ8B', 'super', 'super@example.com', 'hashed_pwd_super', 'SUPERADMIN', NOW(), NOW()),
-('01K4KNRJKABX0FS4Q3RJEQ5RX5', 'anon', 'anon@example.com', 'hashed_pwd_anon', 'ANONYMOUS', NOW(), NOW());
+('0199275c-302b-319f-6a40-decb17493664', 'admin', 'admin@example.com', 'hashed_pwd_admin', 'ADMIN', NOW(), NOW()), -- 01K4KNRC1B66FPMG6YSCBMJDK4
+('0199275c-3c4e-5ccc-d780-270fbb6b5d0b', 'super', 'super@example.com', 'hashed_pwd_super', 'SUPERADMIN', NOW(), NOW()), -- 01K4KNRF2EBK6DF0171YXPPQ8B
+('0199275c-4a6a-5f40-fc92-e3c49d72e3a5', 'anon', 'anon@example.com', 'hashed_pwd_anon', 'ANONYMOUS', NOW(), NOW()); -- 01K4KNRJKABX0FS4Q3RJEQ5RX5
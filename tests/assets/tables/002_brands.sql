@@ -1,3 +1,3 @@
 INSERT INTO brands (id, name, description, logo_url, created_at, updated_at) VALUES
-('01K4KNPTYEBNMX5DP8W0BMTS6C', 'Nike', 'Sportswear brand', 'http://logo.com/nike.png', NOW(), NOW()),
-('01K4KNQ7FG9YCRZ3HPF7HRSPWG', 'Adidas', 'Another sports brand', 'http://logo.com/adidas.png', NOW(), NOW());
+('0199275b-6bce-5d69-d2b6-c8e0174d64cc', 'Nike', 'Sportswear brand', 'http://logo.com/nike.png', NOW(), NOW()), -- 01K4KNPTYEBNMX5DP8W0BMTS6C
+('0199275b-9df0-4f99-8f8e-3679e38cdb90', 'Adidas', 'Another sports brand', 'http://logo.com/adidas.png', NOW(), NOW()); -- 01K4KNQ7FG9YCRZ3HPF7HRSPWG
@@ -1,3 +1,3 @@
 INSERT INTO products (id, sku, name, price, brand_id, created_at, updated_at) VALUES
-('01K4KNQGXMW5KK788YBHJ2D28V', 'SKU-NIKE-001', 'Nike Air Max', 129.99, '01K4KNPTYEBNMX5DP8W0BMTS6C', NOW(), NOW()),
-('01K4KNQSQACSWVRGN2NFAWGMT6', 'SKU-ADIDAS-001', 'Adidas Ultraboost', 149.99, '01K4KNQ7FG9YCRZ3HPF7HRSPWG', NOW(), NOW());
+('0199275b-c3b4-e167-33a1-1e5c6426891b', 'SKU-NIKE-001', 'Nike Air Max', 129.99, '0199275b-6bce-5d69-d2b6-c8e0174d64cc', NOW(), NOW()), -- 01K4KNQGXMW5KK788YBHJ2D28V
+('0199275b-e6ea-6679-bc42-a2abd5c85346', 'SKU-ADIDAS-001', 'Adidas Ultraboost', 149.99, '0199275b-9df0-4f99-8f8e-3679e38cdb90', NOW(), NOW()); -- 01K4KNQSQACSWVRGN2NFAWGMT6
@@ -1,3 +1,3 @@
 INSERT INTO product_views (id, product_id, view_count, created_at, updated_at) VALUES
-('01K4KNR0TNBG17YT9D6MWK4038', '01K4KNQGXMW5KK788YBHJ2D28V', 10, NOW(), NOW()),
-('01K4KNR3RC7GJMFCJD2PB7PBB7', '01K4KNQSQACSWVRGN2NFAWGMT6', 5, NOW(), NOW());
+('0199275c-0355-5c02-7f69-2d3539320068', '0199275b-c3b4-e167-33a1-1e5c6426891b', 10, NOW(), NOW()), -- 01K4KNR0TNBG17YT9D6MWK4038
+('0199275c-0f0c-3c25-47b2-4d15967b2d67', '0199275b-e6ea-6679-bc42-a2abd5c85346', 5, NOW(), NOW()); -- 01K4KNR3RC7GJMFCJD2PB7PBB7
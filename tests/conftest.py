@@ -14,16 +14,21 @@ from jose import jwt
 from psycopg2 import sql
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.future import select
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.session import Session
 from sqlalchemy.pool import NullPool
 from sqlalchemy.sql.functions import func
 
+import app.infrastructure.db.async_session as async_session_mod
 import app.infrastructure.db.database_repository as repo_mod
 import app.infrastructure.db.session as db_session_mod
 from app.core.configurations import settings
 from app.domain.repositories.brand_repository import BrandRepository
+from app.domain.repositories.product_import_job_repository import (
+    ProductImportJobRepository,
+)
 from app.domain.repositories.product_repository import ProductRepository
 from app.domain.repositories.product_view_repository import ProductViewRepository
 from app.domain.repositories.user_repository import UserRepository
@@ -36,26 +41,38 @@ from app.domain.use_cases.products.view_report.product_view_report_use_case impo
 )
 from app.domain.use_cases.users.create.user_create_use_case import UserCreateUseCase
 from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.db.routing_session import RoutingSession
 from app.infrastructure.db.session import Base
 from app.infrastructure.persistence.postgres_brand_repository import (
     PostgresBrandRepository,
 )
+from app.infrastructure.persistence.postgres_product_import_job_repository import (
+    PostgresProductImportJobRepository,
+)
 from app.infrastructure.persistence.postgres_product_repository import (
     PostgresProductRepository,
 )
 from app.infrastructure.persistence.postgres_product_view_repository import (
     PostgresProductViewRepository,
 )
+from app.infrastructure.persistence.postgres_unit_of_work import PostgresUnitOfWork
 from app.infrastructure.persistence.postgres_user_repository import (
     PostgresUserRepository,
 )
 from app.main import app
 
+pytest_plugins = ["tests.query_budget"]
+
 # Default env for test
 os.environ.setdefault("SECRET_KEY", "supersecretkey12345")
 os.environ.setdefault("ALGORITHM", "HS256")
 os.environ.setdefault("TEST_DEBUG", "true")
 
+# Any request leaving a database connection checked out fails its test
+settings.RAISE_ON_DB_SESSION_LEAK = True
+# Every test client comes from the same address; the rate limit tests enable it
+settings.RATE_LIMIT_ENABLED = False
+
 logging.basicConfig(level=logging.DEBUG, format="%(levelname)s: %(message)s")
 logger = logging.getLogger("tests.conftest")
 
@@ -164,13 +181,28 @@ def recreate_db_and_load_fixtures(
         db_session_mod.engine.dispose()
 
     new_engine = create_engine(test_database_url, future=True, poolclass=NullPool)
-    new_session_local = sessionmaker(bind=new_engine, autoflush=False, autocommit=False)
+    new_session_local = sessionmaker(
+        class_=RoutingSession,
+        bind=new_engine,
+        autoflush=False,
+        autocommit=False,
+    )
 
     db_session_mod.engine = new_engine
     db_session_mod.SessionLocal = new_session_local
 
     importlib.reload(repo_mod)
 
+    # asyncpg connections belong to the event loop that opened them, and the
+    # TestClient runs every request on a new loop: no pooling either
+    async_session_mod.set_async_engine(
+        create_async_engine(
+            async_session_mod.async_database_url(test_database_url),
+            poolclass=NullPool,
+        ),
+    )
+    async_session_mod.set_async_read_engines([])
+
     return test_database_url
 
 
@@ -235,6 +267,20 @@ def test_token() -> str:
     )
 
 
+@pytest.fixture
+def test_superadmin_token() -> str:
+    payload = {
+        "sub": "01K4H2DVXW24B09C20NZWMB50T",
+        "role": "SUPERADMIN",
+        "exp": datetime.now(UTC) + timedelta(minutes=60),
+    }
+    return jwt.encode(
+        payload,
+        os.environ.get("SECRET_KEY", "supersecretkey12345"),
+        algorithm=os.environ.get("ALGORITHM", "HS256"),
+    )
+
+
 @pytest.fixture
 def container_test(db_session: Session) -> Generator[dict[type, object], None, None]:
     test_db_repo = DatabaseRepository()
@@ -244,18 +290,23 @@ def container_test(db_session: Session) -> Generator[dict[type, object], None, N
     brand_repo = PostgresBrandRepository(database_repository=test_db_repo)
     product_repo = PostgresProductRepository(database_repository=test_db_repo)
     view_repo = PostgresProductViewRepository(database_repository=test_db_repo)
+    import_job_repo = PostgresProductImportJobRepository(
+        database_repository=test_db_repo,
+    )
 
     container = {}
     container[UserRepository] = user_repo
     container[BrandRepository] = brand_repo
     container[ProductRepository] = product_repo
     container[ProductViewRepository] = view_repo
+    container[ProductImportJobRepository] = import_job_repo
 
     container[UserCreateUseCase] = UserCreateUseCase(user_repository=user_repo)
     container[BrandCreateUseCase] = BrandCreateUseCase(brand_repository=brand_repo)
     container[ProductCreateUseCase] = ProductCreateUseCase(
         product_repository=product_repo,
         brand_repository=brand_repo,
+        unit_of_work=PostgresUnitOfWork(database_repository=test_db_repo),
     )
     container[ProductViewReportUseCase] = ProductViewReportUseCase(
         product_repository=product_repo,
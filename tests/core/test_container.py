@@ -1,6 +1,14 @@
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from app.core.container import Container, DependencyNotRegisteredError
+from app.core.container import (
+    Container,
+    DependencyLifetimeError,
+    DependencyNotRegisteredError,
+)
 
 
 def test_register_and_resolve():
@@ -41,3 +49,113 @@ def test_builder_receives_container():
     result = container.resolve("service")
 
     assert result == "service_with_container"
+
+
+def test_transient_is_built_on_every_resolve():
+    container = Container()
+
+    container.register("service", lambda _: object())
+
+    assert container.resolve("service") is not container.resolve("service")
+
+
+def test_singleton_is_built_once():
+    container = Container()
+    built = []
+
+    container.singleton("service", lambda _: built.append(object()) or built[-1])
+
+    assert container.resolve("service") is container.resolve("service")
+    with container.scope():
+        assert container.resolve("service") is built[0]
+    assert len(built) == 1
+
+
+def test_singleton_is_built_once_across_threads():
+    container = Container()
+    built = []
+
+    def builder(_: Container) -> object:
+        time.sleep(0.01)
+        built.append(object())
+        return built[-1]
+
+    container.singleton("service", builder)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        instances = set(pool.map(lambda _: id(container["service"]), range(8)))
+
+    assert len(built) == 1
+    assert instances == {id(built[0])}
+
+
+def test_scoped_is_built_once_per_scope_and_disposed_at_its_end():
+    container = Container()
+    disposed = []
+    container.scoped("session", lambda _: object(), dispose=disposed.append)
+
+    with container.scope():
+        first = container.resolve("session")
+        assert container.resolve("session") is first
+        assert disposed == []
+    with container.scope():
+        second = container.resolve("session")
+
+    assert first is not second
+    assert disposed == [first, second]
+
+
+def test_scoped_dependencies_are_disposed_in_reverse_order():
+    container = Container()
+    disposed = []
+    container.scoped("repository", lambda _: "repository", dispose=disposed.append)
+    container.scoped(
+        "use_case",
+        lambda c: f"use_case({c['repository']})",
+        dispose=disposed.append,
+    )
+
+    with container.scope():
+        container.resolve("use_case")
+
+    assert disposed == ["use_case(repository)", "repository"]
+
+
+def test_scoped_outside_a_scope_behaves_as_transient():
+    container = Container()
+
+    container.scoped("session", lambda _: object())
+
+    assert container.resolve("session") is not container.resolve("session")
+
+
+def test_scope_is_shared_with_threadpool_workers():
+    container = Container()
+    container.scoped("session", lambda _: object())
+
+    with container.scope(), ThreadPoolExecutor(max_workers=2) as pool:
+        context = contextvars.copy_context()
+        in_worker = pool.submit(context.run, container.resolve, "session").result()
+        assert in_worker is container.resolve("session")
+
+
+def test_singleton_can_not_depend_on_scoped():
+    container = Container()
+    container.scoped("session", lambda _: object())
+    container.singleton("service", lambda c: ("service", c["session"]))
+
+    with container.scope(), pytest.raises(DependencyLifetimeError) as exc_info:
+        container.resolve("service")
+
+    assert "Singleton service can not depend on scoped session" in str(exc_info.value)
+
+
+def test_close_disposes_singletons():
+    container = Container()
+    disposed = []
+    container.singleton("client", lambda _: object(), dispose=disposed.append)
+    client = container.resolve("client")
+
+    container.close()
+
+    assert disposed == [client]
+    assert container.resolve("client") is not client
@@ -0,0 +1,93 @@
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from app.core import security
+from app.core.configurations import settings
+from app.core.security import JWTBearer, VerifiedTokenCache
+
+MAX_SIZE = 2
+
+
+def _token(subject: str, expires_in: timedelta = timedelta(minutes=5)) -> str:
+    return jwt.encode(
+        {"sub": subject, "role": "ADMIN", "exp": datetime.now(UTC) + expires_in},
+        settings.SECRET_KEY,
+        algorithm=settings.ALGORITHM,
+    )
+
+
+def _credentials(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.fixture
+def decodes(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls = []
+    decode = jwt.decode
+
+    def counting_decode(token: str, *args: object, **kwargs: object) -> dict:
+        calls.append(token)
+        return decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(security.jwt, "decode", counting_decode)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_verified_tokens_are_decoded_once(decodes: list[str]) -> None:
+    bearer = JWTBearer(cache=VerifiedTokenCache(MAX_SIZE))
+    token = _token("user")
+
+    first = await bearer(_credentials(token))
+    second = await bearer(_credentials(token))
+
+    assert first == second
+    assert first["sub"] == "user"
+    assert decodes == [token]
+
+
+@pytest.mark.asyncio
+async def test_invalid_tokens_are_not_cached(decodes: list[str]) -> None:
+    bearer = JWTBearer(cache=VerifiedTokenCache(MAX_SIZE))
+    token = _token("user") + "tampered"
+
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            await bearer(_credentials(token))
+
+    assert decodes == [token, token]
+
+
+def test_claims_expire_with_the_token() -> None:
+    cache = VerifiedTokenCache(MAX_SIZE)
+    cache.put("token", {"sub": "user", "exp": time.time() - 1})
+
+    assert cache.get("token") is None
+
+
+def test_least_recently_used_tokens_are_evicted() -> None:
+    cache = VerifiedTokenCache(MAX_SIZE)
+    expires_at = time.time() + 60
+    cache.put("first", {"sub": "first", "exp": expires_at})
+    cache.put("second", {"sub": "second", "exp": expires_at})
+    cache.get("first")
+
+    cache.put("third", {"sub": "third", "exp": expires_at})
+
+    assert cache.get("second") is None
+    assert cache.get("first")["sub"] == "first"
+    assert cache.get("third")["sub"] == "third"
+
+
+def test_cached_claims_are_copies() -> None:
+    cache = VerifiedTokenCache(MAX_SIZE)
+    cache.put("token", {"sub": "user", "exp": time.time() + 60})
+
+    cache.get("token")["role"] = "SUPERADMIN"
+
+    assert "role" not in cache.get("token")
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+
+import pytest
+from anyio import to_thread
+
+from app.core.security_utils import (
+    PasswordHasher,
+    PasswordHashingBusyError,
+    hash_password,
+    verify_password,
+)
+
+
+class BlockingContext:
+    """Stands in for the CryptContext, holding every call until released."""
+
+    def __init__(self) -> None:
+        self.started = threading.Semaphore(0)
+        self.release = threading.Event()
+
+    def hash(self, password: str) -> str:
+        self.started.release()
+        self.release.wait()
+        return f"hashed-{password}"
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self.hash(password) == hashed_password
+
+
+@pytest.mark.asyncio
+async def test_hash_password_is_verified() -> None:
+    hashed = await hash_password("SuperSecure123!")
+
+    assert hashed.startswith("$2b$")
+    assert await verify_password("SuperSecure123!", hashed)
+    assert not await verify_password("wrong", hashed)
+
+
+@pytest.mark.asyncio
+async def test_calls_over_the_queue_limit_fail_fast() -> None:
+    context = BlockingContext()
+    hasher = PasswordHasher(max_workers=1, queue_limit=0, context=context)
+
+    running = asyncio.ensure_future(hasher.hash("first"))
+    await asyncio.to_thread(context.started.acquire)
+
+    with pytest.raises(PasswordHashingBusyError):
+        await hasher.verify("second", "hashed-second")
+
+    context.release.set()
+    assert await running == "hashed-first"
+
+    # The slot is given back
+    assert await hasher.verify("second", "hashed-second")
+    hasher.close()
+
+
+@pytest.mark.asyncio
+async def test_queued_calls_wait_for_a_worker() -> None:
+    context = BlockingContext()
+    hasher = PasswordHasher(max_workers=1, queue_limit=1, context=context)
+
+    first = asyncio.ensure_future(hasher.hash("first"))
+    await asyncio.to_thread(context.started.acquire)
+    second = asyncio.ensure_future(hasher.hash("second"))
+    context.release.set()
+
+    assert await first == "hashed-first"
+    assert await second == "hashed-second"
+    hasher.close()
+
+
+@pytest.mark.asyncio
+async def test_waiting_callers_hold_no_threadpool_thread() -> None:
+    context = BlockingContext()
+    hasher = PasswordHasher(max_workers=1, queue_limit=8, context=context)
+
+    calls = [asyncio.ensure_future(hasher.hash(f"user-{n}")) for n in range(8)]
+    try:
+        await asyncio.to_thread(context.started.acquire)
+
+        assert to_thread.current_default_thread_limiter().borrowed_tokens == 0
+    finally:
+        context.release.set()
+    assert await asyncio.gather(*calls) == [f"hashed-user-{n}" for n in range(8)]
+    hasher.close()
@@ -0,0 +1,26 @@
+import pytest
+
+from app.domain.helpers.backoff import backoff_delay
+
+
+@pytest.mark.parametrize(
+    ("attempt", "expected"),
+    [(1, 2.0), (2, 4.0), (3, 8.0), (4, 16.0), (10, 60.0)],
+)
+def test_ceiling_doubles_up_to_the_maximum(attempt: int, expected: float) -> None:
+    delay = backoff_delay(attempt, base_seconds=2, max_seconds=60, rand=lambda: 1.0)
+
+    assert delay == expected
+
+
+def test_delay_is_jittered_below_the_ceiling() -> None:
+    delay = backoff_delay(3, base_seconds=2, max_seconds=60, rand=lambda: 0.25)
+
+    assert delay == 2.0  # noqa: PLR2004
+
+
+def test_default_jitter_stays_within_the_ceiling() -> None:
+    delays = {backoff_delay(4, base_seconds=1, max_seconds=60) for _ in range(50)}
+
+    assert all(0 <= delay <= 8 for delay in delays)  # noqa: PLR2004
+    assert len(delays) > 1
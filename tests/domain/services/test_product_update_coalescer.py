@@ -0,0 +1,69 @@
+from app.domain.services.product_update_coalescer import coalesce_product_updates
+from app.domain.services.product_update_event import ProductUpdateEvent
+
+
+def event(product_id: str, **changes: tuple[str, str]) -> ProductUpdateEvent:
+    return ProductUpdateEvent(
+        product_id=product_id,
+        changes={
+            field: {"old": old, "new": new} for field, (old, new) in changes.items()
+        },
+    )
+
+
+def test_keeps_the_first_old_and_the_last_new_value() -> None:
+    coalesced = coalesce_product_updates(
+        [
+            event("p1", price=("1", "2")),
+            event("p1", price=("2", "3"), name=("A", "B")),
+            event("p1", price=("3", "4")),
+        ],
+    )
+
+    assert coalesced == [event("p1", price=("1", "4"), name=("A", "B"))]
+
+
+def test_products_keep_the_order_of_their_first_update() -> None:
+    coalesced = coalesce_product_updates(
+        [
+            event("p2", price=("1", "2")),
+            event("p1", price=("1", "2")),
+            event("p2", sku=("S1", "S2")),
+        ],
+    )
+
+    assert [product.product_id for product in coalesced] == ["p2", "p1"]
+    assert coalesced[0] == event("p2", price=("1", "2"), sku=("S1", "S2"))
+
+
+def test_reverted_fields_and_products_are_dropped() -> None:
+    coalesced = coalesce_product_updates(
+        [
+            event("p1", price=("1", "2"), name=("A", "B")),
+            event("p1", price=("2", "1")),
+            event("p2", name=("X", "Y")),
+            event("p2", name=("Y", "X")),
+        ],
+    )
+
+    assert coalesced == [event("p1", name=("A", "B"))]
+
+
+def test_input_events_are_not_modified() -> None:
+    first = event("p1", price=("1", "2"))
+
+    coalesce_product_updates([first, event("p1", price=("2", "3"))])
+
+    assert first == event("p1", price=("1", "2"))
+
+
+def test_prices_written_differently_are_compared_as_numbers() -> None:
+    coalesced = coalesce_product_updates(
+        [
+            event("p1", price=("100.00", "120")),
+            event("p1", price=("120", "100")),
+            event("p2", price=("5.0", "5.50")),
+        ],
+    )
+
+    assert coalesced == [event("p2", price=("5.0", "5.50"))]
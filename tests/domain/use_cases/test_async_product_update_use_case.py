@@ -0,0 +1,109 @@
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.domain.enums.code_enum import ErrorCodeEnum
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
+from app.domain.exceptions.data_validation_exception import DataValidationError
+from app.domain.models.product import Product
+from app.domain.use_cases.products.edit.async_product_update_use_case import (
+    AsyncProductUpdateUseCase,
+)
+from app.domain.use_cases.products.edit.product_update_input import ProductUpdateInput
+
+
+@pytest.fixture
+def mock_product_repository() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_brand_repository() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_outbox_repository() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def use_case(
+    mock_product_repository: AsyncMock,
+    mock_brand_repository: AsyncMock,
+    mock_outbox_repository: AsyncMock,
+) -> AsyncProductUpdateUseCase:
+    return AsyncProductUpdateUseCase(
+        product_repository=mock_product_repository,
+        brand_repository=mock_brand_repository,
+        outbox_repository=mock_outbox_repository,
+        unit_of_work=AsyncMock(),
+    )
+
+
+existing_product = Product(
+    id="p1",
+    sku="SKU1",
+    name="Product 1",
+    price=Decimal("10.0"),
+    brand_id="01K4KNQ7FG9YCRZ3HPF7HRSPWG",
+)
+
+
+@pytest.mark.asyncio
+class TestAsyncProductUpdateUseCase:
+
+    async def test_update_product_records_changes_in_outbox(
+        self,
+        use_case: AsyncProductUpdateUseCase,
+        mock_product_repository: AsyncMock,
+        mock_brand_repository: AsyncMock,
+        mock_outbox_repository: AsyncMock,
+    ) -> None:
+        update_input = ProductUpdateInput(
+            sku="SKU1",
+            name="Product 1",
+            price=Decimal("12.0"),
+            brand_id="01K4KNQ7FG9YCRZ3HPF7HRSPWG",
+        )
+        updated_product = existing_product.model_copy(update={"price": Decimal("12.0")})
+        mock_brand_repository.exists_by_id.return_value = True
+        mock_product_repository.find_by_sku.return_value = existing_product
+        mock_product_repository.find_by_id.return_value = existing_product
+        mock_product_repository.update.return_value = updated_product
+
+        result = await use_case.update_product("p1", update_input)
+
+        assert result == updated_product
+        mock_outbox_repository.add.assert_awaited_once_with(
+            OutboxEventType.PRODUCT_UPDATED,
+            {
+                "product_id": "p1",
+                "changes": {"price": {"old": "10.0", "new": "12.0"}},
+            },
+        )
+
+    async def test_update_product_with_unknown_brand_raises_error(
+        self,
+        use_case: AsyncProductUpdateUseCase,
+        mock_brand_repository: AsyncMock,
+        mock_product_repository: AsyncMock,
+        mock_outbox_repository: AsyncMock,
+    ) -> None:
+        mock_brand_repository.exists_by_id.return_value = False
+
+        with pytest.raises(DataValidationError) as exc_info:
+            await use_case.update_product(
+                "p1",
+                ProductUpdateInput(
+                    sku="SKU1",
+                    name="Product 1",
+                    price=Decimal("10.0"),
+                    brand_id="ANY",
+                ),
+            )
+
+        assert exc_info.value.code == ErrorCodeEnum.BRAND_NOT_FOUND
+        mock_product_repository.update.assert_not_called()
+        mock_outbox_repository.add.assert_not_called()
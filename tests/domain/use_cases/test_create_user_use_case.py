@@ -8,7 +8,8 @@ from app.domain.use_cases.users.create.user_create_use_case import UserCreateUse
 
 class TestUserCreateUseCase:
 
-    def test_create_successfully_user(
+    @pytest.mark.asyncio
+    async def test_create_successfully_user(
         self,
         container_test: dict,
     ) -> None:
@@ -19,7 +20,7 @@ class TestUserCreateUseCase:
         )
 
         use_case: UserCreateUseCase = container_test[UserCreateUseCase]
-        user = use_case.create_user(input_data)
+        user = await use_case.create_user(input_data)
 
         assert user.id is not None
         assert user.username == "::username::"
@@ -41,7 +42,8 @@ class TestUserCreateUseCase:
                 ("unique_user", "email@gmail.com", "SuperSecure123!", "already exists"),
             ],
         )
-        def test_user_create_duplicate_username_or_email(
+        @pytest.mark.asyncio
+        async def test_user_create_duplicate_username_or_email(
             self,
             container_test: dict,
             username: str,
@@ -57,7 +59,7 @@ class TestUserCreateUseCase:
                 password="SuperSecure123!",
             )
             try:
-                use_case.create_user(initial_user)
+                await use_case.create_user(initial_user)
             except DataValidationError:
                 pass  # Ignoramos si ya existía, nos interesa el segundo test
 
@@ -68,13 +70,14 @@ class TestUserCreateUseCase:
             )
 
             with pytest.raises(DataValidationError) as exc_info:
-                use_case.create_user(input_data)
+                await use_case.create_user(input_data)
 
             err = exc_info.value
             assert err.code == ErrorCodeEnum.ALREADY_EXIST_USER
             assert expected_error_msg in err.message
 
-        def test_create_user_password_is_hashed(
+        @pytest.mark.asyncio
+        async def test_create_user_password_is_hashed(
             self,
             container_test: dict,
         ):
@@ -85,7 +88,7 @@ class TestUserCreateUseCase:
                 email="testuser@gmail.com",
                 password="PlainPassword123",
             )
-            user = use_case.create_user(input_data)
+            user = await use_case.create_user(input_data)
 
             assert user.hashed_password != input_data.password
             assert user.hashed_password is not None
@@ -0,0 +1,36 @@
+from datetime import UTC, datetime, timedelta
+
+from jose import jwt
+
+from app.core.configurations import settings
+from app.domain.use_cases.users.guest_token.guest_token_use_case import (
+    GuestTokenUseCase,
+)
+
+
+class TestGuestTokenUseCase:
+
+    def test_issue_signs_a_short_lived_anonymous_guest_token(self) -> None:
+        token = GuestTokenUseCase().issue()
+
+        claims = jwt.decode(
+            token,
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM],
+        )
+        assert claims["role"] == "ANONYMOUS"
+        assert claims["guest"] is True
+        assert claims["sub"].startswith("guest-")
+        expires_at = datetime.fromtimestamp(claims["exp"], UTC)
+        assert expires_at <= datetime.now(UTC) + timedelta(
+            minutes=settings.GUEST_TOKEN_EXPIRE_MINUTES,
+        )
+
+    def test_every_guest_gets_its_own_subject(self) -> None:
+        use_case = GuestTokenUseCase()
+
+        subjects = {
+            jwt.get_unverified_claims(use_case.issue())["sub"] for _ in range(2)
+        }
+
+        assert len(subjects) == 2  # noqa: PLR2004
@@ -0,0 +1,325 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.configurations import settings
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
+from app.domain.exceptions.notification_delivery_exception import (
+    NotificationDeliveryError,
+)
+from app.domain.helpers.datetime_generator import get_now_datetime
+from app.domain.models.outbox_message import OutboxMessage
+from app.domain.services.product_batch_update_event import ProductBatchUpdateEvent
+from app.domain.services.product_update_event import ProductUpdateEvent
+from app.domain.use_cases.notifications.dispatch.outbox_dispatch_use_case import (
+    OutboxDispatchUseCase,
+)
+
+BATCH_SIZE = 10
+WINDOW_SECONDS = 30
+MAX_ATTEMPTS = 3
+RETRY_BASE_SECONDS = 2
+
+
+@pytest.fixture(autouse=True)
+def outbox_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        settings,
+        "NOTIFICATION_COALESCE_WINDOW_SECONDS",
+        WINDOW_SECONDS,
+    )
+    monkeypatch.setattr(settings, "OUTBOX_MAX_ATTEMPTS", MAX_ATTEMPTS)
+    monkeypatch.setattr(settings, "OUTBOX_RETRY_BASE_SECONDS", RETRY_BASE_SECONDS)
+
+
+@pytest.fixture
+def mock_outbox_repository() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_notification_service() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def use_case(
+    mock_outbox_repository: MagicMock,
+    mock_notification_service: MagicMock,
+) -> OutboxDispatchUseCase:
+    return OutboxDispatchUseCase(
+        outbox_repository=mock_outbox_repository,
+        notification_service=mock_notification_service,
+        unit_of_work=MagicMock(),
+    )
+
+
+def make_message(
+    message_id: str,
+    product_id: str,
+    old_price: str,
+    new_price: str,
+    age_seconds: int = WINDOW_SECONDS,
+    attempts: int = 0,
+) -> OutboxMessage:
+    return OutboxMessage(
+        id=message_id,
+        event_type=OutboxEventType.PRODUCT_UPDATED,
+        payload={
+            "product_id": product_id,
+            "changes": {"price": {"old": old_price, "new": new_price}},
+        },
+        created_at=get_now_datetime() - timedelta(seconds=age_seconds),
+        attempts=attempts,
+    )
+
+
+def test_dispatch_batch_sends_one_digest_with_changes_merged_per_product(
+    use_case: OutboxDispatchUseCase,
+    mock_outbox_repository: MagicMock,
+    mock_notification_service: MagicMock,
+) -> None:
+    mock_outbox_repository.claim_batch.return_value = [
+        make_message("m1", "p1", "1.00", "2.00"),
+        make_message("m2", "p2", "5.00", "6.00"),
+        make_message("m3", "p1", "2.00", "3.00", age_seconds=0),
+    ]
+
+    delivered = use_case.dispatch_batch(BATCH_SIZE)
+
+    assert delivered == 3  # noqa: PLR2004
+    mock_outbox_repository.claim_batch.assert_called_once_with(BATCH_SIZE)
+    mock_notification_service.notify.assert_not_called()
+    digest: ProductBatchUpdateEvent = (
+        mock_notification_service.notify_batch.call_args.kwargs["event"]
+    )
+    assert digest.events == [
+        ProductUpdateEvent(
+            product_id="p1",
+            changes={"price": {"old": "1.00", "new": "3.00"}},
+        ),
+        ProductUpdateEvent(
+            product_id="p2",
+            changes={"price": {"old": "5.00", "new": "6.00"}},
+        ),
+    ]
+    mock_outbox_repository.delete.assert_called_once_with(["m1", "m2", "m3"])
+
+
+def test_dispatch_batch_sends_a_single_product_as_a_plain_notification(
+    use_case: OutboxDispatchUseCase,
+    mock_outbox_repository: MagicMock,
+    mock_notification_service: MagicMock,
+) -> None:
+    mock_outbox_repository.claim_batch.return_value = [
+        make_message("m1", "p1", "1.00", "2.00"),
+    ]
+
+    assert use_case.dispatch_batch(BATCH_SIZE) == 1
+
+    event: ProductUpdateEvent = mock_notification_service.notify.call_args.kwargs[
+        "event"
+    ]
+    assert event.product_id == "p1"
+    mock_notification_service.notify_batch.assert_not_called()
+
+
+def test_dispatch_batch_waits_for_the_window_of_the_oldest_message(
+    use_case: OutboxDispatchUseCase,
+    mock_outbox_repository: MagicMock,
+    mock_notification_service: MagicMock,
+) -> None:
+    mock_outbox_repository.claim_batch.return_value = [
+        make_message("m1", "p1", "1.00", "2.00", age_seconds=WINDOW_SECONDS - 5),
+    ]
+
+    assert use_case.dispatch_batch(BATCH_SIZE) == 0
+
+    mock_notification_service.notify.assert_not_called()
+    mock_outbox_repository.delete.assert_not_called()
+
+
+def test_dispatch_batch_drops_updates_that_were_reverted(
+    use_case: OutboxDispatchUseCase,
+    mock_outbox_repository: MagicMock,
+    mock_notification_service: MagicMock,
+) -> None:
+    mock_outbox_repository.claim_batch.return_value = [
+        make_message("m1", "p1", "1.00", "2.00"),
+        make_message("m2", "p1", "2.00", "1.00"),
+    ]
+
+    assert use_case.dispatch_batch(BATCH_SIZE) == 2  # noqa: PLR2004
+
+    mock_notification_service.notify.assert_not_called()
+    mock_notification_service.notify_batch.assert_not_called()
+    mock_outbox_repository.delete.assert_called_once_with(["m1", "m2"])
+
+
+def test_dispatch_batch_keeps_the_messages_when_sending_fails(
+    use_case: OutboxDispatchUseCase,
+    mock_outbox_repository: MagicMock,
+    mock_notification_service: MagicMock,
+) -> None:
+    mock_outbox_repository.claim_batch.return_value = [
+        make_message("m1", "p1", "1.00", "2.00"),
+    ]
+    mock_notification_service.notify.side_effect = RuntimeError("SES")
+
+    assert use_case.dispatch_batch(BATCH_SIZE) == 0
+
+    mock_outbox_repository.delete.assert_not_called()
+    assert mock_outbox_repository.schedule_retry.call_args.args[0] == ["m1"]
+
+
+def test_dispatch_batch_with_empty_outbox(
+    use_case: OutboxDispatchUseCase,
+    mock_outbox_repository: MagicMock,
+    mock_notification_service: MagicMock,
+) -> None:
+    mock_outbox_repository.claim_batch.return_value = []
+
+    assert use_case.dispatch_batch(BATCH_SIZE) == 0
+    mock_notification_service.notify.assert_not_called()
+
+
+def test_dispatch_batch_retries_later_after_a_transient_failure(
+    use_case: OutboxDispatchUseCase,
+    mock_outbox_repository: MagicMock,
+    mock_notification_service: MagicMock,
+) -> None:
+    mock_outbox_repository.claim_batch.return_value = [
+        make_message("m1", "p1", "1.00", "2.00", attempts=1),
+        make_message("m2", "p2", "1.00", "2.00"),
+    ]
+    mock_notification_service.notify_batch.side_effect = NotificationDeliveryError(
+        message="SES Throttling: Maximum sending rate exceeded.",
+        retryable=True,
+    )
+    before = get_now_datetime()
+
+    assert use_case.dispatch_batch(BATCH_SIZE) == 0
+
+    message_ids, retry_at, error = mock_outbox_repository.schedule_retry.call_args.args
+    assert message_ids == ["m1", "m2"]
+    # Second attempt of the oldest: up to twice the base delay
+    assert (
+        before
+        <= retry_at
+        <= get_now_datetime()
+        + timedelta(
+            seconds=2 * RETRY_BASE_SECONDS,
+        )
+    )
+    assert error == "SES Throttling: Maximum sending rate exceeded."
+    mock_outbox_repository.move_to_dead_letters.assert_not_called()
+    mock_outbox_repository.delete.assert_not_called()
+
+
+def test_dispatch_batch_dead_letters_messages_out_of_attempts(
+    use_case: OutboxDispatchUseCase,
+    mock_outbox_repository: MagicMock,
+    mock_notification_service: MagicMock,
+) -> None:
+    mock_outbox_repository.claim_batch.return_value = [
+        make_message("m1", "p1", "1.00", "2.00", attempts=MAX_ATTEMPTS - 1),
+        make_message("m2", "p2", "1.00", "2.00"),
+    ]
+    mock_notification_service.notify_batch.side_effect = NotificationDeliveryError(
+        message="SES unreachable",
+        retryable=True,
+    )
+
+    use_case.dispatch_batch(BATCH_SIZE)
+
+    mock_outbox_repository.move_to_dead_letters.assert_called_once_with(
+        ["m1"],
+        "SES unreachable",
+    )
+    assert mock_outbox_repository.schedule_retry.call_args.args[0] == ["m2"]
+
+
+def test_dispatch_batch_dead_letters_permanent_failures(
+    use_case: OutboxDispatchUseCase,
+    mock_outbox_repository: MagicMock,
+    mock_notification_service: MagicMock,
+) -> None:
+    mock_outbox_repository.claim_batch.return_value = [
+        make_message("m1", "p1", "1.00", "2.00"),
+    ]
+    mock_notification_service.notify.side_effect = NotificationDeliveryError(
+        message="SES MessageRejected: Email address is not verified.",
+        retryable=False,
+    )
+
+    assert use_case.dispatch_batch(BATCH_SIZE) == 0
+
+    mock_outbox_repository.move_to_dead_letters.assert_called_once_with(
+        ["m1"],
+        "SES MessageRejected: Email address is not verified.",
+    )
+    mock_outbox_repository.schedule_retry.assert_not_called()
+
+
+def test_dispatch_batch_dead_letters_invalid_payloads_and_sends_the_rest(
+    use_case: OutboxDispatchUseCase,
+    mock_outbox_repository: MagicMock,
+    mock_notification_service: MagicMock,
+) -> None:
+    invalid = make_message("m1", "p1", "1.00", "2.00")
+    invalid.payload = {"changes": "price"}
+    mock_outbox_repository.claim_batch.return_value = [
+        invalid,
+        make_message("m2", "p2", "1.00", "2.00"),
+    ]
+
+    assert use_case.dispatch_batch(BATCH_SIZE) == 1
+
+    message_ids, error = mock_outbox_repository.move_to_dead_letters.call_args.args
+    assert message_ids == ["m1"]
+    assert error.startswith("Invalid payload:")
+    assert mock_notification_service.notify.call_args.kwargs["event"].product_id == (
+        "p2"
+    )
+    mock_outbox_repository.delete.assert_called_once_with(["m2"])
+
+
+def test_dispatch_batch_dead_letters_unknown_event_types(
+    use_case: OutboxDispatchUseCase,
+    mock_outbox_repository: MagicMock,
+    mock_notification_service: MagicMock,
+) -> None:
+    unknown = make_message("m1", "p1", "1.00", "2.00")
+    unknown.event_type = "PRODUCT_DELETED"
+    mock_outbox_repository.claim_batch.return_value = [unknown]
+
+    assert use_case.dispatch_batch(BATCH_SIZE) == 0
+
+    mock_outbox_repository.move_to_dead_letters.assert_called_once_with(
+        ["m1"],
+        "Unknown event type PRODUCT_DELETED",
+    )
+    mock_notification_service.notify.assert_not_called()
+    mock_outbox_repository.delete.assert_not_called()
+
+
+def test_dispatch_batch_retries_unexpected_errors_until_out_of_attempts(
+    use_case: OutboxDispatchUseCase,
+    mock_outbox_repository: MagicMock,
+    mock_notification_service: MagicMock,
+) -> None:
+    mock_outbox_repository.claim_batch.return_value = [
+        make_message("m1", "p1", "1.00", "2.00", attempts=MAX_ATTEMPTS - 1),
+        make_message("m2", "p2", "1.00", "2.00"),
+    ]
+    mock_notification_service.notify_batch.side_effect = KeyError("old")
+
+    assert use_case.dispatch_batch(BATCH_SIZE) == 0
+
+    mock_outbox_repository.move_to_dead_letters.assert_called_once_with(
+        ["m1"],
+        "KeyError: 'old'",
+    )
+    assert mock_outbox_repository.schedule_retry.call_args.args[0] == ["m2"]
+    mock_outbox_repository.delete.assert_not_called()
@@ -0,0 +1,71 @@
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domain.enums.product_change_type_enum import ProductChangeType
+from app.domain.models.product_change import ProductChange, ProductChangeCursor
+from app.domain.use_cases.products.changes.product_changes_use_case import (
+    ProductChangesUseCase,
+)
+
+
+@pytest.fixture
+def mock_product_repository() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def use_case(mock_product_repository: MagicMock) -> ProductChangesUseCase:
+    return ProductChangesUseCase(product_repository=mock_product_repository)
+
+
+def make_change(product_id: str, second: int) -> ProductChange:
+    return ProductChange(
+        change_type=ProductChangeType.DELETE,
+        product_id=product_id,
+        changed_at=datetime(2026, 10, 19, 10, 0, second, tzinfo=UTC),
+        product=None,
+    )
+
+
+def test_list_changes_returns_page_and_next_cursor(
+    use_case: ProductChangesUseCase,
+    mock_product_repository: MagicMock,
+) -> None:
+    mock_product_repository.find_changes.return_value = [
+        make_change("p1", 1),
+        make_change("p2", 2),
+        make_change("p3", 3),
+    ]
+
+    page = use_case.list_changes(since=None, limit=2)
+
+    expected_fetched = 3
+    assert (
+        mock_product_repository.find_changes.call_args.kwargs["limit"]
+        == expected_fetched
+    )
+    assert [change.product_id for change in page.changes] == ["p1", "p2"]
+    assert page.has_more is True
+    assert page.next_cursor == ProductChangeCursor(
+        changed_at=datetime(2026, 10, 19, 10, 0, 2, tzinfo=UTC),
+        product_id="p2",
+    )
+
+
+def test_list_changes_without_changes_keeps_cursor(
+    use_case: ProductChangesUseCase,
+    mock_product_repository: MagicMock,
+) -> None:
+    since = ProductChangeCursor(
+        changed_at=datetime(2026, 10, 19, tzinfo=UTC),
+        product_id="p1",
+    )
+    mock_product_repository.find_changes.return_value = []
+
+    page = use_case.list_changes(since=since, limit=10)
+
+    assert page.changes == []
+    assert page.has_more is False
+    assert page.next_cursor == since
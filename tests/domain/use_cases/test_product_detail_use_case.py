@@ -20,14 +20,21 @@ def mock_view_repository():
     return MagicMock()
 
 
+@pytest.fixture
+def mock_unit_of_work() -> MagicMock:
+    return MagicMock()
+
+
 @pytest.fixture
 def use_case(
     mock_product_repository: MagicMock,
     mock_view_repository: MagicMock,
+    mock_unit_of_work: MagicMock,
 ):
     return ProductDetailUseCase(
         product_repository=mock_product_repository,
         view_repository=mock_view_repository,
+        unit_of_work=mock_unit_of_work,
     )
 
 
@@ -0,0 +1,34 @@
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domain.models.product_export import ProductExportRow
+from app.domain.use_cases.products.export.product_export_use_case import (
+    ProductExportUseCase,
+)
+
+
+@pytest.fixture
+def mock_product_repository() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def use_case(mock_product_repository: MagicMock) -> ProductExportUseCase:
+    return ProductExportUseCase(product_repository=mock_product_repository)
+
+
+def test_export_products_returns_repository_batches(
+    use_case: ProductExportUseCase,
+    mock_product_repository: MagicMock,
+) -> None:
+    batches = iter(
+        [[ProductExportRow("p1", "SKU-1", "Product", Decimal("1.00"), "b1", "B")]],
+    )
+    mock_product_repository.export_products.return_value = batches
+
+    result = use_case.export_products(batch_size=10)
+
+    assert result is batches
+    mock_product_repository.export_products.assert_called_once_with(batch_size=10)
@@ -0,0 +1,263 @@
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domain.enums.code_enum import ErrorCodeEnum
+from app.domain.enums.import_job_status_enum import ImportJobStatus
+from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundError
+from app.domain.models.product_import import ProductImportError, ProductImportJob
+from app.domain.use_cases.products.bulk_import.product_import_input import (
+    ProductImportRow,
+)
+from app.domain.use_cases.products.bulk_import.product_import_use_case import (
+    ProductImportUseCase,
+)
+from app.domain.use_cases.products.create.product_create_input import ProductCreateInput
+
+NIKE_ID = "01K4KNPTYEBNMX5DP8W0BMTS6C"
+
+
+@pytest.fixture
+def mock_product_repository() -> MagicMock:
+    repository = MagicMock()
+    repository.find_existing_skus.return_value = set()
+    repository.bulk_create.side_effect = lambda products: {p.sku for p in products}
+    return repository
+
+
+@pytest.fixture
+def mock_brand_repository() -> MagicMock:
+    repository = MagicMock()
+    repository.find_existing_ids.return_value = {NIKE_ID}
+    return repository
+
+
+@pytest.fixture
+def mock_import_job_repository() -> MagicMock:
+    repository = MagicMock()
+    repository.save.side_effect = lambda job: job
+    return repository
+
+
+@pytest.fixture
+def mock_unit_of_work() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def use_case(
+    mock_product_repository: MagicMock,
+    mock_brand_repository: MagicMock,
+    mock_import_job_repository: MagicMock,
+    mock_unit_of_work: MagicMock,
+) -> ProductImportUseCase:
+    return ProductImportUseCase(
+        product_repository=mock_product_repository,
+        brand_repository=mock_brand_repository,
+        import_job_repository=mock_import_job_repository,
+        unit_of_work=mock_unit_of_work,
+    )
+
+
+def make_job(rows_processed: int = 0) -> ProductImportJob:
+    return ProductImportJob(
+        id="01K4EH5T4YQERHJ99RM1SWYV99",
+        status=ImportJobStatus.RUNNING,
+        rows_processed=rows_processed,
+        imported=rows_processed,
+        rejected=0,
+    )
+
+
+def make_row(row: int, sku: str, brand_id: str = NIKE_ID) -> ProductImportRow:
+    return ProductImportRow(
+        row=row,
+        product=ProductCreateInput(
+            sku=sku,
+            name=f"Product {sku}",
+            price=Decimal("10.00"),
+            brand_id=brand_id,
+        ),
+    )
+
+
+def test_import_products_successfully(
+    use_case: ProductImportUseCase,
+    mock_product_repository: MagicMock,
+    mock_brand_repository: MagicMock,
+) -> None:
+    expected_imported = 2
+    rows = [make_row(2, "SKU-A"), make_row(3, "SKU-B")]
+
+    result = use_case.import_products(rows)
+
+    assert result.imported == expected_imported
+    assert result.errors == []
+    mock_brand_repository.find_existing_ids.assert_called_once_with({NIKE_ID})
+    mock_product_repository.find_existing_skus.assert_called_once_with(
+        {"SKU-A", "SKU-B"},
+    )
+    mock_product_repository.bulk_create.assert_called_once_with(
+        [row.product for row in rows],
+    )
+
+
+def test_import_products_reports_business_errors_per_row(
+    use_case: ProductImportUseCase,
+    mock_product_repository: MagicMock,
+) -> None:
+    mock_product_repository.find_existing_skus.return_value = {"SKU-NIKE-001"}
+    rows = [
+        make_row(2, "SKU-A"),
+        make_row(3, "SKU-B", brand_id="ANY"),
+        make_row(4, "SKU-NIKE-001"),
+        make_row(5, "SKU-A"),
+    ]
+
+    result = use_case.import_products(rows)
+
+    assert result.imported == 1
+    assert [(error.row, error.code) for error in result.errors] == [
+        (3, ErrorCodeEnum.BRAND_NOT_FOUND.value),
+        (4, ErrorCodeEnum.ALREADY_EXIST_PRODUCT_SKU.value),
+        (5, ErrorCodeEnum.ALREADY_EXIST_PRODUCT_SKU.value),
+    ]
+    assert result.errors[0].message == "Brand with ID 'ANY' not found"
+    assert result.errors[1].message == "Product with SKU 'SKU-NIKE-001' already exists"
+    assert "first seen at row 2" in result.errors[2].message
+    mock_product_repository.bulk_create.assert_called_once_with([rows[0].product])
+
+
+def test_import_products_reports_skus_created_concurrently(
+    use_case: ProductImportUseCase,
+    mock_product_repository: MagicMock,
+) -> None:
+    expected_rejected_row = 3
+    mock_product_repository.bulk_create.side_effect = None
+    mock_product_repository.bulk_create.return_value = {"SKU-A"}
+
+    result = use_case.import_products([make_row(2, "SKU-A"), make_row(3, "SKU-B")])
+
+    assert result.imported == 1
+    assert len(result.errors) == 1
+    assert result.errors[0].row == expected_rejected_row
+    assert result.errors[0].code == ErrorCodeEnum.ALREADY_EXIST_PRODUCT_SKU.value
+
+
+def test_import_products_without_valid_rows_does_not_insert(
+    use_case: ProductImportUseCase,
+    mock_product_repository: MagicMock,
+    mock_brand_repository: MagicMock,
+) -> None:
+    mock_brand_repository.find_existing_ids.return_value = set()
+
+    result = use_case.import_products([make_row(2, "SKU-A")])
+
+    assert result.imported == 0
+    assert len(result.errors) == 1
+    mock_product_repository.bulk_create.assert_not_called()
+
+
+def test_import_products_with_no_rows(
+    use_case: ProductImportUseCase,
+    mock_product_repository: MagicMock,
+    mock_brand_repository: MagicMock,
+) -> None:
+    result = use_case.import_products([])
+
+    assert result.imported == 0
+    assert result.errors == []
+    mock_brand_repository.find_existing_ids.assert_not_called()
+    mock_product_repository.bulk_create.assert_not_called()
+
+
+def test_start_job_creates_a_new_job(
+    use_case: ProductImportUseCase,
+    mock_import_job_repository: MagicMock,
+) -> None:
+    mock_import_job_repository.create.return_value = make_job()
+
+    job = use_case.start_job(None)
+
+    assert job == make_job()
+    mock_import_job_repository.find_by_id.assert_not_called()
+
+
+def test_start_job_resumes_an_existing_job(
+    use_case: ProductImportUseCase,
+    mock_import_job_repository: MagicMock,
+) -> None:
+    mock_import_job_repository.find_by_id.return_value = make_job(rows_processed=10)
+
+    job = use_case.start_job("01K4EH5T4YQERHJ99RM1SWYV99")
+
+    assert job.rows_processed == 10  # noqa: PLR2004
+    mock_import_job_repository.create.assert_not_called()
+
+
+def test_start_job_not_found_raises_error(
+    use_case: ProductImportUseCase,
+    mock_import_job_repository: MagicMock,
+) -> None:
+    mock_import_job_repository.find_by_id.return_value = None
+
+    with pytest.raises(ResourceNotFoundError) as exc_info:
+        use_case.start_job("01ZZZZZZZZZZZZZZZZZZZZZZZZ")
+
+    assert exc_info.value.code == ErrorCodeEnum.IMPORT_JOB_NOT_FOUND
+
+
+def test_import_records_checkpoints_every_chunk(
+    use_case: ProductImportUseCase,
+    mock_product_repository: MagicMock,
+    mock_import_job_repository: MagicMock,
+) -> None:
+    expected_bulk_inserts = 3
+    invalid_record = [
+        ProductImportError(row=4, code="missing", location=["sku"], message="Missing"),
+    ]
+    records = [
+        make_row(2, "SKU-A"),
+        make_row(3, "SKU-B"),
+        invalid_record,
+        make_row(5, "SKU-C"),
+        make_row(6, "SKU-D"),
+    ]
+
+    report = use_case.import_records(
+        make_job(rows_processed=10),
+        records,
+        chunk_size=2,
+        max_reported_errors=100,
+    )
+
+    assert mock_product_repository.bulk_create.call_count == expected_bulk_inserts
+    checkpoints = [
+        call.args[0].rows_processed
+        for call in mock_import_job_repository.save.call_args_list
+    ]
+    assert checkpoints == [12, 14, 15, 15]
+    assert report.job.status == ImportJobStatus.COMPLETED
+    assert report.job.imported == 14  # noqa: PLR2004
+    assert report.job.rejected == 1
+    assert report.errors == invalid_record
+
+
+def test_import_records_truncates_reported_errors(
+    use_case: ProductImportUseCase,
+    mock_brand_repository: MagicMock,
+) -> None:
+    mock_brand_repository.find_existing_ids.return_value = set()
+    records = [make_row(row, f"SKU-{row}") for row in range(2, 7)]
+
+    report = use_case.import_records(
+        make_job(),
+        records,
+        chunk_size=2,
+        max_reported_errors=3,
+    )
+
+    assert [error.row for error in report.errors] == [2, 3, 4]
+    assert report.job.rejected == 5  # noqa: PLR2004
+    assert report.job.imported == 0
@@ -0,0 +1,178 @@
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import delete
+
+from app.core.configurations import settings
+from app.domain.enums.code_enum import ErrorCodeEnum
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
+from app.domain.exceptions.data_validation_exception import DataValidationError
+from app.domain.models.product_price_update import ProductPriceChange
+from app.domain.use_cases.notifications.dispatch.outbox_dispatch_use_case import (
+    OutboxDispatchUseCase,
+)
+from app.domain.use_cases.products.price_update.product_price_update_input import (
+    ProductPriceUpdateInput,
+)
+from app.domain.use_cases.products.price_update.product_price_update_use_case import (
+    ProductPriceUpdateUseCase,
+)
+from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.entity.outbox_message_entity import OutboxMessageEntity
+from app.infrastructure.persistence.postgres_outbox_repository import (
+    PostgresOutboxRepository,
+)
+from app.infrastructure.persistence.postgres_unit_of_work import PostgresUnitOfWork
+
+OUTBOX_BATCH_SIZE = 50
+
+
+@pytest.fixture
+def mock_product_repository() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_outbox_repository() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def use_case(
+    mock_product_repository: MagicMock,
+    mock_outbox_repository: MagicMock,
+) -> ProductPriceUpdateUseCase:
+    return ProductPriceUpdateUseCase(
+        product_repository=mock_product_repository,
+        outbox_repository=mock_outbox_repository,
+        unit_of_work=MagicMock(),
+    )
+
+
+def make_change(product_id: str, sku: str) -> ProductPriceChange:
+    return ProductPriceChange(
+        product_id=product_id,
+        sku=sku,
+        old_price=Decimal("10.00"),
+        new_price=Decimal("12.00"),
+    )
+
+
+def test_update_prices_records_the_changes_in_outbox(
+    use_case: ProductPriceUpdateUseCase,
+    mock_product_repository: MagicMock,
+    mock_outbox_repository: MagicMock,
+) -> None:
+    prices = [
+        ProductPriceUpdateInput(sku="SKU-1", price=Decimal("12.00")),
+        ProductPriceUpdateInput(sku="SKU-2", price=Decimal("12.00")),
+        ProductPriceUpdateInput(sku="SKU-3", price=Decimal("10.00")),
+        ProductPriceUpdateInput(sku="SKU-4", price=Decimal("10.00")),
+    ]
+    mock_product_repository.update_prices.return_value = [
+        make_change("p1", "SKU-1"),
+        make_change("p2", "SKU-2"),
+    ]
+    mock_product_repository.find_existing_skus.return_value = {"SKU-3"}
+
+    result = use_case.update_prices(prices)
+
+    mock_product_repository.update_prices.assert_called_once_with(prices)
+    mock_product_repository.find_existing_skus.assert_called_once_with(
+        {"SKU-3", "SKU-4"},
+    )
+    assert len(result.changes) == 2  # noqa: PLR2004
+    assert result.unchanged == 1
+    assert result.not_found_skus == ["SKU-4"]
+
+    mock_outbox_repository.add.assert_called_once_with(
+        OutboxEventType.PRODUCTS_UPDATED,
+        {
+            "events": [
+                {
+                    "product_id": product_id,
+                    "changes": {"price": {"old": "10.00", "new": "12.00"}},
+                }
+                for product_id in ("p1", "p2")
+            ],
+        },
+    )
+
+
+def test_update_prices_without_changes_records_nothing(
+    use_case: ProductPriceUpdateUseCase,
+    mock_product_repository: MagicMock,
+    mock_outbox_repository: MagicMock,
+) -> None:
+    mock_product_repository.update_prices.return_value = []
+    mock_product_repository.find_existing_skus.return_value = {"SKU-1"}
+
+    result = use_case.update_prices(
+        [ProductPriceUpdateInput(sku="SKU-1", price=Decimal("10.00"))],
+    )
+
+    assert result.changes == []
+    assert result.unchanged == 1
+    mock_outbox_repository.add.assert_not_called()
+
+
+def test_update_prices_with_repeated_sku_raises_error(
+    use_case: ProductPriceUpdateUseCase,
+    mock_product_repository: MagicMock,
+) -> None:
+    prices = [
+        ProductPriceUpdateInput(sku="SKU-1", price=Decimal("12.00")),
+        ProductPriceUpdateInput(sku="SKU-1", price=Decimal("13.00")),
+    ]
+
+    with pytest.raises(DataValidationError) as exc_info:
+        use_case.update_prices(prices)
+
+    assert exc_info.value.code == ErrorCodeEnum.REPEATED_PRODUCT_SKU
+    assert exc_info.value.location == ["prices", 1, "sku"]
+    mock_product_repository.update_prices.assert_not_called()
+
+
+def test_a_price_update_larger_than_an_outbox_batch_sends_one_notification(
+    mock_product_repository: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "NOTIFICATION_COALESCE_WINDOW_SECONDS", 0)
+    database_repository = DatabaseRepository()
+    database_repository.get_db_session().execute(delete(OutboxMessageEntity))
+    database_repository.commit()
+    outbox_repository = PostgresOutboxRepository(database_repository)
+    unit_of_work = PostgresUnitOfWork(database_repository)
+    changes = [
+        make_change(f"p{number}", f"SKU-{number}")
+        for number in range(OUTBOX_BATCH_SIZE + 1)
+    ]
+    mock_product_repository.update_prices.return_value = changes
+    mock_product_repository.find_existing_skus.return_value = set()
+    notification_service = MagicMock()
+
+    ProductPriceUpdateUseCase(
+        product_repository=mock_product_repository,
+        outbox_repository=outbox_repository,
+        unit_of_work=unit_of_work,
+    ).update_prices(
+        [
+            ProductPriceUpdateInput(sku=change.sku, price=change.new_price)
+            for change in changes
+        ],
+    )
+    delivered = OutboxDispatchUseCase(
+        outbox_repository=outbox_repository,
+        notification_service=notification_service,
+        unit_of_work=unit_of_work,
+    ).dispatch_batch(OUTBOX_BATCH_SIZE)
+    database_repository.close()
+
+    assert delivered == 1
+    notification_service.notify.assert_not_called()
+    notification_service.notify_batch.assert_called_once()
+    digest = notification_service.notify_batch.call_args.kwargs["event"]
+    assert [event.product_id for event in digest.events] == [
+        change.product_id for change in changes
+    ]
@@ -17,14 +17,21 @@ def mock_view_repository() -> MagicMock:
     return MagicMock()
 
 
+@pytest.fixture
+def mock_unit_of_work() -> MagicMock:
+    return MagicMock()
+
+
 @pytest.fixture
 def use_case(
     mock_product_repository: MagicMock,
     mock_view_repository: MagicMock,
+    mock_unit_of_work: MagicMock,
 ) -> ProductRemoveUseCase:
     return ProductRemoveUseCase(
         product_repository=mock_product_repository,
         view_repository=mock_view_repository,
+        unit_of_work=mock_unit_of_work,
     )
 
 
@@ -69,3 +76,18 @@ def test_remove_product_no_exceptions_if_not_found(
 
     mock_view_repository.delete_views_by_product_id.assert_called_once_with(product_id)
     mock_product_repository.delete_by_id.assert_called_once_with(product_id)
+
+
+def test_remove_product_runs_in_one_unit_of_work(
+    use_case: ProductRemoveUseCase,
+    mock_product_repository: MagicMock,
+    mock_unit_of_work: MagicMock,
+) -> None:
+    mock_product_repository.delete_by_id.side_effect = RuntimeError("DB error")
+
+    with pytest.raises(RuntimeError):
+        use_case.remove_product("p123")
+
+    mock_unit_of_work.__enter__.assert_called_once()
+    exc_type, _, _ = mock_unit_of_work.__exit__.call_args.args
+    assert exc_type is RuntimeError
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 import pytest
 import ulid
 
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
 from app.domain.exceptions.data_validation_exception import DataValidationError
 from app.domain.models.product import Product
 from app.domain.services.product_update_event import ProductUpdateEvent
@@ -24,7 +25,12 @@ def mock_brand_repository() -> MagicMock:
 
 
 @pytest.fixture
-def mock_notification_service() -> MagicMock:
+def mock_outbox_repository() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_unit_of_work() -> MagicMock:
     return MagicMock()
 
 
@@ -32,12 +38,14 @@ def mock_notification_service() -> MagicMock:
 def use_case(
     mock_product_repository: MagicMock,
     mock_brand_repository: MagicMock,
-    mock_notification_service: MagicMock,
+    mock_outbox_repository: MagicMock,
+    mock_unit_of_work: MagicMock,
 ) -> ProductUpdateUseCase:
     return ProductUpdateUseCase(
         product_repository=mock_product_repository,
         brand_repository=mock_brand_repository,
-        notification_service=mock_notification_service,
+        outbox_repository=mock_outbox_repository,
+        unit_of_work=mock_unit_of_work,
     )
 
 
@@ -93,7 +101,7 @@ def test_update_product_success(
     use_case: ProductUpdateUseCase,
     mock_product_repository: MagicMock,
     mock_brand_repository: MagicMock,
-    mock_notification_service: MagicMock,
+    mock_outbox_repository: MagicMock,
 ) -> None:
     product_id = "p1"
     update_input = make_update_input()
@@ -118,14 +126,14 @@ def test_update_product_success(
         product_id=product_id,
         product_update=update_input,
     )
-    mock_notification_service.notify.assert_not_called()
+    mock_outbox_repository.add.assert_not_called()
 
 
-def test_notify_changes_no_changes(
+def test_record_changes_no_changes(
     use_case: ProductUpdateUseCase,
     mock_product_repository: MagicMock,
     mock_brand_repository: MagicMock,
-    mock_notification_service: MagicMock,
+    mock_outbox_repository: MagicMock,
 ) -> None:
     product_id = "p1"
     existing = make_product(product_id=product_id)
@@ -143,13 +151,13 @@ def test_notify_changes_no_changes(
 
     use_case.update_product(product_id, update_input)
 
-    mock_notification_service.notify.assert_not_called()
+    mock_outbox_repository.add.assert_not_called()
 
 
-def test_notify_changes_with_changes(
+def test_record_changes_with_changes(
     use_case: ProductUpdateUseCase,
     mock_product_repository: MagicMock,
-    mock_notification_service: MagicMock,
+    mock_outbox_repository: MagicMock,
 ) -> None:
     product_id = "p1"
     existing = make_product(name="Old Name")
@@ -157,11 +165,12 @@ def test_notify_changes_with_changes(
 
     mock_product_repository.find_by_id.return_value = existing
 
-    use_case._notify_changes(product_id, update_input)
+    use_case._record_changes(product_id, update_input)
 
-    mock_notification_service.notify.assert_called_once()
-    args, kwargs = mock_notification_service.notify.call_args
-    event: ProductUpdateEvent = kwargs["event"]
-    assert "name" in event.changes
+    mock_outbox_repository.add.assert_called_once()
+    event_type, payload = mock_outbox_repository.add.call_args.args
+    assert event_type == OutboxEventType.PRODUCT_UPDATED
+    event = ProductUpdateEvent.model_validate(payload)
+    assert event.product_id == product_id
     assert event.changes["name"]["old"] == "Old Name"
     assert event.changes["name"]["new"] == "New Name"
@@ -0,0 +1,69 @@
+"""
+Throwaway databases on the pytest-postgresql server, for tests that need the
+schema built by the real migrations instead of the ORM metadata.
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import psycopg2
+from psycopg2 import sql
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from yoyo import get_backend, read_migrations
+
+MIGRATIONS_PATH = "migrations"
+
+
+@contextmanager
+def _admin_cursor(postgresql_proc: Any) -> Iterator[Any]:
+    connection = psycopg2.connect(
+        dbname="postgres",
+        user=postgresql_proc.user,
+        password=postgresql_proc.password,
+        host=postgresql_proc.host,
+        port=postgresql_proc.port,
+    )
+    connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+    try:
+        with connection.cursor() as cursor:
+            yield cursor
+    finally:
+        connection.close()
+
+
+@contextmanager
+def scratch_database(postgresql_proc: Any, name: str) -> Iterator[str]:
+    """Creates an empty database and yields its location (user@host:port/db)."""
+    dbname = f"{postgresql_proc.dbname}_{name}"
+    with _admin_cursor(postgresql_proc) as cursor:
+        cursor.execute(
+            sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(dbname)),
+        )
+        cursor.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(dbname)))
+
+    creds = postgresql_proc.user
+    if postgresql_proc.password:
+        creds = f"{creds}:{postgresql_proc.password}"
+    try:
+        yield f"{creds}@{postgresql_proc.host}:{postgresql_proc.port}/{dbname}"
+    finally:
+        with _admin_cursor(postgresql_proc) as cursor:
+            cursor.execute(
+                sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(
+                    sql.Identifier(dbname),
+                ),
+            )
+
+
+def apply_migrations(
+    location: str,
+    include: Callable[[str], bool] = lambda _migration_id: True,
+) -> None:
+    """Applies the pending migrations whose ID passes `include`, in order."""
+    backend = get_backend(f"postgresql://{location}")
+    migrations = read_migrations(MIGRATIONS_PATH).filter(
+        lambda migration: include(migration.id),
+    )
+    with backend.lock():
+        backend.apply_migrations(backend.to_apply(migrations))
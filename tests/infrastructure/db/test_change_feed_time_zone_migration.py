@@ -0,0 +1,105 @@
+from collections.abc import Generator
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+import app.infrastructure.db.database_repository as repo_mod
+from app.domain.enums.product_change_type_enum import ProductChangeType
+from app.domain.models.product_change import ProductChangeCursor
+from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.persistence.postgres_product_repository import (
+    PostgresProductRepository,
+)
+from tests.infrastructure.db.scratch_database import (
+    apply_migrations,
+    scratch_database,
+)
+
+TIME_ZONE_MIGRATION = "20261019_08__store_change_feed_times_with_time_zone"
+
+BRAND_ID = "01K4KNPTYEBNMX5DP8W0BMTS6C"
+PRODUCT_ID = "01K4KNQGXMW5KK788YBHJ2D28V"
+DELETED_PRODUCT_ID = "01K4KNR0TNBG17YT9D6MWK4038"
+
+UPDATED_AT = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+DELETED_AT = datetime(2026, 10, 1, 12, 0, 1, tzinfo=timezone.utc)
+
+# Stored as UTC wall-clock times, the way the application wrote them
+SEED = f"""
+INSERT INTO brands (id, name, created_at, updated_at)
+VALUES (ulid_to_uuid('{BRAND_ID}'), 'Nike', NOW(), NOW());
+INSERT INTO products (id, sku, name, price, brand_id, created_at, updated_at)
+VALUES (ulid_to_uuid('{PRODUCT_ID}'), 'SKU-1', 'Air Max', 1,
+    ulid_to_uuid('{BRAND_ID}'), NOW(), '2026-10-01 12:00:00');
+INSERT INTO product_tombstones (product_id, deleted_at)
+VALUES (ulid_to_uuid('{DELETED_PRODUCT_ID}'), '2026-10-01 12:00:01');
+"""  # noqa: S608
+
+
+@pytest.fixture
+def location(postgresql_proc: Any) -> Generator[str, None, None]:
+    """Database with the change feed rows written before the migration."""
+    with scratch_database(postgresql_proc, "change_feed_tz") as location:
+        apply_migrations(location, include=lambda id_: id_ < TIME_ZONE_MIGRATION)
+        engine = create_engine(f"postgresql+psycopg2://{location}", poolclass=NullPool)
+        with engine.begin() as connection:
+            connection.exec_driver_sql(SEED)
+        engine.dispose()
+
+        yield location
+
+
+@pytest.fixture
+def bogota_engine(location: str) -> Generator[Engine, None, None]:
+    """Engine whose sessions are not on UTC."""
+    engine = create_engine(
+        f"postgresql+psycopg2://{location}",
+        poolclass=NullPool,
+        connect_args={"options": "-c timezone=America/Bogota"},
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_migration_keeps_the_instants(
+    location: str,
+    bogota_engine: Engine,
+) -> None:
+    apply_migrations(location)
+
+    with bogota_engine.connect() as connection:
+        row = connection.execute(
+            text(
+                "SELECT p.updated_at, t.deleted_at "
+                "FROM products p CROSS JOIN product_tombstones t",
+            ),
+        ).one()
+    assert tuple(row) == (UPDATED_AT, DELETED_AT)
+
+
+def test_change_feed_cursor_does_not_depend_on_the_session_time_zone(
+    monkeypatch: pytest.MonkeyPatch,
+    location: str,
+    bogota_engine: Engine,
+) -> None:
+    apply_migrations(location)
+    monkeypatch.setattr(repo_mod, "SessionLocal", sessionmaker(bind=bogota_engine))
+    database_repository = DatabaseRepository()
+    repository = PostgresProductRepository(database_repository)
+
+    try:
+        changes = repository.find_changes(
+            ProductChangeCursor(changed_at=UPDATED_AT, product_id=PRODUCT_ID),
+            10,
+            0,
+        )
+    finally:
+        database_repository.close()
+
+    assert [(c.change_type, c.product_id, c.changed_at) for c in changes] == [
+        (ProductChangeType.DELETE, DELETED_PRODUCT_ID, DELETED_AT),
+    ]
@@ -24,7 +24,7 @@ class TestDatabaseRepository:
 
     def test_commit_success(self) -> None:
         repo = DatabaseRepository()
-        mock_session = MagicMock()
+        mock_session = MagicMock(info={})
         repo._session = mock_session
 
         repo.commit()
@@ -34,7 +34,7 @@ class TestDatabaseRepository:
 
     def test_commit_rollback_on_exception(self) -> None:
         repo = DatabaseRepository()
-        mock_session = MagicMock()
+        mock_session = MagicMock(info={})
         repo._session = mock_session
         mock_session.commit.side_effect = Exception("DB error")
 
@@ -45,7 +45,7 @@ class TestDatabaseRepository:
 
     def test_add_and_commit(self) -> None:
         repo = DatabaseRepository()
-        mock_session = MagicMock()
+        mock_session = MagicMock(info={})
         repo._session = mock_session
 
         entity = object()
@@ -56,7 +56,7 @@ class TestDatabaseRepository:
 
     def test_rollback(self) -> None:
         repo = DatabaseRepository()
-        mock_session = MagicMock()
+        mock_session = MagicMock(info={})
         repo._session = mock_session
 
         repo.rollback()
@@ -65,10 +65,37 @@ class TestDatabaseRepository:
 
     def test_close(self) -> None:
         repo = DatabaseRepository()
-        mock_session = MagicMock()
+        mock_session = MagicMock(info={})
         repo._session = mock_session
 
         repo.close()
 
         mock_session.close.assert_called_once()
         assert repo._session is None
+
+    def test_commit_inside_unit_of_work_only_flushes(self) -> None:
+        repo = DatabaseRepository()
+        mock_session = MagicMock(info={})
+        repo._session = mock_session
+
+        repo.begin_unit_of_work()
+        repo.commit()
+
+        mock_session.flush.assert_called_once()
+        mock_session.commit.assert_not_called()
+
+        repo.end_unit_of_work(commit=True)
+
+        mock_session.commit.assert_called_once()
+        assert repo.in_unit_of_work() is False
+
+    def test_failed_unit_of_work_is_rolled_back(self) -> None:
+        repo = DatabaseRepository()
+        mock_session = MagicMock(info={})
+        repo._session = mock_session
+
+        repo.begin_unit_of_work()
+        repo.end_unit_of_work(commit=False)
+
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
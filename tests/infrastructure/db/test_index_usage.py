@@ -0,0 +1,284 @@
+"""
+Runs the repository queries against a database built from the real migrations
+and seeded with enough rows for the planner to prefer indexes, and checks with
+EXPLAIN that none of them scans a whole table.
+"""
+
+import re
+import uuid
+from collections.abc import Callable, Generator, Iterator
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any, NamedTuple
+
+import pytest
+from sqlalchemy import Engine, create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+import app.infrastructure.db.database_repository as repo_mod
+from app.domain.helpers.datetime_generator import get_now_datetime
+from app.domain.models.product_change import ProductChangeCursor
+from app.domain.use_cases.products.create.product_create_input import (
+    ProductCreateInput,
+)
+from app.domain.use_cases.products.price_update.product_price_update_input import (
+    ProductPriceUpdateInput,
+)
+from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.db.ulid_type import uuid_to_ulid
+from app.infrastructure.persistence.postgres_brand_repository import (
+    PostgresBrandRepository,
+)
+from app.infrastructure.persistence.postgres_product_repository import (
+    PostgresProductRepository,
+)
+from app.infrastructure.persistence.postgres_product_view_repository import (
+    PostgresProductViewRepository,
+)
+from app.infrastructure.persistence.postgres_user_repository import (
+    PostgresUserRepository,
+)
+from tests.infrastructure.db.scratch_database import (
+    apply_migrations,
+    scratch_database,
+)
+
+BRANDS = 2_000
+PRODUCTS = 100_000
+USERS = 20_000
+TOMBSTONES = 10_000
+
+# Sequential scans on these tables are what the suite is here to catch; the
+# temporary tables and unnest() the repositories feed their input with are not
+SEEDED_TABLES = {"brands", "products", "product_views", "users", "product_tombstones"}
+
+EXPLAINABLE = re.compile(r"^\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+
+SEED = [
+    # IDs are the UUID of (table number << 64 | row number)
+    text(
+        """
+        CREATE FUNCTION pg_temp.seeded_id(kind INT, number INT) RETURNS UUID
+        AS $$ SELECT (lpad(to_hex(kind), 16, '0') || lpad(to_hex(number), 16, '0'))::UUID $$
+        LANGUAGE sql
+        """,
+    ),
+    text(
+        """
+        INSERT INTO brands (id, name, created_at, updated_at)
+        SELECT pg_temp.seeded_id(1, i), 'Brand ' || i, NOW(), NOW()
+        FROM generate_series(1, :brands) AS i
+        """,
+    ),
+    text(
+        """
+        INSERT INTO products (id, sku, name, price, brand_id, created_at, updated_at)
+        SELECT
+            pg_temp.seeded_id(2, i),
+            'SKU-' || i,
+            'Product ' || i,
+            mod(i, 500) + 0.99,
+            pg_temp.seeded_id(1, mod(i, :brands) + 1),
+            NOW(),
+            NOW() - make_interval(secs => i)
+        FROM generate_series(1, :products) AS i
+        """,
+    ),
+    text(
+        """
+        INSERT INTO product_views (id, product_id, view_count, created_at, updated_at)
+        SELECT pg_temp.seeded_id(3, i), pg_temp.seeded_id(2, i), i, NOW(), NOW()
+        FROM generate_series(1, :products) AS i
+        """,
+    ),
+    text(
+        """
+        INSERT INTO users (id, username, email, hashed_password, role, created_at,
+            updated_at)
+        SELECT pg_temp.seeded_id(4, i), 'user' || i, 'user' || i || '@test.com',
+            'hash', 'ADMIN', NOW(), NOW()
+        FROM generate_series(1, :users) AS i
+        """,
+    ),
+    text(
+        """
+        INSERT INTO product_tombstones (product_id, deleted_at)
+        SELECT pg_temp.seeded_id(5, i), NOW() - make_interval(secs => i)
+        FROM generate_series(1, :tombstones) AS i
+        """,
+    ),
+    text("ANALYZE"),
+]
+SEED_SIZES = {
+    "brands": BRANDS,
+    "products": PRODUCTS,
+    "users": USERS,
+    "tombstones": TOMBSTONES,
+}
+
+
+def seeded_id(kind: int, number: int) -> str:
+    return uuid_to_ulid(uuid.UUID(int=kind << 64 | number))
+
+
+def brand_id(number: int) -> str:
+    return seeded_id(1, number)
+
+
+def product_id(number: int) -> str:
+    return seeded_id(2, number)
+
+
+class Repositories(NamedTuple):
+    products: PostgresProductRepository
+    brands: PostgresBrandRepository
+    users: PostgresUserRepository
+    views: PostgresProductViewRepository
+
+
+@pytest.fixture(scope="module")
+def seeded_engine(postgresql_proc: Any) -> Generator[Engine, None, None]:
+    with scratch_database(postgresql_proc, "indexes") as location:
+        apply_migrations(location)
+        engine = create_engine(
+            f"postgresql+psycopg2://{location}",
+            poolclass=NullPool,
+        )
+        with engine.begin() as connection:
+            for statement in SEED:
+                connection.execute(
+                    statement,
+                    {
+                        name: size
+                        for name, size in SEED_SIZES.items()
+                        if name in statement.compile().params
+                    },
+                )
+
+        yield engine
+
+        engine.dispose()
+
+
+@pytest.fixture
+def explained_statements(
+    seeded_engine: Engine,
+) -> Generator[list[tuple[str, dict[str, Any]]], None, None]:
+    """Plans of the statements run on the seeded database during the test."""
+    explained: list[tuple[str, dict[str, Any]]] = []
+
+    def explain(
+        conn: Any,
+        _cursor: Any,
+        statement: str,
+        parameters: Any,
+        _context: Any,
+        executemany: bool,
+    ) -> None:
+        if executemany or not EXPLAINABLE.match(statement):
+            return
+        # Same connection and transaction (temporary tables are visible), but
+        # straight on the DBAPI connection so it is not captured itself
+        with conn.connection.dbapi_connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            explained.append((statement, cursor.fetchone()[0][0]["Plan"]))
+
+    event.listen(seeded_engine, "before_cursor_execute", explain)
+    yield explained
+    event.remove(seeded_engine, "before_cursor_execute", explain)
+
+
+@pytest.fixture
+def repositories(
+    monkeypatch: pytest.MonkeyPatch,
+    seeded_engine: Engine,
+) -> Generator[Repositories, None, None]:
+    monkeypatch.setattr(repo_mod, "SessionLocal", sessionmaker(bind=seeded_engine))
+    database_repository = DatabaseRepository()
+
+    yield Repositories(
+        products=PostgresProductRepository(database_repository),
+        brands=PostgresBrandRepository(database_repository),
+        users=PostgresUserRepository(database_repository),
+        views=PostgresProductViewRepository(database_repository),
+    )
+
+    database_repository.close()
+
+
+def sequential_scans(plan: dict[str, Any]) -> Iterator[str]:
+    if plan["Node Type"] == "Seq Scan" and plan["Relation Name"] in SEEDED_TABLES:
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", []):
+        yield from sequential_scans(child)
+
+
+def since_cursor() -> ProductChangeCursor:
+    return ProductChangeCursor(
+        changed_at=get_now_datetime() - timedelta(seconds=PRODUCTS // 2),
+        product_id=product_id(PRODUCTS // 2),
+    )
+
+
+REPOSITORY_QUERIES: dict[str, Callable[[Repositories], object]] = {
+    "products.bulk_create": lambda r: r.products.bulk_create(
+        [
+            ProductCreateInput(
+                sku=sku,
+                name="New product",
+                price=Decimal("9.99"),
+                brand_id=brand_id(9),
+            )
+            for sku in ("SKU-9", "NEW-SKU-9")
+        ],
+    ),
+    "products.exists_by_sku": lambda r: r.products.exists_by_sku("SKU-10"),
+    "products.find_by_id": lambda r: r.products.find_by_id(product_id(11)),
+    "products.find_by_sku": lambda r: r.products.find_by_sku("SKU-12"),
+    "products.find_existing_skus": lambda r: r.products.find_existing_skus(
+        {"SKU-13", "SKU-14", "NEW-SKU"},
+    ),
+    "products.list_products_by_brand": lambda r: r.products.list_products(
+        brand_id(15),
+    ),
+    "products.update_prices": lambda r: r.products.update_prices(
+        [ProductPriceUpdateInput(sku="SKU-16", price=Decimal("1.50"))],
+    ),
+    "products.delete_by_id": lambda r: r.products.delete_by_id(product_id(17)),
+    "products.find_changes": lambda r: r.products.find_changes(None, 100, 0),
+    "products.find_changes_since": lambda r: r.products.find_changes(
+        since_cursor(),
+        100,
+        0,
+    ),
+    "brands.exists_by_id": lambda r: r.brands.exists_by_id(brand_id(18)),
+    "brands.exists_by_name": lambda r: r.brands.exists_by_name("Brand 19"),
+    "brands.find_existing_ids": lambda r: r.brands.find_existing_ids(
+        {brand_id(20), brand_id(21)},
+    ),
+    "users.find_by_username": lambda r: r.users.find_by_username("user22"),
+    "users.exists_by": lambda r: r.users.exists_by("user23", "user24@test.com"),
+    "users.exists_by_email": lambda r: r.users.exists_by_email("user25@test.com"),
+    "views.increment_view": lambda r: r.views.increment_view(product_id(26)),
+    "views.delete_views_by_product_id": lambda r: (
+        r.views.delete_views_by_product_id(product_id(27))
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "query",
+    REPOSITORY_QUERIES.values(),
+    ids=REPOSITORY_QUERIES.keys(),
+)
+def test_repository_query_uses_indexes(
+    query: Callable[[Repositories], object],
+    repositories: Repositories,
+    explained_statements: list[tuple[str, dict[str, Any]]],
+) -> None:
+    query(repositories)
+
+    assert explained_statements
+    for statement, plan in explained_statements:
+        assert list(sequential_scans(plan)) == [], statement
@@ -0,0 +1,177 @@
+import asyncio
+from collections.abc import Generator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.pool import NullPool
+
+from app.core.configurations import settings
+from app.infrastructure.db.async_session import (
+    asyncpg_connect_args,
+    create_async_database_engine,
+)
+from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.db.routing_session import RoutingSession
+from app.infrastructure.db.session import create_database_engine
+from app.infrastructure.persistence.postgres_product_repository import (
+    PostgresProductRepository,
+)
+from tests.infrastructure.db.transaction_pooling_proxy import TransactionPoolingProxy
+
+SELECT_SKU = text("SELECT sku FROM products WHERE sku = :sku")
+
+
+@pytest.fixture
+def pgbouncer_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "DATABASE_PGBOUNCER", True)
+    monkeypatch.setattr(settings, "DATABASE_NULL_POOL", True)
+
+
+def start_proxy(server_connections: int) -> TransactionPoolingProxy:
+    url = make_url(settings.DATABASE_URL)
+    proxy = TransactionPoolingProxy(url.host, url.port, server_connections)
+    proxy.start()
+    return proxy
+
+
+@pytest.fixture
+def proxy() -> Generator[TransactionPoolingProxy, None, None]:
+    proxy = start_proxy(server_connections=2)
+    yield proxy
+    proxy.stop()
+
+
+@pytest.fixture
+def single_server_proxy() -> Generator[TransactionPoolingProxy, None, None]:
+    proxy = start_proxy(server_connections=1)
+    yield proxy
+    proxy.stop()
+
+
+def proxied_url(proxy: TransactionPoolingProxy) -> str:
+    return (
+        make_url(settings.DATABASE_URL)
+        .set(host="127.0.0.1", port=proxy.listen_port)
+        .render_as_string(hide_password=False)
+    )
+
+
+def run_async_transactions(proxy: TransactionPoolingProxy, transactions: int) -> None:
+    async def run() -> None:
+        engine = create_async_database_engine(proxied_url(proxy))
+        try:
+            async with engine.connect() as connection:
+                for _ in range(transactions):
+                    result = await connection.execute(
+                        SELECT_SKU,
+                        {"sku": "SKU-NIKE-001"},
+                    )
+                    assert result.scalar_one() == "SKU-NIKE-001"
+                    await connection.commit()
+        finally:
+            await engine.dispose()
+
+    asyncio.run(asyncio.wait_for(run(), timeout=30))
+
+
+class TestPgBouncerMode:
+
+    def test_engines_do_not_pool_in_null_pool_mode(
+        self,
+        pgbouncer_mode: None,  # noqa: ARG002
+    ) -> None:
+        engine = create_database_engine(settings.DATABASE_URL)
+        async_engine = create_async_database_engine(settings.DATABASE_URL)
+
+        assert isinstance(engine.pool, NullPool)
+        assert isinstance(async_engine.pool, NullPool)
+        engine.dispose()
+
+    def test_asyncpg_statement_names_are_unique_in_pgbouncer_mode(
+        self,
+        pgbouncer_mode: None,  # noqa: ARG002
+    ) -> None:
+        connect_args = asyncpg_connect_args()
+        name_func = connect_args["prepared_statement_name_func"]
+
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["prepared_statement_cache_size"] == 0
+        assert name_func() != name_func()
+
+    def test_asyncpg_connect_args_are_untouched_by_default(self) -> None:
+        assert asyncpg_connect_args() == {}
+
+
+class TestTransactionPoolingIntegration:
+
+    def test_async_transactions_move_between_server_connections(
+        self,
+        pgbouncer_mode: None,  # noqa: ARG002
+        proxy: TransactionPoolingProxy,
+    ) -> None:
+        run_async_transactions(proxy, transactions=4)
+
+        assert proxy.opened_server_connections == 2  # noqa: PLR2004
+        assert proxy.transactions_served >= 4  # noqa: PLR2004
+
+    def test_cached_prepared_statements_break_without_pgbouncer_mode(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        proxy: TransactionPoolingProxy,
+    ) -> None:
+        # Control: the stand-in really behaves like PgBouncer
+        monkeypatch.setattr(settings, "DATABASE_NULL_POOL", True)
+
+        with pytest.raises(DBAPIError, match="prepared statement .* does not exist"):
+            run_async_transactions(proxy, transactions=4)
+
+    def test_sync_connections_share_one_server_connection(
+        self,
+        pgbouncer_mode: None,  # noqa: ARG002
+        single_server_proxy: TransactionPoolingProxy,
+    ) -> None:
+        engine = create_database_engine(proxied_url(single_server_proxy))
+        connections = [engine.connect() for _ in range(3)]
+        try:
+            for _ in range(2):
+                for connection in connections:
+                    with connection.begin():
+                        sku = connection.execute(
+                            SELECT_SKU,
+                            {"sku": "SKU-NIKE-001"},
+                        ).scalar_one()
+                        assert sku == "SKU-NIKE-001"
+        finally:
+            for connection in connections:
+                connection.close()
+            engine.dispose()
+
+        assert single_server_proxy.clients_served == 3  # noqa: PLR2004
+        assert single_server_proxy.opened_server_connections == 1
+
+    def test_repositories_run_behind_transaction_pooling(
+        self,
+        pgbouncer_mode: None,  # noqa: ARG002
+        proxy: TransactionPoolingProxy,
+    ) -> None:
+        engine = create_database_engine(proxied_url(proxy))
+        database_repository = DatabaseRepository()
+        database_repository._session = RoutingSession(bind=engine)
+        repository = PostgresProductRepository(database_repository)
+        try:
+            # Temp table + COPY, then a named cursor: both transaction scoped
+            existing = repository.find_existing_skus({"SKU-NIKE-001", "UNKNOWN"})
+            database_repository.rollback()
+            exported = [
+                row.sku
+                for batch in repository.export_products(batch_size=2)
+                for row in batch
+            ]
+        finally:
+            database_repository.close()
+            engine.dispose()
+
+        assert existing == {"SKU-NIKE-001"}
+        assert "SKU-NIKE-001" in exported
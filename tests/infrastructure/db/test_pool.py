@@ -0,0 +1,137 @@
+from collections.abc import Generator
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import app.infrastructure.db.async_session as async_session_mod
+import app.infrastructure.db.session as db_session_mod
+from app.core.configurations import settings
+from app.infrastructure.db.async_session import (
+    async_database_url,
+    create_async_database_engine,
+)
+from app.infrastructure.db.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+)
+from app.infrastructure.service.sqlalchemy_pool_monitor import (
+    SqlAlchemyDatabasePoolMonitor,
+)
+
+
+@pytest.fixture
+def pooled_engine(
+    recreate_db_and_load_fixtures: str,
+) -> Generator[Engine, None, None]:
+    engine = create_engine(
+        recreate_db_and_load_fixtures,
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    yield engine
+    engine.dispose()
+
+
+class TestInstrumentedQueuePool:
+
+    def test_checkouts_and_timeouts_are_measured(self, pooled_engine: Engine) -> None:
+        expected_min_wait = 0.1
+
+        with pooled_engine.connect(), pytest.raises(PoolTimeoutError):
+            pooled_engine.connect()
+
+        metrics = pooled_engine.pool.wait_metrics
+        assert metrics.checkouts == 1
+        assert metrics.timeouts == 1
+        assert metrics.wait_seconds_max >= expected_min_wait
+        assert metrics.wait_seconds_total >= metrics.wait_seconds_max
+
+    @pytest.mark.asyncio
+    async def test_async_checkouts_are_measured(
+        self,
+        recreate_db_and_load_fixtures: str,
+    ) -> None:
+        engine = create_async_engine(
+            async_database_url(recreate_db_and_load_fixtures),
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+        )
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+        finally:
+            await engine.dispose()
+
+        assert engine.pool.wait_metrics.checkouts == 1
+        assert engine.pool.max_overflow == 0
+
+
+class TestSqlAlchemyDatabasePoolMonitor:
+
+    def test_status_reports_the_current_engine_pool(
+        self,
+        pooled_engine: Engine,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(db_session_mod, "engine", pooled_engine)
+
+        with pooled_engine.connect():
+            status = SqlAlchemyDatabasePoolMonitor().status().pools[0]
+
+        assert status.engine == "primary"
+        assert status.pool_class == "InstrumentedQueuePool"
+        assert status.size == 1
+        assert status.max_overflow == 0
+        assert status.checked_out == 1
+        assert status.checked_in == 0
+        assert status.overflow == 0
+        assert status.checkouts == 1
+
+    def test_status_reports_every_engine(
+        self,
+        pooled_engine: Engine,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        replica = create_engine(
+            db_session_mod.engine.url,
+            poolclass=InstrumentedQueuePool,
+            pool_size=2,
+        )
+        async_engine = create_async_database_engine(db_session_mod.engine.url)
+        monkeypatch.setattr(db_session_mod, "engine", pooled_engine)
+        monkeypatch.setattr(db_session_mod, "read_engines", [replica])
+        monkeypatch.setattr(async_session_mod, "_async_engine", async_engine)
+        monkeypatch.setattr(async_session_mod, "_async_read_engines", [async_engine])
+
+        status = SqlAlchemyDatabasePoolMonitor().status()
+
+        assert status.process_id > 0
+        assert [(pool.engine, pool.pool_class, pool.size) for pool in status.pools] == [
+            ("primary", "InstrumentedQueuePool", 1),
+            ("replica-1", "InstrumentedQueuePool", 2),
+            ("async", "InstrumentedAsyncAdaptedQueuePool", settings.DATABASE_POOL_SIZE),
+            (
+                "async-replica-1",
+                "InstrumentedAsyncAdaptedQueuePool",
+                settings.DATABASE_POOL_SIZE,
+            ),
+        ]
+        assert status.pools[2].max_overflow == settings.DATABASE_MAX_OVERFLOW
+
+    def test_status_does_not_create_the_async_engine(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(async_session_mod, "_async_engine", None)
+        monkeypatch.setattr(async_session_mod, "_async_read_engines", None)
+
+        status = SqlAlchemyDatabasePoolMonitor().status()
+
+        assert [pool.engine for pool in status.pools] == ["primary"]
+        assert async_session_mod.created_async_engine() is None
+        assert async_session_mod.created_async_read_engines() == []
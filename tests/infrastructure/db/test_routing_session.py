@@ -0,0 +1,239 @@
+from collections.abc import Generator
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import Engine, create_engine, event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+import app.infrastructure.db.async_session as async_session_mod
+from app.core.configurations import settings
+from app.infrastructure.db.async_database_repository import AsyncDatabaseRepository
+from app.infrastructure.db.async_session import async_database_url
+from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.db.routing_session import HAS_WRITTEN, RoutingSession
+from app.infrastructure.db.session_scope import (
+    async_database_session_scope,
+    database_session_scope,
+)
+from app.infrastructure.persistence.async_postgres_product_repository import (
+    AsyncPostgresProductRepository,
+)
+from app.infrastructure.persistence.async_postgres_unit_of_work import (
+    AsyncPostgresUnitOfWork,
+)
+from app.infrastructure.persistence.postgres_product_repository import (
+    PostgresProductRepository,
+)
+from app.infrastructure.persistence.postgres_unit_of_work import PostgresUnitOfWork
+
+STALE_PRICE = Decimal("0.01")
+
+
+@pytest.fixture
+def primary() -> Generator[Engine, None, None]:
+    engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def replicas() -> Generator[list[Engine], None, None]:
+    # Both "replicas" point at the test database; only the engine differs
+    engines = [
+        create_engine(settings.DATABASE_URL, poolclass=NullPool) for _ in range(2)
+    ]
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+@pytest.fixture
+def stale_replica(primary: Engine) -> Generator[Engine, None, None]:
+    # A copy of the catalog, in its own schema, that missed a price change
+    with primary.begin() as connection:
+        connection.execute(text("CREATE SCHEMA stale_replica"))
+        for table in ("brands", "products"):
+            connection.execute(
+                text(f"CREATE TABLE stale_replica.{table} AS TABLE public.{table}"),
+            )
+        connection.execute(
+            text("UPDATE stale_replica.products SET price = :price"),
+            {"price": STALE_PRICE},
+        )
+    engine = create_engine(
+        settings.DATABASE_URL,
+        poolclass=NullPool,
+        connect_args={"options": "-csearch_path=stale_replica"},
+    )
+    yield engine
+    engine.dispose()
+    with primary.begin() as connection:
+        connection.execute(text("DROP SCHEMA stale_replica CASCADE"))
+
+
+@pytest.fixture
+def async_stale_replica(
+    stale_replica: Engine,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncEngine:
+    """The stale replica as the only replica of AsyncSessionLocal."""
+    # NullPool: there are no connections left to dispose of afterwards
+    engine = create_async_engine(
+        async_database_url(settings.DATABASE_URL),
+        poolclass=NullPool,
+        connect_args={"server_settings": {"search_path": "stale_replica"}},
+    )
+    monkeypatch.setattr(async_session_mod, "_async_read_engines", [engine])
+    return engine
+
+
+def make_repository(session: RoutingSession) -> DatabaseRepository:
+    database_repository = DatabaseRepository()
+    database_repository._session = session
+    return database_repository
+
+
+class TestRoutingSession:
+
+    def test_reads_go_to_a_replica_and_the_rest_to_the_primary(
+        self,
+        primary: Engine,
+        replicas: list[Engine],
+    ) -> None:
+        session = RoutingSession(bind=primary, read_engines=replicas)
+        database_repository = make_repository(session)
+
+        with database_repository.read_only():
+            assert session.get_bind() in replicas
+        assert session.get_bind() is primary
+        session.close()
+
+    def test_session_sticks_to_the_primary_after_a_write(
+        self,
+        primary: Engine,
+        replicas: list[Engine],
+    ) -> None:
+        session = RoutingSession(bind=primary, read_engines=replicas)
+        database_repository = make_repository(session)
+
+        session.execute(text("SELECT 1"))
+        with database_repository.read_only():
+            bind = session.get_bind()
+
+        assert session.info[HAS_WRITTEN] is True
+        assert bind is primary
+        session.close()
+
+    def test_replicas_are_used_round_robin_by_session(
+        self,
+        primary: Engine,
+        replicas: list[Engine],
+    ) -> None:
+        binds = []
+        for _ in range(len(replicas)):
+            session = RoutingSession(bind=primary, read_engines=replicas)
+            with make_repository(session).read_only():
+                binds.extend([session.get_bind(), session.get_bind()])
+            session.close()
+
+        assert binds[0] is binds[1]
+        assert binds[2] is binds[3]
+        assert {binds[0], binds[2]} == set(replicas)
+
+    def test_without_replicas_reads_go_to_the_primary(self, primary: Engine) -> None:
+        session = RoutingSession(bind=primary)
+
+        with make_repository(session).read_only():
+            assert session.get_bind() is primary
+        session.close()
+
+    def test_read_only_repository_methods_run_on_the_replica(
+        self,
+        primary: Engine,
+        replicas: list[Engine],
+    ) -> None:
+        executed_on: list[Engine] = []
+        for engine in (primary, replicas[0]):
+            event.listen(
+                engine,
+                "before_cursor_execute",
+                lambda *_, engine=engine: executed_on.append(engine),
+            )
+        session = RoutingSession(bind=primary, read_engines=replicas[:1])
+        repository = PostgresProductRepository(make_repository(session))
+
+        product = repository.find_by_sku("SKU-NIKE-001")
+        session.close()
+
+        assert product is not None
+        assert executed_on
+        assert set(executed_on) == {replicas[0]}
+
+    def test_standalone_reads_see_the_stale_replica(
+        self,
+        primary: Engine,
+        stale_replica: Engine,
+    ) -> None:
+        session = RoutingSession(bind=primary, read_engines=[stale_replica])
+        repository = PostgresProductRepository(make_repository(session))
+
+        product = repository.find_by_sku("SKU-NIKE-001")
+        session.close()
+
+        assert product is not None
+        assert product.price == STALE_PRICE
+
+    def test_reads_inside_a_unit_of_work_stay_on_the_primary(
+        self,
+        primary: Engine,
+        stale_replica: Engine,
+    ) -> None:
+        database_repository = DatabaseRepository()
+        repository = PostgresProductRepository(database_repository)
+
+        with database_session_scope() as scope:
+            session = scope.get_session(
+                lambda: RoutingSession(bind=primary, read_engines=[stale_replica]),
+            )
+            with PostgresUnitOfWork(database_repository):
+                product = repository.find_by_sku("SKU-NIKE-001")
+                assert session.info[HAS_WRITTEN] is True
+
+        assert product is not None
+        assert product.price != STALE_PRICE
+
+
+@pytest.mark.asyncio
+class TestAsyncRoutingSession:
+
+    async def test_standalone_reads_see_the_stale_replica(
+        self,
+        async_stale_replica: AsyncEngine,  # noqa: ARG002
+    ) -> None:
+        database_repository = AsyncDatabaseRepository()
+        repository = AsyncPostgresProductRepository(database_repository)
+
+        product = await repository.find_by_sku("SKU-NIKE-001")
+        await database_repository.close()
+
+        assert product is not None
+        assert product.price == STALE_PRICE
+
+    async def test_reads_inside_a_unit_of_work_stay_on_the_primary(
+        self,
+        async_stale_replica: AsyncEngine,  # noqa: ARG002
+    ) -> None:
+        database_repository = AsyncDatabaseRepository()
+        repository = AsyncPostgresProductRepository(database_repository)
+
+        async with (
+            async_database_session_scope(),
+            AsyncPostgresUnitOfWork(database_repository),
+        ):
+            product = await repository.find_by_sku("SKU-NIKE-001")
+            session = database_repository.get_db_session()
+            assert session.info[HAS_WRITTEN] is True
+
+        assert product is not None
+        assert product.price != STALE_PRICE
@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import text
+
+import app.infrastructure.db.session as db_session_mod
+from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.db.session_scope import (
+    DatabaseSessionScope,
+    SessionLeakError,
+    activate_session_scope,
+    current_session_scope,
+    database_session_scope,
+)
+
+
+class TestDatabaseSessionScope:
+
+    def test_repositories_share_the_scope_session(self) -> None:
+        with database_session_scope() as scope:
+            first = DatabaseRepository().get_db_session()
+            second = DatabaseRepository().get_db_session()
+
+            assert first is second
+            assert current_session_scope() is scope
+
+        assert scope.closed is True
+        assert current_session_scope() is None
+
+    def test_session_outside_a_scope_belongs_to_the_repository(self) -> None:
+        repo = DatabaseRepository()
+
+        session = repo.get_db_session()
+
+        assert session is repo.get_db_session()
+        assert session is not DatabaseRepository().get_db_session()
+        repo.close()
+
+    def test_scope_returns_connections_on_close(self) -> None:
+        with database_session_scope():
+            DatabaseRepository().get_db_session().execute(text("SELECT 1"))
+
+    def test_connection_outliving_the_scope_is_detected(self) -> None:
+        scope = DatabaseSessionScope()
+        with activate_session_scope(scope):
+            leaked_session = db_session_mod.SessionLocal()
+            leaked_session.execute(text("SELECT 1"))
+
+        with pytest.raises(SessionLeakError):
+            scope.close()
+
+        leaked_session.close()
+
+    def test_closed_scope_can_not_be_used(self) -> None:
+        scope = DatabaseSessionScope()
+        scope.close()
+
+        with pytest.raises(RuntimeError):
+            scope.get_session(db_session_mod.SessionLocal)
@@ -0,0 +1,164 @@
+import asyncio
+import logging
+from collections.abc import Generator
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.configurations import settings
+from app.infrastructure.db.async_session import async_database_url
+from app.infrastructure.db.slow_query_log import (
+    SlowQueryRecorder,
+    fingerprint_parameters,
+    normalize_statement,
+    slow_query_recorder,
+)
+
+SELECT_PRODUCT = text("SELECT id, name FROM products WHERE sku = :sku")
+
+
+@pytest.fixture(autouse=True)
+def clear_recorder() -> Generator[None, None, None]:
+    slow_query_recorder.clear()
+    yield
+    slow_query_recorder.clear()
+
+
+@pytest.fixture
+def every_query_is_slow(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+
+
+def test_statements_are_normalized() -> None:
+    statement = """SELECT products.id
+        FROM products
+        WHERE products.sku IN (%(sku_1_1)s, %(sku_1_2)s, %(sku_1_3)s)"""
+
+    assert normalize_statement(statement) == (
+        "SELECT products.id FROM products WHERE products.sku IN (...)"
+    )
+    assert normalize_statement("SELECT 1 WHERE $1 IN ($2, $3)") == (
+        "SELECT 1 WHERE $1 IN (...)"
+    )
+
+
+def test_parameters_are_fingerprinted() -> None:
+    assert fingerprint_parameters({"sku": "A"}) == fingerprint_parameters({"sku": "A"})
+    assert fingerprint_parameters({"sku": "A"}) != fingerprint_parameters({"sku": "B"})
+    assert "A" not in fingerprint_parameters({"sku": "A"})
+
+
+def test_nothing_is_recorded_without_threshold() -> None:
+    engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+    with engine.connect() as connection:
+        connection.execute(SELECT_PRODUCT, {"sku": "SKU-NIKE-001"})
+
+    assert slow_query_recorder.recent() == []
+
+
+def test_slow_query_is_logged_and_explained_once_per_interval(
+    every_query_is_slow: None,  # noqa: ARG001
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+
+    with caplog.at_level(logging.WARNING), engine.connect() as connection:
+        rows = [
+            connection.execute(SELECT_PRODUCT, {"sku": "SKU-NIKE-001"}).all()
+            for _ in range(2)
+        ]
+
+    # The statement's own rows are not disturbed by the EXPLAIN
+    assert rows[0] == rows[1]
+    assert len(rows[0]) == 1
+    assert caplog.text.count("Slow query") == 2  # noqa: PLR2004
+    captured = slow_query_recorder.recent()
+    assert len(captured) == 1
+    assert captured[0].statement == (
+        "SELECT id, name FROM products WHERE sku = %(sku)s"
+    )
+    assert captured[0].parameters_fingerprint == fingerprint_parameters(
+        {"sku": "SKU-NIKE-001"},
+    )
+    assert "Plan" in captured[0].plan[0]
+
+
+def test_plans_are_captured_again_after_the_interval(
+    every_query_is_slow: None,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS", 0)
+    engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+
+    with engine.connect() as connection:
+        for _ in range(2):
+            connection.execute(SELECT_PRODUCT, {"sku": "SKU-NIKE-001"})
+
+    assert len(slow_query_recorder.recent()) == 2  # noqa: PLR2004
+
+
+def test_explained_statements_are_bounded_by_the_ring_size() -> None:
+    recorder = SlowQueryRecorder(size=2)
+
+    assert [recorder._explain_due(f"SELECT {n}") for n in range(3)] == [True] * 3
+
+    assert list(recorder._last_explained) == ["SELECT 1", "SELECT 2"]
+    # The forgotten statement can be explained again straight away
+    assert recorder._explain_due("SELECT 0")
+    assert not recorder._explain_due("SELECT 2")
+
+
+def test_explained_statements_are_forgotten_after_the_interval(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    recorder = SlowQueryRecorder(size=10)
+    recorder._explain_due("SELECT 1")
+    monkeypatch.setattr(settings, "SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS", 0)
+
+    recorder._explain_due("SELECT 2")
+
+    assert list(recorder._last_explained) == ["SELECT 2"]
+
+
+def test_failed_explain_does_not_break_the_transaction() -> None:
+    engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        slow_query_recorder.record(
+            connection,
+            "SELECT * FROM missing_table",
+            {},
+            executemany=False,
+            duration_ms=1000,
+        )
+        assert connection.execute(text("SELECT 2")).scalar_one() == 2  # noqa: PLR2004
+
+    assert slow_query_recorder.recent() == []
+
+
+def test_slow_query_is_explained_on_the_async_engine(
+    every_query_is_slow: None,  # noqa: ARG001
+) -> None:
+    async def run() -> None:
+        engine = create_async_engine(
+            async_database_url(settings.DATABASE_URL),
+            poolclass=NullPool,
+        )
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(SELECT_PRODUCT, {"sku": "SKU-NIKE-001"})
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+    captured = [
+        slow_query
+        for slow_query in slow_query_recorder.recent()
+        if "FROM products" in slow_query.statement
+    ]
+    assert captured
+    assert "Plan" in captured[0].plan[0]
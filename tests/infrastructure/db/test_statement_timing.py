@@ -0,0 +1,52 @@
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.pool import NullPool
+
+from app.core.configurations import settings
+from app.infrastructure.db import statement_timing
+from app.infrastructure.db.statement_timing import _STARTED_AT, on_statement_timed
+
+
+@pytest.fixture
+def timed() -> Generator[list[str], None, None]:
+    statements: list[str] = []
+
+    @on_statement_timed
+    def record(
+        _conn: Connection,
+        statement: str,
+        _parameters: Any,
+        _executemany: bool,
+        seconds: float,
+    ) -> None:
+        assert seconds >= 0
+        statements.append(statement)
+
+    yield statements
+    statement_timing._timers.remove(record)
+
+
+def test_statements_are_timed_once(timed: list[str]) -> None:
+    engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+        assert timed == ["SELECT 1"]
+        assert connection.info[_STARTED_AT] == []
+
+
+def test_failed_statement_leaves_no_start_time(timed: list[str]) -> None:
+    engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+    with engine.connect() as connection:
+        with pytest.raises(ProgrammingError):
+            connection.execute(text("SELECT * FROM missing_table"))
+        connection.rollback()
+        connection.execute(text("SELECT 2"))
+
+        assert timed == ["SELECT 2"]
+        assert connection.info[_STARTED_AT] == []
@@ -0,0 +1,161 @@
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.pool import NullPool
+from yoyo import get_backend, read_migrations
+
+from app.domain.helpers.ulid_generator import generate_ulid
+from app.infrastructure.db.ulid_type import ulid_to_uuid
+from tests.infrastructure.db.scratch_database import (
+    MIGRATIONS_PATH,
+    apply_migrations,
+    scratch_database,
+)
+
+ULID_MIGRATION = "20261019_04__store_ulids_as_uuid"
+
+BRAND_ID = "01K4KNPTYEBNMX5DP8W0BMTS6C"
+PRODUCT_ID = "01K4KNQGXMW5KK788YBHJ2D28V"
+VIEW_ID = "01K4KNR0TNBG17YT9D6MWK4038"
+USER_ID = "01K4KNRC1B66FPMG6YSCBMJDK4"
+JOB_ID = "01K4KNRJKABX0FS4Q3RJEQ5RX5"
+
+KEY_COLUMNS = [
+    ("brands", "id"),
+    ("products", "id"),
+    ("products", "brand_id"),
+    ("product_views", "id"),
+    ("product_views", "product_id"),
+    ("users", "id"),
+    ("product_tombstones", "product_id"),
+    ("product_import_jobs", "id"),
+]
+
+SEED = f"""
+INSERT INTO brands (id, name, created_at, updated_at)
+VALUES ('{BRAND_ID}', 'Nike', NOW(), NOW());
+INSERT INTO products (id, sku, name, price, brand_id, created_at, updated_at)
+VALUES ('{PRODUCT_ID}', 'SKU-1', 'Air Max', 1, '{BRAND_ID}', NOW(), NOW());
+INSERT INTO product_views (id, product_id, view_count, created_at, updated_at)
+VALUES ('{VIEW_ID}', '{PRODUCT_ID}', 7, NOW(), NOW());
+INSERT INTO users (id, username, email, hashed_password, created_at, updated_at)
+VALUES ('{USER_ID}', 'admin', 'admin@example.com', 'hash', NOW(), NOW());
+INSERT INTO product_tombstones (product_id, deleted_at)
+VALUES ('{PRODUCT_ID}', NOW());
+INSERT INTO product_import_jobs (id, created_at, updated_at)
+VALUES ('{JOB_ID}', NOW(), NOW());
+"""  # noqa: S608
+
+
+@pytest.fixture
+def database(postgresql_proc: Any) -> Generator[tuple[str, Engine], None, None]:
+    """Database with the rows written before the conversion to uuid."""
+    with scratch_database(postgresql_proc, "ulids") as location:
+        apply_migrations(location, include=lambda id_: id_ < ULID_MIGRATION)
+        engine = create_engine(
+            f"postgresql+psycopg2://{location}",
+            poolclass=NullPool,
+        )
+        with engine.begin() as connection:
+            connection.exec_driver_sql(SEED)
+
+        yield location, engine
+
+        engine.dispose()
+
+
+def column_types(engine: Engine) -> set[str]:
+    with engine.connect() as connection:
+        return {
+            connection.execute(
+                text(
+                    "SELECT data_type FROM information_schema.columns "
+                    "WHERE table_name = :table AND column_name = :column",
+                ),
+                {"table": table, "column": column},
+            ).scalar_one()
+            for table, column in KEY_COLUMNS
+        }
+
+
+def test_migration_keeps_ulid_bits_in_uuid_columns(
+    database: tuple[str, Engine],
+) -> None:
+    location, engine = database
+
+    apply_migrations(location)
+
+    assert column_types(engine) == {"uuid"}
+    with engine.connect() as connection:
+        row = connection.execute(
+            text(
+                "SELECT p.id, p.brand_id, v.view_count, uuid_to_ulid(p.id) "
+                "FROM products p JOIN product_views v ON v.product_id = p.id",
+            ),
+        ).one()
+        user_id = connection.execute(
+            text("SELECT uuid_to_ulid(id) FROM users"),
+        ).scalar_one()
+    assert row == (
+        ulid_to_uuid(PRODUCT_ID),
+        ulid_to_uuid(BRAND_ID),
+        7,
+        PRODUCT_ID,
+    )
+    assert user_id == USER_ID
+
+
+def test_migration_keeps_foreign_keys(database: tuple[str, Engine]) -> None:
+    location, engine = database
+
+    apply_migrations(location)
+
+    with engine.connect() as connection:
+        foreign_keys = connection.execute(
+            text(
+                "SELECT conname FROM pg_constraint "
+                "WHERE contype = 'f' ORDER BY conname",
+            ),
+        ).scalars()
+        assert list(foreign_keys) == ["fk_brand", "product_views_product_id_fkey"]
+
+
+def test_sql_conversion_matches_the_application(
+    database: tuple[str, Engine],
+) -> None:
+    location, engine = database
+    ulids = [generate_ulid() for _ in range(200)]
+
+    apply_migrations(location)
+
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text(
+                "SELECT ulid_to_uuid(u), uuid_to_ulid(ulid_to_uuid(u)) "
+                "FROM unnest(CAST(:ulids AS TEXT[])) AS u",
+            ),
+            {"ulids": ulids},
+        ).all()
+    assert rows == [(ulid_to_uuid(value), value) for value in ulids]
+
+
+def test_migration_rolls_back_to_the_original_strings(
+    database: tuple[str, Engine],
+) -> None:
+    location, engine = database
+    apply_migrations(location)
+
+    backend = get_backend(f"postgresql://{location}")
+    migrations = read_migrations(MIGRATIONS_PATH).filter(
+        lambda migration: migration.id == ULID_MIGRATION,
+    )
+    with backend.lock():
+        backend.rollback_migrations(backend.to_rollback(migrations))
+
+    assert column_types(engine) == {"character varying"}
+    with engine.connect() as connection:
+        assert connection.execute(
+            text("SELECT id, brand_id FROM products"),
+        ).one() == (PRODUCT_ID, BRAND_ID)
@@ -0,0 +1,34 @@
+import uuid
+
+from app.domain.helpers.ulid_generator import generate_ulid
+from app.infrastructure.db.ulid_type import (
+    NIL_ULID,
+    ULIDType,
+    ulid_to_uuid,
+    uuid_to_ulid,
+)
+
+
+def test_ulids_round_trip_through_uuid() -> None:
+    value = generate_ulid()
+
+    stored = ulid_to_uuid(value)
+
+    assert isinstance(stored, uuid.UUID)
+    assert uuid_to_ulid(stored) == value
+    assert ulid_to_uuid(value.lower()) == stored
+
+
+def test_uuid_order_is_ulid_order() -> None:
+    values = sorted(generate_ulid() for _ in range(100))
+
+    assert sorted(values, key=ulid_to_uuid) == values
+
+
+def test_malformed_ulids_are_bound_as_nil() -> None:
+    ulid_type = ULIDType()
+
+    assert ulid_type.process_bind_param("nonexistent-id", None) == NIL_ULID
+    assert ulid_type.process_bind_param("Z" * 26, None) == NIL_ULID
+    assert ulid_type.process_bind_param(None, None) is None
+    assert ulid_type.process_result_value(None, None) is None
@@ -0,0 +1,195 @@
+"""
+Stand-in for PgBouncer in transaction pooling mode, for tests. The proxy
+answers the client startup itself and runs every transaction on whichever of
+its few server connections is free, giving the connection back as soon as the
+server reports it idle (ReadyForQuery 'I'), exactly like PgBouncer does.
+Only trust authentication is supported.
+"""
+
+import asyncio
+import struct
+import threading
+from dataclasses import dataclass, field
+
+SSL_REQUEST_CODE = 80877103
+GSSENC_REQUEST_CODE = 80877104
+CANCEL_REQUEST_CODE = 80877102
+
+
+async def _read_message(reader: asyncio.StreamReader) -> tuple[bytes, bytes]:
+    header = await reader.readexactly(5)
+    (length,) = struct.unpack("!I", header[1:])
+    return header[:1], header + await reader.readexactly(length - 4)
+
+
+def _message(kind: bytes, payload: bytes) -> bytes:
+    return kind + struct.pack("!I", len(payload) + 4) + payload
+
+
+@dataclass
+class _ServerConnection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+
+
+@dataclass
+class _Client:
+    writer: asyncio.StreamWriter
+    server: _ServerConnection | None = None
+    pump: asyncio.Task | None = field(default=None, repr=False)
+
+
+class TransactionPoolingProxy:
+
+    def __init__(self, host: str, port: int, server_connections: int = 1) -> None:
+        self.host = host
+        self.port = port
+        self.server_connections = server_connections
+        self.clients_served = 0
+        self.transactions_served = 0
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._idle: asyncio.Queue[_ServerConnection] | None = None
+        self._opened: list[_ServerConnection] = []
+        self._greeting: list[bytes] = []
+        self._startup_lock: asyncio.Lock | None = None
+        self._startup = b""
+        self.listen_port: int | None = None
+        self._server: asyncio.Server | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def start(self) -> int:
+        """Starts listening on localhost and returns the port."""
+        self._thread.start()
+        return asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _start(self) -> int:
+        self._idle = asyncio.Queue()
+        self._startup_lock = asyncio.Lock()
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        self.listen_port = self._server.sockets[0].getsockname()[1]
+        return self.listen_port
+
+    async def _stop(self) -> None:
+        self._server.close()
+        for task in list(self._tasks):
+            task.cancel()
+        for server in self._opened:
+            server.writer.close()
+
+    async def _serve(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        client = _Client(writer=writer)
+        try:
+            startup = await self._read_startup(reader, writer)
+            if startup is None:
+                return
+            await self._open_server_connections(startup)
+            self.clients_served += 1
+            writer.write(
+                _message(b"R", struct.pack("!I", 0))
+                + b"".join(self._greeting)
+                + _message(b"K", struct.pack("!II", 0, 0))
+                + _message(b"Z", b"I"),
+            )
+            await writer.drain()
+
+            while True:
+                kind, message = await _read_message(reader)
+                if kind == b"X":
+                    break
+                if client.server is None:
+                    client.server = await self._idle.get()
+                    self.transactions_served += 1
+                    client.pump = asyncio.create_task(self._pump(client))
+                client.server.writer.write(message)
+                await client.server.writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            if client.pump is not None and not client.pump.done():
+                # Gone in the middle of a transaction: the server connection
+                # is in an unknown state, replace it
+                client.pump.cancel()
+                client.server.writer.close()
+                self._opened.remove(client.server)
+                await self._connect(self._startup)
+            writer.close()
+            self._tasks.discard(task)
+
+    async def _pump(self, client: _Client) -> None:
+        server = client.server
+        while True:
+            kind, message = await _read_message(server.reader)
+            if kind == b"Z" and message[5:6] == b"I":
+                # Released before the client can send its next transaction
+                client.server = None
+                self._idle.put_nowait(server)
+                client.writer.write(message)
+                await client.writer.drain()
+                return
+            client.writer.write(message)
+            await client.writer.drain()
+
+    @staticmethod
+    async def _read_startup(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> bytes | None:
+        while True:
+            (length,) = struct.unpack("!I", await reader.readexactly(4))
+            payload = await reader.readexactly(length - 4)
+            (code,) = struct.unpack("!I", payload[:4])
+            if code in (SSL_REQUEST_CODE, GSSENC_REQUEST_CODE):
+                writer.write(b"N")
+                await writer.drain()
+                continue
+            if code == CANCEL_REQUEST_CODE:
+                return None
+            return struct.pack("!I", length) + payload
+
+    async def _open_server_connections(self, startup: bytes) -> None:
+        async with self._startup_lock:
+            if self._opened:
+                return
+            self._startup = startup
+            for _ in range(self.server_connections):
+                await self._connect(startup)
+
+    async def _connect(self, startup: bytes) -> None:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        writer.write(startup)
+        await writer.drain()
+        greeting = []
+        while True:
+            kind, message = await _read_message(reader)
+            if kind == b"R" and message[5:9] != struct.pack("!I", 0):
+                writer.close()
+                msg = "Only trust authentication is supported"
+                raise RuntimeError(msg)
+            if kind == b"E":
+                writer.close()
+                raise RuntimeError(message[5:].decode(errors="replace"))
+            if kind == b"S":
+                greeting.append(message)
+            if kind == b"Z":
+                break
+        self._greeting = greeting
+        server = _ServerConnection(reader=reader, writer=writer)
+        self._opened.append(server)
+        self._idle.put_nowait(server)
+
+    @property
+    def opened_server_connections(self) -> int:
+        return len(self._opened)
@@ -0,0 +1,87 @@
+from collections.abc import Generator
+from typing import Any
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from app.domain.exceptions.notification_delivery_exception import (
+    NotificationDeliveryError,
+)
+from app.domain.services.product_update_event import ProductUpdateEvent
+from app.infrastructure.service.aws_ses_service import AwsSESNotificationService
+from app.infrastructure.service.token_bucket import TokenBucket
+
+EVENT = ProductUpdateEvent(
+    product_id="01K4KNQSQACSWVRGN2NFAWGMT6",
+    changes={"price": {"old": "1.00", "new": "2.00"}},
+)
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> Any:
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test")
+    return boto3.session.Session().client("ses", region_name="us-east-1")
+
+
+@pytest.fixture
+def stubber(client: Any) -> Generator[Stubber, None, None]:
+    with Stubber(client) as stubber:
+        yield stubber
+
+
+def test_notify_sends_the_email(client: Any, stubber: Stubber) -> None:
+    stubber.add_response("send_email", {"MessageId": "message-1"})
+    service = AwsSESNotificationService(client=client)
+
+    service.notify("from@test.com", "to@test.com", EVENT)
+
+    stubber.assert_no_pending_responses()
+
+
+@pytest.mark.parametrize(
+    ("error_code", "retryable"),
+    [
+        ("Throttling", True),
+        ("ServiceUnavailable", True),
+        ("MessageRejected", False),
+        ("MailFromDomainNotVerified", False),
+    ],
+)
+def test_notify_raises_delivery_error(
+    client: Any,
+    stubber: Stubber,
+    error_code: str,
+    retryable: bool,
+) -> None:
+    stubber.add_client_error(
+        "send_email",
+        service_error_code=error_code,
+        service_message="Something went wrong",
+    )
+    service = AwsSESNotificationService(client=client)
+
+    with pytest.raises(NotificationDeliveryError) as exc_info:
+        service.notify("from@test.com", "to@test.com", EVENT)
+
+    assert exc_info.value.retryable is retryable
+    assert error_code in exc_info.value.message
+
+
+def test_notify_takes_a_token_before_sending(client: Any, stubber: Stubber) -> None:
+    stubber.add_response("send_email", {"MessageId": "message-1"})
+    acquired = []
+
+    class RecordingBucket(TokenBucket):
+        def acquire(self) -> None:
+            acquired.append(True)
+
+    service = AwsSESNotificationService(
+        client=client,
+        rate_limiter=RecordingBucket(rate=1),
+    )
+
+    service.notify("from@test.com", "to@test.com", EVENT)
+
+    assert acquired == [True]
@@ -0,0 +1,30 @@
+import pytest
+
+from app.infrastructure.service.in_memory_rate_limiter import InMemoryRateLimiter
+
+RATE = 1.0
+CAPACITY = 2
+
+
+@pytest.mark.asyncio
+async def test_keys_have_separate_buckets() -> None:
+    limiter = InMemoryRateLimiter(max_keys=10)
+
+    waits = [await limiter.hit("ip:1", RATE, CAPACITY) for _ in range(CAPACITY + 1)]
+
+    assert waits[:CAPACITY] == [0.0] * CAPACITY
+    assert 0 < waits[-1] <= 1 / RATE
+    assert await limiter.hit("ip:2", RATE, CAPACITY) == 0
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_keys_are_dropped_past_max_keys() -> None:
+    limiter = InMemoryRateLimiter(max_keys=2)
+    for _ in range(CAPACITY):
+        await limiter.hit("ip:1", RATE, CAPACITY)
+    await limiter.hit("ip:2", RATE, CAPACITY)
+
+    await limiter.hit("ip:3", RATE, CAPACITY)
+
+    # ip:1 was dropped and starts over with a full bucket
+    assert await limiter.hit("ip:1", RATE, CAPACITY) == 0
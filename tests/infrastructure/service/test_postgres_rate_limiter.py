@@ -0,0 +1,79 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+import ulid
+from sqlalchemy import select
+
+from app.domain.helpers.datetime_generator import get_now_datetime
+from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.entity.rate_limit_bucket_entity import (
+    RateLimitBucketEntity,
+)
+from app.infrastructure.service import postgres_rate_limiter
+from app.infrastructure.service.postgres_rate_limiter import PostgresRateLimiter
+
+RATE = 1.0
+CAPACITY = 3
+
+
+@pytest.mark.asyncio
+class TestPostgresRateLimiter:
+
+    async def test_tokens_run_out_and_report_the_wait(self) -> None:
+        limiter = PostgresRateLimiter(idle_seconds=60)
+        key = f"ip:{ulid.new().str}"
+
+        waits = [await limiter.hit(key, RATE, CAPACITY) for _ in range(CAPACITY + 1)]
+
+        assert waits[:CAPACITY] == [0.0] * CAPACITY
+        assert 0 < waits[-1] <= 1 / RATE
+
+    async def test_concurrent_hits_do_not_overspend_the_bucket(self) -> None:
+        limiter = PostgresRateLimiter(idle_seconds=60)
+        key = f"ip:{ulid.new().str}"
+
+        waits = await asyncio.gather(
+            *(limiter.hit(key, RATE, CAPACITY) for _ in range(CAPACITY * 2)),
+        )
+
+        assert waits.count(0.0) == CAPACITY
+
+    async def test_bucket_written_later_than_the_hit_started_keeps_its_tokens(
+        self,
+    ) -> None:
+        # What a hit waiting on the row lock sees: a bucket stamped after the
+        # start of its own transaction
+        key = f"ip:{ulid.new().str}"
+        database_repository = DatabaseRepository()
+        session = database_repository.get_db_session()
+        session.add(
+            RateLimitBucketEntity(
+                key=key,
+                tokens=1,
+                updated_at=get_now_datetime() + timedelta(seconds=10),
+            ),
+        )
+        session.commit()
+        database_repository.close()
+
+        wait = await PostgresRateLimiter(idle_seconds=60).hit(key, RATE, CAPACITY)
+
+        assert wait == 0.0
+
+    async def test_idle_buckets_are_pruned(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(postgres_rate_limiter, "PRUNE_EVERY", 2)
+        limiter = PostgresRateLimiter(idle_seconds=0)
+        idle_key = f"ip:{ulid.new().str}"
+        await limiter.hit(idle_key, RATE, CAPACITY)
+
+        await limiter.hit(f"ip:{ulid.new().str}", RATE, CAPACITY)
+
+        database_repository = DatabaseRepository()
+        session = database_repository.get_db_session()
+        keys = session.scalars(select(RateLimitBucketEntity.key)).all()
+        database_repository.close()
+        assert idle_key not in keys
@@ -0,0 +1,89 @@
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.configurations import settings
+from app.domain.services.product_update_event import ProductUpdateEvent
+from app.infrastructure.service.aws_ses_service import AwsSESNotificationService
+from app.infrastructure.service.ses_client import SESClientHolder
+from scripts.ses_stand_in import SESStandInServer, running_stand_in
+
+
+@pytest.fixture
+def stand_in(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[SESStandInServer, None, None]:
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "stand-in")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "stand-in")
+    with running_stand_in() as server:
+        monkeypatch.setattr(settings, "SES_ENDPOINT_URL", server.endpoint_url)
+        yield server
+
+
+@pytest.fixture
+def holder(
+    stand_in: SESStandInServer,  # noqa: ARG001
+) -> Generator[SESClientHolder, None, None]:
+    holder = SESClientHolder()
+    yield holder
+    holder.close()
+
+
+def test_client_is_built_once_per_region(holder: SESClientHolder) -> None:
+    client = holder.get("us-east-1")
+
+    assert holder.get("us-east-1") is client
+    assert holder.get("eu-west-1") is not client
+
+
+def test_concurrent_first_use_builds_one_client(holder: SESClientHolder) -> None:
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: holder.get("us-east-1"), range(32)))
+
+    assert len({id(client) for client in clients}) == 1
+
+
+def test_client_uses_pool_and_endpoint_settings(
+    monkeypatch: pytest.MonkeyPatch,
+    holder: SESClientHolder,
+    stand_in: SESStandInServer,
+) -> None:
+    monkeypatch.setattr(settings, "SES_MAX_POOL_CONNECTIONS", 25)
+
+    client = holder.get("us-east-1")
+
+    assert client.meta.endpoint_url == stand_in.endpoint_url
+    assert client.meta.config.max_pool_connections == 25  # noqa: PLR2004
+    assert client.meta.config.tcp_keepalive is True
+
+
+def test_close_drops_the_clients(holder: SESClientHolder) -> None:
+    client = holder.get("us-east-1")
+
+    holder.close()
+
+    assert holder.get("us-east-1") is not client
+
+
+def test_services_share_the_client_and_send(
+    holder: SESClientHolder,
+    stand_in: SESStandInServer,
+) -> None:
+    services = [
+        AwsSESNotificationService(client=holder.get("us-east-1")) for _ in range(3)
+    ]
+    event = ProductUpdateEvent(product_id="01K0000000000000000000000", changes={})
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(
+            executor.map(
+                lambda service: service.notify("from@test.com", "to@test.com", event),
+                services,
+            ),
+        )
+
+    assert len({id(service.client) for service in services}) == 1
+    assert len(stand_in.messages) == 3  # noqa: PLR2004
+    assert stand_in.messages[0]["Source"] == "from@test.com"
+    assert stand_in.messages[0]["Destination.ToAddresses.member.1"] == "to@test.com"
@@ -0,0 +1,77 @@
+import threading
+import time
+
+from app.infrastructure.service.token_bucket import TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_burst_up_to_capacity_does_not_wait() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=5, clock=clock, sleep=clock.sleep)
+
+    for _ in range(5):
+        bucket.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_acquire_waits_for_the_next_token() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=4, capacity=1, clock=clock, sleep=clock.sleep)
+
+    for _ in range(3):
+        bucket.acquire()
+
+    assert clock.sleeps == [0.25, 0.25]
+
+
+def test_tokens_refill_while_idle_up_to_capacity() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, capacity=2, clock=clock, sleep=clock.sleep)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now += 60
+    for _ in range(3):
+        bucket.acquire()
+
+    assert clock.sleeps == [1.0]
+
+
+def test_threads_share_the_rate() -> None:
+    bucket = TokenBucket(rate=100, capacity=1)
+
+    def worker() -> None:
+        for _ in range(5):
+            bucket.acquire()
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 20 tokens at 100 per second, the first one already in the bucket
+    assert time.monotonic() - started >= 0.19  # noqa: PLR2004
+
+
+def test_try_acquire_returns_the_wait_instead_of_sleeping() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=4, capacity=1, clock=clock, sleep=clock.sleep)
+
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0.25  # noqa: PLR2004
+    assert clock.sleeps == []
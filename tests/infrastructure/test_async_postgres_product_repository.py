@@ -0,0 +1,104 @@
+from decimal import Decimal
+
+import pytest
+import ulid
+from sqlalchemy import select
+
+from app.domain.use_cases.products.create.product_create_input import ProductCreateInput
+from app.domain.use_cases.products.edit.product_update_input import ProductUpdateInput
+from app.infrastructure.db.async_database_repository import AsyncDatabaseRepository
+from app.infrastructure.db.session_scope import async_database_session_scope
+from app.infrastructure.entity.product_tombstone_entity import (
+    ProductTombstoneEntity,
+)
+from app.infrastructure.persistence.async_postgres_brand_repository import (
+    AsyncPostgresBrandRepository,
+)
+from app.infrastructure.persistence.async_postgres_product_repository import (
+    AsyncPostgresProductRepository,
+)
+from app.infrastructure.persistence.async_postgres_product_view_repository import (
+    AsyncPostgresProductViewRepository,
+)
+
+
+def make_input(ulid_str: str) -> ProductCreateInput:
+    return ProductCreateInput(
+        sku=f"SKU-ASYNC-{ulid_str}",
+        name=f"Async Product {ulid_str}",
+        price=Decimal("20.00"),
+        brand_id="01K4KNPTYEBNMX5DP8W0BMTS6C",  # Nike
+    )
+
+
+@pytest.mark.asyncio
+class TestAsyncPostgresProductRepository:
+
+    async def test_create_and_find_product(self) -> None:
+        ulid_str = ulid.new().str
+
+        async with async_database_session_scope():
+            repo = AsyncPostgresProductRepository(AsyncDatabaseRepository())
+            product = await repo.create(make_input(ulid_str))
+
+            found_by_id = await repo.find_by_id(product.id)
+            found_by_sku = await repo.find_by_sku(product.sku)
+
+            assert found_by_id == product
+            assert found_by_sku == product
+            assert await repo.exists_by_sku(product.sku) is True
+            assert await repo.find_by_id("01ZZZZZZZZZZZZZZZZZZZZZZZZ") is None
+
+    async def test_update_product(self) -> None:
+        ulid_str = ulid.new().str
+
+        async with async_database_session_scope():
+            repo = AsyncPostgresProductRepository(AsyncDatabaseRepository())
+            product = await repo.create(make_input(ulid_str))
+
+            updated = await repo.update(
+                product.id,
+                ProductUpdateInput(
+                    sku=product.sku,
+                    name=f"Renamed {ulid_str}",
+                    price=Decimal("25.00"),
+                    brand_id=product.brand_id,
+                ),
+            )
+
+            assert updated.name == f"Renamed {ulid_str}"
+            assert updated.price == Decimal("25.00")
+
+    async def test_delete_product_leaves_tombstone_and_views_are_listed(
+        self,
+    ) -> None:
+        ulid_str = ulid.new().str
+
+        async with async_database_session_scope():
+            repo = AsyncPostgresProductRepository(AsyncDatabaseRepository())
+            view_repo = AsyncPostgresProductViewRepository(AsyncDatabaseRepository())
+            product = await repo.create(make_input(ulid_str))
+            await view_repo.increment_view(product.id)
+            await view_repo.increment_view(product.id)
+
+            views = {view.id: view.view for view in await repo.list_products()}
+            assert views[product.id] == 2  # noqa: PLR2004
+
+            await view_repo.delete_views_by_product_id(product.id)
+            await repo.delete_by_id(product.id)
+
+            session = repo.database_repository.get_db_session()
+            tombstone = await session.scalar(
+                select(ProductTombstoneEntity).where(
+                    ProductTombstoneEntity.product_id == product.id,
+                ),
+            )
+            assert tombstone is not None
+            assert await repo.find_by_id(product.id) is None
+
+    async def test_brand_exists_by_id(self) -> None:
+        async with async_database_session_scope():
+            repo = AsyncPostgresBrandRepository(AsyncDatabaseRepository())
+
+            assert await repo.exists_by_id("01K4KNPTYEBNMX5DP8W0BMTS6C") is True
+            assert await repo.exists_by_id("ANY") is False
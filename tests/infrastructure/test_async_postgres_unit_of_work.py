@@ -0,0 +1,53 @@
+from decimal import Decimal
+
+import pytest
+import ulid
+
+from app.domain.use_cases.products.create.product_create_input import ProductCreateInput
+from app.infrastructure.db.async_database_repository import AsyncDatabaseRepository
+from app.infrastructure.persistence.async_postgres_product_repository import (
+    AsyncPostgresProductRepository,
+)
+from app.infrastructure.persistence.async_postgres_unit_of_work import (
+    AsyncPostgresUnitOfWork,
+)
+
+
+def make_input(ulid_str: str) -> ProductCreateInput:
+    return ProductCreateInput(
+        sku=f"SKU-AUOW-{ulid_str}",
+        name=f"Async unit of work {ulid_str}",
+        price=Decimal("10.00"),
+        brand_id="01K4KNPTYEBNMX5DP8W0BMTS6C",
+    )
+
+
+@pytest.mark.asyncio
+class TestAsyncPostgresUnitOfWork:
+
+    async def test_work_is_committed_at_the_end(self) -> None:
+        product_repo = AsyncPostgresProductRepository(AsyncDatabaseRepository())
+        unit_of_work = AsyncPostgresUnitOfWork(AsyncDatabaseRepository())
+        ulid_str = ulid.new().str
+
+        async with unit_of_work:
+            product = await product_repo.create(make_input(ulid_str))
+
+        async with unit_of_work:
+            assert await product_repo.find_by_id(product.id) == product
+
+    async def test_work_is_rolled_back_when_the_block_raises(self) -> None:
+        product_repo = AsyncPostgresProductRepository(AsyncDatabaseRepository())
+        unit_of_work = AsyncPostgresUnitOfWork(AsyncDatabaseRepository())
+        ulid_str = ulid.new().str
+
+        async def create_and_fail() -> None:
+            async with unit_of_work:
+                await product_repo.create(make_input(ulid_str))
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            await create_and_fail()
+
+        async with unit_of_work:
+            assert not await product_repo.exists_by_sku(f"SKU-AUOW-{ulid_str}")
@@ -36,3 +36,12 @@ class TestPostgresBrandRepository:
         nike_id = "01K4KNPTYEBNMX5DP8W0BMTS6C"
 
         assert repo.exists_by_id(nike_id) is True
+
+    def test_find_existing_ids(self, container_test: dict) -> None:
+        repo: PostgresBrandRepository = container_test[BrandRepository]
+
+        existing = repo.find_existing_ids(
+            {"01K4KNPTYEBNMX5DP8W0BMTS6C", "01ZZZZZZZZZZZZZZZZZZZZZZZZ", "ANY"},
+        )
+
+        assert existing == {"01K4KNPTYEBNMX5DP8W0BMTS6C"}
@@ -0,0 +1,224 @@
+import threading
+from collections.abc import Generator
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import delete
+
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
+from app.domain.helpers.datetime_generator import get_now_datetime
+from app.domain.helpers.ulid_generator import generate_ulid
+from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.entity.outbox_message_entity import (
+    OutboxDeadLetterEntity,
+    OutboxMessageEntity,
+)
+from app.infrastructure.persistence.postgres_outbox_repository import (
+    PostgresOutboxRepository,
+)
+from app.infrastructure.persistence.postgres_unit_of_work import PostgresUnitOfWork
+
+BATCH_SIZE = 2
+
+
+@pytest.fixture(autouse=True)
+def empty_outbox() -> Generator[None, None, None]:
+    database_repository = DatabaseRepository()
+
+    def empty() -> None:
+        session = database_repository.get_db_session()
+        session.execute(delete(OutboxMessageEntity))
+        session.execute(delete(OutboxDeadLetterEntity))
+        database_repository.commit()
+
+    empty()
+    yield
+    empty()
+    database_repository.close()
+
+
+def add_messages(count: int) -> None:
+    repository = PostgresOutboxRepository(DatabaseRepository())
+    for number in range(count):
+        repository.add(OutboxEventType.PRODUCT_UPDATED, {"number": number})
+    repository.database_repository.close()
+
+
+def claim_all(repository: PostgresOutboxRepository) -> list[int]:
+    with PostgresUnitOfWork(repository.database_repository):
+        return [message.payload["number"] for message in repository.claim_batch(100)]
+
+
+def dead_letters() -> list[OutboxDeadLetterEntity]:
+    database_repository = DatabaseRepository()
+    entities = (
+        database_repository.get_db_session()
+        .query(OutboxDeadLetterEntity)
+        .order_by(OutboxDeadLetterEntity.id)
+        .all()
+    )
+    database_repository.close()
+    return entities
+
+
+class TestPostgresOutboxRepository:
+
+    def test_claim_batch_returns_the_oldest_messages(self) -> None:
+        add_messages(3)
+        repository = PostgresOutboxRepository(DatabaseRepository())
+
+        with PostgresUnitOfWork(repository.database_repository):
+            messages = repository.claim_batch(BATCH_SIZE)
+
+        assert [message.payload for message in messages] == [
+            {"number": 0},
+            {"number": 1},
+        ]
+        assert {message.event_type for message in messages} == {
+            OutboxEventType.PRODUCT_UPDATED,
+        }
+
+    def test_claim_batch_keeps_unknown_event_types_as_written(self) -> None:
+        database_repository = DatabaseRepository()
+        database_repository.add_and_commit(
+            OutboxMessageEntity(
+                id=generate_ulid(),
+                event_type="PRODUCT_DELETED",
+                payload={},
+                created_at=get_now_datetime(),
+                next_attempt_at=get_now_datetime(),
+            ),
+        )
+        database_repository.close()
+        add_messages(1)
+        repository = PostgresOutboxRepository(DatabaseRepository())
+
+        with PostgresUnitOfWork(repository.database_repository):
+            messages = repository.claim_batch(BATCH_SIZE)
+
+        assert [message.event_type for message in messages] == [
+            "PRODUCT_DELETED",
+            OutboxEventType.PRODUCT_UPDATED,
+        ]
+        assert messages[1].event_type is OutboxEventType.PRODUCT_UPDATED
+
+    def test_delete_removes_the_messages(self) -> None:
+        add_messages(3)
+        repository = PostgresOutboxRepository(DatabaseRepository())
+
+        with PostgresUnitOfWork(repository.database_repository):
+            repository.delete(
+                [message.id for message in repository.claim_batch(BATCH_SIZE)],
+            )
+
+        with PostgresUnitOfWork(repository.database_repository):
+            remaining = repository.claim_batch(BATCH_SIZE)
+
+        assert [message.payload for message in remaining] == [{"number": 2}]
+
+    def test_messages_are_not_written_when_the_transaction_rolls_back(self) -> None:
+        repository = PostgresOutboxRepository(DatabaseRepository())
+
+        def add_then_fail() -> None:
+            with PostgresUnitOfWork(repository.database_repository):
+                repository.add(OutboxEventType.PRODUCT_UPDATED, {"number": 0})
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            add_then_fail()
+
+        with PostgresUnitOfWork(repository.database_repository):
+            assert repository.claim_batch(BATCH_SIZE) == []
+
+    def test_locked_messages_are_skipped_by_other_dispatchers(self) -> None:
+        add_messages(3)
+        first_claimed = threading.Event()
+        second_done = threading.Event()
+        claimed: dict[str, list[int]] = {}
+
+        def claim(name: str) -> None:
+            repository = PostgresOutboxRepository(DatabaseRepository())
+            with PostgresUnitOfWork(repository.database_repository):
+                claimed[name] = [
+                    message.payload["number"]
+                    for message in repository.claim_batch(BATCH_SIZE)
+                ]
+                if name == "first":
+                    first_claimed.set()
+                    # Hold the locks until the other one has claimed
+                    second_done.wait(timeout=10)
+            repository.database_repository.close()
+
+        first = threading.Thread(target=claim, args=("first",))
+        first.start()
+        first_claimed.wait(timeout=10)
+        claim("second")
+        second_done.set()
+        first.join()
+
+        assert claimed == {"first": [0, 1], "second": [2]}
+
+    def test_add_many_writes_all_the_messages(self) -> None:
+        repository = PostgresOutboxRepository(DatabaseRepository())
+
+        with PostgresUnitOfWork(repository.database_repository):
+            repository.add_many(
+                OutboxEventType.PRODUCT_UPDATED,
+                [{"number": number} for number in range(3)],
+            )
+
+        assert claim_all(repository) == [0, 1, 2]
+
+    def test_retried_messages_wait_until_their_next_attempt(self) -> None:
+        add_messages(2)
+        repository = PostgresOutboxRepository(DatabaseRepository())
+
+        with PostgresUnitOfWork(repository.database_repository):
+            first = repository.claim_batch(1)
+            repository.schedule_retry(
+                [first[0].id],
+                get_now_datetime() + timedelta(minutes=5),
+                "SES Throttling",
+            )
+        assert claim_all(repository) == [1]
+
+        with PostgresUnitOfWork(repository.database_repository):
+            repository.schedule_retry(
+                [first[0].id],
+                get_now_datetime() - timedelta(seconds=1),
+                "SES Throttling",
+            )
+            retried = repository.claim_batch(BATCH_SIZE)
+
+        assert retried[0].id == first[0].id
+        assert retried[0].attempts == 2  # noqa: PLR2004
+
+    def test_dead_letters_are_kept_until_replayed(self) -> None:
+        add_messages(3)
+        repository = PostgresOutboxRepository(DatabaseRepository())
+
+        with PostgresUnitOfWork(repository.database_repository):
+            claimed = repository.claim_batch(BATCH_SIZE)
+            repository.move_to_dead_letters(
+                [message.id for message in claimed],
+                "SES MessageRejected",
+            )
+
+        assert claim_all(repository) == [2]
+        letters = dead_letters()
+        assert [letter.payload for letter in letters] == [
+            {"number": 0},
+            {"number": 1},
+        ]
+        assert {(letter.attempts, letter.last_error) for letter in letters} == {
+            (1, "SES MessageRejected"),
+        }
+
+        with PostgresUnitOfWork(repository.database_repository):
+            assert repository.replay_dead_letters([letters[1].id]) == 1
+        assert claim_all(repository) == [1, 2]
+
+        with PostgresUnitOfWork(repository.database_repository):
+            assert repository.replay_dead_letters() == 1
+        assert claim_all(repository) == [0, 1, 2]
+        assert dead_letters() == []
@@ -0,0 +1,71 @@
+import pytest
+
+from app.domain.enums.import_job_status_enum import ImportJobStatus
+from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundError
+from app.domain.models.product_import import ProductImportJob
+from app.domain.repositories.product_import_job_repository import (
+    ProductImportJobRepository,
+)
+from app.infrastructure.persistence.postgres_product_import_job_repository import (
+    PostgresProductImportJobRepository,
+)
+
+
+class TestPostgresProductImportJobRepository:
+
+    def test_create_and_find_job(self, container_test: dict) -> None:
+        repo: PostgresProductImportJobRepository = container_test[
+            ProductImportJobRepository
+        ]
+
+        job = repo.create()
+
+        assert job.status == ImportJobStatus.RUNNING
+        assert job.rows_processed == 0
+        assert repo.find_by_id(job.id) == job
+
+    def test_find_by_id_returns_none_if_not_found(self, container_test: dict) -> None:
+        repo: PostgresProductImportJobRepository = container_test[
+            ProductImportJobRepository
+        ]
+
+        assert repo.find_by_id("01ZZZZZZZZZZZZZZZZZZZZZZZZ") is None
+
+    def test_save_checkpoint(self, container_test: dict) -> None:
+        repo: PostgresProductImportJobRepository = container_test[
+            ProductImportJobRepository
+        ]
+        job = repo.create()
+
+        saved = repo.save(
+            job.model_copy(
+                update={
+                    "status": ImportJobStatus.COMPLETED,
+                    "rows_processed": 10,
+                    "imported": 8,
+                    "rejected": 2,
+                },
+            ),
+        )
+
+        assert saved == repo.find_by_id(job.id)
+        assert saved.status == ImportJobStatus.COMPLETED
+        assert saved.rows_processed == 10  # noqa: PLR2004
+        assert saved.imported == 8  # noqa: PLR2004
+        assert saved.rejected == 2  # noqa: PLR2004
+
+    def test_save_unknown_job_raises(self, container_test: dict) -> None:
+        repo: PostgresProductImportJobRepository = container_test[
+            ProductImportJobRepository
+        ]
+
+        with pytest.raises(ResourceNotFoundError):
+            repo.save(
+                ProductImportJob(
+                    id="01ZZZZZZZZZZZZZZZZZZZZZZZZ",
+                    status=ImportJobStatus.RUNNING,
+                    rows_processed=0,
+                    imported=0,
+                    rejected=0,
+                ),
+            )
@@ -3,10 +3,15 @@ from decimal import Decimal
 import pytest
 import ulid
 
+from app.domain.enums.product_change_type_enum import ProductChangeType
 from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundError
+from app.domain.models.product_change import ProductChangeCursor
 from app.domain.repositories.product_repository import ProductRepository
 from app.domain.use_cases.products.create.product_create_input import ProductCreateInput
 from app.domain.use_cases.products.edit.product_update_input import ProductUpdateInput
+from app.domain.use_cases.products.price_update.product_price_update_input import (
+    ProductPriceUpdateInput,
+)
 from app.infrastructure.persistence.postgres_product_repository import (
     PostgresProductRepository,
 )
@@ -129,3 +134,155 @@ class TestPostgresProductRepository:
 
         products_for_adidas = repo.list_products("01K4KNQ7FG9YCRZ3HPF7HRSPWG")
         assert all(prod.id is not None for prod in products_for_adidas)
+
+    def test_find_existing_skus(self, container_test: dict) -> None:
+        repo: PostgresProductRepository = container_test[ProductRepository]
+
+        ulid_str = ulid.new().str
+        existing = repo.find_existing_skus({"SKU-NIKE-001", f"SKU-{ulid_str}"})
+
+        assert existing == {"SKU-NIKE-001"}
+
+    def test_bulk_create_skips_existing_skus(self, container_test: dict) -> None:
+        repo: PostgresProductRepository = container_test[ProductRepository]
+
+        ulid_str = ulid.new().str
+        products = [
+            ProductCreateInput(
+                sku=f"SKU-{index}-{ulid_str}",
+                name=f"Bulk Product {index} {ulid_str}",
+                price=Decimal("12.50"),
+                brand_id="01K4KNPTYEBNMX5DP8W0BMTS6C",
+            )
+            for index in range(3)
+        ]
+        products.append(
+            ProductCreateInput(
+                sku="SKU-NIKE-001",
+                name="Duplicated",
+                price=Decimal("1.00"),
+                brand_id="01K4KNPTYEBNMX5DP8W0BMTS6C",
+            ),
+        )
+
+        inserted = repo.bulk_create(products)
+
+        assert inserted == {product.sku for product in products[:3]}
+        created = repo.find_by_sku(f"SKU-0-{ulid_str}")
+        assert created is not None
+        assert created.price == Decimal("12.50")
+        assert repo.find_by_sku("SKU-NIKE-001").name == "Nike Air Max"
+
+    def test_update_prices_returns_changed_products(
+        self,
+        container_test: dict,
+    ) -> None:
+        repo: PostgresProductRepository = container_test[ProductRepository]
+
+        ulid_str = ulid.new().str
+        changed = repo.create(
+            ProductCreateInput(
+                sku=f"SKU-PRICE-1-{ulid_str}",
+                name=f"Price Product 1 {ulid_str}",
+                price=Decimal("10.00"),
+                brand_id="01K4KNPTYEBNMX5DP8W0BMTS6C",
+            ),
+        )
+        unchanged = repo.create(
+            ProductCreateInput(
+                sku=f"SKU-PRICE-2-{ulid_str}",
+                name=f"Price Product 2 {ulid_str}",
+                price=Decimal("20.00"),
+                brand_id="01K4KNPTYEBNMX5DP8W0BMTS6C",
+            ),
+        )
+
+        changes = repo.update_prices(
+            [
+                ProductPriceUpdateInput(sku=changed.sku, price=Decimal("12.50")),
+                ProductPriceUpdateInput(sku=unchanged.sku, price=Decimal("20.00")),
+                ProductPriceUpdateInput(sku=f"SKU-{ulid_str}", price=Decimal("1.00")),
+            ],
+        )
+
+        assert len(changes) == 1
+        assert changes[0].product_id == changed.id
+        assert changes[0].old_price == Decimal("10.00")
+        assert changes[0].new_price == Decimal("12.50")
+        assert repo.find_by_id(changed.id).price == Decimal("12.50")
+        assert repo.find_by_id(unchanged.id).price == Decimal("20.00")
+
+    def test_update_prices_compares_the_rounded_price(
+        self,
+        container_test: dict,
+    ) -> None:
+        repo: PostgresProductRepository = container_test[ProductRepository]
+        product = repo.create(
+            ProductCreateInput(
+                sku=f"SKU-ROUNDED-{ulid.new().str}",
+                name="Rounded price",
+                price=Decimal("10.00"),
+                brand_id="01K4KNPTYEBNMX5DP8W0BMTS6C",
+            ),
+        )
+        price = [ProductPriceUpdateInput(sku=product.sku, price=Decimal("49.999"))]
+
+        first = repo.update_prices(price)
+        second = repo.update_prices(price)
+
+        assert [change.new_price for change in first] == [Decimal("50.00")]
+        # Stored as 50.00: sending it again is not a change
+        assert second == []
+
+    def test_export_products_yields_batches_with_brand(
+        self,
+        container_test: dict,
+    ) -> None:
+        repo: PostgresProductRepository = container_test[ProductRepository]
+
+        batches = list(repo.export_products(batch_size=2))
+
+        rows = [row for batch in batches for row in batch]
+        assert all(len(batch) <= 2 for batch in batches)  # noqa: PLR2004
+        assert len(rows) > 2  # noqa: PLR2004
+        assert [row.id for row in rows] == sorted(row.id for row in rows)
+        nike = next(row for row in rows if row.sku == "SKU-NIKE-001")
+        assert nike.brand_name == "Nike"
+        assert nike.price == Decimal("129.99")
+
+    def test_find_changes_after_cursor(self, container_test: dict) -> None:
+        repo: PostgresProductRepository = container_test[ProductRepository]
+
+        previous = repo.find_changes(since=None, limit=100_000, settle_seconds=0)
+        since = ProductChangeCursor(
+            changed_at=previous[-1].changed_at,
+            product_id=previous[-1].product_id,
+        )
+        ulid_str = ulid.new().str
+        deleted = repo.create(
+            ProductCreateInput(
+                sku=f"SKU-DELETED-{ulid_str}",
+                name=f"Deleted {ulid_str}",
+                price=Decimal("1.00"),
+                brand_id="01K4KNPTYEBNMX5DP8W0BMTS6C",
+            ),
+        )
+        repo.delete_by_id(deleted.id)
+        created = repo.create(
+            ProductCreateInput(
+                sku=f"SKU-CREATED-{ulid_str}",
+                name=f"Created {ulid_str}",
+                price=Decimal("2.00"),
+                brand_id="01K4KNPTYEBNMX5DP8W0BMTS6C",
+            ),
+        )
+
+        changes = repo.find_changes(since=since, limit=10, settle_seconds=0)
+
+        assert [(change.change_type, change.product_id) for change in changes] == [
+            (ProductChangeType.DELETE, deleted.id),
+            (ProductChangeType.UPSERT, created.id),
+        ]
+        assert changes[0].product is None
+        assert changes[1].product == created
+        assert repo.find_changes(since=since, limit=10, settle_seconds=60) == []
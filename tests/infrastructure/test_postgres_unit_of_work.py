@@ -0,0 +1,72 @@
+from decimal import Decimal
+
+import pytest
+import ulid
+
+from app.domain.use_cases.products.create.product_create_input import ProductCreateInput
+from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.persistence.postgres_product_repository import (
+    PostgresProductRepository,
+)
+from app.infrastructure.persistence.postgres_product_view_repository import (
+    PostgresProductViewRepository,
+)
+from app.infrastructure.persistence.postgres_unit_of_work import PostgresUnitOfWork
+
+
+def make_input(ulid_str: str) -> ProductCreateInput:
+    return ProductCreateInput(
+        sku=f"SKU-UOW-{ulid_str}",
+        name=f"Unit of work {ulid_str}",
+        price=Decimal("10.00"),
+        brand_id="01K4KNPTYEBNMX5DP8W0BMTS6C",
+    )
+
+
+class TestPostgresUnitOfWork:
+
+    def test_repositories_share_one_transaction(self) -> None:
+        product_repo = PostgresProductRepository(DatabaseRepository())
+        view_repo = PostgresProductViewRepository(DatabaseRepository())
+        unit_of_work = PostgresUnitOfWork(DatabaseRepository())
+        ulid_str = ulid.new().str
+
+        with unit_of_work:
+            product_session = product_repo.database_repository.get_db_session()
+            view_session = view_repo.database_repository.get_db_session()
+            product = product_repo.create(make_input(ulid_str))
+            view_repo.increment_view(product.id)
+
+            assert product_session is view_session
+            assert product_session.in_transaction()
+
+        assert PostgresProductRepository(DatabaseRepository()).find_by_id(product.id)
+
+    def test_changes_are_rolled_back_when_the_block_raises(self) -> None:
+        product_repo = PostgresProductRepository(DatabaseRepository())
+        ulid_str = ulid.new().str
+
+        def create_then_fail() -> None:
+            with PostgresUnitOfWork(DatabaseRepository()):
+                product_repo.create(make_input(ulid_str))
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            create_then_fail()
+
+        assert product_repo.find_by_sku(f"SKU-UOW-{ulid_str}") is None
+
+    def test_nested_units_of_work_commit_once(self) -> None:
+        unit_of_work = PostgresUnitOfWork(DatabaseRepository())
+        product_repo = PostgresProductRepository(DatabaseRepository())
+        ulid_str = ulid.new().str
+
+        with unit_of_work:
+            with unit_of_work:
+                product_repo.create(make_input(ulid_str))
+            session = product_repo.database_repository.get_db_session()
+
+            assert session.in_transaction()
+            assert session.info["unit_of_work_depth"] == 1
+
+        assert product_repo.find_by_sku(f"SKU-UOW-{ulid_str}") is not None
@@ -10,6 +10,9 @@ from app.infrastructure.persistence.postgres_user_repository import (
     PostgresUserRepository,
 )
 
+# Users are created with the hash already computed (see PasswordHasher)
+HASHED_PASSWORD = "$2b$12$hashed"
+
 
 class TestPostgresUserRepository:
 
@@ -23,12 +26,12 @@ class TestPostgresUserRepository:
             password="StrongPass123",
         )
 
-        user = repo.create(input_data, UserRole.ADMIN)
+        user = repo.create(input_data, HASHED_PASSWORD, UserRole.ADMIN)
 
         assert user.id is not None
         assert user.username == f"user_{ulid_str}"
         assert user.email == f"user{ulid_str}@example.com"
-        assert user.hashed_password != "StrongPass123"
+        assert user.hashed_password == HASHED_PASSWORD
         assert user.role == UserRole.ADMIN
 
         found = repo.find_by_username(f"user_{ulid_str}")
@@ -53,7 +56,7 @@ class TestPostgresUserRepository:
             email=f"user{ulid_str}@example.com",
             password="StrongPass123",
         )
-        user = repo.create(input_data, UserRole.ADMIN)
+        user = repo.create(input_data, HASHED_PASSWORD, UserRole.ADMIN)
 
         assert repo.exists_by(username=user.username, email="other@example.com") is True
         assert repo.exists_by(username="otheruser", email=user.email) is True
@@ -72,6 +75,7 @@ class TestPostgresUserRepository:
                 email=f"user{ulid_str}@example.com",
                 password="Secret123",
             ),
+            HASHED_PASSWORD,
             UserRole.ANONYMOUS,
         )
 
@@ -100,6 +104,7 @@ class TestPostgresUserRepository:
                 email=f"user{ulid_str}@example.com",
                 password="Secret123",
             ),
+            HASHED_PASSWORD,
             UserRole.ANONYMOUS,
         )
 
@@ -0,0 +1,81 @@
+"""
+Pytest plugin failing the tests whose endpoints run more SQL statements than
+they declare, so N+1 regressions in the repositories are caught early:
+
+    @pytest.mark.query_budget(4)
+    def test_something(client): ...
+
+or, to count only part of a test:
+
+    def test_something(client, query_budget):
+        with query_budget(4):
+            client.get("/products/...")
+
+Statements are counted process-wide, whichever thread or engine runs them.
+"""
+
+from collections import Counter
+from collections.abc import Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@contextmanager
+def _count_statements() -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def after_cursor_execute(_conn: Any, _cursor: Any, statement: str, *_: Any) -> None:
+        statements.append(statement)
+
+    event.listen(Engine, "after_cursor_execute", after_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "after_cursor_execute", after_cursor_execute)
+
+
+def _check_budget(statements: list[str], max_queries: int) -> None:
+    if len(statements) <= max_queries:
+        return
+    breakdown = "\n".join(
+        f"  {count} x {statement}"
+        for statement, count in Counter(statements).most_common()
+    )
+    pytest.fail(
+        f"Query budget exceeded: {len(statements)} statements run, "
+        f"{max_queries} allowed\n{breakdown}",
+        pytrace=False,
+    )
+
+
+@contextmanager
+def _query_budget(max_queries: int) -> Iterator[list[str]]:
+    with _count_statements() as statements:
+        yield statements
+    _check_budget(statements, max_queries)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "query_budget(max_queries): fail when the test runs more SQL statements",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> Generator[None, Any, Any]:
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        return (yield)
+
+    with _query_budget(marker.args[0]):
+        return (yield)
+
+
+@pytest.fixture
+def query_budget() -> Callable[[int], AbstractContextManager[list[str]]]:
+    return _query_budget
@@ -0,0 +1,22 @@
+from scripts.benchmark_product_updates import run_benchmark
+from scripts.ses_stand_in import StandInConfig
+
+REQUESTS = 40
+CONCURRENCY = 4
+
+
+def test_updates_are_notified_through_the_stand_in(
+    recreate_db_and_load_fixtures: str,  # noqa: ARG001
+) -> None:
+    result = run_benchmark(
+        requests=REQUESTS,
+        concurrency=CONCURRENCY,
+        products=REQUESTS,
+        stand_in_config=StandInConfig(latency_ms=20, error_rate=0.3),
+        coalesce_window=0,
+    )
+
+    assert result.requests_per_second > 0
+    assert result.p50_ms <= result.p95_ms
+    # The outbox drained, retrying past the injected errors
+    assert result.emails_sent > 0
@@ -0,0 +1,12 @@
+from scripts.benchmark_ses_client import run_benchmark
+
+NOTIFICATIONS = 20
+
+
+def test_shared_client_is_faster_than_one_per_notification() -> None:
+    results = {
+        result.strategy: result for result in run_benchmark(notifications=NOTIFICATIONS)
+    }
+
+    assert results["shared client"].mean_ms < results["per-notification client"].mean_ms
+    assert all(result.notifications == NOTIFICATIONS for result in results.values())
@@ -0,0 +1,24 @@
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.pool import NullPool
+
+from scripts.benchmark_ulid_keys import run_benchmark
+
+
+def test_uuid_keys_take_less_index_space(recreate_db_and_load_fixtures: str) -> None:
+    engine = create_engine(recreate_db_and_load_fixtures, poolclass=NullPool)
+
+    results = {
+        result.key_type: result
+        for result in run_benchmark(engine, products=5_000, repeats=1)
+    }
+
+    assert results["uuid"].index_bytes < results["varchar"].index_bytes
+    assert all(result.report_ms > 0 for result in results.values())
+    assert all(result.brand_report_ms > 0 for result in results.values())
+    # The scratch schemas are dropped
+    assert not [
+        schema
+        for schema in inspect(engine).get_schema_names()
+        if schema.startswith("benchmark_")
+    ]
+    engine.dispose()
@@ -0,0 +1,31 @@
+from sqlalchemy import delete
+
+from app.domain.enums.outbox_event_type_enum import OutboxEventType
+from app.infrastructure.db.database_repository import DatabaseRepository
+from app.infrastructure.entity.outbox_message_entity import (
+    OutboxDeadLetterEntity,
+    OutboxMessageEntity,
+)
+from app.infrastructure.persistence.postgres_outbox_repository import (
+    PostgresOutboxRepository,
+)
+from app.infrastructure.persistence.postgres_unit_of_work import PostgresUnitOfWork
+from scripts.replay_dead_letters import replay_dead_letters
+
+
+def test_replay_dead_letters_moves_them_back_to_the_outbox() -> None:
+    repository = PostgresOutboxRepository(DatabaseRepository())
+    session = repository.database_repository.get_db_session()
+    session.execute(delete(OutboxMessageEntity))
+    session.execute(delete(OutboxDeadLetterEntity))
+    with PostgresUnitOfWork(repository.database_repository):
+        repository.add(OutboxEventType.PRODUCT_UPDATED, {"number": 0})
+        message_ids = [message.id for message in repository.claim_batch(1)]
+        repository.move_to_dead_letters(message_ids, "SES MessageRejected")
+
+    assert replay_dead_letters() == 1
+
+    with PostgresUnitOfWork(repository.database_repository):
+        assert [message.id for message in repository.claim_batch(1)] == message_ids
+        repository.delete(message_ids)
+    repository.database_repository.close()
@@ -0,0 +1,91 @@
+import boto3
+import httpx
+import pytest
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from scripts.ses_stand_in import StandInConfig, running_stand_in
+
+DESTINATIONS = 3
+SERVICE_UNAVAILABLE = 503
+BAD_REQUEST = 400
+
+
+def _client(endpoint_url: str):  # noqa: ANN202
+    return boto3.client(
+        "ses",
+        region_name="us-east-1",
+        endpoint_url=endpoint_url,
+        aws_access_key_id="stand-in",
+        aws_secret_access_key="stand-in",
+        config=Config(retries={"max_attempts": 1}),
+    )
+
+
+def _send(client) -> dict:  # noqa: ANN001
+    return client.send_email(
+        Source="from@test.com",
+        Destination={"ToAddresses": ["to@test.com"]},
+        Message={"Subject": {"Data": "Subject"}, "Body": {"Text": {"Data": "Body"}}},
+    )
+
+
+def test_bulk_email_counts_every_destination() -> None:
+    with running_stand_in() as server:
+        response = _client(server.endpoint_url).send_bulk_templated_email(
+            Source="from@test.com",
+            Template="product-updates",
+            DefaultTemplateData="{}",
+            Destinations=[
+                {"Destination": {"ToAddresses": [f"to{number}@test.com"]}}
+                for number in range(DESTINATIONS)
+            ],
+        )
+
+        assert [status["Status"] for status in response["Status"]] == [
+            "Success",
+        ] * DESTINATIONS
+        assert server.sent == DESTINATIONS
+
+
+def test_injected_errors_are_answered_as_ses_does() -> None:
+    config = StandInConfig(error_rate=1.0, error_code="ServiceUnavailable")
+    with running_stand_in(config=config) as server:
+        with pytest.raises(ClientError) as error:
+            _send(_client(server.endpoint_url))
+
+        assert error.value.response["Error"]["Code"] == "ServiceUnavailable"
+        status = error.value.response["ResponseMetadata"]["HTTPStatusCode"]
+        assert status == SERVICE_UNAVAILABLE
+        assert server.sent == 0
+
+
+def test_sends_over_the_quota_are_throttled() -> None:
+    with running_stand_in(config=StandInConfig(max_send_rate=1)) as server:
+        client = _client(server.endpoint_url)
+        _send(client)
+        with pytest.raises(ClientError) as error:
+            _send(client)
+
+        assert error.value.response["Error"]["Code"] == "Throttling"
+        assert server.sent == 1
+
+
+def test_admin_endpoints_inspect_reset_and_configure() -> None:
+    with running_stand_in() as server:
+        _send(_client(server.endpoint_url))
+        admin = httpx.Client(base_url=f"{server.endpoint_url}/_stand_in")
+
+        messages = admin.get("/messages").json()
+        assert messages["sent"] == 1
+        assert messages["messages"][0]["Source"] == "from@test.com"
+
+        assert admin.delete("/messages").json()["sent"] == 0
+        assert server.sent == 0
+
+        response = admin.post("/config", json={"latency_ms": 5, "error_rate": "0.5"})
+        assert response.json()["error_rate"] == 0.5  # noqa: PLR2004
+        assert server.config.latency_ms == 5  # noqa: PLR2004
+        response = admin.post("/config", json={"unknown": 1})
+        assert response.status_code == BAD_REQUEST
+        admin.close()
@@ -0,0 +1,37 @@
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+QueryBudget = Callable[[int], AbstractContextManager[list[str]]]
+
+
+def test_statements_within_budget_pass(
+    query_budget: QueryBudget,
+    db_session: Session,
+) -> None:
+    with query_budget(2) as statements:
+        db_session.execute(text("SELECT 1"))
+        db_session.execute(text("SELECT 2"))
+
+    assert statements == ["SELECT 1", "SELECT 2"]
+
+
+def test_statements_over_budget_fail_with_a_breakdown(
+    query_budget: QueryBudget,
+    db_session: Session,
+) -> None:
+    def run_over_budget() -> None:
+        with query_budget(1):
+            for _ in range(3):
+                db_session.execute(text("SELECT 1"))
+
+    with pytest.raises(pytest.fail.Exception, match=r"3 statements run, 1 allowed"):
+        run_over_budget()
+
+
+@pytest.mark.query_budget(1)
+def test_marker_counts_the_whole_test(db_session: Session) -> None:
+    db_session.execute(text("SELECT 1"))